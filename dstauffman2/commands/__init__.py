@@ -13,6 +13,7 @@
 from .help     import print_help, print_version, parse_help, parse_version, execute_help, \
                           execute_version
 from .runtests import parse_tests, execute_tests, parse_coverage, execute_coverage
+from .words    import parse_find_words, execute_find_words
 # fmt: on
 
 # %% Unittest
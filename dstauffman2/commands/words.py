@@ -0,0 +1,145 @@
+r"""
+Functions related to the `find_words` command.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import argparse
+import doctest
+import os
+import sys
+import unittest
+
+from slog import ReturnCodes
+
+
+# %% Functions - parse_find_words
+def parse_find_words(input_args: list[str]) -> argparse.Namespace:
+    r"""
+    Parser for the find_words command.
+
+    Parameters
+    ----------
+    input_args : list of str
+        Input arguments as passed to sys.argv for this command
+
+    Returns
+    -------
+    args : class Namespace
+        Arguments as parsed by argparse.parse_args
+
+    Notes
+    -----
+    #.  Written by David C. Stauffer in October 2026.
+
+    Examples
+    --------
+    >>> from dstauffman2.commands import parse_find_words
+    >>> input_args = ["words"]
+    >>> args = parse_find_words(input_args)
+    >>> print(args)
+    Namespace(tiles='words', pattern='', socket=None, dict_name=None, show_blanks=False)
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="dcs2 find_words",
+        description="Finds all the words that can be made from the given tiles.  Without any tiles, the word index is only "
+        + "loaded once and then one query per line of tiles and an optional pattern is answered from stdin.",
+    )
+
+    parser.add_argument("tiles", nargs="?", default=None, help="Tiles to anagram, with ? for blanks")
+
+    parser.add_argument("-p", "--pattern", default="", help="Regular expression pattern the words have to match")
+
+    parser.add_argument(
+        "-s", "--socket", default=None, help="Answer the queries from connections to this local Unix socket instead of stdin"
+    )
+
+    parser.add_argument("-d", "--dict", dest="dict_name", default=None, help="Name of the word list in the data folder")
+
+    parser.add_argument("-b", "--show-blanks", action="store_true", help="Show the letters that the blanks stand for in uppercase")
+
+    args = parser.parse_args(input_args)
+    return args
+
+
+# %% Functions - execute_find_words
+def execute_find_words(args: argparse.Namespace) -> int:
+    r"""
+    Executes the find_words command.
+
+    Parameters
+    ----------
+    args : class argparse.Namespace, with fields:
+        .tiles : str
+        .pattern : str
+        .socket : str
+        .dict_name : str
+        .show_blanks : bool
+
+    Returns
+    -------
+    return_code : int
+        Return code for whether the command executed cleanly
+
+    Notes
+    -----
+    #.  Written by David C. Stauffer in October 2026.
+    #.  For a single query, an invalid pattern is printed to stderr and gives a bad_command return code.
+    #.  For the stdin and socket modes, the number of queries and how many were answered per second
+        are printed to stderr at the end, so that stdout only has the answers.
+
+    Examples
+    --------
+    >>> from dstauffman2.commands import execute_find_words
+    >>> from argparse import Namespace
+    >>> args = Namespace(tiles="words", pattern="", socket=None, dict_name=None, show_blanks=False)
+    >>> execute_find_words(args) # doctest: +SKIP
+
+    """
+    # delayed import of the scrabble game, so that the other commands don't have to load it
+    from dstauffman2.games.scrabble import DICT  # pylint: disable=import-outside-toplevel
+    from dstauffman2.games.scrabble.service import format_throughput, WordService  # pylint: disable=import-outside-toplevel
+
+    # alias options
+    # fmt: off
+    tiles       = args.tiles
+    pattern     = args.pattern
+    path        = args.socket
+    dict_name   = args.dict_name if args.dict_name is not None else DICT
+    show_blanks = args.show_blanks
+    # fmt: on
+
+    service = WordService(dict_name=dict_name, show_blanks=show_blanks)
+    if tiles is not None:
+        try:
+            words = service.find(tiles, pattern)
+        except ValueError as err:
+            print(f"Error: {err}", file=sys.stderr)
+            return ReturnCodes.bad_command
+        print(" ".join(words))
+        return ReturnCodes.clean
+    if path is None:
+        service.serve_lines(sys.stdin, sys.stdout)
+    else:
+        with service.make_server(path) as server:
+            print(f'Answering queries on "{path}", press Ctrl+C to stop.', file=sys.stderr)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                # remove the socket file, since nothing is listening on it anymore
+                os.remove(path)
+    print(format_throughput(service.num_queries, service.elapsed), file=sys.stderr)
+    return ReturnCodes.clean
+
+
+# %% Unit test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.tests.test_commands_words", exit=False)
+    doctest.testmod(verbose=False)
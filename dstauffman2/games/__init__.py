@@ -2,9 +2,14 @@
 The "games" submodule within the "dstauffman2" module is a playground for simulating and solving
 different types of games.
 
+The "batch" file runs headless simulations in chunks, in this process or across a process pool.
 The "brick" file solves a 3D red and gray brick puzzle.
+The "cards" file defines playing cards as objects or uint8 arrays, with a batch poker hand evaluator.
 The "knight" file solves chessboard and knight related logic puzzles.
-The "rubik" file solves Rubik's Cube related permutation puzzles.
+The "poker" file estimates the equity of poker hands by Monte Carlo simulation.
+The "rubik" file counts, turns and solves Rubik's Cubes.
+The "selfplay" file plays batches of headless pentago and tictactoe games to evaluate the AIs.
+The "war" file plays batches of headless games of War to find the statistics of the game.
 
 Notes
 -----
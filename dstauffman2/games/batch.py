@@ -0,0 +1,135 @@
+r"""
+Batch module file for the "dstauffman2" library.  It runs headless simulations in chunks, either in
+this process or across a process pool.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  The work is always split into the same chunks, each with its own random stream spawned from the
+    seed, and the chunk results are always returned in order, so for the same seed the results are
+    the same with or without a process pool, and for any number of workers.
+
+"""
+
+# %% Imports
+from concurrent.futures import ProcessPoolExecutor
+import doctest
+import os
+import unittest
+
+import numpy as np
+
+# %% Constants
+# player values for the results of headless games
+PLAYER1 = 1
+PLAYER2 = -1
+DRAW    = 2
+NONE    = 0
+
+
+# %% split_chunks
+def split_chunks(num_items, chunk_size, seed=None):
+    r"""
+    Splits the work into chunks, each with its own random stream.
+
+    Parameters
+    ----------
+    num_items : int
+        Number of games or trials to split up
+    chunk_size : int
+        Maximum number of items in each chunk
+    seed : int, optional
+        Seed for the random number generator
+
+    Returns
+    -------
+    list of (int, int, class numpy.random.SeedSequence)
+        Start index, number of items and random stream of each chunk
+
+    Notes
+    -----
+    #.  There is always at least one chunk, even if it is empty, so that the results can always be
+        combined.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.batch import split_chunks
+    >>> chunks = split_chunks(1200, 500, seed=0)
+    >>> print([(start, size) for (start, size, _) in chunks])
+    [(0, 500), (500, 500), (1000, 200)]
+
+    """
+    starts = range(0, max(num_items, 1), chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    return [(start, min(chunk_size, num_items - start), this_seed) for (start, this_seed) in zip(starts, seeds)]
+
+
+# %% _run_task
+def _run_task(func, args):
+    r"""Runs a single chunk, for use with a process pool."""
+    return func(*args)
+
+
+# %% run_chunks
+def run_chunks(func, tasks, *, parallel=True, num_workers=None, is_done=None):
+    r"""
+    Runs a function on the arguments for each chunk, in order.
+
+    Parameters
+    ----------
+    func : callable
+        Module level function that runs a single chunk, so that it can be sent to a process pool
+    tasks : list of tuple
+        Arguments to func for each chunk
+    parallel : bool, optional
+        Whether there is enough work to be worth using a process pool
+    num_workers : int, optional
+        Number of worker processes, defaults to the number of CPUs, and 1 runs everything in this process
+    is_done : callable, optional
+        Called with the list of results after each chunk, to stop early once it returns True
+
+    Returns
+    -------
+    results : list
+        Results of each chunk that was run, in order
+
+    Notes
+    -----
+    #.  When stopping early, the chunks that have not started yet are cancelled, and the results of
+        any later chunks that were already running are ignored, so that the results only depend on
+        the order of the chunks.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.batch import run_chunks
+    >>> print(run_chunks(pow, [(2, 3), (3, 2), (4, 1)], num_workers=1))
+    [8, 9, 4]
+
+    >>> print(run_chunks(pow, [(2, 3), (3, 2), (4, 1)], num_workers=1, is_done=lambda results: sum(results) > 10))
+    [8, 9]
+
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    results = []
+    if not parallel or num_workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            results.append(func(*task))
+            if is_done is not None and is_done(results):
+                break
+        return results
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        futures = [pool.submit(_run_task, func, task) for task in tasks]
+        for future in futures:
+            results.append(future.result())
+            if is_done is not None and is_done(results):
+                break
+        for future in futures:
+            future.cancel()
+    return results
+
+
+# %% Unit test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.test_batch", exit=False)
+    doctest.testmod(verbose=False)
@@ -5,6 +5,11 @@
 Notes
 -----
 #.  Written by David C. Stauffer in May 2016.
+#.  Updated by David C. Stauffer in October 2026 to add the array based cards, where each card is a
+    uint8 code of rank * 4 + suit, and the batch poker hand evaluator.  Hands without a flush only
+    depend on how many of each rank they have, so every possible set of rank counts is scored once
+    into a sorted lookup table, keyed by the counts as a base five number.  Flushes only depend on
+    which ranks are in the flush suit, so they use a second table indexed by a 13 bit rank mask.
 
 """
 
@@ -12,9 +17,12 @@
 from collections import Counter
 import doctest
 from enum import IntEnum, unique
+from itertools import combinations_with_replacement
 from random import shuffle as shuffle_func
 import unittest
 
+import numpy as np
+
 
 # %% Enums - Suit
 @unique
@@ -73,6 +81,22 @@ class Rank(IntEnum):
 RANK_SYMBOL[Rank.ACE]   = "A"
 # all possible straights
 STRAIGHTS = [set(range(i, i + 5)) for i in range(9)]
+# number of cards in a full deck
+DECK_SIZE = NUM_RANKS * NUM_SUITS
+# names of the hand categories, in order of increasing strength
+HAND_NAMES = ["high card", "pair", "two pair", "three of a kind", "straight", "flush", "full house", "four of a kind",
+    "straight flush", "five of a kind"]
+
+# hand values are the category followed by up to five ranks for breaking ties, with four bits each
+_KICKER_BITS    = 4
+_NUM_KICKERS    = 5
+_CATEGORY_SHIFT = _KICKER_BITS * _NUM_KICKERS
+
+# key for each rank, so that the sum over a hand is its rank counts as a base five number
+_RANK_KEYS = 5 ** np.arange(NUM_RANKS, dtype=np.int64)
+
+# lookup tables for the hand evaluator, built the first time they are needed
+_TABLES = {}
 
 
 # %% Classes - Card
@@ -131,6 +155,17 @@ def get_suit(self):
         r"""Gets the suit of the current card."""
         return self._card2suit(self._card)
 
+    @property
+    def code(self):
+        r"""Integer code of the card, as rank * NUM_SUITS + suit."""
+        return int(encode_cards(self.get_rank(), self.get_suit()))
+
+    @classmethod
+    def from_code(cls, code):
+        r"""Creates the card from its integer code."""
+        (rank, suit) = decode_cards(code)
+        return cls(Rank(int(rank)), Suit(int(suit)))
+
 
 # %% Classes - Deck
 class Deck(object):
@@ -158,6 +193,10 @@ def get_next_card(self):
     def count_remaining_cards(self):
         return len(self._cards)
 
+    def to_array(self):
+        r"""Gets the remaining cards as an array of codes, with the next card last."""
+        return np.array([card.code for card in self._cards], dtype=np.uint8)
+
 
 # %% Classes - Card
 class Hand(object):
@@ -198,50 +237,242 @@ def get_suits(self):
     def shuffle(self):
         shuffle_func(self._cards)
 
+    def to_array(self):
+        r"""Gets the cards as an array of codes."""
+        return np.array([card.code for card in self._cards], dtype=np.uint8)
+
     def score_hand(self):
-        # hand order:
-        # 9. five of a kind (not possible without wilds)
-        # 8. straight flush (includes royal flush)
-        # 7. four of a kind
-        # 6. full house
-        # 5. flush
-        # 4. straight
-        # 3. three of a kind
-        # 2. two pair
-        # 1. pair
-        # 0. high card
-
-        # place-holder, delete later
-        score = 0
-
-        # get the ranks and suits
-        ranks = self.get_ranks()
-        suits = self.get_suits()
-
-        # count the number of suits and get unique sets for straights
-        suits_count = Counter(suits)
-        ranks_count = Counter(ranks)
-        ranks_set   = set(ranks)
-
-        # determine if there is a flush or straight
-        has_flush    = max(suits_count.values()) >= 5
-        has_straight = ranks_set in STRAIGHTS
-
-        # check for five of a kind
-        if max(ranks_count.values()) >= 5:
-            pass
-            # rank_ix = np.argmax(ranks_count[::-1])
-            # score = 9 + (rank_ix-NUM_RANKS) / NUM_RANKS
-        # check for straight flush
-        # elif np.any(suits_count) >= 5 and np.any(straight_count) >= 5:
-        #    # check that cards from the straight also make the flush
-        #    straight_ix = np.flatnonzero(straight_count == 5)
-        #    for this_straight in straight_ix[::-1]:
-        #        for this_suit in NUM_SUITS:
-        #            has_all_ranks = True
-        #            for ranks in STRAIGHTS[this_straight, :]:
-        #                pass
-        return score
+        r"""
+        Scores the best five card poker hand within the cards.
+
+        Returns
+        -------
+        int
+            Hand value, where higher values are better hands, and `get_hand_category` gives its index into HAND_NAMES
+
+        Notes
+        -----
+        #.  Updated by David C. Stauffer in October 2026 to score all the hands, including five of
+            a kind for hands with duplicate cards.
+
+        Examples
+        --------
+        >>> from dstauffman2.games.cards import Card, Hand, Rank, Suit, HAND_NAMES, get_hand_category
+        >>> hand = Hand([Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES), Card(Rank.QUEEN, Suit.HEARTS), \
+        ...     Card(Rank.JACK, Suit.DIAMONDS), Card(Rank.TEN, Suit.CLUBS)])
+        >>> print(HAND_NAMES[get_hand_category(hand.score_hand())])
+        straight
+
+        """
+        return _score_cards(self.get_ranks(), self.get_suits())
+
+
+# %% Functions - encode_cards
+def encode_cards(ranks, suits):
+    r"""
+    Encodes the given ranks and suits as uint8 card codes.
+
+    Parameters
+    ----------
+    ranks : int or array_like of int
+        Card ranks, from class Rank
+    suits : int or array_like of int
+        Card suits, from class Suit
+
+    Returns
+    -------
+    ndarray of uint8
+        Card codes, as rank * NUM_SUITS + suit
+
+    Examples
+    --------
+    >>> from dstauffman2.games.cards import encode_cards, Rank, Suit
+    >>> print(encode_cards([Rank.TWO, Rank.ACE], [Suit.CLUBS, Suit.SPADES]))
+    [ 0 51]
+
+    """
+    return (np.asarray(ranks, dtype=np.uint8) * NUM_SUITS + np.asarray(suits, dtype=np.uint8)).astype(np.uint8)
+
+
+# %% Functions - decode_cards
+def decode_cards(codes):
+    r"""
+    Decodes the given card codes into their ranks and suits.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.cards import decode_cards
+    >>> (ranks, suits) = decode_cards([0, 51])
+    >>> print(ranks, suits)
+    [ 0 12] [0 3]
+
+    """
+    codes = np.asarray(codes, dtype=np.uint8)
+    return (codes // NUM_SUITS, codes % NUM_SUITS)
+
+
+# %% Functions - new_deck
+def new_deck():
+    r"""
+    Creates a full deck as an array of card codes, sorted from the two of clubs to the ace of spades.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.cards import new_deck
+    >>> deck = new_deck()
+    >>> print(deck.dtype, deck.size)
+    uint8 52
+
+    """
+    return np.arange(DECK_SIZE, dtype=np.uint8)
+
+
+# %% Functions - _pack_value
+def _pack_value(category, kickers):
+    r"""Packs the hand category and the ranks that break ties into a single integer."""
+    value = category
+    for ix in range(_NUM_KICKERS):
+        value = (value << _KICKER_BITS) | (int(kickers[ix]) if ix < len(kickers) else 0)
+    return value
+
+
+# %% Functions - _find_straight
+def _find_straight(ranks):
+    r"""Finds the highest rank of the best straight within the set of ranks, or None if there isn't one."""
+    for high in range(Rank.ACE, Rank.FIVE - 1, -1):
+        low = high - 4
+        if all((rank if rank >= 0 else Rank.ACE) in ranks for rank in range(low, high + 1)):
+            return high
+    return None
+
+
+# %% Functions - _score_counts
+def _score_counts(counts):
+    r"""Scores the best hand without a flush from the number of cards of each rank."""
+    ranks = sorted((rank for rank in counts if counts[rank] > 0), reverse=True)
+    trips = [rank for rank in ranks if counts[rank] >= 3]
+    pairs = [rank for rank in ranks if counts[rank] >= 2]
+    if not ranks:
+        return 0
+    if any(counts[rank] >= 5 for rank in ranks):
+        return _pack_value(9, [max(rank for rank in ranks if counts[rank] >= 5)])
+    quads = [rank for rank in ranks if counts[rank] >= 4]
+    if quads:
+        return _pack_value(7, [quads[0]] + [rank for rank in ranks if rank != quads[0]][:1])
+    if trips and len(pairs) >= 2:
+        return _pack_value(6, [trips[0], next(rank for rank in pairs if rank != trips[0])])
+    straight = _find_straight(set(ranks))
+    if straight is not None:
+        return _pack_value(4, [straight])
+    if trips:
+        return _pack_value(3, [trips[0]] + [rank for rank in ranks if rank != trips[0]][:2])
+    if len(pairs) >= 2:
+        return _pack_value(2, pairs[:2] + [rank for rank in ranks if rank not in pairs[:2]][:1])
+    if pairs:
+        return _pack_value(1, [pairs[0]] + [rank for rank in ranks if rank != pairs[0]][:3])
+    return _pack_value(0, ranks[:_NUM_KICKERS])
+
+
+# %% Functions - _score_flush
+def _score_flush(ranks):
+    r"""Scores the flush made from the given set of ranks in one suit."""
+    straight = _find_straight(ranks)
+    if straight is not None:
+        return _pack_value(8, [straight])
+    return _pack_value(5, sorted(ranks, reverse=True)[:_NUM_KICKERS])
+
+
+# %% Functions - _score_cards
+def _score_cards(ranks, suits):
+    r"""Scores the best five card hand within any number of cards, one at a time."""
+    best = _score_counts(Counter(ranks))
+    for suit, num in Counter(suits).items():
+        if num >= 5:
+            best = max(best, _score_flush({rank for (rank, this_suit) in zip(ranks, suits) if this_suit == suit}))
+    return best
+
+
+# %% Functions - _get_tables
+def _get_tables(num_cards):
+    r"""Gets the lookup tables for hands of the given size, building them the first time."""
+    if "flush" not in _TABLES:
+        masks = np.arange(1 << NUM_RANKS)
+        flush = np.zeros(masks.size, dtype=np.int32)
+        for mask in masks:
+            ranks = {rank for rank in range(NUM_RANKS) if mask & (1 << rank)}
+            if len(ranks) >= 5:
+                flush[mask] = _score_flush(ranks)
+        _TABLES["flush"] = flush
+    if num_cards not in _TABLES:
+        keys = []
+        values = []
+        for ranks in combinations_with_replacement(range(NUM_RANKS), num_cards):
+            counts = Counter(ranks)
+            if max(counts.values()) > NUM_SUITS:
+                continue
+            keys.append(sum(int(_RANK_KEYS[rank]) for rank in ranks))
+            values.append(_score_counts(counts))
+        order = np.argsort(keys)
+        _TABLES[num_cards] = (np.array(keys, dtype=np.int64)[order], np.array(values, dtype=np.int32)[order])
+    return (_TABLES[num_cards], _TABLES["flush"])
+
+
+# %% Functions - evaluate_hands
+def evaluate_hands(hands):
+    r"""
+    Scores a batch of poker hands with the lookup tables.
+
+    Parameters
+    ----------
+    hands : (N, M) or (M, ) array_like of uint8
+        Card codes for each hand, with 5 to 7 distinct cards each
+
+    Returns
+    -------
+    (N, ) or scalar ndarray of int32
+        Value of the best five card hand within each one, where higher values are better hands
+
+    Notes
+    -----
+    #.  The tables for each hand size are built the first time that they are used.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.cards import encode_cards, evaluate_hands, get_hand_category, HAND_NAMES
+    >>> hands = [encode_cards([12, 11, 10, 9, 8], [3, 3, 3, 3, 3]), encode_cards([0, 0, 1, 1, 2], [0, 1, 0, 1, 0])]
+    >>> print([HAND_NAMES[x] for x in get_hand_category(evaluate_hands(hands))])
+    ['straight flush', 'two pair']
+
+    """
+    hands = np.asarray(hands, dtype=np.uint8)
+    if hands.ndim == 1:
+        return evaluate_hands(hands[np.newaxis, :])[0]
+    num_cards = hands.shape[1]
+    if not 5 <= num_cards <= 7:
+        raise ValueError(f"Hands must have 5 to 7 cards, not {num_cards}.")
+    (ranks, suits) = decode_cards(hands)
+    ((keys, values), flush) = _get_tables(num_cards)
+    # hands without a flush, from the rank counts
+    out = values[np.searchsorted(keys, _RANK_KEYS[ranks].sum(axis=1))]
+    # flushes, from the ranks in each suit
+    bits = np.left_shift(1, ranks, dtype=np.int32)
+    masks = np.stack([np.where(suits == suit, bits, 0).sum(axis=1) for suit in range(NUM_SUITS)], axis=1)
+    return np.maximum(out, flush[masks].max(axis=1))
+
+
+# %% Functions - get_hand_category
+def get_hand_category(values):
+    r"""
+    Gets the hand category from the hand values, as an index into HAND_NAMES.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.cards import get_hand_category, HAND_NAMES
+    >>> print(HAND_NAMES[get_hand_category(8 << 20)])
+    straight flush
+
+    """
+    return np.asarray(values) >> _CATEGORY_SHIFT
 
 
 # %% Classes - WarGame
@@ -9,11 +9,18 @@
 
 # %% Imports
 # fmt: off
+from .bitboard  import bits_to_board, bits_to_mask, board_to_bits, canonical_bits, canonical_key, find_winning_moves, has_win, \
+                       iter_moves, rotate_bits, transform_bits, transform_move, win_bits, BIT_COL, BIT_ROW, CELL_BITS, \
+                       CELL_WINS, FULL_BOARD, QUAD_LINES, ROT_TABLE, ROTATIONS, SYM_INVERSE, SYM_QUAD, SYM_TABLE, WIN_MASKS
+from .book      import book_key, build_opening_book, load_opening_book, opening_positions, OpeningBook, BOOK_DTYPE, \
+                       BOOK_FILENAME
 from .classes   import GameStats, Move, State # TODO: update these
-from .constants import COLOR, INT_TOKEN, PLAYER, ONE_OFF, OPTIONS, SIZES, WIN
+from .constants import COLOR, INT_TOKEN, PLAYER, ONE_OFF, OPTIONS, SIZES, SNAPSHOT_INTERVAL, WIN
 from .gui       import PentagoGui, RotationButton
 from .plotting  import plot_board, plot_cur_move, plot_piece, plot_possible_win, plot_win
-from .utils     import calc_cur_move, check_for_win, create_board_from_moves, find_moves, get_root_dir, rotate_board
+from .search    import evaluate, find_best_move, Searcher, TranspositionTable, zobrist_hash, WIN_SCORE
+from .utils     import apply_move, calc_cur_move, calc_line_counts, check_for_win, check_line_counts, create_board_from_moves, \
+                       find_moves, get_root_dir, rotate_board, undo_move
 # fmt: on
 
 # %% Unit Test
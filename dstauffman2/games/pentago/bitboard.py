@@ -0,0 +1,519 @@
+r"""
+Bitboard module file for the "pentago" game.  It defines an integer based board representation.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  Each position is held as two 36-bit ints, one for the white pieces and one for the black pieces.
+    The bits are ordered by quadrant, so that bits 0-8 are quadrant 1, bits 9-17 are quadrant 2 and
+    so on, with each quadrant stored row-wise.  This keeps every quadrant as a contiguous 9-bit
+    field, so that rotations become a shift, a mask and a table lookup.
+
+"""
+
+# %% Imports
+import doctest
+import unittest
+
+import numpy as np
+
+from dstauffman2.games.pentago.constants import PLAYER, SIZES, WIN
+
+# %% Constants
+# number of bits in a single quadrant and the mask to pull them out
+QUAD_BITS = 9
+QUAD_MASK = (1 << QUAD_BITS) - 1
+
+# mask for every square on the board
+FULL_BOARD = (1 << (SIZES["board"] * SIZES["board"])) - 1
+
+# bit number for each (row, column) square on the board
+CELL_BITS = np.array(
+    [[9 * (2 * (r // 3) + c // 3) + 3 * (r % 3) + (c % 3) for c in range(SIZES["board"])] for r in range(SIZES["board"])],
+    dtype=int,
+)
+
+# row and column for each bit number
+BIT_ROW = tuple(int(np.flatnonzero(CELL_BITS.ravel() == bit)[0]) // SIZES["board"] for bit in range(FULL_BOARD.bit_length()))
+BIT_COL = tuple(int(np.flatnonzero(CELL_BITS.ravel() == bit)[0]) % SIZES["board"] for bit in range(FULL_BOARD.bit_length()))
+
+# all the quadrant and direction combinations for a rotation
+ROTATIONS = ((1, -1), (2, -1), (3, -1), (4, -1), (1, 1), (2, 1), (3, 1), (4, 1))
+
+
+# %% _build_rotation_table
+def _build_rotation_table(direction):
+    r"""Builds the lookup table of rotated 9-bit quadrant contents for the given direction."""
+    # local index that ends up in each local position after the rotation
+    if direction == -1:
+        source = [3 * j + (2 - i) for i in range(3) for j in range(3)]
+    elif direction == 1:
+        source = [3 * (2 - j) + i for i in range(3) for j in range(3)]
+    else:
+        raise ValueError("Unexpected value for dir")
+    table = []
+    for contents in range(1 << QUAD_BITS):
+        table.append(sum(1 << new for (new, old) in enumerate(source) if contents & (1 << old)))
+    return tuple(table)
+
+
+# rotation lookup tables keyed by direction, then by the 9-bit quadrant contents
+ROT_TABLE = {-1: _build_rotation_table(-1), 1: _build_rotation_table(1)}
+
+# all possible winning combinations as masks
+WIN_MASKS = tuple(int(sum(1 << int(bit) for bit in CELL_BITS.ravel()[WIN[:, i]])) for i in range(WIN.shape[1]))
+
+# winning combinations that pass through each bit
+CELL_WINS = tuple(tuple(mask for mask in WIN_MASKS if mask & (1 << bit)) for bit in range(FULL_BOARD.bit_length()))
+
+# number of pieces in each winning combination for each quadrant and 9-bit quadrant contents
+QUAD_LINES = np.array(
+    [[[sum((contents >> i) & 1 for i in range(QUAD_BITS) if mask >> (QUAD_BITS * quad + i) & 1) for mask in WIN_MASKS] \
+        for contents in range(1 << QUAD_BITS)] for quad in range(4)],
+    dtype=np.int8,
+)
+
+# weights to convert a linearized board into bits
+_WEIGHTS = np.array([1 << int(bit) for bit in CELL_BITS.ravel()], dtype=np.int64)
+
+
+# %% _build_symmetry_tables
+def _build_symmetry_tables():
+    r"""Builds the per quadrant lookup tables for each of the eight symmetries of the board."""
+    size = SIZES["board"]
+    tables = []
+    quads = []
+    for symmetry in range(8):
+        # cell that ends up in each position on the board after the transform
+        index = np.arange(size * size).reshape(size, size)
+        if symmetry >= 4:
+            index = np.fliplr(index)
+        source = np.rot90(index, symmetry % 4).ravel()
+        # new bit for each old bit
+        new_bit = np.empty(size * size, dtype=int)
+        new_bit[CELL_BITS.ravel()[source]] = CELL_BITS.ravel()
+        quad_tables = []
+        for quad in range(4):
+            bits = [int(new_bit[QUAD_BITS * quad + i]) for i in range(QUAD_BITS)]
+            quad_tables.append(tuple(sum(1 << bits[i] for i in range(QUAD_BITS) if contents & (1 << i)) for contents in range(1 << QUAD_BITS)))
+        tables.append(tuple(quad_tables))
+        quads.append(tuple(1 + int(new_bit[QUAD_BITS * quad]) // QUAD_BITS for quad in range(4)))
+    return (tuple(tables), tuple(quads))
+
+
+# symmetry lookup tables keyed by symmetry, then quadrant, then the 9-bit quadrant contents, and the
+# quadrant that each quadrant moves to.  Symmetry k is np.rot90(board, k) for k < 4, and
+# np.rot90(np.fliplr(board), k - 4) for k >= 4.
+(SYM_TABLE, SYM_QUAD) = _build_symmetry_tables()
+
+# symmetry that undoes each symmetry
+SYM_INVERSE = (0, 3, 2, 1, 4, 5, 6, 7)
+
+
+# %% board_to_bits
+def board_to_bits(board):
+    r"""
+    Converts a 6x6 board to a pair of bitboards.
+
+    Parameters
+    ----------
+    board : 2D ndarray of int
+        Board position
+
+    Returns
+    -------
+    white : int
+        Bitboard of the white pieces
+    black : int
+        Bitboard of the black pieces
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import board_to_bits, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[0, 1] = PLAYER["white"]
+    >>> board[3, 3] = PLAYER["black"]
+    >>> (white, black) = board_to_bits(board)
+    >>> print(white, black)
+    2 134217728
+
+    """
+    flat = board.ravel()
+    white = int(np.dot(flat == PLAYER["white"], _WEIGHTS))
+    black = int(np.dot(flat == PLAYER["black"], _WEIGHTS))
+    return (white, black)
+
+
+# %% bits_to_board
+def bits_to_board(white, black):
+    r"""
+    Converts a pair of bitboards back into a 6x6 board.
+
+    Parameters
+    ----------
+    white : int
+        Bitboard of the white pieces
+    black : int
+        Bitboard of the black pieces
+
+    Returns
+    -------
+    board : 2D ndarray of int
+        Board position
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import bits_to_board
+    >>> board = bits_to_board(2, 134217728)
+    >>> print(board[0, 1], board[3, 3])
+    1 -1
+
+    """
+    board = np.full((SIZES["board"], SIZES["board"]), PLAYER["none"], dtype=int)
+    board[bits_to_mask(white)] = PLAYER["white"]
+    board[bits_to_mask(black)] = PLAYER["black"]
+    return board
+
+
+# %% bits_to_mask
+def bits_to_mask(bits):
+    r"""
+    Converts a bitboard into a 6x6 boolean mask.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import bits_to_mask
+    >>> mask = bits_to_mask(7)
+    >>> print(mask[0, :])
+    [ True  True  True False False False]
+
+    """
+    return (np.right_shift(bits, CELL_BITS) & 1).astype(bool)
+
+
+# %% rotate_bits
+def rotate_bits(bits, quadrant, direction):
+    r"""
+    Rotates the specified quadrant of a bitboard.
+
+    Parameters
+    ----------
+    bits : int
+        Bitboard to rotate
+    quadrant : int
+        Quadrant to rotate, from {1, 2, 3, 4}
+    direction : int
+        Direction to rotate the quadrant, from {-1=left, 1=right}
+
+    Returns
+    -------
+    int
+        Rotated bitboard
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import rotate_bits
+    >>> print(rotate_bits(0b000111000, 1, -1))
+    146
+
+    """
+    shift = QUAD_BITS * (quadrant - 1)
+    sub = (bits >> shift) & QUAD_MASK
+    return (bits & ~(QUAD_MASK << shift)) | (ROT_TABLE[direction][sub] << shift)
+
+
+# %% has_win
+def has_win(bits):
+    r"""
+    Determines whether the given bitboard has five in a row.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import board_to_bits, has_win, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[1, 0:5] = PLAYER["white"]
+    >>> (white, black) = board_to_bits(board)
+    >>> print(has_win(white), has_win(black))
+    True False
+
+    """
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+# %% win_bits
+def win_bits(bits):
+    r"""
+    Finds all the squares that are part of a five in a row within the given bitboard.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import win_bits
+    >>> print(win_bits(0b11111) == 0)
+    True
+
+    """
+    out = 0
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            out |= mask
+    return out
+
+
+# %% iter_moves
+def iter_moves(own, other):
+    r"""
+    Iterates through all the place and rotate moves for the player to move.
+
+    Parameters
+    ----------
+    own : int
+        Bitboard of the player to move
+    other : int
+        Bitboard of the opponent
+
+    Yields
+    ------
+    row : int
+        Row of the placed piece
+    column : int
+        Column of the placed piece
+    quadrant : int
+        Quadrant that is rotated
+    direction : int
+        Direction of the rotation
+    new_own : int
+        Resulting bitboard of the player that moved
+    new_other : int
+        Resulting bitboard of the opponent
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import iter_moves
+    >>> moves = list(iter_moves(0, 0))
+    >>> print(len(moves))
+    288
+
+    """
+    empty = FULL_BOARD & ~(own | other)
+    while empty:
+        low = empty & -empty
+        bit = low.bit_length() - 1
+        empty ^= low
+        placed = own | low
+        row = BIT_ROW[bit]
+        column = BIT_COL[bit]
+        for quadrant, direction in ROTATIONS:
+            yield (row, column, quadrant, direction, rotate_bits(placed, quadrant, direction), rotate_bits(other, quadrant, direction))
+
+
+# %% find_winning_moves
+def find_winning_moves(own, other):
+    r"""
+    Finds all the place and rotate moves that give the player to move five in a row.
+
+    Parameters
+    ----------
+    own : int
+        Bitboard of the player to move
+    other : int
+        Bitboard of the opponent
+
+    Returns
+    -------
+    out : list of (row, column, quadrant, direction)
+        Winning moves, which may also give the opponent five in a row
+
+    Notes
+    -----
+    #.  Since a rotation just permutes the bits, placing a piece and then rotating is the same as
+        rotating and then placing the rotated piece.  So each of the eight rotations is applied once,
+        and then any line that is missing a single piece is mapped back to the square that needs to
+        be empty before the rotation.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import board_to_bits, find_winning_moves, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[2, 0:3] = PLAYER["white"]
+    >>> board[1, 3] = PLAYER["white"]
+    >>> (white, black) = board_to_bits(board)
+    >>> print(find_winning_moves(white, black))
+    [(0, 3, 2, -1)]
+
+    """
+    empty = FULL_BOARD & ~(own | other)
+    out = []
+    for quadrant, direction in ROTATIONS:
+        rotated = rotate_bits(own, quadrant, direction)
+        cells = 0
+        for mask in WIN_MASKS:
+            missing = mask & ~rotated
+            if missing == 0:
+                # the rotation alone wins, so any placement does
+                cells = empty
+                break
+            if missing & (missing - 1) == 0:
+                cells |= rotate_bits(missing, quadrant, -direction) & empty
+        while cells:
+            low = cells & -cells
+            bit = low.bit_length() - 1
+            cells ^= low
+            out.append((BIT_ROW[bit], BIT_COL[bit], quadrant, direction))
+    return out
+
+
+# %% transform_bits
+def transform_bits(bits, symmetry):
+    r"""
+    Applies one of the eight symmetries of the board to a bitboard.
+
+    Parameters
+    ----------
+    bits : int
+        Bitboard to transform
+    symmetry : int
+        Symmetry to apply, from 0 to 7, where 0 is the identity
+
+    Returns
+    -------
+    int
+        Transformed bitboard
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import CELL_BITS, transform_bits
+    >>> bits = transform_bits(1 << int(CELL_BITS[0, 1]), 1)
+    >>> print(bits == 1 << int(CELL_BITS[4, 0]))
+    True
+
+    """
+    table = SYM_TABLE[symmetry]
+    return table[0][bits & QUAD_MASK] | table[1][(bits >> QUAD_BITS) & QUAD_MASK] | \
+        table[2][(bits >> 2 * QUAD_BITS) & QUAD_MASK] | table[3][bits >> 3 * QUAD_BITS]
+
+
+# %% transform_move
+def transform_move(row, column, quadrant, direction, symmetry):
+    r"""
+    Applies one of the eight symmetries of the board to a move.
+
+    Parameters
+    ----------
+    row : int
+        Row of the placed piece
+    column : int
+        Column of the placed piece
+    quadrant : int
+        Quadrant that is rotated
+    direction : int
+        Direction of the rotation
+    symmetry : int
+        Symmetry to apply, from 0 to 7, where 0 is the identity
+
+    Returns
+    -------
+    tuple of (row, column, quadrant, direction)
+        Transformed move
+
+    Notes
+    -----
+    #.  The reflections (symmetries 4 to 7) also reverse the direction of the rotation.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import transform_move
+    >>> print(transform_move(0, 1, 1, 1, 1))
+    (4, 0, 3, 1)
+
+    """
+    bit = transform_bits(1 << int(CELL_BITS[row, column]), symmetry).bit_length() - 1
+    return (BIT_ROW[bit], BIT_COL[bit], SYM_QUAD[symmetry][quadrant - 1], -direction if symmetry >= 4 else direction)
+
+
+# %% canonical_bits
+def canonical_bits(white, black):
+    r"""
+    Finds the canonical version of a position out of all its symmetric equivalents.
+
+    Parameters
+    ----------
+    white : int
+        Bitboard of the white pieces
+    black : int
+        Bitboard of the black pieces
+
+    Returns
+    -------
+    white : int
+        Canonical bitboard of the white pieces
+    black : int
+        Canonical bitboard of the black pieces
+    symmetry : int
+        Symmetry that transforms the given position into the canonical one
+
+    Notes
+    -----
+    #.  The canonical position is the one with the smallest key, as given by `canonical_key`.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import canonical_bits
+    >>> print(canonical_bits(0, 0))
+    (0, 0, 0)
+
+    """
+    best_key = (black << FULL_BOARD.bit_length()) | white
+    best = (white, black, 0)
+    for symmetry in range(1, 8):
+        new_white = transform_bits(white, symmetry)
+        new_black = transform_bits(black, symmetry)
+        key = (new_black << FULL_BOARD.bit_length()) | new_white
+        if key < best_key:
+            best_key = key
+            best = (new_white, new_black, symmetry)
+    return best
+
+
+# %% canonical_key
+def canonical_key(white, black):
+    r"""
+    Calculates a key for the position that is the same for all its symmetric equivalents.
+
+    Parameters
+    ----------
+    white : int
+        Bitboard of the white pieces
+    black : int
+        Bitboard of the black pieces
+
+    Returns
+    -------
+    int
+        72-bit key, with the canonical white pieces in the low 36 bits and the black pieces above
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import board_to_bits, canonical_key, PLAYER
+    >>> import numpy as np
+    >>> board1 = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board1[0, 1] = PLAYER["white"]
+    >>> board2 = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board2[4, 5] = PLAYER["white"]
+    >>> print(canonical_key(*board_to_bits(board1)) == canonical_key(*board_to_bits(board2)))
+    True
+
+    """
+    (new_white, new_black, _) = canonical_bits(white, black)
+    return (new_black << FULL_BOARD.bit_length()) | new_white
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.pentago.tests.test_bitboard", exit=False)
+    doctest.testmod(verbose=False)
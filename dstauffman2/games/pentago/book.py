@@ -0,0 +1,297 @@
+r"""
+Book module file for the "pentago" game.  It defines the opening book for the alpha-beta AI.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  The book is built offline by running deep searches over every distinct opening position in a
+    process pool.  Positions are stored from the point of view of the player to move, in their
+    canonical orientation, so that all eight symmetric equivalents share one entry.
+#.  Each position is packed into a single 64 bit key by writing the board in base 3, and the book is
+    saved as a sorted array of keys, moves and scores that is memory-mapped and binary searched.
+
+"""
+
+# %% Imports
+from concurrent.futures import ProcessPoolExecutor
+import doctest
+import os
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2 import get_output_dir
+from dstauffman2.games.pentago.bitboard import (
+    bits_to_board,
+    board_to_bits,
+    canonical_bits,
+    FULL_BOARD,
+    has_win,
+    iter_moves,
+    QUAD_BITS,
+    QUAD_MASK,
+    SYM_INVERSE,
+    transform_move,
+)
+from dstauffman2.games.pentago.classes import Move
+from dstauffman2.games.pentago.constants import PLAYER, SIZES
+from dstauffman2.games.pentago.search import Searcher
+
+# %% Constants
+# record for each position in the opening book
+BOOK_DTYPE = np.dtype([("key", "<u8"), ("move", "<u2"), ("value", "<i4")])
+
+# default file name for the opening book in the output folder
+BOOK_FILENAME = "pentago_book.npy"
+
+# base 3 value of each of the 9-bit quadrant contents, and the place value of each quadrant
+_TERNARY    = tuple(sum(3**i for i in range(QUAD_BITS) if (contents >> i) & 1) for contents in range(1 << QUAD_BITS))
+_QUAD_SCALE = tuple(3 ** (QUAD_BITS * quad) for quad in range(4))
+
+
+# %% _ternary
+def _ternary(bits):
+    r"""Converts a bitboard into the base 3 number with a one for each piece."""
+    return sum(_TERNARY[(bits >> (QUAD_BITS * quad)) & QUAD_MASK] * scale for (quad, scale) in enumerate(_QUAD_SCALE))
+
+
+# %% _encode_move
+def _encode_move(row, column, quadrant, direction):
+    r"""Packs a move into 16 bits, as the square in the low six bits, then the quadrant and then the direction."""
+    return (SIZES["board"] * row + column) | ((quadrant - 1) << 6) | (int(direction == 1) << 8)
+
+
+# %% _decode_move
+def _decode_move(code):
+    r"""Unpacks a move from the 16 bit code made by `_encode_move`."""
+    (row, column) = divmod(code & 63, SIZES["board"])
+    return (row, column, ((code >> 6) & 3) + 1, 1 if code >> 8 else -1)
+
+
+# %% book_key
+def book_key(own, other):
+    r"""
+    Calculates the opening book key for a position.
+
+    Parameters
+    ----------
+    own : int
+        Bitboard of the player to move
+    other : int
+        Bitboard of the opponent
+
+    Returns
+    -------
+    key : int
+        Base 3 key of the canonical position, which fits in 64 bits
+    symmetry : int
+        Symmetry that transforms the given position into the canonical one
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago.book import book_key
+    >>> print(book_key(0, 0))
+    (0, 0)
+
+    >>> print(book_key(1 << 35, 0)[0] == book_key(1, 0)[0])
+    True
+
+    """
+    (new_own, new_other, symmetry) = canonical_bits(own, other)
+    return (_ternary(new_own) + 2 * _ternary(new_other), symmetry)
+
+
+# %% opening_positions
+def opening_positions(max_ply):
+    r"""
+    Finds all the distinct positions that can be reached in the opening.
+
+    Parameters
+    ----------
+    max_ply : int
+        Number of plies in the opening, where the positions before each of them are included
+
+    Returns
+    -------
+    list of (int, int)
+        Canonical (own, other) bitboards, from the point of view of the player to move, that aren't
+        already finished
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago.book import opening_positions
+    >>> print(len(opening_positions(1)), len(opening_positions(2)))
+    1 7
+
+    """
+    positions = []
+    level = {(0, 0)}
+    for ply in range(max_ply):
+        positions.extend(sorted(level))
+        if ply == max_ply - 1:
+            break
+        next_level = set()
+        for own, other in level:
+            for *_, new_own, new_other in iter_moves(own, other):
+                if has_win(new_own) or has_win(new_other) or new_own | new_other == FULL_BOARD:
+                    continue
+                # the opponent is the player to move next
+                next_level.add(canonical_bits(new_other, new_own)[0:2])
+        level = next_level
+    return positions
+
+
+# %% _search_position
+def _search_position(task):
+    r"""Searches a single position for the opening book, for use by the process pool."""
+    (own, other, max_depth, time_budget) = task
+    searcher = Searcher(max_depth=max_depth, time_budget=time_budget)
+    move = searcher.search(bits_to_board(own, other), PLAYER["white"])
+    return (book_key(own, other)[0], _encode_move(move.row, move.column, move.quadrant, move.direction), move.power)
+
+
+# %% build_opening_book
+def build_opening_book(filename, max_ply=2, max_depth=4, time_budget=None, num_workers=None, chunk_size=4):
+    r"""
+    Builds the opening book by searching every distinct opening position.
+
+    Parameters
+    ----------
+    filename : str
+        File to save the book to, normally with a .npy extension
+    max_ply : int, optional
+        Number of plies in the opening to cover
+    max_depth : int, optional
+        Search depth in plies for each position
+    time_budget : float, optional
+        Time budget in seconds for each position, None for no limit
+    num_workers : int, optional
+        Number of processes to use, defaults to the number of CPUs
+    chunk_size : int, optional
+        Number of positions to send to each process at a time
+
+    Returns
+    -------
+    book : ndarray of BOOK_DTYPE
+        Book entries, sorted by key
+
+    Notes
+    -----
+    #.  The number of positions grows very quickly, so this is meant to be run offline, with the
+        result saved to the output folder where `load_opening_book` finds it.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago.book import build_opening_book
+    >>> import os
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as folder:
+    ...     book = build_opening_book(os.path.join(folder, "book.npy"), max_ply=1, max_depth=1, num_workers=1)
+    >>> print(len(book))
+    1
+
+    """
+    positions = opening_positions(max_ply)
+    tasks = [(own, other, max_depth, time_budget) for (own, other) in positions]
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers <= 1:
+        results = [_search_position(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as pool:
+            results = list(pool.map(_search_position, tasks, chunksize=chunk_size))
+    book = np.array(results, dtype=BOOK_DTYPE)
+    book.sort(order="key")
+    np.save(filename, book)
+    return book
+
+
+# %% Classes - OpeningBook
+class OpeningBook(Frozen):
+    r"""
+    Memory-mapped opening book.
+
+    Parameters
+    ----------
+    filename : str
+        File with the book from `build_opening_book`
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago.book import build_opening_book, OpeningBook
+    >>> from dstauffman2.games.pentago import PLAYER
+    >>> import numpy as np
+    >>> import os
+    >>> import tempfile
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> with tempfile.TemporaryDirectory() as folder:
+    ...     filename = os.path.join(folder, "book.npy")
+    ...     _ = build_opening_book(filename, max_ply=1, max_depth=1, num_workers=1)
+    ...     book = OpeningBook(filename)
+    ...     move = book.lookup(board, PLAYER["black"])
+    ...     del book
+    >>> print(move is not None)
+    True
+
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._book    = np.load(filename, mmap_mode="r")
+        self._keys    = self._book["key"]
+
+    def __len__(self):
+        return len(self._book)
+
+    def lookup_bits(self, own, other):
+        r"""Finds the book move for the given bitboards, from the point of view of the player to move, or None."""
+        (key, symmetry) = book_key(own, other)
+        ix = int(np.searchsorted(self._keys, key))
+        if ix == len(self._keys) or self._keys[ix] != key:
+            return None
+        entry = self._book[ix]
+        # the stored move is for the canonical orientation, so transform it back
+        move = transform_move(*_decode_move(int(entry["move"])), SYM_INVERSE[symmetry])
+        return Move(*move, power=int(entry["value"]))
+
+    def lookup(self, board, player):
+        r"""Finds the book move for the given board and player to move, or None if it isn't in the book."""
+        (white, black) = board_to_bits(board)
+        return self.lookup_bits(white, black) if player == PLAYER["white"] else self.lookup_bits(black, white)
+
+
+# %% load_opening_book
+def load_opening_book(filename=None):
+    r"""
+    Loads the opening book if it exists.
+
+    Parameters
+    ----------
+    filename : str, optional
+        File with the book, defaults to BOOK_FILENAME in the output folder
+
+    Returns
+    -------
+    class OpeningBook or None
+        Opening book, or None if the file doesn't exist
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago.book import load_opening_book
+    >>> print(load_opening_book("does_not_exist.npy"))
+    None
+
+    """
+    if filename is None:
+        filename = os.path.join(get_output_dir(), BOOK_FILENAME)
+    if not os.path.isfile(filename):
+        return None
+    return OpeningBook(filename)
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.pentago.tests.test_book", exit=False)
+    doctest.testmod(verbose=False)
@@ -10,13 +10,24 @@
 # %% Imports
 import doctest
 import pickle
+import struct
 import unittest
 
 import numpy as np
 
 from dstauffman import Frozen
 
-from dstauffman2.games.pentago.constants import PLAYER, SIZES
+from dstauffman2.games.pentago.bitboard import bits_to_board, CELL_BITS, rotate_bits
+from dstauffman2.games.pentago.constants import PLAYER, SIZES, SNAPSHOT_INTERVAL, WIN
+
+# %% Constants
+# header of the binary game history files, as the file signature, format version and number of games
+_FILE_MAGIC   = b"PNTG"
+_FILE_VERSION = 1
+_FILE_HEADER  = struct.Struct("<4sBI")
+
+# record for each game in the binary game history files
+_GAME_DTYPE = np.dtype([("number", "<u4"), ("first_move", "i1"), ("winner", "i1"), ("num_moves", "<u2")])
 
 
 # %% Classes - State
@@ -29,6 +40,7 @@ def __init__(self):
         self.cur_game    = np.array(0, dtype=int)
         self.move_status = {"ok": False, "pos": None, "patch_object": None}
         self.game_hist   = [GameStats(number=self.cur_game, first_move=PLAYER["white"])]
+        self.line_counts = np.zeros((2, WIN.shape[1]), dtype=np.int8)
 
 
 # %% Classes - Move
@@ -115,6 +127,8 @@ def __init__(self, number, first_move, winner=PLAYER["none"], move_list=None):
             self.move_list = []
         else:
             self.move_list = move_list
+        # (white, black) bitboards after every SNAPSHOT_INTERVAL moves, built as needed
+        self._snapshots = [(0, 0)]
 
     def add_move(self, move):
         r"""Adds the given move to the game move history."""
@@ -125,8 +139,66 @@ def remove_moves(self, cur_move=None):
         r"""Removes the moves from the current move number to the end of the list."""
         if cur_move is None:
             self.move_list.pop()
+            cur_move = len(self.move_list)
         else:
             del self.move_list[cur_move:]
+        # drop the snapshots that could depend on the removed moves, including one taken right at the
+        # cut, since callers may have replaced the move before it
+        del self._snapshots[max((cur_move - 1) // SNAPSHOT_INTERVAL + 1, 1):]
+
+    def _replay(self, bits, start, num_moves):
+        r"""Replays the given number of moves from the start move onto a pair of bitboards."""
+        (white, black) = bits
+        for ix in range(start, start + num_moves):
+            move = self.move_list[ix]
+            bit = 1 << int(CELL_BITS[move.row, move.column])
+            assert not (white | black) & bit, "Invalid move encountered."
+            if (ix % 2 == 0) == (self.first_move == PLAYER["white"]):
+                white |= bit
+            else:
+                black |= bit
+            white = rotate_bits(white, move.quadrant, move.direction)
+            black = rotate_bits(black, move.quadrant, move.direction)
+        return (white, black)
+
+    def board_at(self, move_number=None):
+        r"""
+        Gets the board after the given number of moves.
+
+        Parameters
+        ----------
+        move_number : int, optional
+            Number of moves to play, defaults to all of them
+
+        Returns
+        -------
+        board : 2D ndarray of int
+            Board position
+
+        Notes
+        -----
+        #.  Snapshots of the board are kept as bitboards every SNAPSHOT_INTERVAL moves, so any move
+            can be reached by replaying at most SNAPSHOT_INTERVAL - 1 moves onto the nearest one.
+
+        Examples
+        --------
+        >>> from dstauffman2.games.pentago import GameStats, Move, PLAYER
+        >>> game = GameStats(number=0, first_move=PLAYER["white"])
+        >>> game.add_move(Move(0, 0, 1, 1))
+        >>> game.add_move(Move(5, 5, 4, -1))
+        >>> board = game.board_at(1)
+        >>> print(board[0, 2] == PLAYER["white"], game.board_at()[3, 5] == PLAYER["black"])
+        True True
+
+        """
+        if move_number is None:
+            move_number = self.num_moves
+        assert 0 <= move_number <= self.num_moves, "Move number must be within the game."
+        (index, extra) = divmod(int(move_number), SNAPSHOT_INTERVAL)
+        while len(self._snapshots) <= index:
+            last = len(self._snapshots) - 1
+            self._snapshots.append(self._replay(self._snapshots[last], last * SNAPSHOT_INTERVAL, SNAPSHOT_INTERVAL))
+        return bits_to_board(*self._replay(self._snapshots[index], index * SNAPSHOT_INTERVAL, extra))
 
     @property
     def num_moves(self):
@@ -140,15 +212,47 @@ def get_results(game_hist):
 
     @staticmethod
     def save(filename, game_hist):
-        r"""Saves a list of GameStats objects to disk."""
+        r"""
+        Saves a list of GameStats objects to disk.
+
+        Notes
+        -----
+        #.  The file is a small header, followed by a record for each game, followed by all the moves
+            packed into two bytes each as the square in the low six bits, the quadrant in the next
+            two and the direction in the ninth.
+
+        """
+        games = np.array([(game.number, game.first_move, game.winner, game.num_moves) for game in game_hist], dtype=_GAME_DTYPE)
+        moves = np.array(
+            [(6 * m.row + m.column) | ((m.quadrant - 1) << 6) | ((m.direction == 1) << 8) for game in game_hist for m in game.move_list],
+            dtype="<u2",
+        )
         with open(filename, "wb") as file:
-            pickle.dump(game_hist, file)
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, len(game_hist)))
+            file.write(games.tobytes())
+            file.write(moves.tobytes())
 
     @staticmethod
     def load(filename):
-        r"""Loads a list of GameStats objects to disk."""
+        r"""Loads a list of GameStats objects from disk, including older pickled files."""
         with open(filename, "rb") as file:
-            game_hist = pickle.load(file)
+            data = file.read()
+        if not data.startswith(_FILE_MAGIC):
+            # older histories were pickled lists of GameStats, so rebuild them to get the snapshots
+            old_hist = pickle.loads(data)
+            return [GameStats(x.number, x.first_move, winner=x.winner, move_list=x.move_list) for x in old_hist]
+        (_, version, num_games) = _FILE_HEADER.unpack_from(data)
+        if version != _FILE_VERSION:
+            raise ValueError(f"Unexpected game history file version: {version}")
+        games = np.frombuffer(data, dtype=_GAME_DTYPE, count=num_games, offset=_FILE_HEADER.size)
+        moves = np.frombuffer(data, dtype="<u2", offset=_FILE_HEADER.size + games.nbytes).tolist()
+        game_hist = []
+        start = 0
+        for game in games:
+            codes = moves[start : start + game["num_moves"]]
+            start += game["num_moves"]
+            move_list = [Move((c & 63) // 6, (c & 63) % 6, ((c >> 6) & 3) + 1, 1 if c >> 8 else -1) for c in codes]
+            game_hist.append(GameStats(int(game["number"]), int(game["first_move"]), winner=int(game["winner"]), move_list=move_list))
         return game_hist
 
 
@@ -48,13 +48,20 @@
 SIZES["button"] = 71  # number of pixels on rotation buttons
 
 # Gameplay options
-OPTIONS: dict[str, str | bool] = {}
+OPTIONS: dict[str, str | bool | int | float] = {}
 OPTIONS["load_previous_game"] = "Ask" # from ["Yes","No","Ask"]
 OPTIONS["plot_winning_moves"] = True
+OPTIONS["white_is_computer"]  = False
+OPTIONS["black_is_computer"]  = False
+OPTIONS["search_depth"]       = 4  # maximum search depth in plies for the computer player
+OPTIONS["search_time"]        = 2.0  # time budget in seconds per computer move
 
 # Token value for invalid board positions and such
 INT_TOKEN = -101
 
+# number of moves between the board snapshots kept in each game history
+SNAPSHOT_INTERVAL = 8
+
 # all possible winning combinations
 WIN = np.array([\
     [1,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],\
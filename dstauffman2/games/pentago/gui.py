@@ -22,10 +22,19 @@
 import numpy as np
 
 from dstauffman2 import get_images_dir, get_output_dir
+from dstauffman2.games.pentago.book import load_opening_book
 from dstauffman2.games.pentago.classes import GameStats, Move, State
 from dstauffman2.games.pentago.constants import COLOR, OPTIONS, PLAYER, SIZES
 from dstauffman2.games.pentago.plotting import plot_board, plot_cur_move, plot_piece, plot_possible_win, plot_win
-from dstauffman2.games.pentago.utils import calc_cur_move, check_for_win, create_board_from_moves, find_moves, rotate_board
+from dstauffman2.games.pentago.search import Searcher
+from dstauffman2.games.pentago.utils import (
+    apply_move,
+    calc_cur_move,
+    calc_line_counts,
+    check_line_counts,
+    find_moves,
+    undo_move,
+)
 
 # TODO: add boxes for flipping settings
 
@@ -72,6 +81,12 @@ def __init__(self, filename=None, **kwargs) -> None:
         super().__init__(**kwargs)
         # initialize the state data
         self.initialize_state(filename=filename)
+        # create the computer player
+        self.searcher = Searcher(
+            max_depth=OPTIONS["search_depth"], time_budget=OPTIONS["search_time"], book=load_opening_book()
+        )
+        # whether a computer move is already queued to run on the event loop
+        self.ai_pending = False
         # load the image data
         self.load_images()
         # call init method to instantiate the GUI
@@ -106,8 +121,8 @@ def initialize_state(self, filename) -> None:
                 self.state.game_hist   = GameStats.load(filename)
                 self.state.cur_game    = np.array(len(self.state.game_hist)-1, dtype=int)
                 self.state.cur_move    = np.array(len(self.state.game_hist[-1].move_list), dtype=int)
-                self.state.board       = create_board_from_moves(self.state.game_hist[-1].move_list, \
-                    self.state.game_hist[-1].first_move)
+                self.state.board       = self.state.game_hist[-1].board_at()
+                self.state.line_counts = calc_line_counts(self.state.board)
                 self.state.move_status = {"ok": False, "pos": None, "patch_object": None}
             else:
                 raise ValueError(f'Could not find file: "{filename}"')  # pragma: no cover
@@ -288,6 +303,7 @@ def init(self) -> None:
         # %% Finalization
         # Call wrapper to initialize GUI
         self.wrapper()
+        self.schedule_ai_move()
 
         # GUI final layout properties
         self.resize(1000, 700)
@@ -380,10 +396,8 @@ def btn_undo_function(self) -> None:
         # get last move
         last_move = self.state.game_hist[self.state.cur_game].move_list[self.state.cur_move - 1]
         logger.debug(f"Undoing move = {last_move}")
-        # undo rotation
-        rotate_board(self.state.board, last_move.quadrant, -last_move.direction)
-        # delete piece
-        self.state.board[last_move.row, last_move.column] = PLAYER["none"]
+        # undo rotation and delete piece
+        undo_move(self.state.board, self.state.line_counts, last_move)
         # update current move
         self.state.cur_move -= 1
         # call GUI wrapper
@@ -399,18 +413,18 @@ def btn_new_function(self) -> None:
         self.state.cur_move = np.array(0, dtype=int)
         self.state.game_hist.append(GameStats(number=self.state.cur_game, first_move=next_lead, winner=PLAYER["none"]))
         self.state.board = np.full((SIZES["board"], SIZES["board"]), PLAYER["none"], dtype=int)
+        self.state.line_counts = calc_line_counts(self.state.board)
         # call GUI wrapper
         self.wrapper()
+        self.schedule_ai_move()
 
     def btn_redo_function(self) -> None:
         r"""Function that executes on redo button press."""
         # get next move
         redo_move = self.state.game_hist[self.state.cur_game].move_list[self.state.cur_move]
         logger.debug(f"Redoing move = {redo_move}")
-        # place piece
-        self.state.board[redo_move.row, redo_move.column] = calc_cur_move(self.state.cur_move, self.state.cur_game)
-        # redo rotation
-        rotate_board(self.state.board, redo_move.quadrant, redo_move.direction)
+        # place piece and redo rotation
+        apply_move(self.state.board, self.state.line_counts, redo_move, calc_cur_move(self.state.cur_move, self.state.cur_game))
         # update current move
         self.state.cur_move += 1
         # call GUI wrapper
@@ -424,6 +438,7 @@ def btn_rot_function(self) -> None:
         self.execute_move(quadrant=button.quadrant, direction=button.direction)
         # call GUI wrapper
         self.wrapper()
+        self.schedule_ai_move()
 
     # %% Menu action callbacks
     pass  # TODO: write this
@@ -481,18 +496,15 @@ def execute_move(self, *, quadrant, direction) -> None:
         if self.state.move_status["ok"]:
             logger.debug("Rotating Quadrant {} in Direction {}.".format(quadrant, direction))
             # delete gray piece
-            self.state.move_status["patch_object"].remove()
-            self.state.move_status["patch_object"] = None
-            # add new piece to board
-            self.state.board[self.state.move_status["pos"][0], self.state.move_status["pos"][1]] = calc_cur_move(
-                self.state.cur_move, self.state.cur_game
-            )
-            # rotate board
-            rotate_board(self.state.board, quadrant, direction)
+            if self.state.move_status["patch_object"] is not None:
+                self.state.move_status["patch_object"].remove()
+                self.state.move_status["patch_object"] = None
+            # add new piece to board and rotate board
+            this_move = Move(self.state.move_status["pos"][0], self.state.move_status["pos"][1], quadrant, direction)
+            apply_move(self.state.board, self.state.line_counts, this_move, calc_cur_move(self.state.cur_move, self.state.cur_game))
             # increment move list
             assert self.state.game_hist[self.state.cur_game].num_moves >= self.state.cur_move, \
                 "Number of moves = {}, Current Move = {}".format(self.state.game_hist[self.state.cur_game].num_moves, self.state.cur_move)
-            this_move = Move(self.state.move_status["pos"][0], self.state.move_status["pos"][1], quadrant, direction)
             if self.state.game_hist[self.state.cur_game].num_moves == self.state.cur_move:
                 self.state.game_hist[self.state.cur_game].add_move(this_move)
             else:
@@ -506,6 +518,61 @@ def execute_move(self, *, quadrant, direction) -> None:
         else:
             logger.debug("No move to execute.")
 
+    # %% schedule_ai_move
+    def schedule_ai_move(self) -> None:
+        r"""
+        Queues a move for the computer player, if it plays next and no move is already queued.
+
+        Notes
+        -----
+        #.  This is only called after a new game or a move, and not after an undo or redo, so that
+            stepping back through a game against the computer doesn't immediately replay its move.
+
+        """
+        if self.ai_pending or self.state.game_hist[self.state.cur_game].winner != PLAYER["none"] or not self.is_computer_turn():
+            return
+        self.ai_pending = True
+        # let the GUI redraw before starting the search
+        QtCore.QTimer.singleShot(0, self.execute_ai_move)
+
+    # %% execute_ai_move
+    def execute_ai_move(self) -> None:
+        r"""
+        Finds and executes the move for the computer player.
+
+        Notes
+        -----
+        #.  The search runs on the GUI thread, so the GUI doesn't respond to input until it finishes,
+            which is limited to OPTIONS["search_time"] seconds by the searcher's time budget.
+
+        """
+        self.ai_pending = False
+        # the game may have changed since the move was queued
+        if self.state.game_hist[self.state.cur_game].winner != PLAYER["none"] or not self.is_computer_turn():
+            return
+        player = calc_cur_move(self.state.cur_move, self.state.cur_game)
+        move = self.searcher.search(self.state.board, player)
+        logger.debug(
+            "Computer found {} at depth {} in {:.2f} seconds with {} nodes.".format(
+                move, self.searcher.depth, self.searcher.elapsed, self.searcher.nodes
+            )
+        )
+        self.state.move_status["ok"] = True
+        self.state.move_status["pos"] = (move.row, move.column)
+        self.execute_move(quadrant=move.quadrant, direction=move.direction)
+        self.wrapper()
+        self.schedule_ai_move()
+
+    # %% is_computer_turn
+    def is_computer_turn(self) -> bool:
+        r"""Determines whether the computer is set to play the next move."""
+        player = calc_cur_move(self.state.cur_move, self.state.cur_game)
+        if player == PLAYER["white"]:
+            return bool(OPTIONS["white_is_computer"])
+        if player == PLAYER["black"]:
+            return bool(OPTIONS["black_is_computer"])
+        return False
+
     # %% wrapper
     def wrapper(self) -> None:
         r"""Acts as a wrapper to everything the GUI needs to do."""
@@ -524,7 +591,7 @@ def wrapper(self) -> None:
         plot_board(self.board_axes, self.state.board)
 
         # check for win
-        (winner, win_mask) = check_for_win(self.state.board)
+        (winner, win_mask) = check_line_counts(self.state.board, self.state.line_counts)
         # update winner
         self.state.game_hist[self.state.cur_game].winner = winner
 
@@ -0,0 +1,502 @@
+r"""
+Search module file for the "pentago" game.  It defines the alpha-beta AI.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  The search is a negamax alpha-beta with iterative deepening that works on the bitboards from the
+    `bitboard` module, with a bounded, Zobrist hashed transposition table and a time budget per move.
+#.  The transposition table is keyed on the canonical version of each position, so that all eight
+    symmetric equivalents share the same entry.
+
+"""
+
+# %% Imports
+import doctest
+import time
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2.games.pentago.bitboard import (
+    BIT_COL,
+    BIT_ROW,
+    board_to_bits,
+    canonical_bits,
+    CELL_BITS,
+    find_winning_moves,
+    FULL_BOARD,
+    has_win,
+    QUAD_BITS,
+    QUAD_MASK,
+    rotate_bits,
+    ROTATIONS,
+    SYM_INVERSE,
+    transform_move,
+    WIN_MASKS,
+)
+from dstauffman2.games.pentago.classes import Move
+from dstauffman2.games.pentago.constants import PLAYER
+from dstauffman2.games.pentago.utils import find_moves
+
+# %% Constants
+# score for a win, reduced by the number of plies it takes to get there
+WIN_SCORE = 100000
+
+# scores above this threshold are wins (or losses) found by the search instead of by the heuristic
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+# heuristic value of a line that is only blocked by the opponent, by number of pieces in the line
+LINE_WEIGHTS = (0, 1, 4, 16, 64, WIN_SCORE)
+
+# transposition table flags
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+# %% _build_zobrist_tables
+def _build_zobrist_tables(seed=1234):
+    r"""Builds the Zobrist keys, pre-combined into one table per quadrant and color of 9-bit contents."""
+    prng = np.random.default_rng(seed)
+    keys = prng.integers(0, 2**63, size=(2, CELL_BITS.size), dtype=np.int64)
+    tables = []
+    for color in range(2):
+        color_tables = []
+        for quad in range(4):
+            table = [0] * (1 << QUAD_BITS)
+            for contents in range(1, 1 << QUAD_BITS):
+                low = contents & -contents
+                table[contents] = table[contents ^ low] ^ int(keys[color, QUAD_BITS * quad + low.bit_length() - 1])
+            color_tables.append(tuple(table))
+        tables.append(tuple(color_tables))
+    side = int(prng.integers(0, 2**63, dtype=np.int64))
+    return (tables[0], tables[1], side)
+
+
+# Zobrist keys for the white pieces, the black pieces and for black to move
+(ZOBRIST_WHITE, ZOBRIST_BLACK, ZOBRIST_SIDE) = _build_zobrist_tables()
+
+
+# %% zobrist_hash
+def zobrist_hash(white, black, player):
+    r"""
+    Calculates the Zobrist hash of a position.
+
+    Parameters
+    ----------
+    white : int
+        Bitboard of the white pieces
+    black : int
+        Bitboard of the black pieces
+    player : int
+        Player to move
+
+    Returns
+    -------
+    key : int
+        64-bit hash of the position
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import zobrist_hash, PLAYER
+    >>> print(zobrist_hash(0, 0, PLAYER["white"]))
+    0
+
+    >>> print(zobrist_hash(1, 0, PLAYER["white"]) != zobrist_hash(0, 1, PLAYER["white"]))
+    True
+
+    """
+    key = ZOBRIST_SIDE if player == PLAYER["black"] else 0
+    for quad in range(4):
+        shift = QUAD_BITS * quad
+        key ^= ZOBRIST_WHITE[quad][(white >> shift) & QUAD_MASK] ^ ZOBRIST_BLACK[quad][(black >> shift) & QUAD_MASK]
+    return key
+
+
+# %% evaluate
+def evaluate(own, other):
+    r"""
+    Heuristic evaluation of a position from the point of view of the player with the `own` pieces.
+
+    Notes
+    -----
+    #.  Each line that is still open for a player is worth more the more pieces they already have in it.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import evaluate
+    >>> print(evaluate(0, 0))
+    0
+
+    >>> print(evaluate(1, 0) > 0)
+    True
+
+    """
+    score = 0
+    for mask in WIN_MASKS:
+        if mask & other == 0:
+            score += LINE_WEIGHTS[(mask & own).bit_count()]
+        elif mask & own == 0:
+            score -= LINE_WEIGHTS[(mask & other).bit_count()]
+    return score
+
+
+# %% Classes - _SearchTimeout
+class _SearchTimeout(Exception):
+    r"""Raised internally to unwind the search when the time budget runs out."""
+
+
+# %% Classes - TranspositionTable
+class TranspositionTable(Frozen):
+    r"""
+    Fixed size transposition table.
+
+    Parameters
+    ----------
+    size : int, optional
+        Number of slots, rounded up to a power of two
+
+    Notes
+    -----
+    #.  Each slot keeps a single entry.  A new entry replaces the old one if it is for the same
+        position, the old one is from a previous search, or the new one was searched at least as deep.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import TranspositionTable
+    >>> table = TranspositionTable(size=1024)
+    >>> table.store(12345, 2, 10, 0, (0, 0, 1, 1))
+    >>> print(table.probe(12345))
+    (2, 10, 0, (0, 0, 1, 1))
+
+    """
+
+    def __init__(self, size=2**20):
+        self.size       = 1 << max(int(size) - 1, 0).bit_length()
+        self.generation = 0
+        self._mask      = self.size - 1
+        self._entries   = [None] * self.size
+
+    def __len__(self):
+        return sum(1 for entry in self._entries if entry is not None)
+
+    def clear(self):
+        r"""Removes all the entries from the table."""
+        self._entries = [None] * self.size
+
+    def new_search(self):
+        r"""Marks the start of a new search, so that older entries get replaced first."""
+        self.generation += 1
+
+    def probe(self, key):
+        r"""Finds the (depth, value, flag, move) entry for the given key, or None if it isn't stored."""
+        entry = self._entries[key & self._mask]
+        if entry is None or entry[0] != key:
+            return None
+        return entry[1:5]
+
+    def store(self, key, depth, value, flag, move):
+        r"""Stores the given search result, subject to the replacement policy."""
+        ix = key & self._mask
+        entry = self._entries[ix]
+        if entry is None or entry[0] == key or entry[5] != self.generation or depth >= entry[1]:
+            self._entries[ix] = (key, depth, value, flag, move, self.generation)
+
+
+# %% Classes - Searcher
+class Searcher(Frozen):
+    r"""
+    Negamax alpha-beta searcher with iterative deepening.
+
+    Parameters
+    ----------
+    max_depth : int, optional
+        Maximum search depth in plies
+    time_budget : float, optional
+        Time budget per move in seconds, None for no limit
+    table : class TranspositionTable, optional
+        Transposition table, which can be shared between searches
+    book : class OpeningBook, optional
+        Opening book to play from before searching
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import Searcher, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[2, 0:4] = PLAYER["white"]
+    >>> board[4, 0:3] = PLAYER["black"]
+    >>> searcher = Searcher(max_depth=2)
+    >>> move = searcher.search(board, PLAYER["white"])
+    >>> print(move.row, move.column, move.power > 0)
+    2 4 True
+
+    """
+
+    def __init__(self, max_depth=4, time_budget=5.0, table=None, book=None):
+        self.max_depth   = max_depth
+        self.time_budget = time_budget
+        self.table       = TranspositionTable() if table is None else table
+        self.book        = book
+        self.nodes       = 0
+        self.depth       = 0
+        self.elapsed     = 0.0
+        self._deadline   = None
+
+    def search(self, board, player):
+        r"""
+        Finds the best move for the given player.
+
+        Parameters
+        ----------
+        board : 2D ndarray of int
+            Board position
+        player : int
+            Player to move
+
+        Returns
+        -------
+        class Move
+            Best move found, with the power set to the search score from the point of view of `player`
+
+        """
+        (white, black) = board_to_bits(board)
+        if player == PLAYER["white"]:
+            (own, other) = (white, black)
+        elif player == PLAYER["black"]:
+            (own, other) = (black, white)
+        else:
+            raise ValueError("Unexpected player to move next.")
+        if has_win(white) or has_win(black) or white | black == FULL_BOARD:
+            raise ValueError("Board should not already be in a finished position.")
+
+        # play straight from the opening book when the position is in it
+        start = time.perf_counter()
+        if self.book is not None:
+            move = self.book.lookup_bits(own, other)
+            if move is not None:
+                self.nodes = 0
+                self.depth = 0
+                self.elapsed = time.perf_counter() - start
+                return move
+
+        # seed the move ordering with the winning moves for either player
+        (white_moves, black_moves) = find_moves(board)
+        seeds = [(move.row, move.column, move.quadrant, move.direction) for move in white_moves + black_moves]
+
+        # iterative deepening
+        self._deadline = None if self.time_budget is None else start + self.time_budget
+        self.nodes = 0
+        self.depth = 0
+        self.table.new_search()
+        best = None
+        for depth in range(1, self.max_depth + 1):
+            try:
+                (value, move) = self._negamax(own, other, player, depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0, seeds)
+            except _SearchTimeout:
+                break
+            best = (value, move)
+            self.depth = depth
+            # stop once the game has been solved from here
+            if abs(value) >= WIN_THRESHOLD:
+                break
+            # don't start another iteration once the time is up
+            if self._deadline is not None and time.perf_counter() > self._deadline:
+                break
+        self.elapsed = time.perf_counter() - start
+        assert best is not None
+        (value, move) = best
+        return Move(*move, power=value)
+
+    def _check_time(self):
+        r"""Raises a timeout once the time budget is used up, always allowing the first iteration to finish."""
+        if self._deadline is not None and self.depth > 0 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+    def _negamax(self, own, other, player, depth, alpha, beta, ply, seeds=None):
+        r"""Recursive negamax search, returning the score and best move from the point of view of `own`."""
+        self.nodes += 1
+        if self.nodes & 1023 == 0:
+            self._check_time()
+
+        # probe the transposition table
+        alpha_orig = alpha
+        if player == PLAYER["white"]:
+            (white, black, symmetry) = canonical_bits(own, other)
+        else:
+            (white, black, symmetry) = canonical_bits(other, own)
+        key = zobrist_hash(white, black, player)
+        entry = self.table.probe(key)
+        tt_move = None
+        if entry is not None:
+            (tt_depth, tt_value, tt_flag, tt_move) = entry
+            # the stored move is for the canonical position, so transform it back
+            if tt_move is not None:
+                tt_move = transform_move(*tt_move, SYM_INVERSE[symmetry])
+            if tt_depth >= depth and ply > 0:
+                tt_value = _from_table(tt_value, ply)
+                if tt_flag == EXACT:
+                    return (tt_value, tt_move)
+                if tt_flag == LOWER:
+                    alpha = max(alpha, tt_value)
+                elif tt_flag == UPPER:
+                    beta = min(beta, tt_value)
+                if alpha >= beta:
+                    return (tt_value, tt_move)
+
+        # generate and order the children
+        children = self._children(own, other, depth, ply, tt_move, seeds)
+
+        # search the children
+        best_value = -WIN_SCORE - 1
+        best_move = None
+        for value, move, new_own, new_other in children:
+            if value is None:
+                value = -self._negamax(new_other, new_own, -player, depth - 1, -beta, -alpha, ply + 1)[0]
+            if value > best_value:
+                best_value = value
+                best_move = move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+
+        # store the result
+        if best_value <= alpha_orig:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        canonical_move = None if best_move is None else transform_move(*best_move, symmetry)
+        self.table.store(key, depth, _to_table(best_value, ply), flag, canonical_move)
+        return (best_value, best_move)
+
+    def _children(self, own, other, depth, ply, tt_move, seeds):
+        r"""
+        Generates the ordered list of (value, move, new_own, new_other) children.
+
+        Notes
+        -----
+        #.  The value is filled in for terminal positions and leaves, and None when it needs to be searched.
+
+        """
+        win_value = WIN_SCORE - ply - 1
+        empty = FULL_BOARD & ~(own | other)
+        # winning moves for the player to move, and the squares the opponent would like to play on
+        wins = set(find_winning_moves(own, other))
+        threats = {move[0:2] for move in find_winning_moves(other, own)}
+        if seeds:
+            threats |= {move[0:2] for move in seeds}
+        # the opponent only changes with the rotation, so check those once
+        other_rotations = {}
+        for quadrant, direction in ROTATIONS:
+            new_other = rotate_bits(other, quadrant, direction)
+            other_rotations[quadrant, direction] = (new_other, has_win(new_other))
+        first = []
+        rest = []
+        seen = set()
+        while empty:
+            low = empty & -empty
+            bit = low.bit_length() - 1
+            empty ^= low
+            placed = own | low
+            row = BIT_ROW[bit]
+            column = BIT_COL[bit]
+            for quadrant, direction in ROTATIONS:
+                new_own = rotate_bits(placed, quadrant, direction)
+                (new_other, other_win) = other_rotations[quadrant, direction]
+                if (new_own, new_other) in seen:
+                    continue
+                seen.add((new_own, new_other))
+                move = (row, column, quadrant, direction)
+                own_win = move in wins
+                if own_win and not other_win:
+                    # nothing can be better than winning right away
+                    return [(win_value, move, new_own, new_other)]
+                if own_win or other_win:
+                    value = 0 if own_win else -win_value
+                    rest.append((value, value, move, new_own, new_other))
+                elif new_own | new_other == FULL_BOARD:
+                    rest.append((0, 0, move, new_own, new_other))
+                elif depth == 1:
+                    value = evaluate(new_own, new_other)
+                    rest.append((value, value, move, new_own, new_other))
+                elif move == tt_move:
+                    first.insert(0, (None, move, new_own, new_other))
+                elif (row, column) in threats:
+                    first.append((None, move, new_own, new_other))
+                else:
+                    rest.append((evaluate(new_own, new_other) if depth > 2 else 0, None, move, new_own, new_other))
+        rest.sort(key=lambda x: x[0], reverse=True)
+        return first + [x[1:] for x in rest]
+
+
+# %% _to_table
+def _to_table(value, ply):
+    r"""Converts a win score relative to the root into one relative to the current node for storage."""
+    if value >= WIN_THRESHOLD:
+        return value + ply
+    if value <= -WIN_THRESHOLD:
+        return value - ply
+    return value
+
+
+# %% _from_table
+def _from_table(value, ply):
+    r"""Converts a stored win score relative to the node back into one relative to the root."""
+    if value >= WIN_THRESHOLD:
+        return value - ply
+    if value <= -WIN_THRESHOLD:
+        return value + ply
+    return value
+
+
+# %% find_best_move
+def find_best_move(board, player, max_depth=4, time_budget=None, table=None, book=None):
+    r"""
+    Finds the best move for the given player using an alpha-beta search.
+
+    Parameters
+    ----------
+    board : 2D ndarray of int
+        Board position
+    player : int
+        Player to move
+    max_depth : int, optional
+        Maximum search depth in plies
+    time_budget : float, optional
+        Time budget in seconds, None for no limit
+    table : class TranspositionTable, optional
+        Transposition table to reuse between moves
+    book : class OpeningBook, optional
+        Opening book to play from before searching
+
+    Returns
+    -------
+    move : class Move
+        Best move, with the power set to the search score
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import find_best_move, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[0:4, 0] = PLAYER["white"]
+    >>> board[1, 1:4] = PLAYER["black"]
+    >>> move = find_best_move(board, PLAYER["white"], max_depth=2)
+    >>> print(move.row, move.column)
+    4 0
+
+    """
+    searcher = Searcher(max_depth=max_depth, time_budget=time_budget, table=table, book=book)
+    return searcher.search(board, player)
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.pentago.tests.test_search", exit=False)
+    doctest.testmod(verbose=False)
@@ -0,0 +1,322 @@
+r"""
+Test file for the `pentago.bitboard` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.pentago as pentago
+
+# %% Aliases
+w = pentago.PLAYER["white"]
+b = pentago.PLAYER["black"]
+
+
+# %% Functions - _random_board
+def _random_board(prng, num_pieces=20):
+    r"""Makes a random board for use in testing."""
+    board = np.full((6, 6), pentago.PLAYER["none"], dtype=int)
+    ix = prng.choice(36, size=num_pieces, replace=False)
+    board.ravel()[ix] = prng.choice([w, b], size=num_pieces)
+    return board
+
+
+# %% CELL_BITS, BIT_ROW, BIT_COL
+class Test_cell_bits(unittest.TestCase):
+    r"""
+    Tests the CELL_BITS, BIT_ROW and BIT_COL constants with the following cases:
+        unique bits
+        round trip
+    """
+
+    def test_unique(self) -> None:
+        np.testing.assert_array_equal(np.sort(pentago.CELL_BITS.ravel()), np.arange(36))
+
+    def test_round_trip(self) -> None:
+        for row in range(6):
+            for col in range(6):
+                bit = pentago.CELL_BITS[row, col]
+                self.assertEqual(pentago.BIT_ROW[bit], row)
+                self.assertEqual(pentago.BIT_COL[bit], col)
+
+
+# %% WIN_MASKS
+class Test_WIN_MASKS(unittest.TestCase):
+    r"""
+    Tests the WIN_MASKS constant with the following cases:
+        matches WIN
+    """
+
+    def test_matches_win(self) -> None:
+        self.assertEqual(len(pentago.WIN_MASKS), pentago.WIN.shape[1])
+        for ix, mask in enumerate(pentago.WIN_MASKS):
+            self.assertEqual(mask.bit_count(), 5)
+            np.testing.assert_array_equal(pentago.bits_to_mask(mask).ravel(), pentago.WIN[:, ix])
+
+
+# %% board_to_bits & bits_to_board
+class Test_board_to_bits(unittest.TestCase):
+    r"""
+    Tests the board_to_bits and bits_to_board functions with the following cases:
+        empty board
+        round trip
+    """
+
+    def test_empty(self) -> None:
+        board = np.zeros((6, 6), dtype=int)
+        self.assertEqual(pentago.board_to_bits(board), (0, 0))
+
+    def test_round_trip(self) -> None:
+        prng = np.random.default_rng(1)
+        for _ in range(20):
+            board = _random_board(prng)
+            (white, black) = pentago.board_to_bits(board)
+            self.assertEqual(white & black, 0)
+            np.testing.assert_array_equal(pentago.bits_to_board(white, black), board)
+
+
+# %% rotate_bits
+class Test_rotate_bits(unittest.TestCase):
+    r"""
+    Tests the rotate_bits function with the following cases:
+        matches rotate_board for all quadrants and directions
+        four rotations is the identity
+    """
+
+    def setUp(self) -> None:
+        self.prng = np.random.default_rng(2)
+
+    def test_matches_rotate_board(self) -> None:
+        for _ in range(10):
+            board = _random_board(self.prng)
+            (white, black) = pentago.board_to_bits(board)
+            for quadrant, direction in pentago.ROTATIONS:
+                expected = board.copy()
+                pentago.rotate_board(expected, quadrant, direction)
+                new_board = pentago.bits_to_board(
+                    pentago.rotate_bits(white, quadrant, direction), pentago.rotate_bits(black, quadrant, direction)
+                )
+                np.testing.assert_array_equal(new_board, expected)
+
+    def test_identity(self) -> None:
+        bits = 0b101100111000110101010011100011110001
+        for quadrant, direction in pentago.ROTATIONS:
+            temp = bits
+            for _ in range(4):
+                temp = pentago.rotate_bits(temp, quadrant, direction)
+            self.assertEqual(temp, bits)
+
+
+# %% has_win & win_bits
+class Test_has_win(unittest.TestCase):
+    r"""
+    Tests the has_win and win_bits functions with the following cases:
+        no win
+        single win
+        six in a row
+        matches check_for_win
+    """
+
+    def setUp(self) -> None:
+        self.board = np.zeros((6, 6), dtype=int)
+
+    def test_no_win(self) -> None:
+        self.board[0, 0:4] = w
+        (white, _) = pentago.board_to_bits(self.board)
+        self.assertFalse(pentago.has_win(white))
+        self.assertEqual(pentago.win_bits(white), 0)
+
+    def test_win(self) -> None:
+        self.board[1:6, 4] = w
+        (white, _) = pentago.board_to_bits(self.board)
+        self.assertTrue(pentago.has_win(white))
+        self.assertEqual(pentago.win_bits(white), white)
+
+    def test_six(self) -> None:
+        self.board[5, :] = b
+        (_, black) = pentago.board_to_bits(self.board)
+        self.assertTrue(pentago.has_win(black))
+        self.assertEqual(pentago.win_bits(black), black)
+
+    def test_random(self) -> None:
+        prng = np.random.default_rng(3)
+        for _ in range(50):
+            board = _random_board(prng, num_pieces=24)
+            (white, black) = pentago.board_to_bits(board)
+            white_win = np.any(np.sum(np.expand_dims(board.ravel() == w, axis=1) * pentago.WIN, axis=0) == 5)
+            black_win = np.any(np.sum(np.expand_dims(board.ravel() == b, axis=1) * pentago.WIN, axis=0) == 5)
+            self.assertEqual(pentago.has_win(white), white_win)
+            self.assertEqual(pentago.has_win(black), black_win)
+
+
+# %% iter_moves
+class Test_iter_moves(unittest.TestCase):
+    r"""
+    Tests the iter_moves function with the following cases:
+        empty board
+        partial board
+    """
+
+    def test_empty(self) -> None:
+        moves = list(pentago.iter_moves(0, 0))
+        self.assertEqual(len(moves), 288)
+        self.assertEqual(len({(x[0], x[1], x[2], x[3]) for x in moves}), 288)
+        for move in moves:
+            self.assertEqual(move[4].bit_count(), 1)
+            self.assertEqual(move[5], 0)
+
+    def test_partial(self) -> None:
+        board = _random_board(np.random.default_rng(4), num_pieces=10)
+        (white, black) = pentago.board_to_bits(board)
+        moves = list(pentago.iter_moves(white, black))
+        self.assertEqual(len(moves), 26 * 8)
+        for row, column, quadrant, direction, new_white, new_black in moves[::7]:
+            expected = board.copy()
+            self.assertEqual(expected[row, column], pentago.PLAYER["none"])
+            expected[row, column] = w
+            pentago.rotate_board(expected, quadrant, direction)
+            np.testing.assert_array_equal(pentago.bits_to_board(new_white, new_black), expected)
+
+
+# %% find_winning_moves
+class Test_find_winning_moves(unittest.TestCase):
+    r"""
+    Tests the find_winning_moves function with the following cases:
+        empty board
+        rotate to win
+        matches exhaustive search
+    """
+
+    def test_empty(self) -> None:
+        self.assertEqual(pentago.find_winning_moves(0, 0), [])
+
+    def test_rotate_to_win(self) -> None:
+        board = np.zeros((6, 6), dtype=int)
+        board[3, 1] = w
+        board[4, 1] = w
+        board[4, 3:6] = w
+        (white, black) = pentago.board_to_bits(board)
+        moves = pentago.find_winning_moves(white, black)
+        self.assertEqual(sum(1 for move in moves if move[2:] == (3, 1)), 31)
+        self.assertIn((4, 2, 1, -1), moves)
+        self.assertIn((5, 1, 3, -1), moves)
+
+    def test_exhaustive(self) -> None:
+        prng = np.random.default_rng(5)
+        for _ in range(20):
+            board = _random_board(prng, num_pieces=16)
+            (white, black) = pentago.board_to_bits(board)
+            if pentago.has_win(white) or pentago.has_win(black):
+                continue
+            expected = {move[0:4] for move in pentago.iter_moves(white, black) if pentago.has_win(move[4])}
+            moves = pentago.find_winning_moves(white, black)
+            self.assertEqual(len(moves), len(expected))
+            self.assertEqual(set(moves), expected)
+
+
+# %% transform_bits
+class Test_transform_bits(unittest.TestCase):
+    r"""
+    Tests the transform_bits function with the following cases:
+        identity
+        matches numpy transforms
+        inverse
+    """
+
+    def setUp(self) -> None:
+        self.prng = np.random.default_rng(6)
+
+    def test_identity(self) -> None:
+        bits = 0b101100111000110101010011100011110001
+        self.assertEqual(pentago.transform_bits(bits, 0), bits)
+
+    def test_numpy(self) -> None:
+        for _ in range(10):
+            board = _random_board(self.prng)
+            (white, black) = pentago.board_to_bits(board)
+            for symmetry in range(8):
+                expected = np.rot90(np.fliplr(board) if symmetry >= 4 else board, symmetry % 4)
+                new_board = pentago.bits_to_board(pentago.transform_bits(white, symmetry), pentago.transform_bits(black, symmetry))
+                np.testing.assert_array_equal(new_board, expected)
+
+    def test_inverse(self) -> None:
+        bits = 0b101100111000110101010011100011110001
+        for symmetry in range(8):
+            temp = pentago.transform_bits(bits, symmetry)
+            self.assertEqual(pentago.transform_bits(temp, pentago.SYM_INVERSE[symmetry]), bits)
+
+
+# %% transform_move
+class Test_transform_move(unittest.TestCase):
+    r"""
+    Tests the transform_move function with the following cases:
+        identity
+        moves commute with the symmetries
+    """
+
+    def test_identity(self) -> None:
+        self.assertEqual(pentago.transform_move(2, 4, 2, -1, 0), (2, 4, 2, -1))
+
+    def test_commute(self) -> None:
+        board = _random_board(np.random.default_rng(7), num_pieces=12)
+        (white, black) = pentago.board_to_bits(board)
+        for row, column, quadrant, direction, new_white, new_black in list(pentago.iter_moves(white, black))[::5]:
+            for symmetry in range(8):
+                (new_row, new_column, new_quad, new_dir) = pentago.transform_move(row, column, quadrant, direction, symmetry)
+                sym_white = pentago.transform_bits(white, symmetry)
+                sym_black = pentago.transform_bits(black, symmetry)
+                bit = 1 << int(pentago.CELL_BITS[new_row, new_column])
+                self.assertEqual(bit & (sym_white | sym_black), 0)
+                placed = sym_white | bit
+                self.assertEqual(pentago.rotate_bits(placed, new_quad, new_dir), pentago.transform_bits(new_white, symmetry))
+                self.assertEqual(pentago.rotate_bits(sym_black, new_quad, new_dir), pentago.transform_bits(new_black, symmetry))
+
+
+# %% canonical_bits & canonical_key
+class Test_canonical_bits(unittest.TestCase):
+    r"""
+    Tests the canonical_bits and canonical_key functions with the following cases:
+        empty board
+        returns the symmetry used
+        same for all symmetric equivalents
+        different positions
+    """
+
+    def setUp(self) -> None:
+        self.prng = np.random.default_rng(8)
+
+    def test_empty(self) -> None:
+        self.assertEqual(pentago.canonical_bits(0, 0), (0, 0, 0))
+        self.assertEqual(pentago.canonical_key(0, 0), 0)
+
+    def test_symmetry(self) -> None:
+        (white, black) = pentago.board_to_bits(_random_board(self.prng))
+        (new_white, new_black, symmetry) = pentago.canonical_bits(white, black)
+        self.assertEqual(pentago.transform_bits(white, symmetry), new_white)
+        self.assertEqual(pentago.transform_bits(black, symmetry), new_black)
+        self.assertEqual(pentago.canonical_key(white, black), (new_black << 36) | new_white)
+
+    def test_equivalents(self) -> None:
+        for _ in range(10):
+            (white, black) = pentago.board_to_bits(_random_board(self.prng))
+            key = pentago.canonical_key(white, black)
+            for symmetry in range(8):
+                self.assertEqual(pentago.canonical_key(pentago.transform_bits(white, symmetry), pentago.transform_bits(black, symmetry)), key)
+
+    def test_different(self) -> None:
+        # swapping the colors is not a symmetry
+        (white, black) = pentago.board_to_bits(_random_board(self.prng))
+        self.assertNotEqual(pentago.canonical_key(white, black), pentago.canonical_key(black, white))
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,180 @@
+r"""
+Test file for the `pentago.book` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.pentago as pentago
+from dstauffman2.games.pentago.book import _decode_move, _encode_move
+
+# %% Aliases
+o = pentago.PLAYER["none"]
+w = pentago.PLAYER["white"]
+b = pentago.PLAYER["black"]
+
+
+# %% _encode_move and _decode_move
+class Test__encode_move(unittest.TestCase):
+    r"""
+    Tests the _encode_move and _decode_move functions with the following cases:
+        round trip for every move
+    """
+
+    def test_round_trip(self) -> None:
+        codes = set()
+        for row in range(6):
+            for column in range(6):
+                for quadrant, direction in pentago.ROTATIONS:
+                    code = _encode_move(row, column, quadrant, direction)
+                    self.assertLess(code, 2**16)
+                    self.assertEqual(_decode_move(code), (row, column, quadrant, direction))
+                    codes.add(code)
+        self.assertEqual(len(codes), 288)
+
+
+# %% book_key
+class Test_book_key(unittest.TestCase):
+    r"""
+    Tests the book_key function with the following cases:
+        empty board
+        symmetric positions
+        own and other are different
+        fits in 64 bits
+    """
+
+    def test_empty(self) -> None:
+        self.assertEqual(pentago.book_key(0, 0), (0, 0))
+
+    def test_symmetric(self) -> None:
+        board = np.full((6, 6), o, dtype=int)
+        board[0, 1] = w
+        board[2, 4] = b
+        keys = set()
+        for k in range(4):
+            for this_board in (np.rot90(board, k), np.rot90(np.fliplr(board), k)):
+                keys.add(pentago.book_key(*pentago.board_to_bits(this_board))[0])
+        self.assertEqual(len(keys), 1)
+
+    def test_own_other(self) -> None:
+        self.assertNotEqual(pentago.book_key(1, 2)[0], pentago.book_key(2, 1)[0])
+
+    def test_max(self) -> None:
+        key = pentago.book_key(0, pentago.FULL_BOARD)[0]
+        self.assertEqual(key, 3**36 - 1)
+        self.assertLess(key, 2**64)
+
+
+# %% opening_positions
+class Test_opening_positions(unittest.TestCase):
+    r"""
+    Tests the opening_positions function with the following cases:
+        counts
+        canonical and unique
+    """
+
+    def test_counts(self) -> None:
+        self.assertEqual(pentago.opening_positions(0), [])
+        self.assertEqual(pentago.opening_positions(1), [(0, 0)])
+        self.assertEqual(len(pentago.opening_positions(2)), 7)
+
+    def test_canonical(self) -> None:
+        positions = pentago.opening_positions(3)
+        self.assertEqual(len(positions), len(set(positions)))
+        for own, other in positions:
+            self.assertEqual(pentago.canonical_bits(own, other)[0:2], (own, other))
+            # the player to move never has more pieces than the opponent
+            self.assertLessEqual(bin(own).count("1"), bin(other).count("1"))
+
+
+# %% build_opening_book, OpeningBook and load_opening_book
+class Test_OpeningBook(unittest.TestCase):
+    r"""
+    Tests the build_opening_book function and OpeningBook class with the following cases:
+        sorted keys
+        memory-mapped
+        lookup matches the search for every symmetry
+        lookup by board
+        missing position
+        process pool
+        searcher uses the book
+        load missing file
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.filename = os.path.join(cls.folder.name, pentago.BOOK_FILENAME)
+        cls.entries = pentago.build_opening_book(cls.filename, max_ply=2, max_depth=2, num_workers=1)
+        cls.book = pentago.OpeningBook(cls.filename)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        del cls.book
+        cls.folder.cleanup()
+
+    def test_sorted(self) -> None:
+        self.assertEqual(len(self.book), 7)
+        self.assertEqual(self.entries.dtype, pentago.BOOK_DTYPE)
+        self.assertTrue(np.all(np.diff(self.entries["key"].astype(float)) > 0))
+
+    def test_mmap(self) -> None:
+        self.assertIsInstance(self.book._book, np.memmap)
+
+    def test_lookup(self) -> None:
+        board = np.full((6, 6), o, dtype=int)
+        board[1, 1] = b
+        for k in range(4):
+            for this_board in (np.rot90(board, k), np.rot90(np.fliplr(board), k)):
+                move = self.book.lookup(this_board, w)
+                self.assertIsNotNone(move)
+                self.assertEqual(this_board[move.row, move.column], o)
+                expected = pentago.find_best_move(this_board, w, max_depth=2)
+                self.assertEqual(move.power, expected.power)
+
+    def test_lookup_bits(self) -> None:
+        (white, black) = pentago.board_to_bits(np.full((6, 6), o, dtype=int))
+        move = self.book.lookup_bits(white, black)
+        self.assertIsInstance(move, pentago.Move)
+
+    def test_missing(self) -> None:
+        board = np.full((6, 6), o, dtype=int)
+        board[0, 0] = w
+        board[5, 5] = b
+        self.assertIsNone(self.book.lookup(board, w))
+
+    def test_pool(self) -> None:
+        filename = os.path.join(self.folder.name, "pool.npy")
+        entries = pentago.build_opening_book(filename, max_ply=2, max_depth=2, num_workers=2)
+        np.testing.assert_array_equal(entries, self.entries)
+
+    def test_searcher(self) -> None:
+        board = np.full((6, 6), o, dtype=int)
+        board[4, 1] = w
+        searcher = pentago.Searcher(max_depth=2, book=self.book)
+        move = searcher.search(board, b)
+        self.assertEqual(searcher.nodes, 0)
+        self.assertEqual(move, self.book.lookup(board, b))
+        board[5, 5] = b
+        move = searcher.search(board, w)
+        self.assertGreater(searcher.nodes, 0)
+
+    def test_load(self) -> None:
+        self.assertIsNone(pentago.load_opening_book(os.path.join(self.folder.name, "missing.npy")))
+        book = pentago.load_opening_book(self.filename)
+        self.assertEqual(len(book), 7)
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
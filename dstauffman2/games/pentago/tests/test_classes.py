@@ -9,8 +9,13 @@
 """
 
 # %% Imports
+import os
+import pickle
+import tempfile
 import unittest
 
+import numpy as np
+
 import dstauffman2.games.pentago as pentago
 
 # %% Aliases
@@ -24,7 +29,76 @@
 pass
 
 # %% GameStats
-pass
+class Test_GameStats(unittest.TestCase):
+    r"""
+    Tests the GameStats class with the following cases:
+        board at every move
+        snapshots after replacing a move
+        save and load
+        load older pickles
+        bad file version
+    """
+
+    def setUp(self) -> None:
+        prng = np.random.default_rng(0)
+        self.moves = []
+        board = np.zeros((6, 6), dtype=int)
+        player = b
+        for _ in range(20):
+            ix = prng.choice(np.flatnonzero(board.ravel() == 0))
+            move = pentago.Move(ix // 6, ix % 6, int(prng.integers(1, 5)), int(prng.choice([-1, 1])))
+            board[move.row, move.column] = player
+            pentago.rotate_board(board, move.quadrant, move.direction)
+            self.moves.append(move)
+            player = -player
+        self.game = pentago.GameStats(3, b, move_list=self.moves)
+        self.folder = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.folder.name, "pentago.pkl")
+
+    def test_board_at(self) -> None:
+        for i in range(len(self.moves) + 1):
+            np.testing.assert_array_equal(self.game.board_at(i), pentago.create_board_from_moves(self.moves[:i], b))
+        with self.assertRaises(AssertionError):
+            self.game.board_at(21)
+
+    def test_replaced(self) -> None:
+        self.game.board_at()
+        board = self.game.board_at(16)
+        empty = np.flatnonzero(board.ravel() == 0)[-1]
+        self.game.move_list[16] = pentago.Move(empty // 6, empty % 6, 2, 1)
+        self.game.remove_moves(17)
+        expected = pentago.create_board_from_moves(self.game.move_list, b)
+        np.testing.assert_array_equal(self.game.board_at(), expected)
+
+    def test_save_and_load(self) -> None:
+        game_hist = [pentago.GameStats(2, w, winner=pentago.PLAYER["draw"]), self.game]
+        pentago.GameStats.save(self.filename, game_hist)
+        self.assertEqual(os.path.getsize(self.filename), 9 + 2 * 8 + 2 * 20)
+        loaded = pentago.GameStats.load(self.filename)
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded[0].winner, pentago.PLAYER["draw"])
+        self.assertEqual(loaded[1].number, 3)
+        self.assertEqual(loaded[1].first_move, b)
+        self.assertEqual(loaded[1].move_list, self.moves)
+        np.testing.assert_array_equal(loaded[1].board_at(), self.game.board_at())
+
+    def test_load_pickle(self) -> None:
+        with open(self.filename, "wb") as file:
+            pickle.dump([self.game], file)
+        loaded = pentago.GameStats.load(self.filename)
+        self.assertEqual(loaded[0].move_list, self.moves)
+        np.testing.assert_array_equal(loaded[0].board_at(5), self.game.board_at(5))
+
+    def test_bad_version(self) -> None:
+        pentago.GameStats.save(self.filename, [self.game])
+        with open(self.filename, "r+b") as file:
+            file.seek(4)
+            file.write(bytes([99]))
+        with self.assertRaises(ValueError):
+            pentago.GameStats.load(self.filename)
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
 
 # %% Unit test execution
 if __name__ == "__main__":
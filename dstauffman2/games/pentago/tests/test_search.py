@@ -0,0 +1,234 @@
+r"""
+Test file for the `pentago.search` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.pentago as pentago
+
+# %% Aliases
+o = pentago.PLAYER["none"]
+w = pentago.PLAYER["white"]
+b = pentago.PLAYER["black"]
+
+
+# %% zobrist_hash
+class Test_zobrist_hash(unittest.TestCase):
+    r"""
+    Tests the zobrist_hash function with the following cases:
+        empty board
+        side to move
+        different colors
+        incremental
+    """
+
+    def test_empty(self) -> None:
+        self.assertEqual(pentago.zobrist_hash(0, 0, w), 0)
+
+    def test_side(self) -> None:
+        self.assertNotEqual(pentago.zobrist_hash(5, 16, w), pentago.zobrist_hash(5, 16, b))
+
+    def test_colors(self) -> None:
+        self.assertNotEqual(pentago.zobrist_hash(1 << 20, 0, w), pentago.zobrist_hash(0, 1 << 20, w))
+
+    def test_incremental(self) -> None:
+        white = (1 << 3) | (1 << 17) | (1 << 35)
+        black = (1 << 4) | (1 << 22)
+        key = pentago.zobrist_hash(white, black, w)
+        self.assertEqual(key ^ pentago.zobrist_hash(1 << 3, 0, w), pentago.zobrist_hash(white ^ (1 << 3), black, w))
+
+
+# %% evaluate
+class Test_evaluate(unittest.TestCase):
+    r"""
+    Tests the evaluate function with the following cases:
+        empty board
+        symmetric
+        more pieces in a line is better
+    """
+
+    def test_empty(self) -> None:
+        self.assertEqual(pentago.evaluate(0, 0), 0)
+
+    def test_symmetric(self) -> None:
+        (own, other) = ((1 << 2) | (1 << 30), 1 << 13)
+        self.assertEqual(pentago.evaluate(own, other), -pentago.evaluate(other, own))
+
+    def test_lines(self) -> None:
+        board = np.full((6, 6), o, dtype=int)
+        board[0, 0:2] = w
+        (two, _) = pentago.board_to_bits(board)
+        board[0, 2] = w
+        (three, _) = pentago.board_to_bits(board)
+        self.assertGreater(pentago.evaluate(three, 0), pentago.evaluate(two, 0))
+
+
+# %% TranspositionTable
+class Test_TranspositionTable(unittest.TestCase):
+    r"""
+    Tests the TranspositionTable class with the following cases:
+        size rounding
+        store and probe
+        missing key
+        replacement policy
+        clear
+    """
+
+    def setUp(self) -> None:
+        self.table = pentago.TranspositionTable(size=16)
+
+    def test_size(self) -> None:
+        self.assertEqual(pentago.TranspositionTable(size=1000).size, 1024)
+        self.assertEqual(self.table.size, 16)
+
+    def test_store_probe(self) -> None:
+        self.table.store(35, 3, -12, 1, (1, 2, 3, 1))
+        self.assertEqual(self.table.probe(35), (3, -12, 1, (1, 2, 3, 1)))
+        self.assertEqual(len(self.table), 1)
+
+    def test_missing(self) -> None:
+        self.table.store(35, 3, -12, 1, (1, 2, 3, 1))
+        self.assertIsNone(self.table.probe(36))
+        self.assertIsNone(self.table.probe(35 + 16))
+
+    def test_replacement(self) -> None:
+        self.table.store(35, 3, 10, 0, (1, 2, 3, 1))
+        # shallower entry for a different position in the same slot doesn't replace
+        self.table.store(35 + 16, 1, 20, 0, (0, 0, 1, 1))
+        self.assertEqual(self.table.probe(35)[1], 10)
+        self.assertIsNone(self.table.probe(35 + 16))
+        # same position always replaces
+        self.table.store(35, 1, 30, 0, (0, 0, 1, 1))
+        self.assertEqual(self.table.probe(35)[1], 30)
+        # entries from an older search are replaced
+        self.table.store(35, 5, 30, 0, (0, 0, 1, 1))
+        self.table.new_search()
+        self.table.store(35 + 16, 1, 40, 0, (0, 0, 1, 1))
+        self.assertIsNone(self.table.probe(35))
+        self.assertEqual(self.table.probe(35 + 16)[1], 40)
+
+    def test_clear(self) -> None:
+        self.table.store(35, 3, 10, 0, (1, 2, 3, 1))
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+
+
+# %% Searcher
+class Test_Searcher(unittest.TestCase):
+    r"""
+    Tests the Searcher class with the following cases:
+        win in one
+        block a win
+        forced loss
+        bad player
+        finished board
+        time budget
+        shared table
+        symmetric positions share entries
+    """
+
+    def setUp(self) -> None:
+        self.board = np.full((6, 6), o, dtype=int)
+
+    def test_win(self) -> None:
+        self.board[5, 1:5] = b
+        self.board[0, 0:3] = w
+        move = pentago.Searcher(max_depth=3).search(self.board, b)
+        self.assertGreaterEqual(move.power, pentago.WIN_SCORE - 10)
+        (white, black) = pentago.board_to_bits(self.board)
+        self.assertIn((move.row, move.column, move.quadrant, move.direction), pentago.find_winning_moves(black, white))
+
+    def test_block(self) -> None:
+        self.board[2, 1:4] = w
+        self.board[5, 0] = b
+        searcher = pentago.Searcher(max_depth=2)
+        move = searcher.search(self.board, b)
+        self.board[move.row, move.column] = b
+        pentago.rotate_board(self.board, move.quadrant, move.direction)
+        (white, black) = pentago.board_to_bits(self.board)
+        self.assertEqual(pentago.find_winning_moves(white, black), [])
+        self.assertGreater(move.power, -pentago.WIN_SCORE + 10)
+
+    def test_forced_loss(self) -> None:
+        self.board[1, 1:5] = b
+        self.board[4, 0:3] = w
+        move = pentago.Searcher(max_depth=2).search(self.board, w)
+        self.assertEqual(move.power, -pentago.WIN_SCORE + 2)
+
+    def test_bad_player(self) -> None:
+        with self.assertRaises(ValueError):
+            pentago.Searcher(max_depth=1).search(self.board, o)
+
+    def test_finished(self) -> None:
+        self.board[0, 0:5] = w
+        with self.assertRaises(ValueError):
+            pentago.Searcher(max_depth=1).search(self.board, b)
+
+    def test_time_budget(self) -> None:
+        self.board[2, 2] = w
+        self.board[3, 3] = b
+        searcher = pentago.Searcher(max_depth=10, time_budget=0.2)
+        move = searcher.search(self.board, w)
+        self.assertEqual(self.board[move.row, move.column], o)
+        self.assertGreaterEqual(searcher.depth, 1)
+        self.assertLess(searcher.depth, 10)
+        self.assertLess(searcher.elapsed, 2.0)
+
+    def test_shared_table(self) -> None:
+        table = pentago.TranspositionTable(size=2**12)
+        self.board[1, 1] = w
+        pentago.Searcher(max_depth=2, table=table).search(self.board, b)
+        self.assertGreater(len(table), 0)
+        self.assertEqual(table.generation, 1)
+        pentago.Searcher(max_depth=2, table=table).search(self.board, b)
+        self.assertEqual(table.generation, 2)
+
+    def test_symmetric(self) -> None:
+        table = pentago.TranspositionTable(size=2**12)
+        self.board[0, 1] = w
+        self.board[2, 2] = b
+        pentago.Searcher(max_depth=2, table=table).search(self.board, w)
+        # a reflected position finds the same entry, with the move transformed to match
+        board = np.fliplr(self.board)
+        (white, black, _) = pentago.canonical_bits(*pentago.board_to_bits(board))
+        entry = table.probe(pentago.zobrist_hash(white, black, w))
+        self.assertIsNotNone(entry)
+        move = pentago.Searcher(max_depth=2, table=table).search(board, w)
+        self.assertEqual(board[move.row, move.column], o)
+
+
+# %% find_best_move
+class Test_find_best_move(unittest.TestCase):
+    r"""
+    Tests the find_best_move function with the following cases:
+        nominal
+        empty board
+    """
+
+    def test_nominal(self) -> None:
+        board = np.full((6, 6), o, dtype=int)
+        board[0:4, 0] = w
+        board[1, 1:4] = b
+        move = pentago.find_best_move(board, w, max_depth=2)
+        self.assertEqual((move.row, move.column), (4, 0))
+        self.assertGreater(move.power, pentago.WIN_SCORE - 10)
+
+    def test_empty(self) -> None:
+        board = np.full((6, 6), o, dtype=int)
+        move = pentago.find_best_move(board, w, max_depth=1)
+        self.assertIsInstance(move, pentago.Move)
+        self.assertEqual(move.power, pentago.evaluate(*pentago.board_to_bits(pentago.create_board_from_moves([move], w))))
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
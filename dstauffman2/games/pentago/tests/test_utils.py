@@ -368,6 +368,186 @@ def test_everything(self) -> None:
 # %% _create_board_from_moves
 pass
 
+
+# %% Functions - _play_random_game
+def _play_random_game(prng, board, line_counts):
+    r"""Plays random moves with apply_move until the game ends, and returns the list of moves, for use in testing."""
+    moves = []
+    player = w
+    winner = pentago.PLAYER["none"]
+    while winner == pentago.PLAYER["none"]:
+        ix = prng.choice(np.flatnonzero(board.ravel() == pentago.PLAYER["none"]))
+        move = pentago.Move(ix // 6, ix % 6, int(prng.integers(1, 5)), int(prng.choice([-1, 1])))
+        winner = pentago.apply_move(board, line_counts, move, player)
+        moves.append(move)
+        yield (winner, moves)
+        player = -player
+
+
+# %% calc_line_counts
+class Test_calc_line_counts(unittest.TestCase):
+    r"""
+    Tests the calc_line_counts function with the following cases:
+        empty board
+        full row
+        both players
+    """
+
+    def setUp(self) -> None:
+        self.board = np.full((6, 6), pentago.PLAYER["none"], dtype=int)
+
+    def test_empty(self) -> None:
+        line_counts = pentago.calc_line_counts(self.board)
+        self.assertEqual(line_counts.shape, (2, 32))
+        self.assertEqual(line_counts.dtype, np.int8)
+        self.assertFalse(np.any(line_counts))
+
+    def test_row(self) -> None:
+        self.board[0, :] = w
+        line_counts = pentago.calc_line_counts(self.board)
+        self.assertEqual(np.count_nonzero(line_counts[0] == 5), 2)
+        self.assertFalse(np.any(line_counts[1]))
+
+    def test_both(self) -> None:
+        self.board[2, 2] = w
+        self.board[3, 3] = b
+        line_counts = pentago.calc_line_counts(self.board)
+        np.testing.assert_array_equal(line_counts[0] @ np.ones(32, dtype=int), np.sum(pentago.WIN[14, :]))
+        np.testing.assert_array_equal(line_counts[1] @ np.ones(32, dtype=int), np.sum(pentago.WIN[21, :]))
+
+
+# %% apply_move
+class Test_apply_move(unittest.TestCase):
+    r"""
+    Tests the apply_move function with the following cases:
+        place and rotate
+        win by rotation
+        square taken
+        matches check_for_win over random games
+    """
+
+    def setUp(self) -> None:
+        self.board = np.full((6, 6), pentago.PLAYER["none"], dtype=int)
+        self.line_counts = pentago.calc_line_counts(self.board)
+
+    def test_place(self) -> None:
+        winner = pentago.apply_move(self.board, self.line_counts, pentago.Move(0, 0, 1, 1), b)
+        self.assertEqual(winner, pentago.PLAYER["none"])
+        self.assertEqual(self.board[0, 2], b)
+        self.assertEqual(np.count_nonzero(self.board), 1)
+        np.testing.assert_array_equal(self.line_counts, pentago.calc_line_counts(self.board))
+
+    def test_rotate_to_win(self) -> None:
+        self.board[0:3, 1] = w
+        self.board[1, 3:5] = w
+        self.line_counts[:] = pentago.calc_line_counts(self.board)
+        winner = pentago.apply_move(self.board, self.line_counts, pentago.Move(5, 5, 1, -1), w)
+        self.assertEqual(winner, w)
+        np.testing.assert_array_equal(self.board[1, 0:3], [w, w, w])
+
+    def test_taken(self) -> None:
+        self.board[3, 3] = w
+        with self.assertRaises(AssertionError):
+            pentago.apply_move(self.board, self.line_counts, pentago.Move(3, 3, 1, 1), b)
+
+    def test_random_games(self) -> None:
+        prng = np.random.default_rng(0)
+        for _ in range(50):
+            board = np.full((6, 6), pentago.PLAYER["none"], dtype=int)
+            line_counts = pentago.calc_line_counts(board)
+            for winner, _ in _play_random_game(prng, board, line_counts):
+                np.testing.assert_array_equal(line_counts, pentago.calc_line_counts(board))
+                self.assertEqual(winner, pentago.check_for_win(board)[0])
+
+
+# %% undo_move
+class Test_undo_move(unittest.TestCase):
+    r"""
+    Tests the undo_move function with the following cases:
+        single move
+        whole random games
+        empty square
+    """
+
+    def setUp(self) -> None:
+        self.board = np.full((6, 6), pentago.PLAYER["none"], dtype=int)
+        self.line_counts = pentago.calc_line_counts(self.board)
+
+    def test_single(self) -> None:
+        self.board[0:3, 0] = b
+        self.line_counts[:] = pentago.calc_line_counts(self.board)
+        orig = self.board.copy()
+        move = pentago.Move(4, 4, 1, 1)
+        pentago.apply_move(self.board, self.line_counts, move, w)
+        pentago.undo_move(self.board, self.line_counts, move)
+        np.testing.assert_array_equal(self.board, orig)
+        np.testing.assert_array_equal(self.line_counts, pentago.calc_line_counts(orig))
+
+    def test_random_games(self) -> None:
+        prng = np.random.default_rng(1)
+        for _ in range(20):
+            for _, moves in _play_random_game(prng, self.board, self.line_counts):
+                pass
+            for move in reversed(moves):
+                pentago.undo_move(self.board, self.line_counts, move)
+            self.assertFalse(np.any(self.board))
+            self.assertFalse(np.any(self.line_counts))
+
+    def test_empty(self) -> None:
+        with self.assertRaises(AssertionError):
+            pentago.undo_move(self.board, self.line_counts, pentago.Move(0, 0, 4, 1))
+
+
+# %% check_line_counts
+class Test_check_line_counts(unittest.TestCase):
+    r"""
+    Tests the check_line_counts function with the following cases:
+        no winner
+        white and black wins
+        simultaneous win
+        full board draw
+        matches check_for_win
+    """
+
+    def setUp(self) -> None:
+        self.board = np.full((6, 6), pentago.PLAYER["none"], dtype=int)
+
+    def _check(self, expected_winner):
+        (winner, win_mask) = pentago.check_line_counts(self.board, pentago.calc_line_counts(self.board))
+        (exp_winner, exp_mask) = pentago.check_for_win(self.board)
+        self.assertEqual(winner, expected_winner)
+        self.assertEqual(winner, exp_winner)
+        np.testing.assert_array_equal(win_mask, exp_mask)
+
+    def test_no_winner(self) -> None:
+        self._check(pentago.PLAYER["none"])
+
+    def test_wins(self) -> None:
+        self.board[1:6, 2] = w
+        self._check(w)
+        self.board[1:6, 2] = pentago.PLAYER["none"]
+        np.fill_diagonal(self.board, b)
+        self._check(b)
+
+    def test_simultaneous(self) -> None:
+        self.board[0, 0:5] = w
+        self.board[1, 1:6] = b
+        self._check(pentago.PLAYER["draw"])
+
+    def test_draw(self) -> None:
+        self.board[:] = np.array([[w, b, w, b, w, b], [w, b, w, b, w, b], [b, w, b, w, b, w], \
+            [b, w, b, w, b, w], [w, b, w, b, w, b], [w, b, w, b, w, b]])
+        self._check(pentago.PLAYER["draw"])
+
+    def test_random(self) -> None:
+        prng = np.random.default_rng(2)
+        for _ in range(200):
+            self.board[:] = prng.choice([w, pentago.PLAYER["none"], b], size=(6, 6), p=[0.35, 0.3, 0.35])
+            (winner, win_mask) = pentago.check_line_counts(self.board, pentago.calc_line_counts(self.board))
+            (exp_winner, exp_mask) = pentago.check_for_win(self.board)
+            self.assertEqual(winner, exp_winner)
+            np.testing.assert_array_equal(win_mask, exp_mask)
+
 # %% Unit test execution
 if __name__ == "__main__":
     unittest.main(exit=False)
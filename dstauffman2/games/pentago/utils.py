@@ -15,15 +15,36 @@
 
 import numpy as np
 
-from dstauffman import modd
-
 from dstauffman2 import get_root_dir as dcs_root_dir
+from dstauffman2.games.pentago.bitboard import (
+    bits_to_mask,
+    board_to_bits,
+    find_winning_moves,
+    FULL_BOARD,
+    has_win,
+    QUAD_BITS,
+    QUAD_LINES,
+    ROT_TABLE,
+    win_bits,
+)
 from dstauffman2.games.pentago.classes import Move
-from dstauffman2.games.pentago.constants import _rotate_board, INT_TOKEN, ONE_OFF, PLAYER, SIZES, WIN
+from dstauffman2.games.pentago.constants import _rotate_board, PLAYER, SIZES, WIN
 
 # %% Globals
 logger = logging.getLogger(__name__)
 
+# number of pieces that each square contributes to each winning combination
+_CELL_LINES = WIN.reshape(SIZES["board"], SIZES["board"], WIN.shape[1]).astype(np.int8)
+
+# number of pieces needed in each winning combination
+_LINE_LENGTH = np.sum(WIN, axis=0)
+
+# weights to convert the squares in a quadrant into its 9-bit contents
+_QUAD_WEIGHTS = [1 << i for i in range(QUAD_BITS)]
+
+# row index into the line counts for each player
+_COUNT_ROW = {PLAYER["white"]: 0, PLAYER["black"]: 1}
+
 
 # %% get_root_dir
 def get_root_dir():
@@ -87,33 +108,57 @@ def calc_cur_move(cur_move, cur_game):
 
 # %% check_for_win
 def check_for_win(board):
-    r"""Checks for a win."""
-    # find white and black wins
-    white = np.flatnonzero(np.sum(np.expand_dims(board.ravel() == PLAYER["white"], axis=1) * WIN, axis=0) == 5)
-    black = np.flatnonzero(np.sum(np.expand_dims(board.ravel() == PLAYER["black"], axis=1) * WIN, axis=0) == 5)
+    r"""
+    Checks for a win.
+
+    Parameters
+    ----------
+    board : 2D ndarray of int
+        Board position
+
+    Returns
+    -------
+    winner : int
+        Winning player, from {0=none, 1=white, -1=black, 2=draw}
+    win_mask : 2D ndarray of bool
+        Pieces that are part of a winning line
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import check_for_win, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[0:5, 0] = PLAYER["black"]
+    >>> (winner, win_mask) = check_for_win(board)
+    >>> print(winner)
+    -1
+
+    """
+    # convert to bitboards and find white and black wins
+    (white, black) = board_to_bits(board)
+    white_win = win_bits(white)
+    black_win = win_bits(black)
 
     # determine winner
-    if len(white) == 0:
-        if len(black) == 0:
+    if white_win == 0:
+        if black_win == 0:
             winner = PLAYER["none"]
         else:
             winner = PLAYER["black"]
     else:
-        if len(black) == 0:
+        if black_win == 0:
             winner = PLAYER["white"]
         else:
             winner = PLAYER["draw"]
 
     # check for a full game board after determining no other win was found
-    if winner == PLAYER["none"] and not np.any(board == PLAYER["none"]):
+    if winner == PLAYER["none"] and white | black == FULL_BOARD:
         winner = PLAYER["draw"]
 
     # find winning pieces on the board
-    if winner == PLAYER["none"]:
-        win_mask = np.zeros((SIZES["board"], SIZES["board"]), dtype=bool)
-    else:
+    if winner != PLAYER["none"]:
         logger.debug("Win detected.  Winner is {}.".format(list(PLAYER)[list(PLAYER.values()).index(winner)]))
-        win_mask = np.reshape(np.sum(WIN[:, white], axis=1) + np.sum(WIN[:, black], axis=1), (SIZES["board"], SIZES["board"])) != 0
+    win_mask = bits_to_mask(white_win | black_win)
 
     return (winner, win_mask)
 
@@ -126,6 +171,8 @@ def find_moves(board):
     Notes
     -----
     #.  Currently this function is only trying to find a win in one move situation.
+    #.  Updated by David C. Stauffer in October 2026 to use bitboards instead of correlating against
+        the `ONE_OFF` matrix.
 
     Examples
     --------
@@ -140,100 +187,16 @@ def find_moves(board):
     []
 
     """
-
-    # %% get_move_from_one_off
-    def get_move_from_one_off(big_board, ix, ONE_OFF):
-        r"""Turns the given index into a Move instance."""
-        # preallocate x & y to NaNs in case the winning move is just a rotation
-        row = np.full(len(ix), INT_TOKEN, dtype=int)
-        column = row.copy()
-
-        # find missing piece
-        pos_ix = np.logical_and(np.logical_xor(np.abs(big_board), ONE_OFF[:, ix]), ONE_OFF[:, ix])
-
-        assert np.all(np.sum(pos_ix, axis=0) <= 1), "Only exactly one or fewer places should be found."
-
-        # pull out element number from 0 to 35
-        (one_off_row, one_off_col) = np.nonzero(pos_ix)
-        # convert to row and column
-        row[one_off_col] = one_off_row // SIZES["board"]
-        column[one_off_col] = np.mod(one_off_row, SIZES["board"])
-
-        # get quadrant and rotation number
-        # based on order that ONE_OFF was built, so permutations of first quads 1,2,3,4, second left,right;
-        num = np.ceil(ix / WIN.shape[1]).astype(int)
-
-        # pull out quadrant number
-        quadrant = modd(num, 4)
-
-        # pull out rotation direction
-        direction = np.full(len(ix), -1, dtype=int)
-        direction[num < 5] = 1
-
-        # convert to a move class
-        move = set()
-        for i in range(len(ix)):
-            move.add(Move(row[i], column[i], quadrant[i], direction[i], power=5))
-        return move
-
-    # expand the board to a linear 2D matrix
-    big_board = np.expand_dims(board.ravel(), axis=1)
+    # convert to bitboards
+    (white, black) = board_to_bits(board)
 
     # check for wins that shouldn't exist
-    test = big_board * WIN
-    score = np.sum(test, axis=0)
-    if np.any(np.abs(score) >= 5):
+    if has_win(white) or has_win(black):
         raise ValueError("Board should not already be in a winning position.")
 
-    # cross reference two matrices with element-wise multiplication
-    test = big_board * ONE_OFF
-
-    # find score
-    score = np.sum(test, axis=0)
-
-    # find white and black rotate to win moves
-    rot_white = np.flatnonzero(score >=  5)
-    rot_black = np.flatnonzero(score <= -5)
-
-    # find white and black one off potentials
-    white = np.flatnonzero((score >=  4) & (score <  5))
-    black = np.flatnonzero((score <= -4) & (score > -5))
-
-    # see if the remaining piece is an open square
-    if len(white) > 0:
-        pos_white = ONE_OFF[:, white]
-        needed    = np.logical_xor(pos_white, big_board)
-        free      = np.logical_and(needed, np.logical_not(big_board))
-        ix_white  = white[np.any(free, axis=0)]
-    else:
-        ix_white  = np.array([], dtype=int)
-    if len(black) > 0:
-        pos_black = ONE_OFF[:, black]
-        needed    = np.logical_xor(pos_black, big_board)
-        free      = np.logical_and(needed, np.logical_not(big_board))
-        ix_black  = black[np.any(free, axis=0)]
-    else:
-        ix_black  = np.array([], dtype=int)
-
-    # find winning moves
-    # placement winning moves
-    white_set = get_move_from_one_off(big_board, ix_white, ONE_OFF)
-    black_set = get_move_from_one_off(big_board, ix_black, ONE_OFF)
-    # rotation only winning moves
-    white_rotations = get_move_from_one_off(big_board, rot_white, ONE_OFF)
-    black_rotations = get_move_from_one_off(big_board, rot_black, ONE_OFF)
-
-    # fill in all available row and columns positions for the rotate to win moves
-    empty = np.flatnonzero(big_board == PLAYER["none"])
-    for ix in empty:
-        this_row = ix // SIZES["board"]
-        this_col = np.mod(ix, SIZES["board"])
-        for this_rot in white_rotations:
-            this_move = Move(this_row, this_col, this_rot.quadrant, this_rot.direction, power=5)
-            white_set.add(this_move)
-        for this_rot in black_rotations:
-            this_move = Move(this_row, this_col, this_rot.quadrant, this_rot.direction, power=5)
-            black_set.add(this_move)
+    # find the moves that result in five in a row for each player, independent of the other player
+    white_set = {Move(*move, power=5) for move in find_winning_moves(white, black)}
+    black_set = {Move(*move, power=5) for move in find_winning_moves(black, white)}
 
     # check for ties and set their power to -1
     ties = white_set & black_set
@@ -273,6 +236,175 @@ def create_board_from_moves(moves, first_player):
     return board
 
 
+# %% calc_line_counts
+def calc_line_counts(board):
+    r"""
+    Calculates the number of pieces that each player has in each of the winning combinations.
+
+    Parameters
+    ----------
+    board : 2D ndarray of int
+        Board position
+
+    Returns
+    -------
+    line_counts : (2, N) ndarray of int8
+        Number of white (first row) and black (second row) pieces in each winning combination
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import calc_line_counts, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[0, 0:3] = PLAYER["white"]
+    >>> line_counts = calc_line_counts(board)
+    >>> print(line_counts.shape, line_counts[0].max(), line_counts[1].max())
+    (2, 32) 3 0
+
+    """
+    flat = board.ravel()
+    white = (flat == PLAYER["white"]).astype(np.int8) @ WIN.astype(np.int8)
+    black = (flat == PLAYER["black"]).astype(np.int8) @ WIN.astype(np.int8)
+    return np.vstack((white, black))
+
+
+# %% _rotate_line_counts
+def _rotate_line_counts(board, line_counts, quadrant, direction):
+    r"""Updates the line counts for both players for a quadrant rotation, using the board before the rotation."""
+    row = 3 * ((quadrant - 1) // 2)
+    column = 3 * ((quadrant - 1) % 2)
+    squares = board[row : row + 3, column : column + 3].ravel().tolist()
+    for player, ix in _COUNT_ROW.items():
+        contents = sum(weight for (square, weight) in zip(squares, _QUAD_WEIGHTS) if square == player)
+        if contents:
+            line_counts[ix] += QUAD_LINES[quadrant - 1, ROT_TABLE[direction][contents]] - QUAD_LINES[quadrant - 1, contents]
+
+
+# %% _line_count_winner
+def _line_count_winner(board, wins):
+    r"""Determines the winner from which winning combinations are complete for each player."""
+    if not wins.any():
+        return PLAYER["none"] if PLAYER["none"] in board else PLAYER["draw"]
+    (white, black) = wins.any(axis=1)
+    if white and black:
+        return PLAYER["draw"]
+    if white:
+        return PLAYER["white"]
+    return PLAYER["black"]
+
+
+# %% apply_move
+def apply_move(board, line_counts, move, player):
+    r"""
+    Places a piece and rotates a quadrant, updating the line counts for only the changed squares.
+
+    Parameters
+    ----------
+    board : 2D ndarray of int
+        Board position, modified in-place
+    line_counts : (2, N) ndarray of int8
+        Line counts from `calc_line_counts`, modified in-place
+    move : class Move
+        Move to apply
+    player : int
+        Player making the move
+
+    Returns
+    -------
+    winner : int
+        Winner after the move, from {0=none, 1=white, -1=black, 2=draw}
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import apply_move, calc_line_counts, Move, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[2, 0:3] = PLAYER["white"]
+    >>> board[1, 3] = PLAYER["white"]
+    >>> line_counts = calc_line_counts(board)
+    >>> winner = apply_move(board, line_counts, Move(0, 3, 2, -1), PLAYER["white"])
+    >>> print(winner == PLAYER["white"])
+    True
+
+    """
+    assert board[move.row, move.column] == PLAYER["none"], "Invalid move encountered."
+    board[move.row, move.column] = player
+    line_counts[_COUNT_ROW[player]] += _CELL_LINES[move.row, move.column]
+    _rotate_line_counts(board, line_counts, move.quadrant, move.direction)
+    _rotate_board(board, move.quadrant, move.direction, inplace=True)
+    return _line_count_winner(board, line_counts == _LINE_LENGTH)
+
+
+# %% undo_move
+def undo_move(board, line_counts, move):
+    r"""
+    Takes back a move, updating the line counts for only the changed squares.
+
+    Parameters
+    ----------
+    board : 2D ndarray of int
+        Board position, modified in-place
+    line_counts : (2, N) ndarray of int8
+        Line counts from `calc_line_counts`, modified in-place
+    move : class Move
+        Move to take back, which must be the last move made
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import apply_move, calc_line_counts, Move, PLAYER, undo_move
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> line_counts = calc_line_counts(board)
+    >>> _ = apply_move(board, line_counts, Move(1, 1, 2, 1), PLAYER["black"])
+    >>> undo_move(board, line_counts, Move(1, 1, 2, 1))
+    >>> print(np.count_nonzero(board), np.count_nonzero(line_counts))
+    0 0
+
+    """
+    _rotate_line_counts(board, line_counts, move.quadrant, -move.direction)
+    _rotate_board(board, move.quadrant, -move.direction, inplace=True)
+    player = board[move.row, move.column]
+    assert player != PLAYER["none"], "Invalid move encountered."
+    board[move.row, move.column] = PLAYER["none"]
+    line_counts[_COUNT_ROW[player]] -= _CELL_LINES[move.row, move.column]
+
+
+# %% check_line_counts
+def check_line_counts(board, line_counts):
+    r"""
+    Checks for a win using the line counts instead of correlating the whole board.
+
+    Parameters
+    ----------
+    board : 2D ndarray of int
+        Board position
+    line_counts : (2, N) ndarray of int8
+        Line counts from `calc_line_counts`
+
+    Returns
+    -------
+    winner : int
+        Winner, from {0=none, 1=white, -1=black, 2=draw}
+    win_mask : 2D ndarray of bool
+        Mask of the winning pieces, the same as from `check_for_win`
+
+    Examples
+    --------
+    >>> from dstauffman2.games.pentago import calc_line_counts, check_line_counts, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((6, 6), PLAYER["none"], dtype=int)
+    >>> board[1, 0:5] = PLAYER["black"]
+    >>> (winner, win_mask) = check_line_counts(board, calc_line_counts(board))
+    >>> print(winner == PLAYER["black"], np.count_nonzero(win_mask))
+    True 5
+
+    """
+    wins = line_counts == _LINE_LENGTH
+    winner = _line_count_winner(board, wins)
+    win_mask = np.reshape(np.any(WIN[:, wins[0] | wins[1]], axis=1), (SIZES["board"], SIZES["board"]))
+    return (winner, win_mask)
+
+
 # %% Unit test
 if __name__ == "__main__":
     unittest.main(module="dstauffman2.games.pentago.tests.test_utils", exit=False)
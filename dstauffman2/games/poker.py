@@ -0,0 +1,262 @@
+r"""
+Poker module file for the "dstauffman2" library.  It estimates the equity of Texas Hold'em hands by
+Monte Carlo simulation.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  Each batch deals all of its trials at once, as one permutation of the remaining deck per trial,
+    and scores every player's best hand with the vectorized `evaluate_hands` from the "cards" file.
+    The first cards of each permutation finish the board, and the rest are the opponents' hole cards.
+#.  The batches are run with the shared runner in the "batch" file, so that for the same seed the
+    results are the same with or without a process pool, including when stopping early once the
+    confidence interval is narrow enough.
+
+"""
+
+# %% Imports
+import doctest
+from statistics import NormalDist
+import time
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2.games.batch import run_chunks, split_chunks
+from dstauffman2.games.cards import Card, DECK_SIZE, evaluate_hands, Hand, new_deck
+
+# %% Constants
+# number of trials before switching to a process pool
+PARALLEL_THRESHOLD = 100000
+
+# number of cards in the hole and on a full board
+HOLE_SIZE  = 2
+BOARD_SIZE = 5
+
+
+# %% Classes - PokerEquity
+class PokerEquity(Frozen):
+    r"""
+    Results of a Monte Carlo equity calculation.
+
+    Parameters
+    ----------
+    num_trials : int
+        Number of trials
+    num_wins : int
+        Number of trials won outright
+    num_ties : int
+        Number of trials tied with at least one opponent for the best hand
+    total : float
+        Sum of the share of the pot won in each trial
+    total_sq : float
+        Sum of the squares of the share of the pot won in each trial
+    elapsed : float, optional
+        Time taken, in seconds
+    confidence : float, optional
+        Confidence level for the confidence interval
+
+    Examples
+    --------
+    >>> from dstauffman2.games.poker import PokerEquity
+    >>> results = PokerEquity(4, 2, 1, 2.5, 2.25)
+    >>> print(results.equity, results.win_prob, results.tie_prob, results.loss_prob)
+    0.625 0.5 0.25 0.25
+
+    """
+
+    def __init__(self, num_trials, num_wins, num_ties, total, total_sq, elapsed=0.0, confidence=0.95):
+        self.num_trials = num_trials
+        self.num_wins   = num_wins
+        self.num_ties   = num_ties
+        self.total      = total
+        self.total_sq   = total_sq
+        self.elapsed    = elapsed
+        self.confidence = confidence
+
+    def __str__(self):
+        (lower, upper) = self.confidence_interval
+        text = [
+            f"Equity: {100 * self.equity:.2f}% ({100 * self.confidence:g}% CI {100 * lower:.2f}% to {100 * upper:.2f}%)",
+            f"    wins: {100 * self.win_prob:.2f}%, ties: {100 * self.tie_prob:.2f}%, losses: {100 * self.loss_prob:.2f}%",
+            f"    {self.num_trials} trials in {self.elapsed:.3f} seconds ({self.trials_per_sec:.1f} trials/sec)",
+        ]
+        return "\n".join(text)
+
+    @property
+    def num_losses(self):
+        r"""Number of trials lost."""
+        return self.num_trials - self.num_wins - self.num_ties
+
+    @property
+    def equity(self):
+        r"""Average share of the pot won, with ties split evenly between the tied players."""
+        return self.total / self.num_trials if self.num_trials > 0 else 0.0
+
+    @property
+    def win_prob(self):
+        r"""Probability of winning outright."""
+        return self.num_wins / self.num_trials if self.num_trials > 0 else 0.0
+
+    @property
+    def tie_prob(self):
+        r"""Probability of tying for the best hand."""
+        return self.num_ties / self.num_trials if self.num_trials > 0 else 0.0
+
+    @property
+    def loss_prob(self):
+        r"""Probability of losing."""
+        return self.num_losses / self.num_trials if self.num_trials > 0 else 0.0
+
+    @property
+    def std_err(self):
+        r"""Standard error of the equity."""
+        if self.num_trials < 2:
+            return np.inf
+        variance = (self.total_sq - self.total**2 / self.num_trials) / (self.num_trials - 1)
+        return float(np.sqrt(max(variance, 0.0) / self.num_trials))
+
+    @property
+    def half_width(self):
+        r"""Half the width of the confidence interval of the equity."""
+        return NormalDist().inv_cdf(0.5 + self.confidence / 2) * self.std_err
+
+    @property
+    def confidence_interval(self):
+        r"""Lower and upper bounds of the confidence interval of the equity."""
+        return (max(self.equity - self.half_width, 0.0), min(self.equity + self.half_width, 1.0))
+
+    @property
+    def trials_per_sec(self):
+        r"""Number of trials per second."""
+        return self.num_trials / self.elapsed if self.elapsed > 0 else np.inf
+
+    @classmethod
+    def combine(cls, results, elapsed=None, confidence=None):
+        r"""Combines a list of results from the same hands into a single result."""
+        if elapsed is None:
+            elapsed = sum(x.elapsed for x in results)
+        if confidence is None:
+            confidence = results[0].confidence
+        return cls(
+            sum(x.num_trials for x in results),
+            sum(x.num_wins for x in results),
+            sum(x.num_ties for x in results),
+            sum(x.total for x in results),
+            sum(x.total_sq for x in results),
+            elapsed=elapsed,
+            confidence=confidence,
+        )
+
+
+# %% _get_codes
+def _get_codes(cards):
+    r"""Gets the card codes from a Hand, a list of Cards or the codes themselves."""
+    if cards is None:
+        return np.zeros(0, dtype=np.uint8)
+    if isinstance(cards, Hand):
+        return cards.to_array()
+    return np.array([card.code if isinstance(card, Card) else card for card in cards], dtype=np.uint8)
+
+
+# %% _simulate_batch
+def _simulate_batch(hole, board, num_opponents, num_trials, seed):
+    r"""Simulates a single batch of trials with its own random stream."""
+    start = time.perf_counter()
+    prng = np.random.default_rng(seed)
+    remaining = np.setdiff1d(new_deck(), np.concatenate((hole, board)))
+    num_board = BOARD_SIZE - board.size
+    # each trial deals from its own permutation of the remaining deck
+    drawn = prng.permuted(np.tile(remaining, (num_trials, 1)), axis=1)
+    boards = np.concatenate((np.tile(board, (num_trials, 1)), drawn[:, :num_board]), axis=1)
+    mine = evaluate_hands(np.concatenate((np.tile(hole, (num_trials, 1)), boards), axis=1))
+    holes = drawn[:, num_board : num_board + HOLE_SIZE * num_opponents].reshape(num_trials, num_opponents, HOLE_SIZE)
+    theirs = np.concatenate((holes, np.broadcast_to(boards[:, np.newaxis, :], (num_trials, num_opponents, BOARD_SIZE))), \
+        axis=2)
+    others = evaluate_hands(theirs.reshape(-1, HOLE_SIZE + BOARD_SIZE)).reshape(num_trials, num_opponents)
+    best = others.max(axis=1)
+    wins = mine > best
+    ties = mine == best
+    # ties split the pot between everyone with the best hand
+    shares = np.where(wins, 1.0, np.where(ties, 1.0 / (1 + np.count_nonzero(others == mine[:, np.newaxis], axis=1)), 0.0))
+    return PokerEquity(num_trials, int(np.count_nonzero(wins)), int(np.count_nonzero(ties)), float(np.sum(shares)), \
+        float(np.sum(shares**2)), elapsed=time.perf_counter() - start)
+
+
+# %% calc_equity
+def calc_equity(hole, board=None, *, num_opponents=1, num_trials=100000, seed=None, error_target=None, confidence=0.95, \
+        batch_size=10000, num_workers=None):
+    r"""
+    Calculates the equity of the hole cards against random opponents by Monte Carlo simulation.
+
+    Parameters
+    ----------
+    hole : class Hand or list of class Card or array_like of int
+        Your two hole cards, as cards or card codes
+    board : class Hand or list of class Card or array_like of int, optional
+        Community cards that are already dealt, from zero to five of them
+    num_opponents : int, optional
+        Number of opponents with random hole cards
+    num_trials : int, optional
+        Maximum number of trials
+    seed : int, optional
+        Seed for the random number generator
+    error_target : float, optional
+        Stop once half the width of the confidence interval of the equity is at most this
+    confidence : float, optional
+        Confidence level for the confidence interval
+    batch_size : int, optional
+        Number of trials that are dealt and scored at once
+    num_workers : int, optional
+        Number of worker processes, defaults to the number of CPUs, and 1 runs everything in this process
+
+    Returns
+    -------
+    class PokerEquity
+        Equity, with the win, tie and loss probabilities and the confidence interval
+
+    Notes
+    -----
+    #.  The error target is checked after each batch, so at least one batch is always done.
+    #.  A process pool is only used once there are at least PARALLEL_THRESHOLD trials.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.cards import Card, Rank, Suit
+    >>> from dstauffman2.games.poker import calc_equity
+    >>> hole = [Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES)]
+    >>> board = [Card(Rank.QUEEN, Suit.SPADES), Card(Rank.JACK, Suit.SPADES), Card(Rank.TEN, Suit.SPADES)]
+    >>> results = calc_equity(hole, board, num_opponents=3, num_trials=1000, seed=0)
+    >>> print(results.equity, results.num_trials)
+    1.0 1000
+
+    """
+    hole  = _get_codes(hole)
+    board = _get_codes(board)
+    if hole.size != HOLE_SIZE:
+        raise ValueError(f"There must be {HOLE_SIZE} hole cards, not {hole.size}.")
+    if board.size > BOARD_SIZE:
+        raise ValueError(f"There can be at most {BOARD_SIZE} board cards, not {board.size}.")
+    known = np.concatenate((hole, board))
+    if np.any(known >= DECK_SIZE) or np.unique(known).size != known.size:
+        raise ValueError("The hole and board cards must be distinct cards from the deck.")
+    if num_opponents < 1 or known.size + BOARD_SIZE - board.size + HOLE_SIZE * num_opponents > DECK_SIZE:
+        raise ValueError(f"Unexpected number of opponents: {num_opponents}")
+    chunks = split_chunks(num_trials, batch_size, seed)
+    tasks = [(hole, board, num_opponents, size, this_seed) for (_, size, this_seed) in chunks]
+
+    def _is_done(results):
+        return PokerEquity.combine(results, confidence=confidence).half_width <= error_target
+
+    start = time.perf_counter()
+    results = run_chunks(_simulate_batch, tasks, parallel=num_trials >= PARALLEL_THRESHOLD, num_workers=num_workers, \
+        is_done=_is_done if error_target is not None else None)
+    return PokerEquity.combine(results, elapsed=time.perf_counter() - start, confidence=confidence)
+
+
+# %% Unit test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.test_poker", exit=False)
+    doctest.testmod(verbose=False)
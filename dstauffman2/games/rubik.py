@@ -5,15 +5,27 @@
 -----
 #.  Written by David C. Stauffer in September 2015 after he found some old school files of Rubik's
     cube permutations.
+#.  Updated by David C. Stauffer in October 2026 to add a cube engine and solver.  The cube is the
+    54 facelets as a uint8 array of the face that each one belongs to, and each face turn is a
+    precomputed array of where each facelet comes from, so that any sequence of moves is a single
+    index into the facelets, even for many cubes at once.  The solver uses small coordinates of the
+    corner and edge cubies instead, with move tables and pruning tables that are saved to disk.
 
 """
 
 # %% Imports
 import doctest
-from math import factorial
+from functools import lru_cache
+from itertools import combinations, permutations
+from math import comb, factorial
 import os
+import time
 
-from dstauffman2 import get_root_dir
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2 import get_output_dir, get_root_dir
 
 # %% Constants
 COLORS = {}
@@ -24,8 +36,53 @@
 COLORS["B"] = "#ffff00"  # yellow
 COLORS["D"] = "#0000cc"  # blue
 
+# faces in the order of the facelets, and the letter for each move of that face
+FACES = "ULFRBD"
+
+# number of facelets on each face and on the whole cube
+FACE_SIZE = 9
+NUM_FACELETS = len(FACES) * FACE_SIZE
+
+# names of the face turns, as a quarter turn clockwise, a half turn and a quarter turn counterclockwise
+MOVES = [face + suffix for face in FACES for suffix in ("", "2", "'")]
+
+# facelets of the solved cube, as the index of the face that they belong to
+SOLVED = np.repeat(np.arange(len(FACES), dtype=np.uint8), FACE_SIZE)
+
+# outward normal, and the directions of the facelet columns and rows, for each face as it is seen
+# from the outside, where x is to the right, y is up and z is towards the front
+_FACE_AXES = {
+    "U": ((0, 1, 0), (1, 0, 0), (0, 0, 1)),
+    "L": ((-1, 0, 0), (0, 0, 1), (0, -1, 0)),
+    "F": ((0, 0, 1), (1, 0, 0), (0, -1, 0)),
+    "R": ((1, 0, 0), (0, 0, -1), (0, -1, 0)),
+    "B": ((0, 0, -1), (-1, 0, 0), (0, -1, 0)),
+    "D": ((0, -1, 0), (1, 0, 0), (0, 0, -1)),
+}
+
+# positions of the corner and edge cubies, with the four middle layer edges last
+_CORNERS = ["URF", "UFL", "ULB", "UBR", "DFR", "DLF", "DBL", "DRB"]
+_EDGES   = ["UR", "UF", "UL", "UB", "DR", "DF", "DL", "DB", "FR", "FL", "BL", "BR"]
+
+# moves that keep the cube within the subgroup of the second phase of the solver
+_PHASE2_MOVES = [MOVES.index(move) for move in ("U", "U2", "U'", "D", "D2", "D'", "R2", "L2", "F2", "B2")]
+
+# maximum depth of the searches in each phase of the solver
+_MAX_DEPTH1 = 12
+_MAX_DEPTH2 = 18
+
+# version of the cached solver tables, to change whenever they change
+_TABLES_VERSION = 1
+
+# solver tables that are already loaded in this process, by the cached file name
+_TABLES = {}
+
+# face on the opposite side of each face
+_OPPOSITE = [FACES.index(face) for face in "DRBLFU"]
+
 
 # %% Functions
+@lru_cache(maxsize=None)
 def rubiks_cube_permutations(size=3):
     r"""
     Calculates the number of valid permutations in the given sized cube.
@@ -44,6 +101,16 @@ def rubiks_cube_permutations(size=3):
     -----
     #.  Written by David C. Stauffer in September 2015.
     #.  Look at http://www.therubikzone.com/Number-Of-Combinations.html for an example calculator.
+    #.  Updated by David C. Stauffer in October 2026 to use the closed form for any size of cube,
+        instead of the saved values for sizes 4 to 9.  The count is the product of the pieces:
+            corners: 8! * 3^7 arrangements with the last twist fixed, but even cubes have no fixed
+                centers to orient the whole cube by, so one corner is held still, leaving 7! * 3^6
+            edges:   odd cubes have the 12 middle edges, with 12! * 2^11 arrangements and the last
+                flip fixed, and half of those for the parity shared with the corners, or 12! * 2^10
+            wings:   each other orbit of 24 edge pieces can be in any of 24! arrangements
+            centers: each orbit of 24 center pieces can be in any of 24! arrangements, divided by
+                the (4!)^6 ways to swap the four identical pieces of each color
+        The results are exact Python ints, and are remembered for each size.
 
     Examples
     --------
@@ -52,35 +119,630 @@ def rubiks_cube_permutations(size=3):
     >>> print(perms)
     43252003274489856000
 
+    >>> print(rubiks_cube_permutations(2))
+    3674160
+
     """
+    if not isinstance(size, int) or size < 1:
+        raise ValueError(f"Unexpected cube size: {size}")
     if size == 1:
-        perms = 1
-    elif size == 2:
-        perms = factorial(8) * 3**8 // (2 * 3)
-        perms = 3674160  # TODO: calculate this
-    elif size == 3:
-        return factorial(8) * 3**8 * factorial(12) * 2**12 // (2 * 3 * 2)
-    elif size == 4:
-        perms = 7401196841564901869874093974498574336000000000  # TODO: find generic algorithm for all the rest of them!
-    elif size == 5:
-        perms = 282870942277741856536180333107150328293127731985672134721536000000000000000
-    elif size == 6:
-        perms = 157152858401024063281013959519483771508510790313968742344694684829502629887168573442107637760000000000000000000000000
-    elif size == 7:
-        perms = 19500551183731307835329126754019748794904992692043434567152132912323232706135469180065278712755853360682328551719137311299993600000000000000000000000000000000000
-    elif size == 8:
-        perms = 35173780923109452777509592367006557398539936328978098352427605879843998663990903628634874024098344287402504043608416113016679717941937308041012307368528117622006727311360000000000000000000000000000000000000000000000000
-    elif size == 9:
-        perms = 14170392390542612915246393916889970752732946384514830589276833655387444667609821068034079045039617216635075219765012566330942990302517903971787699783519265329288048603083134861573075573092224082416866010882486829056000000000000000000000000000000000000000000000000000000000000000
-    # elif size == 10:
-    #    perms = 82 983 598 512 782 362 708 769 381 780 036 344 745 129 162 094 677 382 883 567 691 311 764 021 348 095 163 778 336 143 207 042 993 152 056 079 271 030 423 741 110 902 768 732 457 008 486 832 096 777 758 106 509 177 169 197 894 747 758 859 723 340 177 608 764 906 985 646 389 382 047 319 811 227 549 112 086 753 524 742 719 830 990 076 805 422 479 380 054 016 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000
-    # elif size == 11:
-    #    perms = 108 540 871 852 024 137 837 529 457 366 425 345 163 408 989 164 877 909 166 491 842 616 641 991 981 135 011 689 476 695 849 803 941 790 591 401 795 168 969 498 249 897 355 324 768 178 088 518 513 156 026 831 828 793 854 471 326 717 801 604 260 274 446 021 846 541 136 205 357 444 802 749 291 495 386 649 979 610 567 642 710 417 177 711 042 509 688 835 903 368 099 465 519 253 326 878 312 637 499 376 794 203 125 671 816 898 434 564 096 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000 000
+        return 1
+    # size of the inner pieces along each edge of the cube
+    inner = size - 2
+    if size % 2 == 0:
+        corners = factorial(7) * 3**6
+        edges   = 1
     else:
-        raise ValueError("Not Implemented.")
+        corners = factorial(8) * 3**7
+        edges   = factorial(12) * 2**10
+    wings   = factorial(24) ** (inner // 2)
+    centers = (factorial(24) // factorial(4) ** 6) ** (inner**2 // 4)
+    return corners * edges * wings * centers
+
+
+# %% _build_facelets
+def _build_facelets():
+    r"""Builds the index of each facelet, by the position of its cubie and its outward normal."""
+    facelets = {}
+    for ix, face in enumerate(FACES):
+        (normal, right, down) = _FACE_AXES[face]
+        for row in range(3):
+            for col in range(3):
+                pos = tuple(n + (col - 1) * r + (row - 1) * d for (n, r, d) in zip(normal, right, down))
+                facelets[(pos, normal)] = ix * FACE_SIZE + 3 * row + col
+    return facelets
+
+
+# %% _rotate
+def _rotate(vector, axis):
+    r"""Rotates the vector a quarter turn about the outward axis, clockwise as seen from the outside."""
+    (x, y, z) = vector
+    (a, b, c) = axis
+    cross = (b * z - c * y, c * x - a * z, a * y - b * x)
+    dot = a * x + b * y + c * z
+    return tuple(dot * k - w for (k, w) in zip(axis, cross))
+
+
+# %% _build_move_perms
+def _build_move_perms(facelets):
+    r"""Builds the source index for each facelet after each of the face turns."""
+    perms = np.empty((len(MOVES), NUM_FACELETS), dtype=np.intp)
+    for ix, face in enumerate(FACES):
+        normal = _FACE_AXES[face][0]
+        quarter = np.arange(NUM_FACELETS)
+        for (pos, facing), source in facelets.items():
+            if sum(p * n for (p, n) in zip(pos, normal)) == 1:
+                quarter[facelets[(_rotate(pos, normal), _rotate(facing, normal))]] = source
+        turn = np.arange(NUM_FACELETS)
+        for power in range(3):
+            turn = turn[quarter]
+            perms[3 * ix + power, :] = turn
     return perms
 
 
+# %% _build_cubie_facelets
+def _build_cubie_facelets(facelets, names):
+    r"""Builds the facelets of each cubie position, in the order of the faces in its name."""
+    out = np.empty((len(names), len(names[0])), dtype=np.intp)
+    for ix, name in enumerate(names):
+        normals = [_FACE_AXES[face][0] for face in name]
+        pos = tuple(sum(values) for values in zip(*normals))
+        out[ix, :] = [facelets[(pos, normal)] for normal in normals]
+    return out
+
+
+# the source index of each facelet after each of the face turns, plus the identity for no move
+_FACELETS   = _build_facelets()
+MOVE_PERMS  = _build_move_perms(_FACELETS)
+_MOVE_PERMS = np.vstack((MOVE_PERMS, np.arange(NUM_FACELETS)))
+
+# facelets of each corner and edge position, and which piece each set of colors is
+_CORNER_FACELETS = _build_cubie_facelets(_FACELETS, _CORNERS)
+_EDGE_FACELETS   = _build_cubie_facelets(_FACELETS, _EDGES)
+_CORNER_PIECES   = {tuple(FACES.index(face) for face in name): ix for (ix, name) in enumerate(_CORNERS)}
+_EDGE_PIECES     = {tuple(FACES.index(face) for face in name): ix for (ix, name) in enumerate(_EDGES)}
+
+
+# %% parse_moves
+def parse_moves(moves):
+    r"""
+    Parses a sequence of face turns into their indices in MOVES.
+
+    Parameters
+    ----------
+    moves : str or iterable of str or int
+        Face turns, either as a string separated by whitespace, or as names or indices
+
+    Returns
+    -------
+    list of int
+        Index of each move in MOVES
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import parse_moves
+    >>> print(parse_moves("R U2 F'"))
+    [9, 1, 8]
+
+    """
+    if isinstance(moves, str):
+        moves = moves.split()
+    out = []
+    for move in moves:
+        if isinstance(move, str):
+            if move not in MOVES:
+                raise ValueError(f'Unexpected move: "{move}"')
+            out.append(MOVES.index(move))
+        else:
+            if not 0 <= move < len(MOVES):
+                raise ValueError(f"Unexpected move: {move}")
+            out.append(int(move))
+    return out
+
+
+# %% format_moves
+def format_moves(moves):
+    r"""
+    Formats a sequence of move indices as a string of face turns.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import format_moves
+    >>> print(format_moves([9, 1, 8]))
+    R U2 F'
+
+    """
+    return " ".join(MOVES[move] for move in parse_moves(moves))
+
+
+# %% apply_moves
+def apply_moves(states, moves):
+    r"""
+    Applies face turns to one or more cubes.
+
+    Parameters
+    ----------
+    states : (54, ) or (N, 54) array_like of uint8
+        Facelets of each cube, as the index of the face that each one belongs to
+    moves : str or iterable of str or int or (N, M) array_like of int
+        Face turns to apply to every cube, or a different sequence of move indices for each cube,
+        padded with -1 for no move
+
+    Returns
+    -------
+    (54, ) or (N, 54) ndarray of uint8
+        Facelets of each cube after the moves
+
+    Notes
+    -----
+    #.  The same moves for every cube are combined into a single permutation, so that the whole
+        sequence is applied with one index into the facelets.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import apply_moves, is_solved, SOLVED
+    >>> state = apply_moves(SOLVED, "R U R' U'")
+    >>> print(is_solved(state), is_solved(apply_moves(state, "R U R' U' " * 5)))
+    False True
+
+    """
+    states = np.asarray(states, dtype=np.uint8)
+    if not isinstance(moves, str) and np.ndim(moves) == 2:
+        moves = np.asarray(moves, dtype=np.intp)
+        if moves.shape[0] != states.shape[0]:
+            raise ValueError("There must be one sequence of moves for each cube.")
+        out = states.copy()
+        for col in moves.T:
+            out = np.take_along_axis(out, _MOVE_PERMS[col], axis=1)
+        return out
+    perm = np.arange(NUM_FACELETS)
+    for move in parse_moves(moves):
+        perm = perm[MOVE_PERMS[move]]
+    return states[..., perm]
+
+
+# %% is_solved
+def is_solved(states):
+    r"""
+    Determines whether each cube is solved, with every face a single color.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import is_solved, SOLVED
+    >>> print(is_solved(SOLVED))
+    True
+
+    """
+    faces = np.asarray(states).reshape(np.shape(states)[:-1] + (len(FACES), FACE_SIZE))
+    return np.all(faces == faces[..., :1], axis=(-2, -1))
+
+
+# %% cube_to_string
+def cube_to_string(state):
+    r"""
+    Converts the facelets of a cube to a string, with the letter of the face that each one belongs to.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import apply_moves, cube_to_string, SOLVED
+    >>> print(cube_to_string(apply_moves(SOLVED, "U"))[:27])
+    UUUUUUUUUFFFLLLLLLRRRFFFFFF
+
+    """
+    return "".join(FACES[face] for face in np.asarray(state))
+
+
+# %% cube_from_string
+def cube_from_string(text):
+    r"""
+    Converts a string of face letters to the facelets of a cube.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import cube_from_string, is_solved
+    >>> print(is_solved(cube_from_string("U" * 9 + "L" * 9 + "F" * 9 + "R" * 9 + "B" * 9 + "D" * 9)))
+    True
+
+    """
+    if len(text) != NUM_FACELETS or any(letter not in FACES for letter in text):
+        raise ValueError(f"Cube strings must have {NUM_FACELETS} letters from {FACES}.")
+    return np.array([FACES.index(letter) for letter in text], dtype=np.uint8)
+
+
+# %% scramble_cube
+def scramble_cube(num_moves=25, seed=None):
+    r"""
+    Scrambles a solved cube with random face turns, never turning the same face twice in a row.
+
+    Parameters
+    ----------
+    num_moves : int, optional
+        Number of face turns
+    seed : int or class numpy.random.Generator, optional
+        Seed for the random number generator
+
+    Returns
+    -------
+    state : (54, ) ndarray of uint8
+        Facelets of the scrambled cube
+    moves : str
+        Face turns that were applied
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import scramble_cube
+    >>> (state, moves) = scramble_cube(10, seed=0)
+    >>> print(len(moves.split()))
+    10
+
+    """
+    prng = np.random.default_rng(seed)
+    moves = []
+    while len(moves) < num_moves:
+        move = int(prng.integers(len(MOVES)))
+        if not moves or move // 3 != moves[-1] // 3:
+            moves.append(move)
+    return (apply_moves(SOLVED, moves), format_moves(moves))
+
+
+# %% _get_cubies
+def _get_cubies(state):
+    r"""Gets the piece and orientation at each corner and edge position, checking that the cube can be solved."""
+    state = np.asarray(state)
+    if state.shape != (NUM_FACELETS,) or np.any(np.bincount(state, minlength=len(FACES)) != FACE_SIZE) or \
+            np.any(state[FACE_SIZE // 2 :: FACE_SIZE] != np.arange(len(FACES))):
+        raise ValueError("The cube must have nine facelets of each color, with the centers in place.")
+    up_down = (FACES.index("U"), FACES.index("D"))
+    (cp, co) = (np.empty(len(_CORNERS), dtype=np.intp), np.empty(len(_CORNERS), dtype=np.intp))
+    for pos, colors in enumerate(state[_CORNER_FACELETS].tolist()):
+        # the orientation is where the up or down color is, and the piece is its colors starting from there
+        co[pos] = next((ix for (ix, color) in enumerate(colors) if color in up_down), 0)
+        cp[pos] = _CORNER_PIECES.get(tuple(colors[co[pos] :] + colors[: co[pos]]), -1)
+    (ep, eo) = (np.empty(len(_EDGES), dtype=np.intp), np.empty(len(_EDGES), dtype=np.intp))
+    for pos, colors in enumerate(state[_EDGE_FACELETS].tolist()):
+        eo[pos] = int(tuple(colors) not in _EDGE_PIECES)
+        ep[pos] = _EDGE_PIECES.get(tuple(colors[::-1]) if eo[pos] else tuple(colors), -1)
+    if np.any(np.sort(cp) != np.arange(len(_CORNERS))) or np.any(np.sort(ep) != np.arange(len(_EDGES))):
+        raise ValueError("The cube has corners or edges that don't exist.")
+    if np.sum(co) % 3 != 0 or np.sum(eo) % 2 != 0 or _get_parity(cp) != _get_parity(ep):
+        raise ValueError("The cube can't be solved, as it has a twisted corner, a flipped edge or two swapped pieces.")
+    return (cp, co, ep, eo)
+
+
+# %% _get_parity
+def _get_parity(perm):
+    r"""Gets the parity of the permutation, as 0 for even and 1 for odd."""
+    return sum(int(a > b) for (i, a) in enumerate(perm) for b in perm[i + 1 :]) % 2
+
+
+# the piece and orientation at each position after each face turn of a solved cube
+(_MOVE_CP, _MOVE_CO, _MOVE_EP, _MOVE_EO) = (np.array(x) for x in zip(*(_get_cubies(SOLVED[perm]) for perm in MOVE_PERMS)))
+
+# all the permutations of the corners or the up and down layer edges, and of the middle layer edges,
+# in order, so that the index of each one is its coordinate
+_PERMS8 = np.array(list(permutations(range(8))), dtype=np.intp)
+_PERMS4 = np.array(list(permutations(range(4))), dtype=np.intp)
+
+# binomial coefficients for the coordinate of the middle layer edge positions
+_BINOMIAL = np.array([[comb(n, k) for k in range(5)] for n in range(len(_EDGES))], dtype=np.intp)
+
+
+# %% _encode_orient
+def _encode_orient(orient, base):
+    r"""Encodes the orientations of all but the last piece as a number in the given base."""
+    num = orient.shape[-1] - 1
+    return orient[..., :num] @ base ** np.arange(num - 1, -1, -1)
+
+
+# %% _decode_orient
+def _decode_orient(coord, num, base):
+    r"""Decodes the orientations of all the pieces, where the last one makes the total a multiple of the base."""
+    orient = np.empty(np.shape(coord) + (num,), dtype=np.intp)
+    orient[..., : num - 1] = np.asarray(coord)[..., np.newaxis] // base ** np.arange(num - 2, -1, -1) % base
+    orient[..., num - 1] = -np.sum(orient[..., : num - 1], axis=-1) % base
+    return orient
+
+
+# %% _encode_perm
+def _encode_perm(perm):
+    r"""Encodes the permutations as their index in the sorted order of all of them."""
+    num = perm.shape[-1]
+    coord = np.zeros(perm.shape[:-1], dtype=np.intp)
+    for i in range(num - 1):
+        coord = coord * (num - i) + np.sum(perm[..., i + 1 :] < perm[..., i : i + 1], axis=-1)
+    return coord
+
+
+# %% _encode_slice
+def _encode_slice(mask):
+    r"""Encodes which edge positions hold the middle layer edges, as the index of that combination."""
+    count = np.cumsum(mask, axis=-1)
+    return np.sum(np.where(mask, _BINOMIAL[np.arange(len(_EDGES)), np.minimum(count, 4)], 0), axis=-1)
+
+
+# %% _build_slice_masks
+def _build_slice_masks():
+    r"""Builds which edge positions hold the middle layer edges for each coordinate."""
+    masks = np.zeros((comb(len(_EDGES), 4), len(_EDGES)), dtype=bool)
+    for positions in combinations(range(len(_EDGES)), 4):
+        mask = np.zeros(len(_EDGES), dtype=bool)
+        mask[list(positions)] = True
+        masks[_encode_slice(mask)] = mask
+    return masks
+
+
+# %% _build_pruning
+def _build_pruning(move1, move2, start):
+    r"""Builds the number of moves to solve each pair of coordinates, by a breadth first search from the start."""
+    num2 = move2.shape[0]
+    depth = np.full(move1.shape[0] * num2, -1, dtype=np.int8)
+    depth[start] = 0
+    level = 0
+    while True:
+        frontier = np.flatnonzero(depth == level)
+        if frontier.size == 0:
+            return depth
+        (coord1, coord2) = np.divmod(frontier, num2)
+        for move in range(move1.shape[1]):
+            after = move1[coord1, move].astype(np.intp) * num2 + move2[coord2, move]
+            depth[after[depth[after] < 0]] = level + 1
+        level += 1
+
+
+# %% _build_tables
+def _build_tables():
+    r"""Builds the move tables for each coordinate and the pruning tables for each phase of the solver."""
+    tables = {}
+    # phase 1 coordinates, as the corner twists, edge flips and middle layer edge positions
+    co = _decode_orient(np.arange(3 ** (len(_CORNERS) - 1)), len(_CORNERS), 3)
+    eo = _decode_orient(np.arange(2 ** (len(_EDGES) - 1)), len(_EDGES), 2)
+    masks = _build_slice_masks()
+    tables["twist_move"] = np.stack([_encode_orient((co[:, cp] + o) % 3, 3) for (cp, o) in zip(_MOVE_CP, _MOVE_CO)], axis=1)
+    tables["flip_move"] = np.stack([_encode_orient((eo[:, ep] + o) % 2, 2) for (ep, o) in zip(_MOVE_EP, _MOVE_EO)], axis=1)
+    tables["slice_move"] = np.stack([_encode_slice(masks[:, ep]) for ep in _MOVE_EP], axis=1)
+    # phase 2 coordinates, as the corner, up and down layer edge and middle layer edge permutations
+    tables["cperm_move"] = np.stack([_encode_perm(_PERMS8[:, _MOVE_CP[move]]) for move in _PHASE2_MOVES], axis=1)
+    tables["eperm_move"] = np.stack([_encode_perm(_PERMS8[:, _MOVE_EP[move, :8]]) for move in _PHASE2_MOVES], axis=1)
+    tables["sperm_move"] = np.stack([_encode_perm(_PERMS4[:, _MOVE_EP[move, 8:] - 8]) for move in _PHASE2_MOVES], axis=1)
+    for key in list(tables):
+        tables[key] = tables[key].astype(np.uint16)
+    # pruning tables for each pair of coordinates
+    num_slice = masks.shape[0]
+    solved_slice = int(_encode_slice(np.arange(len(_EDGES)) >= 8))
+    tables["twist_prune"] = _build_pruning(tables["twist_move"], tables["slice_move"], solved_slice)
+    tables["flip_prune"] = _build_pruning(tables["flip_move"], tables["slice_move"], solved_slice)
+    tables["cperm_prune"] = _build_pruning(tables["cperm_move"], tables["sperm_move"], 0)
+    tables["eperm_prune"] = _build_pruning(tables["eperm_move"], tables["sperm_move"], 0)
+    tables["sizes"] = np.array([_TABLES_VERSION, num_slice, solved_slice, len(_PERMS4)])
+    return tables
+
+
+# %% load_solver_tables
+def load_solver_tables(folder=None):
+    r"""
+    Loads the move and pruning tables for the solver, building and saving them first if needed.
+
+    Parameters
+    ----------
+    folder : str, optional
+        Folder for the cached tables, defaults to the output folder
+
+    Returns
+    -------
+    dict
+        Move table for each coordinate, and pruning table for each pair of coordinates
+
+    Notes
+    -----
+    #.  Tables that are already loaded in this process are reused.
+    #.  Building the tables takes a few seconds, and they are then saved to disk, so that it only
+        happens once.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import load_solver_tables
+    >>> tables = load_solver_tables()
+    >>> print(tables["twist_prune"].size)
+    1082565
+
+    """
+    if folder is None:
+        folder = get_output_dir()
+    cache = os.path.join(folder, f"rubik_tables_v{_TABLES_VERSION}.npz")
+    if cache in _TABLES:
+        return _TABLES[cache]
+    tables = None
+    if os.path.isfile(cache):
+        with np.load(cache) as data:
+            tables = {key: data[key] for key in data.files}
+        if tables.get("sizes", [None])[0] != _TABLES_VERSION:
+            tables = None
+    if tables is None:
+        tables = _build_tables()
+        os.makedirs(folder, exist_ok=True)
+        temp = f"{cache}.{os.getpid()}.tmp.npz"
+        np.savez(temp, **tables)
+        os.replace(temp, cache)
+    _TABLES[cache] = tables
+    return tables
+
+
+# %% Classes - _Search
+class _Search(Frozen):
+    r"""Two phase search for a solution, with iterative deepening in each phase."""
+
+    def __init__(self, tables, cubies, max_length, max_tries, max_time):
+        # lists and bytes are much faster than arrays for looking up one value at a time
+        self.twist_move  = tables["twist_move"].tolist()
+        self.flip_move   = tables["flip_move"].tolist()
+        self.slice_move  = tables["slice_move"].tolist()
+        self.cperm_move  = tables["cperm_move"].tolist()
+        self.eperm_move  = tables["eperm_move"].tolist()
+        self.sperm_move  = tables["sperm_move"].tolist()
+        self.twist_prune = tables["twist_prune"].tobytes()
+        self.flip_prune  = tables["flip_prune"].tobytes()
+        self.cperm_prune = tables["cperm_prune"].tobytes()
+        self.eperm_prune = tables["eperm_prune"].tobytes()
+        (_, self.num_slice, self.solved_slice, self.num_sperm) = tables["sizes"].tolist()
+        self.cubies      = cubies
+        self.max_length  = max_length
+        self.max_tries   = max_tries
+        self.max_time    = max_time
+        self.deadline    = None
+        self.num_tries   = 0
+        self.path1       = []
+        self.path2       = []
+        self.best        = None
+
+    def run(self):
+        r"""Searches for solutions until a short enough one is found, or it runs out of tries."""
+        (cp, co, ep, eo) = self.cubies
+        twist = int(_encode_orient(co, 3))
+        flip = int(_encode_orient(eo, 2))
+        slc = int(_encode_slice(ep >= 8))
+        if self.max_time is not None:
+            self.deadline = time.perf_counter() + self.max_time
+        for depth in range(_MAX_DEPTH1 + 1):
+            if self._phase1(twist, flip, slc, depth, -1):
+                break
+        return self.best
+
+    def _phase1(self, twist, flip, slc, depth, last_face):
+        r"""Searches for the moves into the subgroup of the second phase, and then runs the second phase."""
+        if depth == 0:
+            if twist == 0 and flip == 0 and slc == self.solved_slice:
+                # solutions that end with a second phase move were already found at a shorter depth
+                if not self.path1 or self.path1[-1] not in _PHASE2_MOVES:
+                    return self._start_phase2(last_face)
+            return False
+        num_slice = self.num_slice
+        for move in range(len(MOVES)):
+            face = move // 3
+            if face == last_face or (_OPPOSITE[face] == last_face and face < last_face):
+                continue
+            new_twist = self.twist_move[twist][move]
+            new_flip = self.flip_move[flip][move]
+            new_slice = self.slice_move[slc][move]
+            if max(self.twist_prune[new_twist * num_slice + new_slice], self.flip_prune[new_flip * num_slice + new_slice]) \
+                    >= depth:
+                continue
+            self.path1.append(move)
+            if self._phase1(new_twist, new_flip, new_slice, depth - 1, face):
+                return True
+            self.path1.pop()
+        return False
+
+    def _start_phase2(self, last_face):
+        r"""Runs the second phase from the end of the current first phase, and returns whether to stop."""
+        (cp, _, ep, _) = self.cubies
+        for move in self.path1:
+            (cp, ep) = (cp[_MOVE_CP[move]], ep[_MOVE_EP[move]])
+        (cperm, eperm, sperm) = (int(_encode_perm(cp)), int(_encode_perm(ep[:8])), int(_encode_perm(ep[8:] - 8)))
+        max_depth = _MAX_DEPTH2 if self.best is None else min(_MAX_DEPTH2, len(self.best) - len(self.path1) - 1)
+        for depth in range(max_depth + 1):
+            if self._phase2(cperm, eperm, sperm, depth, last_face):
+                self.best = self.path1 + self.path2
+                self.path2 = []
+                break
+        self.num_tries += 1
+        if self.best is not None and self.max_length is not None and len(self.best) <= self.max_length:
+            return True
+        if self.best is not None and self.deadline is not None and time.perf_counter() >= self.deadline:
+            return True
+        return self.num_tries >= self.max_tries
+
+    def _phase2(self, cperm, eperm, sperm, depth, last_face):
+        r"""Searches for the moves within the subgroup that solve the cube."""
+        if depth == 0:
+            return cperm == 0 and eperm == 0 and sperm == 0
+        num_sperm = self.num_sperm
+        for ix, move in enumerate(_PHASE2_MOVES):
+            face = move // 3
+            if face == last_face or (_OPPOSITE[face] == last_face and face < last_face):
+                continue
+            new_cperm = self.cperm_move[cperm][ix]
+            new_eperm = self.eperm_move[eperm][ix]
+            new_sperm = self.sperm_move[sperm][ix]
+            if max(self.cperm_prune[new_cperm * num_sperm + new_sperm], self.eperm_prune[new_eperm * num_sperm + new_sperm]) \
+                    >= depth:
+                continue
+            self.path2.append(move)
+            if self._phase2(new_cperm, new_eperm, new_sperm, depth - 1, face):
+                return True
+            self.path2.pop()
+        return False
+
+
+# %% _simplify_moves
+def _simplify_moves(moves):
+    r"""Combines consecutive turns of the same face."""
+    out = []
+    for move in moves:
+        if out and out[-1] // 3 == move // 3:
+            power = (out[-1] % 3 + move % 3 + 2) % 4
+            out.pop()
+            if power > 0:
+                out.append(3 * (move // 3) + power - 1)
+        else:
+            out.append(move)
+    return out
+
+
+# %% solve_cube
+def solve_cube(state, *, max_length=None, max_tries=10, max_time=None, folder=None):
+    r"""
+    Solves the cube with a two phase search.
+
+    Parameters
+    ----------
+    state : (54, ) array_like of uint8
+        Facelets of the cube, as the index of the face that each one belongs to
+    max_length : int, optional
+        Stop as soon as a solution with at most this many moves is found
+    max_tries : int, optional
+        Number of first phase solutions to try, keeping the shortest overall solution
+    max_time : float, optional
+        Stop trying more first phase solutions after this many seconds, once any solution is found
+    folder : str, optional
+        Folder for the cached solver tables, defaults to the output folder
+
+    Returns
+    -------
+    str
+        Face turns that solve the cube
+
+    Notes
+    -----
+    #.  The first phase moves the cube into the subgroup generated by U, D, R2, L2, F2 and B2,
+        where every corner and edge is oriented and the middle layer edges are in the middle layer.
+        The second phase then solves the cube with only those moves.  Each phase is an iterative
+        deepening A* search on small coordinates of the cube, where the pruning tables give the
+        exact number of moves to solve each pair of coordinates, which is a lower bound for the
+        whole cube.
+    #.  Each later first phase solution gives the second phase fewer moves to work with, so the
+        overall solutions get shorter with more tries, but never longer.
+    #.  With the default ten tries, a random scramble takes anywhere from a few tenths of a second
+        to over a second, depending on the cube and the machine.  Most of that is spent on the later
+        tries, which usually only save a move or two, so max_time can bound the time instead.  The
+        first solution is always found, however long it takes, so the time can go over max_time.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.rubik import apply_moves, is_solved, solve_cube, SOLVED
+    >>> state = apply_moves(SOLVED, "R U F' L2 D B")
+    >>> solution = solve_cube(state)
+    >>> print(is_solved(apply_moves(state, solution)))
+    True
+
+    """
+    cubies = _get_cubies(state)
+    search = _Search(load_solver_tables(folder), cubies, max_length, max_tries, max_time)
+    solution = search.run()
+    if solution is None:
+        raise ValueError("No solution was found within the maximum search depths.")
+    return format_moves(_simplify_moves(solution))
+
+
 # %% Functions - test_docstrings
 def test_docstrings():
     r"""Tests the docstrings within this file."""
@@ -96,5 +758,5 @@ def test_docstrings():
     if run_tests:
         # Run docstring test
         test_docstrings()
-    for i in range(1, 10):
+    for i in range(1, 12):
         print("A {0}x{0}x{0} Cube has {1} permutations.".format(i, rubiks_cube_permutations(i)))
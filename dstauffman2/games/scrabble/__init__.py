@@ -19,8 +19,13 @@
 from .classes   import Board, Move
 from .constants import LETTERS, VOWELS, CONSONANTS, WWF_SCORES, SCRAB_SCORES, WWF_COUNTS, \
                            WWF_SMALL_COUNTS, SCRAB_COUNTS, COLOR, MAX_LEN, BOARD_SYMBOLS, \
-                           WWF_BOARD, WWF_SMALL_BOARD, SCRAB_BOARD, BOARD, SCORES, COUNTS, DICT
+                           WWF_BOARD, WWF_SMALL_BOARD, SCRAB_BOARD, BOARD, SCORES, COUNTS, DICT, \
+                           RACK_SIZE, WWF_BINGO, SCRAB_BINGO, BINGO, LETTER_PREMIUMS, WORD_PREMIUMS
+from .dawg      import Dawg, load_dawg, ALPHABET
+from .equity    import MoveEquity, evaluate_moves, get_unseen_tiles
 from .gui       import GuiSettings, ScrabbleGui
+from .lexicon   import LEXICONS, Lexicon, load_lexicon
+from .moves     import MoveGenerator, find_moves
 from .plotting  import plot_board, plot_tile, plot_letter, plot_draw_stats, plot_move_strength, \
                            display_tile_bag
 from .special   import find_all, find_all_two_letter_words, find_all_three_letter_words, \
@@ -35,6 +40,8 @@
 from .utils     import get_root_dir, get_dict_path, get_raw_dictionary, create_dict, \
                            count_num_words, find_all_words, validate_board, validate_move, \
                            score_move, get_board_played, get_board_open, get_board_must_play
+from .wordlist  import WordList, get_cache_path, load_word_list
+from .wordstore import WordStore, load_word_store
 # fmt: on
 
 # %% Unit Test
@@ -11,46 +11,177 @@
 import doctest
 import unittest
 
+import numpy as np
+
 from dstauffman import Frozen
 
 from dstauffman2.games.scrabble.constants import BOARD
 from dstauffman2.games.scrabble.utils import validate_board, validate_move
 
+# %% Constants
+# byte value of an empty square in the board grid
+EMPTY = ord(" ")
+
 
 # %% Board
 class Board(Frozen):
-    r"""Class that holds the board."""
+    r"""
+    Class that holds the board.
+
+    Parameters
+    ----------
+    board : str, optional
+        Board layout
+    played : str, optional
+        Tiles already played on the board, with spaces for empty squares
+
+    Attributes
+    ----------
+    grid : (num_rows, num_cols) ndarray of uint8
+        Byte value of the tile on each square, with EMPTY for empty squares and uppercase letters
+        for blanks
+    anchors : (num_rows, num_cols) ndarray of bool
+        Empty squares that a move has to cover at least one of, which are the squares next to a
+        tile, or the start square on an empty board
+    num_tiles : int
+        Number of tiles on the board
+
+    Notes
+    -----
+    #.  Updated by David C. Stauffer in October 2026 to keep the tiles in a NumPy grid, so that
+        moves update the grid and anchors in place, and `played` is only built as a string when
+        it is asked for.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Board, Move
+    >>> board = Board()
+    >>> board.make_move(Move("sword", 7, 3, 0))
+    >>> print(board.played.split("\n")[7].strip())
+    sword
+
+    >>> print(board.anchors.sum())
+    12
+
+    >>> _ = board.undo()
+    >>> print(board.num_tiles)
+    0
+
+    """
 
     def __init__(self, board=BOARD, played=None):
         (num_rows, num_cols) = validate_board(board)
-        self.board    = board
-        self.num_rows = num_rows
-        self.num_cols = num_cols
+        self.board     = board
+        self.num_rows  = num_rows
+        self.num_cols  = num_cols
+        self.grid      = np.full((num_rows, num_cols), EMPTY, dtype=np.uint8)
+        self.anchors   = np.zeros((num_rows, num_cols), dtype=bool)
+        self.num_tiles = 0
+        # start squares, which are the anchors for the first move
+        layout = np.frombuffer(board.replace("\n", "").encode("ascii"), dtype=np.uint8)
+        self._start = layout.reshape(num_rows, num_cols) == ord("s")
+        # occupied squares, padded by one on each side so that the neighbors never go off the board
+        self._occupied = np.zeros((num_rows + 2, num_cols + 2), dtype=bool)
+        # moves that have been made, with the mask of the squares that each one placed tiles on
+        self._history = []
         if played is None:
-            self.played = (" " * num_cols + "\n") * num_rows
+            self._update_anchors()
         else:
             self.played = played
 
-    def make_move(self, move):
-        r"""Makes the given move to the board."""
+    @property
+    def played(self):
+        r"""Tiles on the board as a string, with spaces for empty squares and newlines between the rows."""
+        return "\n".join(row.tobytes().decode("ascii") for row in self.grid)
+
+    @played.setter
+    def played(self, played):
+        rows = played.split("\n")
+        if len(rows) != self.num_rows or any(len(row) != self.num_cols for row in rows):
+            raise ValueError("Played tiles are not the same size as the board.")
+        self.grid[:] = np.frombuffer("".join(rows).encode("ascii"), dtype=np.uint8).reshape(self.num_rows, self.num_cols)
+        self._occupied[1:-1, 1:-1] = self.grid != EMPTY
+        self.num_tiles = int(np.count_nonzero(self._occupied))
+        self._history = []
+        self._update_anchors()
+
+    def _line(self, array, move, pad=0):
+        r"""Gets a view of the squares that the move covers in the given array, which is padded by pad on each side."""
+        (row, col) = (move.row + pad, move.col + pad)
+        if move.dir == 0:
+            return array[row, col : col + len(move.word)]
+        return array[row : row + len(move.word), col]
+
+    def _update_anchors(self, rows=None, cols=None):
+        r"""Updates the anchors within the given (start, stop) rows and columns, or the whole board."""
+        if self.num_tiles == 0:
+            np.copyto(self.anchors, self._start)
+            return
+        (r0, r1) = (0, self.num_rows) if rows is None else (max(rows[0] - 1, 0), min(rows[1] + 1, self.num_rows))
+        (c0, c1) = (0, self.num_cols) if cols is None else (max(cols[0] - 1, 0), min(cols[1] + 1, self.num_cols))
+        occupied = self._occupied
+        near = occupied[r0 : r1, c0 + 1 : c1 + 1] | occupied[r0 + 2 : r1 + 2, c0 + 1 : c1 + 1] | \
+            occupied[r0 + 1 : r1 + 1, c0 : c1] | occupied[r0 + 1 : r1 + 1, c0 + 2 : c1 + 2]
+        self.anchors[r0:r1, c0:c1] = near & ~occupied[r0 + 1 : r1 + 1, c0 + 1 : c1 + 1]
+
+    def _move_bounds(self, move):
+        r"""Gets the (start, stop) rows and columns that the move covers."""
+        (dr, dc) = (0, 1) if move.dir == 0 else (1, 0)
+        num = len(move.word)
+        return ((move.row, move.row + 1 + dr * (num - 1)), (move.col, move.col + 1 + dc * (num - 1)))
+
+    def make_move(self, move, validate=True):
+        r"""
+        Makes the given move to the board.
+
+        Parameters
+        ----------
+        move : class Move
+            Move to make, where the word includes any letters already on the board
+        validate : bool, optional
+            Whether to check that the move is legal with `validate_move`, which can be skipped for
+            moves that came from the move generator
+
+        Notes
+        -----
+        #.  This doesn't check that the words are valid, which `validate_move` can do when given
+            the words.
+
+        """
         # check if the move is not null
         if not move.word:
             return
+        # always check that the move fits, since the slices of the grid would silently stop at the edge
+        if move.dir not in {0, 1}:
+            raise ValueError(f"Bad Move direction: {move.dir}.")
+        (rows, cols) = self._move_bounds(move)
+        if move.row < 0 or move.col < 0 or rows[1] > self.num_rows or cols[1] > self.num_cols:
+            raise ValueError(f'Move "{move.word}" does not fit on the board.')
         # check if move is valid
-        validate_move(self.board, self.played, move)
+        if validate:
+            validate_move(self.board, self.played, move)
+        squares = self._line(self.grid, move)
+        occupied = self._line(self._occupied, move, pad=1)
+        letters = np.frombuffer(move.word.encode("ascii"), dtype=np.uint8)
+        new = ~occupied
         # make the move
-        word_len = len(move.word)
-        if move.dir == 0:
-            ix = move.row * (self.num_cols + 1) + move.col
-            self.played = self.played[:ix] + move.word + self.played[ix + word_len :]
-        elif move.dir == 1:
-            rows = self.played.split("\n")
-            for i in range(word_len):
-                r = move.row + i
-                rows[r] = rows[r][: move.col] + move.word[i] + rows[r][move.col + 1 :]
-            self.played = "\n".join(rows)
-        else:
-            raise ValueError(f"Bad Move direction: {move.dir_}.")
+        squares[new] = letters[new]
+        occupied[new] = True
+        self.num_tiles += int(np.count_nonzero(new))
+        self._history.append((move, new))
+        self._update_anchors(rows, cols)
+
+    def undo(self):
+        r"""Takes back the last move, and returns it."""
+        if not self._history:
+            raise ValueError("There are no moves to undo.")
+        (move, new) = self._history.pop()
+        self._line(self.grid, move)[new] = EMPTY
+        self._line(self._occupied, move, pad=1)[new] = False
+        self.num_tiles -= int(np.count_nonzero(new))
+        (rows, cols) = self._move_bounds(move)
+        self._update_anchors(rows, cols)
+        return move
 
 
 # %% Move
@@ -25,6 +25,13 @@
           "u": 2, "v": 5, "w": 4, "x": 8, "y": 3, "z": 10, "?": 0}
 SCRAB_SCORES: dict[str, int] = {}
 
+# %% Bonuses
+# number of tiles in a full rack
+RACK_SIZE = 7
+# bonus for playing all the tiles in the rack at once
+WWF_BINGO   = 35
+SCRAB_BINGO = 50
+
 # %% Tile counts
 WWF_COUNTS = {"a": 9, "b": 2, "c": 2, "d": 5, "e": 13, "f": 2, "g": 3, "h": 4, "i": 8, "j": 1, \
           "k": 1, "l": 4, "m": 2, "n": 5, "o": 8, "p": 2, "q": 1, "r": 6, "s": 5, "t": 7, \
@@ -52,6 +59,9 @@
 # %% Board layouts
 MAX_LEN = 15
 BOARD_SYMBOLS = frozenset(".dstDT\n")
+# multipliers for the premium squares, as letter and word bonuses
+LETTER_PREMIUMS = {"d": 2, "t": 3}
+WORD_PREMIUMS   = {"D": 2, "T": 3}
 
 # Board Layout
 WWF_BOARD = r"""
@@ -94,6 +104,7 @@
 BOARD  = WWF_BOARD
 SCORES = WWF_SCORES
 COUNTS = WWF_COUNTS
+BINGO  = WWF_BINGO
 DICT   = "wwf_v4.0_master.txt"
 
 # %% Unit Test
@@ -0,0 +1,361 @@
+r"""
+DAWG module file for the "scrabble" game.  It defines the directed acyclic word graph word index.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  The word list is built into a minimal DAWG, which is a trie where all the identical suffixes
+    are shared, and then flattened into one 32 bit integer per edge.  Each edge holds the letter in
+    the low five bits, then a flag for whether a word ends on this letter, then a flag for whether
+    it is the last edge out of its node, and the index of the first edge of the child node in the
+    remaining 25 bits, with zero meaning that there are no children.
+#.  The flattened edges are saved to a binary file, which is then memory-mapped, so loading the
+    index is nearly instant no matter how large the word list is.
+#.  Anagrams are found by a backtracking walk that only follows the edges that start real words
+    and only uses the letters that are still left in the rack.  A blank is a wildcard that can
+    follow any edge, and is only used once there are no real tiles left for that letter, so each
+    blank costs about the same as one more letter instead of a whole new search.
+
+"""
+
+# %% Imports
+import doctest
+import mmap
+import os
+import struct
+import sys
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2 import get_output_dir
+from dstauffman2.games.scrabble.constants import DICT
+from dstauffman2.games.scrabble.utils import get_dict_path, get_raw_dictionary
+
+# %% Constants
+# letters in the order of their five bit codes
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# tile used for blanks, and its index in the tile counts
+BLANK  = "?"
+_BLANK = len(ALPHABET)
+
+# header of the binary DAWG files, as the file signature, format version and number of edges
+_FILE_MAGIC   = b"DAWG"
+_FILE_VERSION = 1
+_FILE_HEADER  = struct.Struct("<4sII")
+
+# bit layout of each edge
+_LETTER_MASK = 0x1F
+_FINAL       = 1 << 5
+_LAST        = 1 << 6
+_CHILD_SHIFT = 7
+
+# index of the first edge out of the root node, since zero is reserved for no children
+_ROOT = 1
+
+
+# %% Classes - _Node
+class _Node:
+    r"""Node in the DAWG while it is being built."""
+
+    __slots__ = ("final", "edges")
+
+    def __init__(self):
+        self.final = False
+        self.edges = {}
+
+    def signature(self):
+        r"""Key that is the same for all nodes with the same suffixes, once the children are minimized."""
+        return (self.final, tuple((letter, id(child)) for (letter, child) in sorted(self.edges.items())))
+
+
+# %% _build_nodes
+def _build_nodes(words):
+    r"""Builds the minimal DAWG from a sorted list of words, and returns the root node."""
+    root = _Node()
+    unchecked = []
+    minimized = {}
+
+    def minimize(down_to):
+        r"""Replaces the unchecked nodes below the given depth with their existing equivalents."""
+        for _ in range(len(unchecked) - down_to):
+            (parent, letter, child) = unchecked.pop()
+            key = child.signature()
+            if key in minimized:
+                parent.edges[letter] = minimized[key]
+            else:
+                minimized[key] = child
+
+    previous = ""
+    for word in words:
+        common = 0
+        for a, b in zip(word, previous):
+            if a != b:
+                break
+            common += 1
+        minimize(common)
+        node = root if not unchecked else unchecked[-1][2]
+        for letter in word[common:]:
+            child = _Node()
+            node.edges[letter] = child
+            unchecked.append((node, letter, child))
+            node = child
+        node.final = True
+        previous = word
+    minimize(0)
+    return root
+
+
+# %% _flatten
+def _flatten(root):
+    r"""Flattens the DAWG into the array of 32 bit edges."""
+    # find every distinct node with children, in breadth first order
+    seen = {id(root)}
+    order = [root]
+    for node in order:
+        for child in node.edges.values():
+            if child.edges and id(child) not in seen:
+                seen.add(id(child))
+                order.append(child)
+    # give each node a block of edges, in the same order
+    start = {}
+    position = _ROOT
+    for node in order:
+        start[id(node)] = position
+        position += len(node.edges)
+    edges = np.zeros(position, dtype="<u4")
+    for node in order:
+        letters = sorted(node.edges)
+        for i, letter in enumerate(letters):
+            child = node.edges[letter]
+            edge = ALPHABET.index(letter) | (start.get(id(child), 0) << _CHILD_SHIFT)
+            if child.final:
+                edge |= _FINAL
+            if i == len(letters) - 1:
+                edge |= _LAST
+            edges[start[id(node)] + i] = edge
+    return edges
+
+
+# %% Classes - Dawg
+class Dawg(Frozen):
+    r"""
+    Directed acyclic word graph for fast word lookups and anagram searches.
+
+    Parameters
+    ----------
+    edges : sequence of int
+        Flattened edges, normally from `from_words` or `load`
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.dawg import Dawg
+    >>> dawg = Dawg.from_words(["cat", "cats", "act", "at", "tact"])
+    >>> print("cats" in dawg, "ca" in dawg)
+    True False
+
+    >>> print(dawg.anagrams("tac"))
+    ['act', 'cat', 'at']
+
+    """
+
+    def __init__(self, edges):
+        self.edges = edges
+        self._mmap = None
+
+    @classmethod
+    def from_words(cls, words, min_len=2, max_len=20):
+        r"""Builds the DAWG from the given words, skipping any with letters outside a-z."""
+        letters = set(ALPHABET)
+        words = sorted(word for word in words if min_len <= len(word) <= max_len and set(word) <= letters)
+        edges = _flatten(_build_nodes(words))
+        if len(edges) >= 1 << (32 - _CHILD_SHIFT):
+            raise ValueError("Too many edges to fit in the DAWG encoding.")
+        return cls(edges.tolist())
+
+    def save(self, filename):
+        r"""Saves the DAWG to a binary file, replacing any existing one all at once."""
+        # write to a temporary file first, so that other processes never memory-map a partial file
+        temp = f"{filename}.{os.getpid()}.tmp"
+        with open(temp, "wb") as file:
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, len(self.edges)))
+            file.write(np.asarray(self.edges, dtype="<u4").tobytes())
+        os.replace(temp, filename)
+
+    @classmethod
+    def load(cls, filename):
+        r"""Loads the DAWG from a binary file by memory-mapping it."""
+        with open(filename, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, num_edges) = _FILE_HEADER.unpack_from(data)
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            data.close()
+            raise ValueError(f'File is not a supported DAWG file: "{filename}"')
+        view = memoryview(data)[_FILE_HEADER.size : _FILE_HEADER.size + 4 * num_edges]
+        if sys.byteorder == "little":
+            edges = view.cast("I")
+        else:  # pragma: no cover
+            edges = np.frombuffer(view, dtype="<u4").tolist()
+        dawg = cls(edges)
+        dawg._mmap = data
+        return dawg
+
+    def __len__(self):
+        return len(self.edges)
+
+    def __contains__(self, word):
+        ix = _ROOT if len(self.edges) > _ROOT else 0
+        final = False
+        for letter in word:
+            if ix == 0 or letter not in ALPHABET:
+                return False
+            code = ALPHABET.index(letter)
+            while True:
+                edge = self.edges[ix]
+                if edge & _LETTER_MASK == code:
+                    break
+                if edge & _LAST:
+                    return False
+                ix += 1
+            final = bool(edge & _FINAL)
+            ix = edge >> _CHILD_SHIFT
+        return final
+
+    def anagrams(self, tiles, min_len=2, show_blanks=False):
+        r"""
+        Finds all the words that can be made from some or all of the given tiles.
+
+        Parameters
+        ----------
+        tiles : str or list of chars
+            Letters to anagram, in either case, with "?" for blanks
+        min_len : int, optional
+            Minimum length of word to include
+        show_blanks : bool, optional
+            Whether to show the letters that the blanks stand for in uppercase
+
+        Returns
+        -------
+        out : list of str
+            Words, sorted longest first and then alphabetically
+
+        Raises
+        ------
+        ValueError
+            If any of the tiles are not letters or blanks
+
+        Notes
+        -----
+        #.  The real tiles are always used first, so a blank is only shown for a letter once all
+            the real tiles for it have been used, counting from the start of the word.
+
+        Examples
+        --------
+        >>> from dstauffman2.games.scrabble.dawg import Dawg
+        >>> dawg = Dawg.from_words(["cat", "cats", "act", "at", "tact", "scat"])
+        >>> print(dawg.anagrams("ta?", show_blanks=True))
+        ['aCt', 'Cat', 'at']
+
+        """
+        counts = [0] * (len(ALPHABET) + 1)
+        for letter in tiles:
+            letter = letter.lower()
+            if letter == BLANK:
+                counts[_BLANK] += 1
+            elif len(letter) == 1 and letter in ALPHABET:
+                counts[ALPHABET.index(letter)] += 1
+            else:
+                raise ValueError(f'Tiles can only be the letters a to z or "{BLANK}" for a blank, not "{letter}".')
+        edges = self.edges
+        out = set()
+
+        # letters to show for blanks
+        blank_letters = ALPHABET.upper() if show_blanks else ALPHABET
+
+        def walk(ix, prefix):
+            r"""Follows all the edges out of the node at ix for which there are tiles or blanks left."""
+            while True:
+                edge = edges[ix]
+                code = edge & _LETTER_MASK
+                if counts[code]:
+                    tile = code
+                    word = prefix + ALPHABET[code]
+                elif counts[_BLANK]:
+                    tile = _BLANK
+                    word = prefix + blank_letters[code]
+                else:
+                    if edge & _LAST:
+                        return
+                    ix += 1
+                    continue
+                counts[tile] -= 1
+                if edge & _FINAL and len(word) >= min_len:
+                    out.add(word)
+                if edge >> _CHILD_SHIFT:
+                    walk(edge >> _CHILD_SHIFT, word)
+                counts[tile] += 1
+                if edge & _LAST:
+                    return
+                ix += 1
+
+        if len(edges) > _ROOT:
+            walk(_ROOT, "")
+        return sorted(out, key=lambda item: (-len(item), item.lower()))
+
+    def close(self):
+        r"""Releases the memory-mapped file, if there is one."""
+        if self._mmap is not None:
+            self.edges.release()
+            self._mmap.close()
+            self._mmap = None
+            self.edges = []
+
+
+# %% load_dawg
+def load_dawg(name=DICT, folder=None):
+    r"""
+    Loads the DAWG for the given word list, building and caching it first if needed.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of the word list in the data folder
+    folder : str, optional
+        Folder for the cached DAWG files, defaults to the output folder
+
+    Returns
+    -------
+    class Dawg
+        Memory-mapped DAWG for the word list
+
+    Notes
+    -----
+    #.  The cached file is rebuilt whenever the word list is newer than it.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.dawg import load_dawg
+    >>> dawg = load_dawg()
+    >>> print("sword" in dawg)
+    True
+
+    >>> dawg.close()
+
+    """
+    if folder is None:
+        folder = get_output_dir()
+    source = get_dict_path(name)
+    filename = os.path.join(folder, os.path.splitext(name)[0] + ".dawg")
+    if not os.path.isfile(filename) or os.path.getmtime(filename) < os.path.getmtime(source):
+        os.makedirs(folder, exist_ok=True)
+        Dawg.from_words(get_raw_dictionary(source)).save(filename)
+    return Dawg.load(filename)
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.scrabble.tests.test_dawg", exit=False)
+    doctest.testmod(verbose=False)
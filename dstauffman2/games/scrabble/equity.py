@@ -0,0 +1,268 @@
+r"""
+Equity module file for the "scrabble" game.  It evaluates the best moves by Monte Carlo simulation.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  The score of a move alone ignores what it leaves behind, both on the board for the opponent
+    and in the rack for the next turn.  Each of the top moves is played out against opponent racks
+    drawn at random from the unseen tiles, and the equity is the average of the move score minus
+    the best reply, plus the best follow up move from the tiles left in the rack for two plies.
+#.  Every move is played against the same random racks, from the same seed, so that the
+    differences between the moves come from the moves themselves instead of from luckier draws.
+#.  The simulations are split into chunks between worker processes, which each load the
+    memory-mapped DAWG once.
+
+"""
+
+# %% Imports
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import doctest
+import os
+import time
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2.games.scrabble.classes import Board, EMPTY
+from dstauffman2.games.scrabble.constants import BINGO, COUNTS, DICT, RACK_SIZE, SCORES
+from dstauffman2.games.scrabble.dawg import BLANK, load_dawg
+from dstauffman2.games.scrabble.moves import MoveGenerator
+
+# %% Constants
+# move generators that are already loaded in this process, by word list, scores and bingo bonus
+_GENERATORS = {}
+
+
+# %% Classes - MoveEquity
+class MoveEquity(Frozen):
+    r"""
+    Simulated equity of a single move.
+
+    Parameters
+    ----------
+    move : class Move
+        Move that was simulated
+    diffs : (N, ) array_like of int
+        Score difference for each simulation
+
+    Attributes
+    ----------
+    equity : float
+        Average score difference over all the simulations
+    std_err : float
+        Standard error of the equity
+    num_sims : int
+        Number of simulations
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Move, MoveEquity
+    >>> equity = MoveEquity(Move("sword", 7, 3, 0, 18), [10, 14, 6])
+    >>> print(equity.equity, equity.num_sims)
+    10.0 3
+
+    """
+
+    def __init__(self, move, diffs):
+        diffs = np.asarray(diffs, dtype=float)
+        self.move     = move
+        self.num_sims = len(diffs)
+        self.equity   = float(np.mean(diffs)) if self.num_sims > 0 else float(move.score)
+        self.std_err  = float(np.std(diffs, ddof=1) / np.sqrt(self.num_sims)) if self.num_sims > 1 else 0.0
+
+
+# %% _get_generator
+def _get_generator(dict_name, scores, bingo):
+    r"""Gets the move generator for the given word list, loading it only once in each process."""
+    key = (dict_name, tuple(sorted(scores.items())), bingo)
+    if key not in _GENERATORS:
+        _GENERATORS[key] = MoveGenerator(load_dawg(dict_name), scores=scores, bingo=bingo)
+    return _GENERATORS[key]
+
+
+# %% _get_leave
+def _get_leave(board, tiles, move):
+    r"""Gets the tiles left in the rack after the given move."""
+    (dr, dc) = (0, 1) if move.dir == 0 else (1, 0)
+    leave = list(tiles)
+    for i, letter in enumerate(move.word):
+        if board.grid[move.row + i * dr, move.col + i * dc] == EMPTY:
+            leave.remove(BLANK if letter.isupper() else letter)
+    return "".join(leave)
+
+
+# %% get_unseen_tiles
+def get_unseen_tiles(board, tiles, counts=COUNTS):
+    r"""
+    Gets the tiles that are either still in the bag or on the opponent's rack.
+
+    Parameters
+    ----------
+    board : class Board
+        Board with the tiles already played
+    tiles : str
+        Tiles on your own rack
+    counts : dict, optional
+        Number of each tile in a full game
+
+    Returns
+    -------
+    str
+        Unseen tiles, sorted
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Board, Move, get_unseen_tiles
+    >>> board = Board()
+    >>> board.make_move(Move("sWord", 7, 3, 0))
+    >>> unseen = get_unseen_tiles(board, "abc?", counts={"a": 3, "c": 1, "d": 2, "o": 1, "r": 1, "s": 1, "?": 2})
+    >>> print(unseen)
+    aad
+
+    """
+    letters = [chr(x) for x in board.grid.ravel() if x != EMPTY]
+    used = Counter(BLANK if letter.isupper() else letter for letter in letters)
+    used.update(tiles)
+    return "".join(sorted((Counter(counts) - used).elements()))
+
+
+# %% _simulate_move
+def _simulate_move(board, played, move, leave, unseen, sims, plies, seed, deadline, generator):
+    r"""Plays out the move against the random racks for the given simulations, and returns the score differences."""
+    this_board = Board(board=board, played=played)
+    this_board.make_move(move, validate=False)
+    tiles = np.array(list(unseen), dtype="<U1")
+    diffs = []
+    for sim in sims:
+        # always do the first simulation, even when out of time
+        if deadline is not None and sim > 0 and time.time() > deadline:
+            break
+        # each simulation has its own random stream, so the racks don't depend on how the work is split
+        bag = np.random.default_rng([seed, sim]).permutation(tiles)
+        replies = generator.find_moves(this_board, "".join(bag[:RACK_SIZE]))
+        diff = move.score - (replies[0].score if replies else 0)
+        if plies > 1:
+            # refill the rack from the rest of the bag, and find the best follow up move
+            rack = leave + "".join(bag[RACK_SIZE : 2 * RACK_SIZE - len(leave)])
+            if replies:
+                this_board.make_move(replies[0], validate=False)
+            follow_ups = generator.find_moves(this_board, rack)
+            diff += follow_ups[0].score if follow_ups else 0
+            if replies:
+                this_board.undo()
+        diffs.append(diff)
+    return diffs
+
+
+# %% _simulate_task
+def _simulate_task(args):
+    r"""Unpacks the arguments for a single chunk of simulations, for use with a process pool."""
+    (dict_name, scores, bingo, *sim_args) = args
+    return _simulate_move(*sim_args, _get_generator(dict_name, scores, bingo))
+
+
+# %% evaluate_moves
+def evaluate_moves(board, tiles, *, moves=None, num_moves=10, num_sims=100, plies=1, seed=None, time_budget=None, \
+        counts=COUNTS, generator=None, dict_name=DICT, scores=SCORES, bingo=BINGO, num_workers=None, chunk_size=5):
+    r"""
+    Evaluates the best moves by simulating the opponent's replies.
+
+    Parameters
+    ----------
+    board : class Board
+        Board with the tiles already played
+    tiles : str
+        Tiles on your own rack, with "?" for blanks
+    moves : list of class Move, optional
+        Moves to evaluate, defaults to the highest scoring moves from the generator
+    num_moves : int, optional
+        Number of the highest scoring moves to evaluate when the moves aren't given
+    num_sims : int, optional
+        Number of simulations for each move
+    plies : int, optional
+        Number of turns after the move to play out, either 1 for the opponent's reply or 2 to also
+        include your own follow up move
+    seed : int, optional
+        Seed for the random number generator
+    time_budget : float, optional
+        Time in seconds after which no more simulations are started, with at least one for each move
+    counts : dict, optional
+        Number of each tile in a full game
+    generator : class MoveGenerator, optional
+        Move generator to use in this process, which skips the process pool
+    dict_name : str, optional
+        Name of the word list for the generators in the worker processes
+    scores : dict, optional
+        Points for each letter for the generators in the worker processes
+    bingo : int, optional
+        Bonus for using all the tiles for the generators in the worker processes
+    num_workers : int, optional
+        Number of worker processes, defaults to the number of CPUs, and 1 runs everything in this process
+    chunk_size : int, optional
+        Number of simulations of a single move for each task
+
+    Returns
+    -------
+    list of class MoveEquity
+        Equity of each move, best first
+
+    Notes
+    -----
+    #.  The simulations are done in chunks, going through all the moves before starting on the
+        next chunk of any of them, so that a time budget is shared evenly between the moves.
+    #.  With a time budget, the number of simulations depends on the speed of the computer, but
+        for the same seed, the simulations that are done are always the same, with or without a
+        process pool.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Board, MoveGenerator, evaluate_moves
+    >>> board = Board()
+    >>> generator = MoveGenerator(["at", "cat", "cats", "act", "ta", "tact"])
+    >>> results = evaluate_moves(board, "cats", num_sims=5, seed=0, counts={"a": 2, "t": 2}, generator=generator)
+    >>> print(len(results), results[0].move.word, results[0].num_sims)
+    10 cats 5
+
+    """
+    if plies not in {1, 2}:
+        raise ValueError(f"Unexpected number of plies: {plies}")
+    if moves is None:
+        this_generator = generator if generator is not None else _get_generator(dict_name, scores, bingo)
+        moves = this_generator.find_moves(board, tiles)[:num_moves]
+    if not moves:
+        return []
+    unseen = get_unseen_tiles(board, tiles, counts=counts)
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    deadline = None if time_budget is None else time.time() + time_budget
+    (board_text, played) = (board.board, board.played)
+    leaves = [_get_leave(board, tiles, move) for move in moves]
+    # go through every move for each chunk of simulations
+    order = [(ix, range(i, min(i + chunk_size, num_sims))) for i in range(0, num_sims, chunk_size) \
+        for ix in range(len(moves))]
+    tasks = [(board_text, played, moves[ix], leaves[ix], unseen, sims, plies, seed, deadline) for (ix, sims) in order]
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if generator is not None:
+        chunks = [_simulate_move(*task, generator) for task in tasks]
+    elif num_workers <= 1 or len(tasks) == 1:
+        chunks = [_simulate_task((dict_name, scores, bingo, *task)) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(tasks))) as pool:
+            chunks = list(pool.map(_simulate_task, [(dict_name, scores, bingo, *task) for task in tasks]))
+    diffs = [[] for _ in moves]
+    for (ix, _), chunk in zip(order, chunks):
+        diffs[ix].extend(chunk)
+    results = [MoveEquity(move, these_diffs) for (move, these_diffs) in zip(moves, diffs)]
+    results.sort(key=lambda item: (-item.equity, -item.move.score))
+    return results
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.scrabble.tests.test_equity", exit=False)
+    doctest.testmod(verbose=False)
@@ -37,8 +37,10 @@
 
 from dstauffman import pprint_dict
 
-from dstauffman2.games.scrabble.classes import Board, Move
+from dstauffman2.games.scrabble.classes import Board, EMPTY, Move
 from dstauffman2.games.scrabble.constants import COLOR, COUNTS, DICT, SCORES
+from dstauffman2.games.scrabble.dawg import load_dawg
+from dstauffman2.games.scrabble.moves import MoveGenerator
 from dstauffman2.games.scrabble.plotting import display_tile_bag, plot_board, plot_draw_stats, plot_move_strength
 from dstauffman2.games.scrabble.utils import get_root_dir
 
@@ -88,6 +90,8 @@ class ScrabbleGui(QMainWindow):
     def __init__(self) -> None:
         # call super method
         super().__init__()
+        # move generator, which is created the first time that moves are suggested
+        self.generator: MoveGenerator | None = None
         # call init method to instantiate the GUI
         self.init()
 
@@ -305,16 +309,47 @@ def center(self) -> None:
 
     # %% Other callbacks - Play Button
     def btn_play_func(self) -> None:
-        r"""Plays the current move."""
-        pass
+        r"""Plays the current move, and then suggests the best moves for the tiles that are left."""
+        move = self.gui_settings.move
+        if move.word:
+            # take the tiles that this move places out of the rack
+            grid = self.gui_settings.board.grid
+            (dr, dc) = (0, 1) if move.dir == 0 else (1, 0)
+            tiles = list(self.gui_settings.tiles)
+            for i, letter in enumerate(move.word):
+                if grid[move.row + i * dr, move.col + i * dc] == EMPTY:
+                    tile = "?" if letter.isupper() else letter
+                    if tile in tiles:
+                        tiles.remove(tile)
+            self.gui_settings.board.make_move(move)
+            self.gui_settings.move_list.append(move)
+            self.gui_settings.tiles = "".join(tiles)
+            self.gui_settings.move = Move()
+        # find the best moves for the current tiles
+        if self.generator is None:
+            self.generator = MoveGenerator(load_dawg(self.gui_settings.dict_name), scores=self.gui_settings.scores)
+        self.gui_settings.pot_moves = self.generator.find_moves(self.gui_settings.board, self.gui_settings.tiles)
+        # show them on the move buttons
+        for ix in range(10):
+            button = getattr(self, f"btn_move{ix}")
+            if ix < len(self.gui_settings.pot_moves):
+                this_move = self.gui_settings.pot_moves[ix]
+                button.setText(str(this_move.score))
+                button.setToolTip(f"{this_move.word} at ({this_move.row}, {this_move.col}) for {this_move.score} points.")
+            else:
+                button.setText("")
+                button.setToolTip("")
+        self.wrapper()
 
     def btn_tile_func(self, tile) -> None:
         r"""Function for button click."""
         pass
 
     def btn_move_func(self, move) -> None:
-        r"""Function for move click."""
-        pass
+        r"""Selects one of the suggested moves to be played."""
+        if move < len(self.gui_settings.pot_moves):
+            self.gui_settings.move = self.gui_settings.pot_moves[move]
+            self.wrapper()
 
     def btn_new_function(self) -> None:
         r"""Function that executes on new game button press."""
@@ -0,0 +1,298 @@
+r"""
+Lexicon module file for the "scrabble" game.  It defines the merged index of all the word lists.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  All the word lists are merged into one sorted list of words, and each word has a bitmask of
+    the lexicons that it belongs to, so that one structure answers whether a word is valid in any
+    of them.  Since the words are sorted, all the words that share a prefix are one contiguous
+    block that is found by a binary search.
+#.  A lexicon can also be defined as changes to another one, such as Words With Friends, which is
+    the ENABLE list plus its additions and minus its deletions.  These are applied by setting and
+    clearing its bit, instead of reading the whole list again.
+#.  The merged index is saved to a binary file that is memory-mapped, and rebuilt whenever any of
+    the word lists change.
+
+"""
+
+# %% Imports
+import bisect
+import doctest
+import mmap
+import os
+import struct
+import unittest
+import zlib
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2 import get_data_dir, get_output_dir
+from dstauffman2.games.scrabble.wordlist import WordList
+
+# %% Constants
+# lexicons in the order of their bits, either as a word list, or as a base lexicon with the files
+# of words added to it and deleted from it
+LEXICONS = {
+    "enable": "enable.txt",
+    "enable2k": "enable2k.txt",
+    "sowpods": "sowpods.txt",
+    "twl06": "twl06.txt",
+    "yawl": "yawl.txt",
+    "wwf": ("enable", "wwf_v4.0_enable_additions.txt", "wwf_v4.0_enable_deletions.txt"),
+}
+
+# maximum number of lexicons that fit in the bitmasks
+_MAX_LEXICONS = 8
+
+# header of the binary lexicon files, as the file signature, format version, number of words,
+# latest modification time and total size of the source files, minimum and maximum word lengths
+# and number of bytes of words
+_FILE_MAGIC   = b"LEXI"
+_FILE_VERSION = 1
+_FILE_HEADER  = struct.Struct("<4sIIqqIIQ")
+
+# lexicons that are already open in this process, by the cached file name
+_OPEN_LEXICONS = {}
+
+
+# %% _read_words
+def _read_words(filename, min_len, max_len):
+    r"""Reads the words of the given lengths from a text file with one word per line."""
+    with open(filename, "rt") as file:
+        return [word for word in (line.rstrip("\n") for line in file) if min_len <= len(word) <= max_len]
+
+
+# %% _get_sources
+def _get_sources(lexicons, folder):
+    r"""Gets the full path to every word list that the lexicons are built from."""
+    sources = []
+    for source in lexicons.values():
+        files = [source] if isinstance(source, str) else source[1:]
+        sources.extend(os.path.join(folder, file) for file in files)
+    return sources
+
+
+# %% _get_source_stat
+def _get_source_stat(sources):
+    r"""Gets the latest modification time in nanoseconds and the total size of the word lists."""
+    stats = [os.stat(source) for source in sources]
+    return (max(stat.st_mtime_ns for stat in stats), sum(stat.st_size for stat in stats))
+
+
+# %% Classes - Lexicon
+class Lexicon(Frozen):
+    r"""
+    Merged index of words with the lexicons that each one belongs to.
+
+    Parameters
+    ----------
+    names : tuple of str
+        Names of the lexicons, in the order of their bits
+    words : class WordList
+        Sorted words that are in any of the lexicons
+    masks : (N, ) ndarray of uint8
+        Bitmask of the lexicons for each word
+    source_stat : (int, int), optional
+        Latest modification time in nanoseconds and total size of the word lists
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.lexicon import Lexicon
+    >>> lexicon = Lexicon.from_words({"us": ["cat", "color"], "uk": ["cat", "colour"]})
+    >>> print(lexicon.is_valid("color", "us"), lexicon.is_valid("color", "uk"), lexicon.get_lexicons("cat"))
+    True False ['us', 'uk']
+
+    """
+
+    def __init__(self, names, words, masks, source_stat=(0, 0)):
+        self.names       = tuple(names)
+        self.words       = words
+        self.masks       = masks
+        self.source_stat = source_stat
+        self._mmap       = None
+
+    @classmethod
+    def from_words(cls, lexicons):
+        r"""Creates the lexicon from a dictionary of the words in each lexicon, in the order of their bits."""
+        if len(lexicons) > _MAX_LEXICONS:
+            raise ValueError(f"Too many lexicons, only {_MAX_LEXICONS} are supported.")
+        masks = {}
+        for bit, words in enumerate(lexicons.values()):
+            for word in words:
+                masks[word] = masks.get(word, 0) | (1 << bit)
+        words = WordList.from_words(masks)
+        return cls(lexicons.keys(), words, np.array([masks[word] for word in words], dtype=np.uint8))
+
+    @classmethod
+    def from_files(cls, lexicons=None, folder=None, min_len=2, max_len=20):
+        r"""Reads the lexicons from the word lists in the given folder, applying the additions and deletions."""
+        if lexicons is None:
+            lexicons = LEXICONS
+        if folder is None:
+            folder = get_data_dir()
+        words = {}
+        for name, source in lexicons.items():
+            if isinstance(source, str):
+                words[name] = set(_read_words(os.path.join(folder, source), min_len, max_len))
+            else:
+                (base, additions, deletions) = source
+                if base not in words:
+                    raise ValueError(f'Lexicon "{name}" is based on "{base}", which has to come before it.')
+                words[name] = (words[base] | set(_read_words(os.path.join(folder, additions), min_len, max_len))) - \
+                    set(_read_words(os.path.join(folder, deletions), min_len, max_len))
+        out = cls.from_words(words)
+        out.source_stat = _get_source_stat(_get_sources(lexicons, folder))
+        return out
+
+    def save(self, filename, min_len=0, max_len=0):
+        r"""Saves the lexicon to a binary file, replacing any existing one all at once."""
+        temp = f"{filename}.{os.getpid()}.tmp"
+        with open(temp, "wb") as file:
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, len(self), *self.source_stat, min_len, max_len, \
+                len(self.words.data)))
+            file.write(np.asarray(self.words.offsets, dtype="<u4").tobytes())
+            file.write(np.asarray(self.words.data, dtype=np.uint8).tobytes())
+            file.write(np.asarray(self.masks, dtype=np.uint8).tobytes())
+        os.replace(temp, filename)
+
+    @classmethod
+    def load(cls, filename, names):
+        r"""Loads the lexicon from a binary file by memory-mapping it."""
+        with open(filename, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, num_words, mtime, size, _, _, num_bytes) = _FILE_HEADER.unpack_from(data)
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            data.close()
+            raise ValueError(f'File is not a supported lexicon file: "{filename}"')
+        offset  = _FILE_HEADER.size
+        offsets = np.frombuffer(data, dtype="<u4", count=num_words + 1, offset=offset)
+        offset += 4 * (num_words + 1)
+        words   = np.frombuffer(data, dtype=np.uint8, count=num_bytes, offset=offset)
+        masks   = np.frombuffer(data, dtype=np.uint8, count=num_words, offset=offset + num_bytes)
+        out = cls(names, WordList(words, offsets), masks, source_stat=(mtime, size))
+        out._mmap = data
+        return out
+
+    def __len__(self):
+        return len(self.masks)
+
+    def __contains__(self, word):
+        return self.get_mask(word) != 0
+
+    def _bit(self, name):
+        r"""Gets the bit for the given lexicon."""
+        if name not in self.names:
+            raise ValueError(f'Unknown lexicon: "{name}"')
+        return 1 << self.names.index(name)
+
+    def get_mask(self, word):
+        r"""Gets the bitmask of the lexicons that the word is in, which is zero if it isn't in any of them."""
+        ix = bisect.bisect_left(self.words, word)
+        if ix < len(self) and self.words[ix] == word:
+            return int(self.masks[ix])
+        return 0
+
+    def is_valid(self, word, name):
+        r"""Determines whether the word is in the given lexicon."""
+        return bool(self.get_mask(word) & self._bit(name))
+
+    def get_lexicons(self, word):
+        r"""Gets the names of all the lexicons that the word is in."""
+        mask = self.get_mask(word)
+        return [name for (bit, name) in enumerate(self.names) if mask & (1 << bit)]
+
+    def get_words(self, name=None, prefix=""):
+        r"""Gets the sorted words in the given lexicon, or in any of them, that start with the given prefix."""
+        first = bisect.bisect_left(self.words, prefix)
+        last = bisect.bisect_left(self.words, prefix + "\x7f", lo=first)
+        (start, stop) = (self.words.offsets[first], self.words.offsets[last])
+        words = self.words.data[start:stop].tobytes().decode("utf-8").split("\n")[:-1]
+        if name is None:
+            return words
+        keep = self.masks[first:last] & self._bit(name)
+        return [word for (word, valid) in zip(words, keep) if valid]
+
+    def close(self):
+        r"""Releases the memory-mapped file, if there is one."""
+        if self._mmap is not None:
+            self.words = WordList.from_words([])
+            self.masks = np.zeros(0, dtype=np.uint8)
+            self._mmap.close()
+            self._mmap = None
+
+
+# %% load_lexicon
+def load_lexicon(lexicons=None, min_len=2, max_len=20, folder=None, data_dir=None):
+    r"""
+    Loads the merged lexicon from its compiled cache, building the cache first if needed.
+
+    Parameters
+    ----------
+    lexicons : dict, optional
+        Word list for each lexicon, or its base lexicon with the files of additions and deletions,
+        defaults to LEXICONS
+    min_len : int, optional
+        Minimum length of word to include
+    max_len : int, optional
+        Maximum length of word to include
+    folder : str, optional
+        Folder for the cached files, defaults to the output folder
+    data_dir : str, optional
+        Folder with the word lists, defaults to the data folder
+
+    Returns
+    -------
+    class Lexicon
+        Memory-mapped lexicon
+
+    Notes
+    -----
+    #.  Lexicons that are already open in this process are reused, as long as the word lists
+        haven't changed, so they should not be closed by the caller.
+    #.  When a word list changes, the old lexicon is dropped from the open ones but not closed, since
+        a caller may still be using it.  Its memory map is released once the last reference to it
+        is gone, so it is only kept as long as it is used.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.lexicon import load_lexicon
+    >>> lexicon = load_lexicon()
+    >>> print(lexicon.get_lexicons("qi"))
+    ['sowpods', 'twl06', 'yawl', 'wwf']
+
+    """
+    if lexicons is None:
+        lexicons = LEXICONS
+    if data_dir is None:
+        data_dir = get_data_dir()
+    if folder is None:
+        folder = get_output_dir()
+    key = zlib.crc32(repr((sorted(lexicons.items()), list(lexicons), os.path.abspath(data_dir))).encode("utf-8"))
+    cache = os.path.join(folder, f"lexicon_{min_len}_{max_len}_{key:08x}.lex")
+    source_stat = _get_source_stat(_get_sources(lexicons, data_dir))
+    lexicon = _OPEN_LEXICONS.get(cache)
+    if lexicon is not None and lexicon.source_stat == source_stat:
+        return lexicon
+    if os.path.isfile(cache):
+        lexicon = Lexicon.load(cache, lexicons.keys())
+        if lexicon.source_stat != source_stat:
+            lexicon.close()
+            lexicon = None
+    if lexicon is None:
+        os.makedirs(folder, exist_ok=True)
+        built = Lexicon.from_files(lexicons, folder=data_dir, min_len=min_len, max_len=max_len)
+        built.source_stat = source_stat
+        built.save(cache, min_len=min_len, max_len=max_len)
+        lexicon = Lexicon.load(cache, lexicons.keys())
+    # replaces any stale lexicon without closing it, as the callers that still have it can keep using it
+    _OPEN_LEXICONS[cache] = lexicon
+    return lexicon
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.scrabble.tests.test_lexicon", exit=False)
+    doctest.testmod(verbose=False)
@@ -0,0 +1,378 @@
+r"""
+Moves module file for the "scrabble" game.  It defines the move generator.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  Moves are generated with the anchor based algorithm from Appel and Jacobson, "The World's
+    Fastest Scrabble Program".  Every legal move has to cover at least one anchor, which is an empty
+    square next to a tile already on the board, so each row and column is searched by building the
+    part of the word to the left of each anchor from the rack, and then extending it to the right
+    through the anchor while following the edges of the DAWG.
+#.  The cross-checks are the letters that make valid words in the other direction for each
+    square.  They are kept between searches and only updated for the rows and columns where the
+    tiles have changed, and the DAWG lookups behind them are cached by the tiles above and below
+    the square.  The anchors are kept up to date by the board itself as moves are made.
+#.  The moves are scored as they are built, using the premium squares from the board layout.
+
+"""
+
+# %% Imports
+import doctest
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2.games.scrabble.classes import EMPTY, Move
+from dstauffman2.games.scrabble.constants import BINGO, LETTER_PREMIUMS, RACK_SIZE, SCORES, WORD_PREMIUMS
+from dstauffman2.games.scrabble.dawg import _BLANK, _CHILD_SHIFT, _FINAL, _LAST, _LETTER_MASK, _ROOT, ALPHABET, BLANK, Dawg
+
+# %% Constants
+# cross-check mask that allows every letter
+_ALL_LETTERS = (1 << len(ALPHABET)) - 1
+
+
+# %% _find_edge
+def _find_edge(edges, ix, letter):
+    r"""Finds the edge for the given letter out of the node starting at ix, or zero if there isn't one."""
+    code = ALPHABET.index(letter)
+    while True:
+        edge = edges[ix]
+        if edge & _LETTER_MASK == code:
+            return edge
+        if edge & _LAST:
+            return 0
+        ix += 1
+
+
+# %% _follow
+def _follow(edges, ix, word):
+    r"""Follows the word from the node at ix, and returns the last edge, or zero if it isn't a prefix."""
+    edge = 0
+    for letter in word:
+        if ix == 0:
+            return 0
+        edge = _find_edge(edges, ix, letter)
+        if not edge:
+            return 0
+        ix = edge >> _CHILD_SHIFT
+    return edge
+
+
+# %% Classes - MoveGenerator
+class MoveGenerator(Frozen):
+    r"""
+    Generates all the legal moves for a rack of tiles.
+
+    Parameters
+    ----------
+    words : class Dawg or iterable of str
+        Valid words, which are built into a DAWG if needed
+    scores : dict, optional
+        Value of each tile
+    bingo : int, optional
+        Bonus for using all the tiles in the rack
+
+    Notes
+    -----
+    #.  The generator keeps the cross-checks for the last board that it searched, and only updates
+        the rows and columns where the tiles have changed since then, so it is fastest to keep
+        using the same generator as moves are made and taken back.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Board, MoveGenerator
+    >>> board = Board(board='.....\n.....\n..s..\n.....\n..D..', played='     \n     \n cat \n     \n     ')
+    >>> generator = MoveGenerator(["at", "cat", "cats", "scat", "tab", "tabs"])
+    >>> moves = generator.find_moves(board, "sab")
+    >>> print([(move.word, move.row, move.col, move.dir, move.score) for move in moves])
+    [('cats', 2, 1, 0, 7), ('scat', 2, 0, 0, 7), ('tab', 2, 3, 1, 6), ('at', 1, 3, 1, 2)]
+
+    """
+
+    def __init__(self, words, scores=SCORES, bingo=BINGO):
+        if not isinstance(words, Dawg):
+            words = Dawg.from_words(words)
+        self.words  = words
+        self.scores = scores
+        self.bingo  = bingo
+        # value of each letter by its code, and cached cross-checks by the tiles before and after
+        self._values = [scores[letter] for letter in ALPHABET]
+        self._cross_checks = {}
+        # board layout of the last search, with its premiums along the rows and along the columns
+        self._layout = None
+        self._premiums = None
+        # tiles of the last search, with the cross-check masks and cross-word sums for moves across
+        # and down, where a sum of -1 means that there isn't a cross word
+        self._grid = None
+        self._masks = None
+        self._sums = None
+
+    def _tile_value(self, tile):
+        r"""Value of a tile on the board, where blanks are uppercase."""
+        return 0 if tile.isupper() else self.scores[tile]
+
+    def _cross_check(self, before, after):
+        r"""Finds the mask of letters that make a word between the given tiles."""
+        key = (before.lower(), after.lower())
+        mask = self._cross_checks.get(key)
+        if mask is None:
+            edges = self.words.edges
+            mask = 0
+            ix = _follow(edges, _ROOT, key[0]) >> _CHILD_SHIFT if key[0] else _ROOT
+            while ix:
+                edge = edges[ix]
+                child = edge >> _CHILD_SHIFT
+                if (not key[1] and edge & _FINAL) or (key[1] and child and _follow(edges, child, key[1]) & _FINAL):
+                    mask |= 1 << (edge & _LETTER_MASK)
+                if edge & _LAST:
+                    break
+                ix += 1
+            self._cross_checks[key] = mask
+        return mask
+
+    def _scan_cross(self, line, masks, sums):
+        r"""Finds the cross-checks and cross-word sums for the empty squares along a line that holds the cross words."""
+        num = len(line)
+        for pos in range(num):
+            masks[pos] = _ALL_LETTERS
+            sums[pos] = -1
+            if line[pos] != " ":
+                continue
+            start = pos
+            while start > 0 and line[start - 1] != " ":
+                start -= 1
+            stop = pos + 1
+            while stop < num and line[stop] != " ":
+                stop += 1
+            (before, after) = (line[start:pos], line[pos + 1 : stop])
+            if before or after:
+                masks[pos] = self._cross_check(before, after)
+                sums[pos] = sum(self._tile_value(tile) for tile in before + after)
+
+    def _update_cross_checks(self, board):
+        r"""Updates the cached cross-checks for the rows and columns that have changed since the last search."""
+        if board.board != self._layout:
+            layout = board.board.split("\n")
+            premiums = []
+            for lines in (layout, ["".join(column) for column in zip(*layout)]):
+                letter_mults = [[LETTER_PREMIUMS.get(square, 1) for square in line] for line in lines]
+                word_mults = [[WORD_PREMIUMS.get(square, 1) for square in line] for line in lines]
+                premiums.append((letter_mults, word_mults))
+            self._layout = board.board
+            self._premiums = premiums
+            self._grid = np.full(board.grid.shape, EMPTY, dtype=np.uint8)
+            self._masks = np.full((2,) + board.grid.shape, _ALL_LETTERS, dtype=np.int64)
+            self._sums = np.full((2,) + board.grid.shape, -1, dtype=np.int16)
+        changed = board.grid != self._grid
+        # the cross words for moves across run down the columns, and the ones for moves down run along the rows
+        for col in np.flatnonzero(np.any(changed, axis=0)):
+            line = board.grid[:, col].tobytes().decode("ascii")
+            (new_masks, new_sums) = ([0] * len(line), [0] * len(line))
+            self._scan_cross(line, new_masks, new_sums)
+            (self._masks[0, :, col], self._sums[0, :, col]) = (new_masks, new_sums)
+        for row in np.flatnonzero(np.any(changed, axis=1)):
+            line = board.grid[row, :].tobytes().decode("ascii")
+            (new_masks, new_sums) = ([0] * len(line), [0] * len(line))
+            self._scan_cross(line, new_masks, new_sums)
+            (self._masks[1, row, :], self._sums[1, row, :]) = (new_masks, new_sums)
+        np.copyto(self._grid, board.grid)
+
+    def find_moves(self, board, tiles):
+        r"""
+        Finds all the legal moves for the given tiles.
+
+        Parameters
+        ----------
+        board : class Board
+            Board with the layout and the tiles already played
+        tiles : str or list of chars
+            Letters in the rack, with "?" for blanks
+
+        Returns
+        -------
+        moves : list of class Move
+            Legal moves, sorted by score from highest to lowest
+
+        """
+        edges = self.words.edges
+        if len(edges) <= _ROOT:
+            return []
+        self._update_cross_checks(board)
+        (num_rows, num_cols) = board.grid.shape
+        text = board.grid.tobytes().decode("ascii")
+        rows = [text[i * num_cols : (i + 1) * num_cols] for i in range(num_rows)]
+        text = board.grid.T.tobytes().decode("ascii")
+        columns = [text[i * num_rows : (i + 1) * num_rows] for i in range(num_cols)]
+        counts = [0] * (len(ALPHABET) + 1)
+        for tile in tiles:
+            counts[_BLANK if tile == BLANK else ALPHABET.index(tile)] += 1
+        values = self._values
+        bingo = self.bingo
+        moves = []
+
+        for dir_ in (0, 1):
+            lines = rows if dir_ == 0 else columns
+            (all_anchors, all_masks, all_sums) = (board.anchors, self._masks[dir_], self._sums[dir_])
+            if dir_ == 1:
+                (all_anchors, all_masks, all_sums) = (all_anchors.T, all_masks.T, all_sums.T)
+            for ix, line in enumerate(lines):
+                anchors = np.flatnonzero(all_anchors[ix]).tolist()
+                if not anchors:
+                    continue
+                num = len(line)
+                masks = all_masks[ix].tolist()
+                sums = all_sums[ix].tolist()
+                (letter_mults, word_mults) = (self._premiums[dir_][0][ix], self._premiums[dir_][1][ix])
+
+                def record(start, word, score, num_placed, anchor):
+                    r"""Saves a finished move, skipping single tiles already found in the other direction."""
+                    # a single tile is always on the anchor, and is found across if it makes a word across
+                    if dir_ == 1 and num_placed == 1 and sums[anchor] >= 0:
+                        return
+                    if num_placed == RACK_SIZE:
+                        score += bingo
+                    if dir_ == 0:
+                        moves.append(Move(word, ix, start, dir_, score))
+                    else:
+                        moves.append(Move(word, start, ix, dir_, score))
+
+                def extend(anchor, pos, node, word, main, mult, cross, num_placed):
+                    r"""Extends the word to the right from the node, through the tiles already played."""
+                    if pos >= num:
+                        return
+                    tile = line[pos]
+                    ends = pos == num - 1 or line[pos + 1] == " "
+                    if tile != " ":
+                        edge = _find_edge(edges, node, tile.lower())
+                        if not edge:
+                            return
+                        main += 0 if tile.isupper() else values[edge & _LETTER_MASK]
+                        if edge & _FINAL and ends:
+                            record(pos - len(word), word + tile, main * mult + cross, num_placed, anchor)
+                        if edge >> _CHILD_SHIFT:
+                            extend(anchor, pos + 1, edge >> _CHILD_SHIFT, word + tile, main, mult, cross, num_placed)
+                        return
+                    (mask, letter_mult, word_mult, cross_sum) = (masks[pos], letter_mults[pos], word_mults[pos], sums[pos])
+                    while True:
+                        edge = edges[node]
+                        code = edge & _LETTER_MASK
+                        if mask >> code & 1:
+                            # try both a real tile and a blank, since they can score differently
+                            for choice in (code, _BLANK):
+                                if not counts[choice]:
+                                    continue
+                                counts[choice] -= 1
+                                value = (values[code] if choice == code else 0) * letter_mult
+                                letter = ALPHABET[code] if choice == code else ALPHABET[code].upper()
+                                this_main = main + value
+                                this_mult = mult * word_mult
+                                this_cross = cross if cross_sum < 0 else cross + (cross_sum + value) * word_mult
+                                this_word = word + letter
+                                if edge & _FINAL and ends:
+                                    score = this_main * this_mult + this_cross
+                                    record(pos - len(word), this_word, score, num_placed + 1, anchor)
+                                if edge >> _CHILD_SHIFT:
+                                    child = edge >> _CHILD_SHIFT
+                                    extend(anchor, pos + 1, child, this_word, this_main, this_mult, this_cross, num_placed + 1)
+                                counts[choice] += 1
+                        if edge & _LAST:
+                            return
+                        node += 1
+
+                def left_part(anchor, part, node, limit):
+                    r"""Builds every left part from the rack that fits before the anchor, and extends each one."""
+                    start = anchor - len(part)
+                    main = sum(values[code] * letter_mults[start + i] for (i, (code, blank)) in enumerate(part) if not blank)
+                    mult = 1
+                    for i in range(len(part)):
+                        mult *= word_mults[start + i]
+                    word = "".join(ALPHABET[code].upper() if blank else ALPHABET[code] for (code, blank) in part)
+                    extend(anchor, anchor, node, word, main, mult, 0, len(part))
+                    if limit == 0:
+                        return
+                    while True:
+                        edge = edges[node]
+                        code = edge & _LETTER_MASK
+                        child = edge >> _CHILD_SHIFT
+                        if child:
+                            for choice in (code, _BLANK):
+                                if counts[choice]:
+                                    counts[choice] -= 1
+                                    left_part(anchor, part + [(code, choice == _BLANK)], child, limit - 1)
+                                    counts[choice] += 1
+                        if edge & _LAST:
+                            return
+                        node += 1
+
+                for (i, anchor) in enumerate(anchors):
+                    if anchor > 0 and line[anchor - 1] != " ":
+                        # the left part is already on the board, so follow it through the DAWG
+                        start = anchor - 1
+                        while start > 0 and line[start - 1] != " ":
+                            start -= 1
+                        prefix = line[start:anchor]
+                        edge = _follow(edges, _ROOT, prefix.lower())
+                        if edge >> _CHILD_SHIFT:
+                            main = sum(self._tile_value(tile) for tile in prefix)
+                            extend(anchor, anchor, edge >> _CHILD_SHIFT, prefix, main, 1, 0, 0)
+                    else:
+                        # the left part can use any empty squares back to the previous anchor
+                        limit = 0
+                        previous = anchors[i - 1] if i > 0 else -1
+                        while anchor - limit - 1 > previous and line[anchor - limit - 1] == " ":
+                            limit += 1
+                        left_part(anchor, [], _ROOT, min(limit, RACK_SIZE - 1))
+
+        moves.sort(key=lambda move: (-move.score, move.word.lower(), move.dir, move.row, move.col))
+        return moves
+
+
+# %% find_moves
+def find_moves(board, tiles, words, scores=SCORES, bingo=BINGO):
+    r"""
+    Finds all the legal moves for the given board and tiles, ranked by score.
+
+    Parameters
+    ----------
+    board : class Board
+        Board with the layout and the tiles already played
+    tiles : str or list of chars
+        Letters in the rack, with "?" for blanks
+    words : class Dawg or iterable of str
+        Valid words
+    scores : dict, optional
+        Value of each tile
+    bingo : int, optional
+        Bonus for using all the tiles in the rack
+
+    Returns
+    -------
+    moves : list of class Move
+        Legal moves, sorted by score from highest to lowest
+
+    Notes
+    -----
+    #.  Use a `MoveGenerator` directly to keep the cached cross-checks from one move to the next.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Board, find_moves, load_dawg
+    >>> board = Board()
+    >>> words = load_dawg()
+    >>> moves = find_moves(board, "wordsxz", words)
+    >>> print(moves[0].word, moves[0].score)
+    sword 18
+
+    >>> words.close()
+
+    """
+    return MoveGenerator(words, scores=scores, bingo=bingo).find_moves(board, tiles)
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.scrabble.tests.test_moves", exit=False)
+    doctest.testmod(verbose=False)
@@ -12,6 +12,7 @@
 import unittest
 
 from matplotlib.patches import Rectangle
+import numpy as np
 
 from dstauffman2.games.scrabble.constants import COLOR
 
@@ -103,8 +104,54 @@ def plot_draw_stats(ax, counts, tiles, move):
 
 
 # %% plot_move_strength
-def plot_move_strength(ax, move, pot_moves):
-    pass
+def plot_move_strength(ax, move, pot_moves, max_moves=10):
+    r"""
+    Plots the strength of the potential moves, highlighting the current one.
+
+    Parameters
+    ----------
+    ax : object
+        Axis to plot on
+    move : class Move
+        Currently selected move
+    pot_moves : list of class Move or class MoveEquity
+        Potential moves, best first, using the simulated equity when it is available and otherwise the score
+    max_moves : int, optional
+        Maximum number of moves to show
+
+    Notes
+    -----
+    #.  Updated by David C. Stauffer in October 2026 to plot the moves, with the error bars from
+        the simulations of `evaluate_moves`.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import plot_move_strength, Move, MoveEquity
+    >>> import matplotlib.pyplot as plt
+    >>> fig = plt.figure()
+    >>> ax = fig.add_subplot(111)
+    >>> moves = [MoveEquity(Move("sword", 7, 3, 0, 18), [8, 12]), MoveEquity(Move("words", 7, 7, 0, 18), [4, 2])]
+    >>> plot_move_strength(ax, moves[1].move, moves)
+    >>> plt.show(block=False) # doctest: +SKIP
+
+    >>> plt.close(fig)
+
+    """
+    ax.clear()
+    items = pot_moves[:max_moves]
+    if not items:
+        return
+    moves     = [getattr(item, "move", item) for item in items]
+    strengths = [item.equity if hasattr(item, "equity") else item.score for item in items]
+    errors    = [getattr(item, "std_err", 0.0) for item in items]
+    key       = (move.word, move.row, move.col, move.dir)
+    colors    = [COLOR["tile"] if (x.word, x.row, x.col, x.dir) == key else COLOR["board"] for x in moves]
+    ax.barh(np.arange(len(items)), strengths, xerr=errors, color=colors, edgecolor=COLOR["edge"])
+    ax.axvline(0, color=COLOR["edge"], linewidth=1)
+    ax.set_yticks(np.arange(len(items)))
+    ax.set_yticklabels([f"{x.word} ({x.score})" for x in moves])
+    ax.set_ylim(len(items) - 0.5, -0.5)
+    ax.set_xlabel("Equity" if hasattr(items[0], "equity") else "Score")
 
 
 # %% display_tile_bag
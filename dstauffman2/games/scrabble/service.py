@@ -0,0 +1,213 @@
+r"""
+Service module file for the "scrabble" game.  It answers batches of anagram queries with one word index.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  The word index is loaded once, and then any number of queries are answered from a stream of
+    lines, such as stdin, or from the connections to a local Unix socket.  Each query is a line with
+    the tiles, and optionally a pattern, separated by whitespace, and each answer is a line with
+    the words separated by spaces, best first.
+
+"""
+
+# %% Imports
+import doctest
+import os
+import re
+import socket
+import socketserver
+import stat
+import time
+import unittest
+
+from dstauffman import Frozen
+
+from dstauffman2.games.scrabble.constants import DICT
+from dstauffman2.games.scrabble.dawg import load_dawg
+from dstauffman2.games.scrabble.utils import find_all_words
+
+
+# %% parse_query
+def parse_query(line):
+    r"""
+    Parses a single query into its tiles and pattern.
+
+    Parameters
+    ----------
+    line : str
+        Query with the tiles and an optional pattern separated by whitespace
+
+    Returns
+    -------
+    tiles : str
+        Tiles, with "?" for blanks
+    pattern : str
+        Regular expression pattern, which is empty if not given
+
+    Raises
+    ------
+    ValueError
+        If the query has too many parts, or the pattern is not a valid regular expression
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.service import parse_query
+    >>> print(parse_query("words a..$\n"))
+    ('words', 'a..$')
+
+    """
+    parts = line.split()
+    if len(parts) > 2:
+        raise ValueError(f'Query should only have tiles and a pattern: "{line.strip()}"')
+    pattern = parts[1] if len(parts) > 1 else ""
+    _check_pattern(pattern)
+    return (parts[0].lower() if parts else "", pattern)
+
+
+# %% _check_pattern
+def _check_pattern(pattern):
+    r"""Checks that the pattern is a valid regular expression, and raises a ValueError if not."""
+    try:
+        re.compile(pattern)
+    except re.error as err:
+        raise ValueError(f'Invalid pattern "{pattern}": {err}') from err
+
+
+# %% format_throughput
+def format_throughput(num_queries, elapsed):
+    r"""
+    Formats the number of queries answered and how quickly.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.service import format_throughput
+    >>> print(format_throughput(500, 2.0))
+    Answered 500 queries in 2.000 s (250.0 queries per second).
+
+    """
+    rate = num_queries / elapsed if elapsed > 0 else 0.0
+    return f"Answered {num_queries} queries in {elapsed:.3f} s ({rate:.1f} queries per second)."
+
+
+# %% Classes - WordService
+class WordService(Frozen):
+    r"""
+    Answers anagram queries with a word index that is only loaded once.
+
+    Parameters
+    ----------
+    words : class Dawg or dict, optional
+        Word index for `find_all_words`, defaults to the DAWG for dict_name
+    dict_name : str, optional
+        Name of the word list in the data folder
+    show_blanks : bool, optional
+        Whether to show the letters that the blanks stand for in uppercase
+
+    Attributes
+    ----------
+    num_queries : int
+        Number of queries answered
+    elapsed : float
+        Time spent answering them, in seconds
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Dawg
+    >>> from dstauffman2.games.scrabble.service import WordService
+    >>> service = WordService(Dawg.from_words(["cat", "act", "at", "tact"]))
+    >>> print(service.answer("tac"))
+    act cat at
+
+    >>> print(service.answer("tac ^c"))
+    cat
+
+    """
+
+    def __init__(self, words=None, dict_name=DICT, show_blanks=False):
+        if words is None:
+            words = load_dawg(dict_name)
+        self.words       = words
+        self.show_blanks = show_blanks
+        self.num_queries = 0
+        self.elapsed     = 0.0
+
+    @property
+    def queries_per_second(self):
+        r"""Average number of queries answered per second."""
+        return self.num_queries / self.elapsed if self.elapsed > 0 else 0.0
+
+    def answer(self, line):
+        r"""Answers a single query, with the words separated by spaces."""
+        (tiles, pattern) = parse_query(line)
+        return " ".join(self.find(tiles, pattern))
+
+    def find(self, tiles, pattern=""):
+        r"""Finds the words for the given tiles and pattern, and raises a ValueError if either is invalid."""
+        start = time.perf_counter()
+        _check_pattern(pattern)
+        tiles = tiles.lower()
+        words = find_all_words(tiles, self.words, pattern=pattern, show_blanks=self.show_blanks) if tiles else []
+        self.num_queries += 1
+        self.elapsed += time.perf_counter() - start
+        return words
+
+    def serve_lines(self, in_stream, out_stream):
+        r"""Answers every line of the input stream with one line on the output stream, and returns the number answered."""
+        count = 0
+        for line in in_stream:
+            try:
+                text = self.answer(line)
+            except ValueError as err:
+                text = f"Error: {err}"
+            out_stream.write(text + "\n")
+            out_stream.flush()
+            count += 1
+        return count
+
+    def make_server(self, path):
+        r"""
+        Makes a server that answers the queries from each connection to the Unix socket at path.
+
+        Notes
+        -----
+        #.  The connections are handled one at a time, so that they all share the same index.
+        #.  An existing socket at path is replaced, since it is left over from an old server, but
+            anything else there is an error, so that a mistyped path can't delete a regular file.
+
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix sockets are not supported on this platform.")
+        if os.path.lexists(path):
+            if not stat.S_ISSOCK(os.lstat(path).st_mode):
+                raise FileExistsError(f'"{path}" already exists and is not a socket.')
+            os.remove(path)
+        service = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            r"""Answers all the queries on a single connection."""
+
+            def handle(self):
+                service.serve_lines((line.decode("utf-8") for line in self.rfile), _SocketWriter(self.wfile))
+
+        return socketserver.UnixStreamServer(path, _Handler)
+
+
+# %% Classes - _SocketWriter
+class _SocketWriter:
+    r"""Writes text to a socket file, encoded as UTF-8."""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, text):
+        self.wfile.write(text.encode("utf-8"))
+
+    def flush(self):
+        self.wfile.flush()
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.scrabble.tests.test_service", exit=False)
+    doctest.testmod(verbose=False)
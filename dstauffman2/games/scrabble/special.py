@@ -4,15 +4,19 @@
 Notes
 -----
 #.  Written by David C. Stauffer in March 2017.
+#.  Updated by David C. Stauffer in October 2026 to run the searches as vectorized queries on the
+    columnar word store instead of calling a Python function on every word.
 
 """
 
 # %% Imports
 import doctest
+from functools import lru_cache
 import unittest
 
 from dstauffman2.games.scrabble.constants import CONSONANTS, MAX_LEN, VOWELS
-from dstauffman2.games.scrabble.utils import get_raw_dictionary
+from dstauffman2.games.scrabble.wordlist import load_word_list
+from dstauffman2.games.scrabble.wordstore import load_word_store, WordStore
 
 
 # %% Support function
@@ -22,8 +26,8 @@ def find_all(words=None, func=None):
 
     Paramters
     ---------
-    words : set, optional
-        List of all valid words as a Python set
+    words : set or class WordList, optional
+        List of all valid words, defaults to the cached default word list
     func : function
         Function to use as criterion for valid words
 
@@ -46,7 +50,7 @@ def find_all(words=None, func=None):
     """
     # if not given, load the default word list
     if words is None:
-        words = get_raw_dictionary()
+        words = load_word_list()
     # apply the given function as a filter to the word list
     out = list(filter(func, words))
     # sort the output based on the length of the words, longest first, then alphabetically
@@ -54,6 +58,23 @@ def find_all(words=None, func=None):
     return out
 
 
+# %% _build_store
+@lru_cache(maxsize=4)
+def _build_store(words):
+    r"""Builds the word store for a frozenset of words, keeping the last few so they aren't rebuilt on every call."""
+    return WordStore(words)
+
+
+# %% _get_store
+def _get_store(words):
+    r"""Gets the word store for the given words, or for the default word list if they aren't given."""
+    if words is None:
+        return load_word_store()
+    if isinstance(words, WordStore):
+        return words
+    return _build_store(frozenset(words))
+
+
 # %% find_all_two_letter_words
 def find_all_two_letter_words(words=None):
     r"""
@@ -61,8 +82,8 @@ def find_all_two_letter_words(words=None):
 
     Paramters
     ---------
-    words : set, optional
-        List of all valid words as a Python set
+    words : set or class WordStore, optional
+        List of all valid words, defaults to the word store for the default word list
 
     Returns
     -------
@@ -77,117 +98,140 @@ def find_all_two_letter_words(words=None):
     ['aa', 'ab', 'ad', 'ae', 'ag', 'ah', 'ai', 'al', 'am', 'an']
 
     """
-    return find_all(words, func=lambda x: len(x) == 2)
+    store = _get_store(words)
+    return store.get_words(store.length_mask(2, 2))
 
 
 # %% find_all_three_letter_words
 def find_all_three_letter_words(words=None):
-    return find_all(words, func=lambda x: len(x) == 3)
+    store = _get_store(words)
+    return store.get_words(store.length_mask(3, 3))
 
 
 # %% find_all_four_letter_words
 def find_all_four_letter_words(words=None):
-    return find_all(words, func=lambda x: len(x) == 4)
+    store = _get_store(words)
+    return store.get_words(store.length_mask(4, 4))
 
 
 # %% find_all_consonant_words
 def find_all_consonant_words(words=None):
-    return find_all(words, func=lambda x: all(i in CONSONANTS for i in x))
+    store = _get_store(words)
+    return store.get_words(store.letter_set_mask(CONSONANTS))
 
 
 # %% find_all_one_vowel_words
 def find_all_one_vowel_words(words=None):
-    return find_all(words, func=lambda x: sum(i in VOWELS for i in x) == 1)
+    store = _get_store(words)
+    return store.get_words(store.vowels == 1)
 
 
 # %% find_all_one_consonant_words
 def find_all_one_consonant_words(words=None):
-    return find_all(words, func=lambda x: sum(i in CONSONANTS for i in x) == 1)
+    store = _get_store(words)
+    return store.get_words(store.lengths - store.vowels == 1)
 
 
 # %% find_all_vowel_words
 def find_all_vowel_words(words=None):
-    return find_all(words, func=lambda x: all(i in VOWELS for i in x))
+    store = _get_store(words)
+    return store.get_words(store.letter_set_mask(VOWELS))
 
 
 # %% find_all_q_without_u_words
 def find_all_q_without_u_words(words=None):
-    return find_all(words, func=lambda x: "q" in x and "u" not in x)
+    store = _get_store(words)
+    return store.get_words(store.contains_mask("q") & ~store.contains_mask("u"))
 
 
 # %% find_starting_with_de
 def find_starting_with_de(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.startswith("de") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.prefix_mask("de") & store.length_mask(max_len=max_len))
 
 
 # %% find_starting_with_re
 def find_starting_with_re(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.startswith("re") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.prefix_mask("re") & store.length_mask(max_len=max_len))
 
 
 # %% find_starting_with_un
 def find_starting_with_un(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.startswith("un") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.prefix_mask("un") & store.length_mask(max_len=max_len))
 
 
 # %% find_starting_with_x
 def find_starting_with_x(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.startswith("x") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.prefix_mask("x") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_est
 def find_ending_with_est(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("est") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("est") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_iest
 def find_ending_with_iest(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("iest") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("iest") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_ing
 def find_ending_with_ing(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("ing") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("ing") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_j
 def find_ending_with_j(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("j") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("j") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_ness
 def find_ending_with_ness(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("ness") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("ness") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_q
 def find_ending_with_q(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("q") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("q") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_ted
 def find_ending_with_ted(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("ted") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("ted") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_u
 def find_ending_with_u(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("u") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("u") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_v
 def find_ending_with_v(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("v") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("v") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_x
 def find_ending_with_x(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("x") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("x") & store.length_mask(max_len=max_len))
 
 
 # %% find_ending_with_z
 def find_ending_with_z(words=None, max_len=MAX_LEN):
-    return find_all(words, func=lambda x: x.endswith("z") and len(x) <= max_len)
+    store = _get_store(words)
+    return store.get_words(store.suffix_mask("z") & store.length_mask(max_len=max_len))
 
 
 # %% Unit test
@@ -11,8 +11,107 @@
 # %% Imports
 import unittest
 
+import numpy as np
+
 import dstauffman2.games.scrabble as scrab
 
+
+# %% Board
+class Test_Board(unittest.TestCase):
+    r"""
+    Tests the Board class with the following cases:
+        defaults
+        given played tiles
+        bad played tiles
+        across move
+        down move
+        null move
+        illegal moves
+        skip validation
+        undo
+        anchors match get_board_must_play
+    """
+
+    def setUp(self) -> None:
+        self.board = scrab.Board()
+
+    def test_defaults(self) -> None:
+        self.assertEqual((self.board.num_rows, self.board.num_cols), (15, 15))
+        self.assertEqual(self.board.grid.shape, (15, 15))
+        self.assertEqual(self.board.grid.dtype, np.uint8)
+        self.assertEqual(len(self.board.played), len(self.board.board))
+        self.assertEqual(set(self.board.played), {" ", "\n"})
+        self.assertEqual(self.board.num_tiles, 0)
+        self.assertEqual(list(zip(*np.nonzero(self.board.anchors))), [(7, 7)])
+
+    def test_played(self) -> None:
+        board = scrab.Board(board="...\n.s.\n...", played="   \n ab\n   ")
+        self.assertEqual(board.played, "   \n ab\n   ")
+        self.assertEqual(board.num_tiles, 2)
+        self.assertEqual(board.anchors.sum(), 5)
+
+    def test_bad_played(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.Board(board="...\n.s.\n...", played="   \n ab\n")
+
+    def test_across(self) -> None:
+        self.board.make_move(scrab.Move("sword", 7, 3, 0))
+        self.assertEqual(self.board.played.split("\n")[7], "   sword       ")
+        self.assertEqual(self.board.num_tiles, 5)
+
+    def test_down(self) -> None:
+        self.board.make_move(scrab.Move("sword", 7, 3, 0))
+        self.board.make_move(scrab.Move("rOw", 5, 4, 1))
+        rows = self.board.played.split("\n")
+        self.assertEqual([row[4] for row in rows[5:8]], ["r", "O", "w"])
+        self.assertEqual(self.board.num_tiles, 7)
+
+    def test_null(self) -> None:
+        self.board.make_move(scrab.Move())
+        self.assertEqual(set(self.board.played), {" ", "\n"})
+
+    def test_illegal(self) -> None:
+        bad_moves = [scrab.Move("sword", 0, 0, 0), scrab.Move("sword", 7, 12, 0), scrab.Move("sword", 7, 3, 2), \
+            scrab.Move("sw0rd", 7, 3, 0)]
+        for move in bad_moves:
+            with self.assertRaises(ValueError):
+                self.board.make_move(move)
+        self.board.make_move(scrab.Move("sword", 7, 3, 0))
+        bad_moves = [scrab.Move("sword", 7, 3, 0), scrab.Move("swore", 7, 3, 0), scrab.Move("or", 7, 5, 0), \
+            scrab.Move("ow", 7, 2, 0), scrab.Move("ab", 0, 0, 1)]
+        for move in bad_moves:
+            with self.assertRaises(ValueError):
+                self.board.make_move(move)
+        self.assertEqual(self.board.num_tiles, 5)
+
+    def test_no_validate(self) -> None:
+        self.board.make_move(scrab.Move("ab", 0, 0, 1), validate=False)
+        self.assertEqual(self.board.num_tiles, 2)
+
+    def test_undo(self) -> None:
+        self.board.make_move(scrab.Move("sword", 7, 3, 0))
+        anchors = self.board.anchors.copy()
+        self.board.make_move(scrab.Move("rOw", 5, 4, 1))
+        move = self.board.undo()
+        self.assertEqual(move.word, "rOw")
+        np.testing.assert_array_equal(self.board.anchors, anchors)
+        self.assertEqual(self.board.played.split("\n")[5], " " * 15)
+        self.board.undo()
+        self.assertEqual(set(self.board.played), {" ", "\n"})
+        self.assertEqual(list(zip(*np.nonzero(self.board.anchors))), [(7, 7)])
+        with self.assertRaises(ValueError):
+            self.board.undo()
+
+    def test_anchors(self) -> None:
+        moves = [scrab.Move("dwarf", 7, 3, 0), scrab.Move("jowed", 5, 4, 1), scrab.Move("canto", 1, 5, 1), \
+            scrab.Move("crank", 1, 5, 0), scrab.Move("redwings", 3, 0, 0)]
+        for move in moves:
+            self.board.make_move(move)
+            expected = scrab.get_board_must_play(self.board.board, 15, 15, self.board.played)
+            (rows, cols) = np.nonzero(self.board.anchors)
+            self.assertEqual(set(rows * 16 + cols), expected)
+
+
 # %% Unit test execution
 if __name__ == "__main__":
     unittest.main(exit=False)
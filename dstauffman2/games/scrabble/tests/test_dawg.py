@@ -0,0 +1,183 @@
+r"""
+Test file for the `scrabble.dawg` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import os
+import tempfile
+import unittest
+
+import dstauffman2.games.scrabble as scrab
+
+# %% Support
+words = scrab.get_raw_dictionary()
+
+
+# %% Dawg
+class Test_Dawg(unittest.TestCase):
+    r"""
+    Tests the Dawg class with the following cases:
+        contains
+        not contains
+        shared suffixes
+        skips invalid words
+        empty
+        anagrams
+        anagrams minimum length
+        blanks
+        show blanks
+        uppercase tiles
+        bad tiles
+        save and load
+        save replaces
+        bad file
+    """
+
+    def setUp(self) -> None:
+        self.words = ["act", "acts", "at", "cat", "cats", "scat", "tact", "tacts", "ta"]
+        self.dawg = scrab.Dawg.from_words(self.words)
+
+    def test_contains(self) -> None:
+        for word in self.words:
+            self.assertIn(word, self.dawg)
+
+    def test_not_contains(self) -> None:
+        for word in ["", "a", "ca", "cast", "tacts!", "Cat", "catss"]:
+            self.assertNotIn(word, self.dawg)
+
+    def test_shared(self) -> None:
+        # a trie would need 18 edges, but the shared suffixes need fewer
+        self.assertLess(len(self.dawg) - 1, 18)
+
+    def test_invalid(self) -> None:
+        dawg = scrab.Dawg.from_words(["ok", "don't", "a", "abcdefghijklmnopqrstuvwxyz"], max_len=20)
+        self.assertIn("ok", dawg)
+        self.assertNotIn("don't", dawg)
+        self.assertNotIn("a", dawg)
+
+    def test_empty(self) -> None:
+        dawg = scrab.Dawg.from_words([])
+        self.assertNotIn("cat", dawg)
+        self.assertEqual(dawg.anagrams("cat"), [])
+
+    def test_anagrams(self) -> None:
+        self.assertEqual(self.dawg.anagrams("stca"), ["acts", "cats", "scat", "act", "cat", "at", "ta"])
+        self.assertEqual(self.dawg.anagrams("tcat"), ["tact", "act", "cat", "at", "ta"])
+        self.assertEqual(self.dawg.anagrams("xyz"), [])
+
+    def test_min_len(self) -> None:
+        self.assertEqual(self.dawg.anagrams("stca", min_len=4), ["acts", "cats", "scat"])
+
+    def test_blanks(self) -> None:
+        self.assertEqual(self.dawg.anagrams("ta?"), ["act", "cat", "at", "ta"])
+        self.assertEqual(self.dawg.anagrams("??"), ["at", "ta"])
+        self.assertEqual(self.dawg.anagrams("??", min_len=3), [])
+
+    def test_show_blanks(self) -> None:
+        self.assertEqual(self.dawg.anagrams("ta?", show_blanks=True), ["aCt", "Cat", "at", "ta"])
+        self.assertEqual(self.dawg.anagrams("tc??", show_blanks=True)[0:3], ["ActS", "cAtS", "ScAt"])
+
+    def test_uppercase(self) -> None:
+        self.assertEqual(self.dawg.anagrams("STca"), self.dawg.anagrams("stca"))
+        self.assertEqual(self.dawg.anagrams(["T", "A", "?"]), ["act", "cat", "at", "ta"])
+
+    def test_bad_tiles(self) -> None:
+        for tiles in ["ca t", "cat!", "cät", ["ca"]]:
+            with self.assertRaises(ValueError) as context:
+                self.dawg.anagrams(tiles)
+            self.assertIn("Tiles can only be", str(context.exception))
+
+    def test_save_and_load(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "test.dawg")
+            self.dawg.save(filename)
+            dawg = scrab.Dawg.load(filename)
+            self.assertEqual(list(dawg.edges), list(self.dawg.edges))
+            self.assertEqual(dawg.anagrams("stca"), self.dawg.anagrams("stca"))
+            dawg.close()
+            self.assertEqual(len(dawg), 0)
+
+    def test_save_replaces(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "test.dawg")
+            self.dawg.save(filename)
+            dawg = scrab.Dawg.load(filename)
+            # replacing the file doesn't change one that is already memory-mapped, nor leave a temporary file
+            scrab.Dawg.from_words(["dog"]).save(filename)
+            self.assertEqual(os.listdir(folder), ["test.dawg"])
+            self.assertEqual(dawg.anagrams("stca"), self.dawg.anagrams("stca"))
+            dawg.close()
+            dawg = scrab.Dawg.load(filename)
+            self.assertEqual(dawg.anagrams("god"), ["dog"])
+            dawg.close()
+
+    def test_bad_file(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "bad.dawg")
+            with open(filename, "wb") as file:
+                file.write(b"NOPE" + bytes(20))
+            with self.assertRaises(ValueError):
+                scrab.Dawg.load(filename)
+
+
+# %% load_dawg
+class Test_load_dawg(unittest.TestCase):
+    r"""
+    Tests the load_dawg function with the following cases:
+        builds and caches
+        rebuilds when the word list is newer
+        matches the whole word list
+        matches find_all_words with the anagram dictionary
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.dawg = scrab.load_dawg(folder=cls.folder.name)
+        cls.filename = os.path.join(cls.folder.name, os.path.splitext(scrab.DICT)[0] + ".dawg")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.dawg.close()
+        cls.folder.cleanup()
+
+    def test_cached(self) -> None:
+        self.assertTrue(os.path.isfile(self.filename))
+        mtime = os.path.getmtime(self.filename)
+        dawg = scrab.load_dawg(folder=self.folder.name)
+        self.assertEqual(os.path.getmtime(self.filename), mtime)
+        self.assertEqual(len(dawg), len(self.dawg))
+        dawg.close()
+
+    def test_rebuild(self) -> None:
+        filename = os.path.join(self.folder.name, "old.dawg")
+        scrab.Dawg.from_words(["old"]).save(filename)
+        os.utime(filename, (0, 0))
+        os.replace(filename, self.filename)
+        dawg = scrab.load_dawg(folder=self.folder.name)
+        self.assertIn("sword", dawg)
+        dawg.close()
+
+    def test_all_words(self) -> None:
+        self.assertTrue(all(word in self.dawg for word in words))
+
+    def test_find_all_words(self) -> None:
+        anagram_dict = scrab.create_dict(scrab.get_dict_path())
+        for tiles in ["words", "retains", "quizzical", "abcdefghijklmno"]:
+            self.assertEqual(scrab.find_all_words(tiles, self.dawg), scrab.find_all_words(tiles, anagram_dict))
+        self.assertEqual(scrab.find_all_words("words", self.dawg, pattern="a..$"), \
+            scrab.find_all_words("words", anagram_dict, pattern="a..$"))
+        for tiles in ["retain?", "qi??", "xzz??"]:
+            self.assertEqual(scrab.find_all_words(tiles, self.dawg, show_blanks=True), \
+                scrab.find_all_words(tiles, anagram_dict, show_blanks=True))
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,147 @@
+r"""
+Test file for the `scrabble.equity` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.scrabble as scrab
+
+# %% Support
+board  = ".d..T\n..t..\nD.s.d\n..t..\nT..d."
+played = "     \n  b  \n cat \n  t  \n     "
+words  = ["at", "ab", "ba", "bat", "bats", "cab", "cat", "cats", "scat", "sat", "tab", "tabs", "ta", "as", \
+    "act", "acts", "tact", "stab", "bast", "tas"]
+counts = {"a": 4, "b": 2, "c": 2, "s": 4, "t": 4, "?": 1}
+
+
+# %% MoveEquity
+class Test_MoveEquity(unittest.TestCase):
+    r"""
+    Tests the MoveEquity class with the following cases:
+        nominal
+        one simulation
+        no simulations
+    """
+
+    def test_nominal(self) -> None:
+        equity = scrab.MoveEquity(scrab.Move("cats", 2, 1, 0, 8), [1, 2, 3, 6])
+        self.assertEqual(equity.equity, 3.0)
+        self.assertEqual(equity.num_sims, 4)
+        self.assertAlmostEqual(equity.std_err, np.std([1, 2, 3, 6], ddof=1) / 2)
+
+    def test_one(self) -> None:
+        equity = scrab.MoveEquity(scrab.Move("cats", 2, 1, 0, 8), [5])
+        self.assertEqual((equity.equity, equity.std_err), (5.0, 0.0))
+
+    def test_none(self) -> None:
+        equity = scrab.MoveEquity(scrab.Move("cats", 2, 1, 0, 8), [])
+        self.assertEqual((equity.equity, equity.num_sims), (8.0, 0))
+
+
+# %% get_unseen_tiles
+class Test_get_unseen_tiles(unittest.TestCase):
+    r"""
+    Tests the get_unseen_tiles function with the following cases:
+        empty board
+        played tiles and blanks
+        more tiles than the counts
+    """
+
+    def test_empty(self) -> None:
+        unseen = scrab.get_unseen_tiles(scrab.Board(), "")
+        self.assertEqual(len(unseen), sum(scrab.COUNTS.values()))
+
+    def test_played(self) -> None:
+        this_board = scrab.Board(board=board, played=played.replace("b", "B"))
+        self.assertEqual(scrab.get_unseen_tiles(this_board, "as", counts=counts), "aabbcssstt")
+
+    def test_extra(self) -> None:
+        this_board = scrab.Board(board=board, played=played)
+        self.assertEqual(scrab.get_unseen_tiles(this_board, "aaaaa", counts={"a": 3, "z": 1}), "z")
+
+
+# %% evaluate_moves
+class Test_evaluate_moves(unittest.TestCase):
+    r"""
+    Tests the evaluate_moves function with the following cases:
+        matches the move scores with no tiles left
+        equity from the replies
+        same seed
+        two plies
+        given moves
+        time budget
+        no moves
+        bad plies
+        process pool
+    """
+
+    def setUp(self) -> None:
+        self.board = scrab.Board(board=board, played=played)
+        self.generator = scrab.MoveGenerator(words)
+
+    def test_no_tiles(self) -> None:
+        results = scrab.evaluate_moves(self.board, "sab", num_sims=3, counts={}, generator=self.generator)
+        self.assertEqual(len(results), 10)
+        self.assertEqual([x.equity for x in results], [float(x.move.score) for x in results])
+        self.assertTrue(all(x.num_sims == 3 for x in results))
+
+    def test_replies(self) -> None:
+        results = scrab.evaluate_moves(self.board, "sab", num_sims=8, seed=1, counts=counts, generator=self.generator)
+        for result in results:
+            self.assertLessEqual(result.equity, result.move.score)
+            self.assertEqual(result.num_sims, 8)
+        equities = [x.equity for x in results]
+        self.assertEqual(equities, sorted(equities, reverse=True))
+
+    def test_seed(self) -> None:
+        results1 = scrab.evaluate_moves(self.board, "sab", num_sims=6, seed=5, counts=counts, generator=self.generator)
+        results2 = scrab.evaluate_moves(self.board, "sab", num_sims=6, seed=5, counts=counts, generator=self.generator, \
+            chunk_size=4)
+        self.assertEqual([(x.move.word, x.equity) for x in results1], [(x.move.word, x.equity) for x in results2])
+
+    def test_two_plies(self) -> None:
+        results1 = scrab.evaluate_moves(self.board, "sab", num_sims=6, seed=5, counts=counts, generator=self.generator)
+        results2 = scrab.evaluate_moves(self.board, "sab", num_sims=6, seed=5, counts=counts, generator=self.generator, \
+            plies=2)
+        equity1 = {(x.move.word, x.move.row, x.move.col, x.move.dir): x.equity for x in results1}
+        for result in results2:
+            self.assertGreaterEqual(result.equity, equity1[(result.move.word, result.move.row, result.move.col, result.move.dir)])
+
+    def test_given_moves(self) -> None:
+        moves = [scrab.Move("cats", 2, 1, 0, 8), scrab.Move("scat", 2, 0, 0, 14)]
+        results = scrab.evaluate_moves(self.board, "sab", moves=moves, num_sims=2, counts={}, generator=self.generator)
+        self.assertEqual([x.move.word for x in results], ["scat", "cats"])
+
+    def test_time_budget(self) -> None:
+        results = scrab.evaluate_moves(self.board, "sab", num_sims=1000, seed=0, time_budget=0.0, counts=counts, \
+            generator=self.generator)
+        self.assertTrue(all(x.num_sims == 1 for x in results))
+
+    def test_no_moves(self) -> None:
+        self.assertEqual(scrab.evaluate_moves(self.board, "", generator=self.generator), [])
+
+    def test_bad_plies(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.evaluate_moves(self.board, "sab", plies=3, generator=self.generator)
+
+    def test_pool(self) -> None:
+        this_board = scrab.Board()
+        this_board.make_move(scrab.Move("sword", 7, 3, 0))
+        results1 = scrab.evaluate_moves(this_board, "retains", num_moves=3, num_sims=4, seed=2, num_workers=1)
+        results2 = scrab.evaluate_moves(this_board, "retains", num_moves=3, num_sims=4, seed=2, num_workers=2, \
+            chunk_size=2)
+        self.assertEqual([(x.move.word, x.equity) for x in results1], [(x.move.word, x.equity) for x in results2])
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,180 @@
+r"""
+Test file for the `scrabble.lexicon` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import gc
+import os
+import tempfile
+import unittest
+import weakref
+
+import numpy as np
+
+import dstauffman2.games.scrabble as scrab
+
+# %% Support
+lexicons = {"us": "us.txt", "uk": "uk.txt", "game": ("us", "adds.txt", "dels.txt")}
+files = {"us.txt": "cat\ncolor\ndog\nx\n", "uk.txt": "cat\ncolour\ndog\n", "adds.txt": "qi\nza\n", "dels.txt": "dog\n"}
+
+
+# %% Functions - _write_files
+def _write_files(folder):
+    r"""Writes the small word lists to the given folder, for use in testing."""
+    for name, text in files.items():
+        with open(os.path.join(folder, name), "wt") as file:
+            file.write(text)
+
+
+# %% Lexicon
+class Test_Lexicon(unittest.TestCase):
+    r"""
+    Tests the Lexicon class with the following cases:
+        masks
+        valid words
+        lexicons for a word
+        words in each lexicon
+        prefixes
+        additions and deletions
+        unknown lexicon
+        bad base lexicon
+        too many lexicons
+        save and load
+        bad file
+    """
+
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        _write_files(self.folder.name)
+        self.lexicon = scrab.Lexicon.from_files(lexicons, folder=self.folder.name)
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def test_masks(self) -> None:
+        self.assertEqual(self.lexicon.words.to_list(), ["cat", "color", "colour", "dog", "qi", "za"])
+        np.testing.assert_array_equal(self.lexicon.masks, [7, 5, 2, 3, 4, 4])
+        self.assertEqual(self.lexicon.get_mask("cats"), 0)
+
+    def test_valid(self) -> None:
+        self.assertTrue(self.lexicon.is_valid("color", "us"))
+        self.assertFalse(self.lexicon.is_valid("color", "uk"))
+        self.assertIn("colour", self.lexicon)
+        self.assertNotIn("x", self.lexicon)
+        self.assertNotIn("colors", self.lexicon)
+
+    def test_lexicons(self) -> None:
+        self.assertEqual(self.lexicon.get_lexicons("cat"), ["us", "uk", "game"])
+        self.assertEqual(self.lexicon.get_lexicons("dog"), ["us", "uk"])
+        self.assertEqual(self.lexicon.get_lexicons("cow"), [])
+
+    def test_words(self) -> None:
+        self.assertEqual(self.lexicon.get_words("uk"), ["cat", "colour", "dog"])
+        self.assertEqual(self.lexicon.get_words("game"), ["cat", "color", "qi", "za"])
+        self.assertEqual(len(self.lexicon.get_words()), len(self.lexicon))
+
+    def test_prefix(self) -> None:
+        self.assertEqual(self.lexicon.get_words(prefix="col"), ["color", "colour"])
+        self.assertEqual(self.lexicon.get_words("uk", prefix="col"), ["colour"])
+        self.assertEqual(self.lexicon.get_words(prefix="zz"), [])
+
+    def test_deltas(self) -> None:
+        base = set(self.lexicon.get_words("us"))
+        self.assertEqual(set(self.lexicon.get_words("game")), (base | {"qi", "za"}) - {"dog"})
+
+    def test_unknown(self) -> None:
+        with self.assertRaises(ValueError):
+            self.lexicon.is_valid("cat", "wwf")
+
+    def test_bad_base(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.Lexicon.from_files({"game": ("us", "adds.txt", "dels.txt"), "us": "us.txt"}, folder=self.folder.name)
+
+    def test_too_many(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.Lexicon.from_words({str(i): ["cat"] for i in range(9)})
+
+    def test_save_and_load(self) -> None:
+        filename = os.path.join(self.folder.name, "test.lex")
+        self.lexicon.save(filename)
+        lexicon = scrab.Lexicon.load(filename, lexicons.keys())
+        self.assertEqual(lexicon.words.to_list(), self.lexicon.words.to_list())
+        np.testing.assert_array_equal(lexicon.masks, self.lexicon.masks)
+        self.assertEqual(lexicon.source_stat, self.lexicon.source_stat)
+        self.assertEqual(lexicon.get_lexicons("colour"), ["uk"])
+        lexicon.close()
+        self.assertEqual(len(lexicon), 0)
+
+    def test_bad_file(self) -> None:
+        filename = os.path.join(self.folder.name, "bad.lex")
+        with open(filename, "wb") as file:
+            file.write(b"NOPE" + bytes(40))
+        with self.assertRaises(ValueError):
+            scrab.Lexicon.load(filename, lexicons.keys())
+
+
+# %% load_lexicon
+class Test_load_lexicon(unittest.TestCase):
+    r"""
+    Tests the load_lexicon function with the following cases:
+        builds and caches
+        reuses the open lexicon
+        rebuilds when a word list changes, and releases the stale one
+        WWF matches its master list
+    """
+
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        _write_files(self.folder.name)
+
+    def tearDown(self) -> None:
+        for lexicon in scrab.lexicon._OPEN_LEXICONS.values():
+            lexicon.close()
+        scrab.lexicon._OPEN_LEXICONS.clear()
+        self.folder.cleanup()
+
+    def test_cached(self) -> None:
+        lexicon = scrab.load_lexicon(lexicons, folder=self.folder.name, data_dir=self.folder.name)
+        caches = [name for name in os.listdir(self.folder.name) if name.endswith(".lex")]
+        self.assertEqual(len(caches), 1)
+        scrab.lexicon._OPEN_LEXICONS.clear()
+        mtime = os.path.getmtime(os.path.join(self.folder.name, caches[0]))
+        lexicon2 = scrab.load_lexicon(lexicons, folder=self.folder.name, data_dir=self.folder.name)
+        self.assertEqual(os.path.getmtime(os.path.join(self.folder.name, caches[0])), mtime)
+        self.assertEqual(lexicon2.get_lexicons("cat"), lexicon.get_lexicons("cat"))
+        lexicon.close()
+
+    def test_reused(self) -> None:
+        lexicon = scrab.load_lexicon(lexicons, folder=self.folder.name, data_dir=self.folder.name)
+        self.assertIs(scrab.load_lexicon(lexicons, folder=self.folder.name, data_dir=self.folder.name), lexicon)
+
+    def test_rebuild(self) -> None:
+        lexicon = scrab.load_lexicon(lexicons, folder=self.folder.name, data_dir=self.folder.name)
+        filename = os.path.join(self.folder.name, "dels.txt")
+        stat = os.stat(filename)
+        with open(filename, "wt") as file:
+            file.write("dog\ncat\n")
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        new_lexicon = scrab.load_lexicon(lexicons, folder=self.folder.name, data_dir=self.folder.name)
+        self.assertFalse(new_lexicon.is_valid("cat", "game"))
+        self.assertTrue(lexicon.is_valid("cat", "game"))
+        # the stale lexicon is released once it isn't used anymore
+        stale = weakref.ref(lexicon._mmap)
+        del lexicon
+        gc.collect()
+        self.assertIsNone(stale())
+
+    def test_wwf(self) -> None:
+        lexicon = scrab.load_lexicon(folder=self.folder.name)
+        self.assertEqual(set(lexicon.get_words("wwf")), scrab.get_raw_dictionary())
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,174 @@
+r"""
+Test file for the `scrabble.moves` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+from collections import Counter
+import unittest
+
+import dstauffman2.games.scrabble as scrab
+
+# %% Support
+board  = ".d..T\n..t..\nD.s.d\n..t..\nT..d."
+played = "     \n  b  \n cat \n  t  \n     "
+words  = ["at", "ab", "ba", "bat", "bats", "cab", "cat", "cats", "scat", "sat", "tab", "tabs", "ta", "as", \
+    "act", "acts", "tact", "stab", "bast", "tas"]
+
+
+# %% Functions - _brute_force
+def _brute_force(board, played, tiles, words):
+    r"""Finds all the legal moves by trying every word in every position, for use in testing."""
+    rows = played.split("\n")
+    out = set()
+    for word in words:
+        for dir_ in (0, 1):
+            for row in range(len(rows)):
+                for col in range(len(rows[0])):
+                    move = scrab.Move(word, row, col, dir_)
+                    try:
+                        scrab.validate_move(board, played, move, words=set(words))
+                    except ValueError:
+                        continue
+                    (dr, dc) = (0, 1) if dir_ == 0 else (1, 0)
+                    new_tiles = Counter(letter for (i, letter) in enumerate(word) if rows[row + i * dr][col + i * dc] == " ")
+                    if new_tiles - Counter(tiles):
+                        continue
+                    # single tiles with neighbors across are only counted across
+                    if dir_ == 1 and sum(new_tiles.values()) == 1:
+                        r = next(row + i for i in range(len(word)) if rows[row + i][col] == " ")
+                        if any(0 <= col + k < len(rows[0]) and rows[r][col + k] != " " for k in (-1, 1)):
+                            continue
+                    out.add((word, row, col, dir_, scrab.score_move(board, played, move)))
+    return out
+
+
+# %% MoveGenerator
+class Test_MoveGenerator(unittest.TestCase):
+    r"""
+    Tests the MoveGenerator class with the following cases:
+        matches brute force
+        matches validate_move and score_move on a full board
+        sorted by score
+        empty board
+        blanks
+        bingo
+        cached cross-checks
+        incremental updates match a new generator
+        empty word list
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.dawg = scrab.load_dawg()
+        cls.generator = scrab.MoveGenerator(cls.dawg)
+        cls.board = scrab.Board(board=board, played=played)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.generator = None
+        cls.dawg.close()
+
+    def test_brute_force(self) -> None:
+        generator = scrab.MoveGenerator(words)
+        for tiles in ["sab", "st", "bats", "a"]:
+            moves = generator.find_moves(self.board, tiles)
+            out = {(move.word, move.row, move.col, move.dir, move.score) for move in moves}
+            self.assertEqual(len(out), len(moves))
+            self.assertEqual(out, _brute_force(board, played, tiles, words))
+
+    def test_full_board(self) -> None:
+        this_board = scrab.Board()
+        for move in [scrab.Move("dwarf", 7, 3, 0), scrab.Move("jowed", 5, 4, 1), scrab.Move("canto", 1, 3, 1)]:
+            this_board.make_move(move)
+        raw_words = scrab.get_raw_dictionary()
+        for tiles in ["nkmrawg", "eiidroe", "ab?"]:
+            moves = self.generator.find_moves(this_board, tiles)
+            self.assertGreater(len(moves), 50)
+            for move in moves:
+                self.assertTrue(scrab.validate_move(this_board.board, this_board.played, move, words=raw_words))
+                self.assertEqual(move.score, scrab.score_move(this_board.board, this_board.played, move))
+
+    def test_sorted(self) -> None:
+        moves = self.generator.find_moves(scrab.Board(), "retains")
+        scores = [move.score for move in moves]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_empty_board(self) -> None:
+        moves = self.generator.find_moves(scrab.Board(), "wordsxz")
+        self.assertEqual((moves[0].word, moves[0].score), ("sword", 18))
+        # every move covers the start square
+        self.assertTrue(all((move.row == 7 and move.col <= 7 < move.col + len(move.word)) if move.dir == 0 else \
+            (move.col == 7 and move.row <= 7 < move.row + len(move.word)) for move in moves))
+
+    def test_blanks(self) -> None:
+        generator = scrab.MoveGenerator(words)
+        moves = generator.find_moves(self.board, "s?")
+        found = {(move.word, move.row, move.col, move.dir): move.score for move in moves}
+        self.assertEqual(found[("cats", 2, 1, 0)], 8)
+        self.assertEqual(found[("catS", 2, 1, 0)], 6)
+        self.assertEqual(found[("scat", 2, 0, 0)], 14)
+        self.assertEqual(found[("Scat", 2, 0, 0)], 12)
+        # the blank scores nothing, but the real tile still scores the cross word on its premium
+        self.assertEqual(found[("As", 1, 0, 1)], 16)
+        self.assertNotIn(("cat", 2, 1, 0), found)
+
+    def test_bingo(self) -> None:
+        moves = self.generator.find_moves(scrab.Board(), "retains")
+        self.assertEqual(len(moves[0].word), 7)
+        self.assertEqual(moves[0].score, scrab.score_move(scrab.BOARD, scrab.Board().played, moves[0], bingo=0) + scrab.BINGO)
+
+    def test_cached(self) -> None:
+        generator = scrab.MoveGenerator(words)
+        moves = generator.find_moves(self.board, "sab")
+        num_cached = len(generator._cross_checks)
+        self.assertGreater(num_cached, 0)
+        self.assertEqual([move.word for move in generator.find_moves(self.board, "sab")], [move.word for move in moves])
+        self.assertEqual(len(generator._cross_checks), num_cached)
+
+    def test_incremental(self) -> None:
+        this_board = scrab.Board()
+        generator = scrab.MoveGenerator(self.dawg)
+        for tiles in ["wordsxz", "jeodnnt", "acnotke", "eiidroe"]:
+            moves = generator.find_moves(this_board, tiles)
+            # try out the other moves, as a search would
+            for move in moves[1:20]:
+                this_board.make_move(move, validate=False)
+                generator.find_moves(this_board, "ab")
+                this_board.undo()
+            fresh = scrab.MoveGenerator(self.dawg).find_moves(this_board, tiles)
+            self.assertEqual([(move.word, move.row, move.col, move.dir, move.score) for move in moves], \
+                [(move.word, move.row, move.col, move.dir, move.score) for move in fresh])
+            this_board.make_move(moves[0])
+
+    def test_no_words(self) -> None:
+        generator = scrab.MoveGenerator([])
+        self.assertEqual(generator.find_moves(self.board, "sab"), [])
+
+
+# %% find_moves
+class Test_find_moves(unittest.TestCase):
+    r"""
+    Tests the find_moves function with the following cases:
+        nominal
+        no tiles
+    """
+
+    def test_nominal(self) -> None:
+        this_board = scrab.Board(board=board, played=played)
+        moves = scrab.find_moves(this_board, "sab", words)
+        self.assertEqual([move.word for move in moves[0:2]], ["as", "scat"])
+
+    def test_no_tiles(self) -> None:
+        this_board = scrab.Board(board=board, played=played)
+        self.assertEqual(scrab.find_moves(this_board, "", words), [])
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
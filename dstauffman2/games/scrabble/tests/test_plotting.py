@@ -11,8 +11,47 @@
 # %% Imports
 import unittest
 
+import matplotlib.pyplot as plt
+
 import dstauffman2.games.scrabble as scrab
 
+
+# %% plot_move_strength
+class Test_plot_move_strength(unittest.TestCase):
+    r"""
+    Tests the plot_move_strength function with the following cases:
+        move scores
+        simulated equity
+        no moves
+    """
+
+    def setUp(self) -> None:
+        self.fig = plt.figure()
+        self.ax = self.fig.add_subplot(111)
+        self.moves = [scrab.Move("sword", 7, 3, 0, 18), scrab.Move("words", 7, 7, 0, 18), scrab.Move("sow", 7, 5, 0, 9)]
+
+    def tearDown(self) -> None:
+        plt.close(self.fig)
+
+    def test_scores(self) -> None:
+        scrab.plot_move_strength(self.ax, self.moves[1], self.moves)
+        self.assertEqual(len(self.ax.patches), 3)
+        self.assertEqual([x.get_width() for x in self.ax.patches], [18, 18, 9])
+        self.assertEqual(self.ax.get_xlabel(), "Score")
+        self.assertEqual(self.ax.patches[1].get_facecolor()[0:3], scrab.COLOR["tile"])
+
+    def test_equity(self) -> None:
+        results = [scrab.MoveEquity(move, [move.score - 4, move.score - 6]) for move in self.moves]
+        scrab.plot_move_strength(self.ax, scrab.Move(), results, max_moves=2)
+        self.assertEqual([x.get_width() for x in self.ax.patches], [13, 13])
+        self.assertEqual(self.ax.get_xlabel(), "Equity")
+        self.assertEqual([x.get_text() for x in self.ax.get_yticklabels()], ["sword (18)", "words (18)"])
+
+    def test_no_moves(self) -> None:
+        scrab.plot_move_strength(self.ax, scrab.Move(), [])
+        self.assertEqual(len(self.ax.patches), 0)
+
+
 # %% Unit test execution
 if __name__ == "__main__":
     unittest.main(exit=False)
@@ -0,0 +1,176 @@
+r"""
+Test file for the `scrabble.service` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import io
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+import dstauffman2.games.scrabble as scrab
+from dstauffman2.games.scrabble.service import format_throughput, parse_query, WordService
+
+# %% Support
+words = ["act", "acts", "at", "cat", "cats", "scat", "tact", "ta"]
+
+
+# %% parse_query
+class Test_parse_query(unittest.TestCase):
+    r"""
+    Tests the parse_query function with the following cases:
+        tiles
+        tiles and pattern
+        uppercase tiles
+        blank line
+        too many parts
+        bad pattern
+    """
+
+    def test_tiles(self) -> None:
+        self.assertEqual(parse_query("tac\n"), ("tac", ""))
+
+    def test_pattern(self) -> None:
+        self.assertEqual(parse_query("  tac \t ^c.t$ \n"), ("tac", "^c.t$"))
+
+    def test_upper(self) -> None:
+        self.assertEqual(parse_query("TAC"), ("tac", ""))
+
+    def test_blank(self) -> None:
+        self.assertEqual(parse_query("\n"), ("", ""))
+
+    def test_bad(self) -> None:
+        with self.assertRaises(ValueError):
+            parse_query("tac ^c extra")
+
+    def test_bad_pattern(self) -> None:
+        with self.assertRaises(ValueError):
+            parse_query("tac a(")
+
+
+# %% format_throughput
+class Test_format_throughput(unittest.TestCase):
+    r"""
+    Tests the format_throughput function with the following cases:
+        nominal
+        no time
+    """
+
+    def test_nominal(self) -> None:
+        self.assertEqual(format_throughput(10, 0.5), "Answered 10 queries in 0.500 s (20.0 queries per second).")
+
+    def test_no_time(self) -> None:
+        self.assertEqual(format_throughput(0, 0.0), "Answered 0 queries in 0.000 s (0.0 queries per second).")
+
+
+# %% WordService
+class Test_WordService(unittest.TestCase):
+    r"""
+    Tests the WordService class with the following cases:
+        answer
+        pattern
+        blanks
+        blank line
+        matches find_all_words
+        stream of lines
+        bad lines
+        bad pattern
+        throughput
+        Unix socket
+        not a socket
+    """
+
+    def setUp(self) -> None:
+        self.service = WordService(scrab.Dawg.from_words(words))
+
+    def test_answer(self) -> None:
+        self.assertEqual(self.service.answer("stca"), "acts cats scat act cat at ta")
+
+    def test_pattern(self) -> None:
+        self.assertEqual(self.service.answer("stca ^c"), "cats cat")
+
+    def test_blanks(self) -> None:
+        service = WordService(scrab.Dawg.from_words(words), show_blanks=True)
+        self.assertEqual(service.answer("ta?"), "aCt Cat at ta")
+
+    def test_blank_line(self) -> None:
+        self.assertEqual(self.service.answer(""), "")
+
+    def test_find_all_words(self) -> None:
+        dawg = scrab.load_dawg()
+        service = WordService(dawg)
+        for tiles in ["words", "retain?", "qi"]:
+            self.assertEqual(service.answer(tiles).split(), scrab.find_all_words(tiles, dawg))
+        dawg.close()
+
+    def test_lines(self) -> None:
+        out = io.StringIO()
+        count = self.service.serve_lines(io.StringIO("tac\nstca ^s\n\nta\n"), out)
+        self.assertEqual(count, 4)
+        self.assertEqual(out.getvalue(), "act cat at ta\nscat\n\nat ta\n")
+
+    def test_bad_lines(self) -> None:
+        out = io.StringIO()
+        self.service.serve_lines(io.StringIO("tac a b\nt4c\ntac\n"), out)
+        lines = out.getvalue().split("\n")
+        self.assertTrue(lines[0].startswith("Error: "))
+        self.assertTrue(lines[1].startswith("Error: Tiles can only be"))
+        self.assertEqual(lines[2], "act cat at ta")
+
+    def test_bad_pattern(self) -> None:
+        out = io.StringIO()
+        count = self.service.serve_lines(io.StringIO("tac\ntac a(\ntac\n"), out)
+        self.assertEqual(count, 3)
+        lines = out.getvalue().split("\n")
+        self.assertEqual(lines[0], "act cat at ta")
+        self.assertTrue(lines[1].startswith("Error: "))
+        self.assertEqual(lines[2], "act cat at ta")
+
+    def test_throughput(self) -> None:
+        self.service.serve_lines(io.StringIO("tac\n" * 50), io.StringIO())
+        self.assertEqual(self.service.num_queries, 50)
+        self.assertGreater(self.service.elapsed, 0)
+        self.assertGreater(self.service.queries_per_second, 0)
+
+    @unittest.skipIf(not hasattr(socket, "AF_UNIX"), "Unix sockets are not supported.")
+    def test_socket(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "words.sock")
+            with self.service.make_server(path) as server:
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+                try:
+                    for _ in range(2):
+                        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                            client.connect(path)
+                            client.sendall(b"tac\nstca ^s\n")
+                            client.shutdown(socket.SHUT_WR)
+                            with client.makefile("rb") as file:
+                                self.assertEqual(file.read(), b"act cat at ta\nscat\n")
+                finally:
+                    server.shutdown()
+                    thread.join()
+            self.assertEqual(self.service.num_queries, 4)
+
+    @unittest.skipIf(not hasattr(socket, "AF_UNIX"), "Unix sockets are not supported.")
+    def test_not_socket(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "words.txt")
+            with open(path, "w") as file:
+                file.write("keep me")
+            with self.assertRaises(FileExistsError):
+                self.service.make_server(path)
+            self.assertTrue(os.path.isfile(path))
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
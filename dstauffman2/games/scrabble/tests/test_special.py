@@ -1,10 +1,12 @@
 r"""
-Test file for the `scrabble.utils` module of the dstauffman2 code.  It is intented to contain test
+Test file for the `scrabble.special` module of the dstauffman2 code.  It is intented to contain test
 cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
 
 Notes
 -----
 #.  Written by David C. Stauffer in March 2017.
+#.  Updated by David C. Stauffer in October 2026 to check the word store searches against the
+    original filters.
 
 """
 
@@ -13,6 +15,85 @@
 
 import dstauffman2.games.scrabble as scrab
 
+# %% Support
+words = scrab.get_raw_dictionary()
+
+
+# %% find_all
+class Test_find_all(unittest.TestCase):
+    r"""
+    Tests the find_all function with the following cases:
+        nominal
+        default words
+    """
+
+    def test_nominal(self) -> None:
+        out = scrab.find_all({"cat", "act", "at", "tacts"}, func=lambda x: "t" in x[1:])
+        self.assertEqual(out, ["tacts", "act", "cat", "at"])
+
+    def test_default(self) -> None:
+        self.assertEqual(scrab.find_all(func=lambda x: len(x) == 2), scrab.find_all(words, func=lambda x: len(x) == 2))
+
+
+# %% special searches
+class Test_special(unittest.TestCase):
+    r"""
+    Tests the special search functions with the following cases:
+        matches filtering every word
+        given words
+        given words are only built once
+        bad words
+        given word store
+    """
+
+    def test_filters(self) -> None:
+        max_len = scrab.MAX_LEN
+        checks = {
+            scrab.find_all_two_letter_words: lambda x: len(x) == 2,
+            scrab.find_all_three_letter_words: lambda x: len(x) == 3,
+            scrab.find_all_four_letter_words: lambda x: len(x) == 4,
+            scrab.find_all_consonant_words: lambda x: all(i in scrab.CONSONANTS for i in x),
+            scrab.find_all_one_vowel_words: lambda x: sum(i in scrab.VOWELS for i in x) == 1,
+            scrab.find_all_one_consonant_words: lambda x: sum(i in scrab.CONSONANTS for i in x) == 1,
+            scrab.find_all_vowel_words: lambda x: all(i in scrab.VOWELS for i in x),
+            scrab.find_all_q_without_u_words: lambda x: "q" in x and "u" not in x,
+            scrab.find_starting_with_de: lambda x: x.startswith("de") and len(x) <= max_len,
+            scrab.find_starting_with_re: lambda x: x.startswith("re") and len(x) <= max_len,
+            scrab.find_starting_with_un: lambda x: x.startswith("un") and len(x) <= max_len,
+            scrab.find_starting_with_x: lambda x: x.startswith("x") and len(x) <= max_len,
+            scrab.find_ending_with_est: lambda x: x.endswith("est") and len(x) <= max_len,
+            scrab.find_ending_with_iest: lambda x: x.endswith("iest") and len(x) <= max_len,
+            scrab.find_ending_with_ing: lambda x: x.endswith("ing") and len(x) <= max_len,
+            scrab.find_ending_with_j: lambda x: x.endswith("j") and len(x) <= max_len,
+            scrab.find_ending_with_ness: lambda x: x.endswith("ness") and len(x) <= max_len,
+            scrab.find_ending_with_q: lambda x: x.endswith("q") and len(x) <= max_len,
+            scrab.find_ending_with_ted: lambda x: x.endswith("ted") and len(x) <= max_len,
+            scrab.find_ending_with_u: lambda x: x.endswith("u") and len(x) <= max_len,
+            scrab.find_ending_with_v: lambda x: x.endswith("v") and len(x) <= max_len,
+            scrab.find_ending_with_x: lambda x: x.endswith("x") and len(x) <= max_len,
+            scrab.find_ending_with_z: lambda x: x.endswith("z") and len(x) <= max_len,
+        }
+        for func, check in checks.items():
+            self.assertEqual(func(), scrab.find_all(words, func=check), func.__name__)
+
+    def test_given_words(self) -> None:
+        these_words = {"rerun", "redo", "do", "undo", "re"}
+        self.assertEqual(scrab.find_starting_with_re(these_words), ["rerun", "redo", "re"])
+        self.assertEqual(scrab.find_starting_with_re(these_words, max_len=4), ["redo", "re"])
+
+    def test_given_words_cached(self) -> None:
+        these_words = {"rerun", "redo", "do", "undo", "re"}
+        self.assertIs(scrab.special._get_store(these_words), scrab.special._get_store(set(these_words)))
+
+    def test_bad_words(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.find_all_one_consonant_words(words={"ab", "Ab", "a-b"})
+
+    def test_given_store(self) -> None:
+        store = scrab.WordStore(["xu", "ax", "xi", "box"])
+        self.assertEqual(scrab.find_ending_with_x(store), ["box", "ax"])
+
+
 # %% Unit test execution
 if __name__ == "__main__":
     unittest.main(exit=False)
@@ -17,13 +17,18 @@
 
 # %% Support
 words = scrab.create_dict(scrab.get_dict_path())
+dawg = scrab.Dawg.from_words(scrab.get_raw_dictionary())
 
 
 # %% find_all_words
 class Test_find_all_words(unittest.TestCase):
     r"""
     Tests the find_all_words function with the following cases:
-        TBD
+        nominal
+        pattern
+        one and two blanks, with the anagram dictionary and the DAWG
+        showing the blanks
+        blanks with a pattern
 
     Notes
     -----
@@ -60,6 +65,8 @@ def test_one_blank(self) -> None:
             "ax", "ay", "ba", "be", "bi", "bo", "by", "da", "fa", "ha", "ka", "la", "ma", "na", \
             "pa", "ta", "ya", "za"]
         np.testing.assert_array_equal(out, expected)
+        out = scrab.find_all_words(tiles, dawg)
+        np.testing.assert_array_equal(out, expected)
 
     def test_two_blanks(self) -> None:
         tiles = ["x", "z", "z", "?", "?"]
@@ -79,6 +86,173 @@ def test_two_blanks(self) -> None:
             "re", "sh", "si", "so", "ta", "ti", "to", "uh", "um", "un", "up", "us", "ut", "we",
             "wo", "xi", "xu", "ya", "ye", "yo", "za"]
         np.testing.assert_array_equal(out, expected)
+        out = scrab.find_all_words(tiles, dawg)
+        np.testing.assert_array_equal(out, expected)
+
+    def test_show_blanks(self) -> None:
+        tiles = ["a", "b", "c", "?"]
+        out = scrab.find_all_words(tiles, self.words, show_blanks=True)
+        self.assertEqual(out[0:6], ["bacH", "bacK", "cabS", "caRb", "cRab", "Scab"])
+        self.assertIn("abA", out)
+        self.assertIn("ab", out)
+        self.assertIn("Za", out)
+        np.testing.assert_array_equal(scrab.find_all_words(tiles, dawg, show_blanks=True), out)
+        self.assertEqual([word.lower() for word in out], scrab.find_all_words(tiles, self.words))
+
+    def test_blank_in_pattern(self) -> None:
+        out = scrab.find_all_words(["d", "o", "?"], dawg, pattern="^o.?$", show_blanks=True)
+        self.assertEqual(out[0:3], ["od", "oE", "oF"])
+        self.assertNotIn("oD", out)
+        self.assertEqual(out, scrab.find_all_words(["d", "o", "?"], self.words, pattern="^o.?$", show_blanks=True))
+
+
+# %% validate_move
+class Test_validate_move(unittest.TestCase):
+    r"""
+    Tests the validate_move function with the following cases:
+        nominal
+        first move
+        off the board
+        bad direction
+        bad letters
+        doesn't match the board
+        no new tiles
+        part of a longer word
+        not connected
+        invalid word
+        invalid cross word
+        blanks
+    """
+
+    def setUp(self) -> None:
+        self.board  = ".....\n.....\n..s..\n.....\n....."
+        self.played = "     \n     \n cat \n     \n     "
+        self.empty  = "     \n     \n     \n     \n     "
+        self.words  = {"cat", "cats", "at", "ta", "bat", "tab", "tabs", "scat", "ab"}
+
+    def test_nominal(self) -> None:
+        self.assertTrue(scrab.validate_move(self.board, self.played, scrab.Move("cats", 2, 1, 0), words=self.words))
+        self.assertTrue(scrab.validate_move(self.board, self.played, scrab.Move("tab", 2, 3, 1), words=self.words))
+
+    def test_first_move(self) -> None:
+        self.assertTrue(scrab.validate_move(self.board, self.empty, scrab.Move("cat", 2, 1, 0), words=self.words))
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.empty, scrab.Move("cat", 1, 1, 0), words=self.words)
+
+    def test_off_board(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("tabs", 2, 3, 1))
+
+    def test_bad_dir(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("cats", 2, 1, 2))
+
+    def test_bad_letters(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("ca?s", 2, 1, 0))
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("", 2, 1, 0))
+
+    def test_mismatch(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("cuts", 2, 1, 0))
+
+    def test_no_new_tiles(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("cat", 2, 1, 0))
+
+    def test_longer_word(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("at", 2, 2, 0))
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("sc", 2, 0, 0))
+
+    def test_not_connected(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("ab", 4, 0, 0), words=self.words)
+
+    def test_invalid_word(self) -> None:
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("catz", 2, 1, 0), words=self.words)
+
+    def test_invalid_cross_word(self) -> None:
+        # "ab" is a word, but it also makes "ca" and "ab" downwards, where "ca" isn't
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, self.played, scrab.Move("ab", 3, 1, 0), words=self.words)
+
+    def test_blanks(self) -> None:
+        self.assertTrue(scrab.validate_move(self.board, self.played, scrab.Move("catS", 2, 1, 0), words=self.words))
+        played = "     \n     \n Cat \n     \n     "
+        self.assertTrue(scrab.validate_move(self.board, played, scrab.Move("Cats", 2, 1, 0), words=self.words))
+        with self.assertRaises(ValueError):
+            scrab.validate_move(self.board, played, scrab.Move("cats", 2, 1, 0), words=self.words)
+
+
+# %% score_move
+class Test_score_move(unittest.TestCase):
+    r"""
+    Tests the score_move function with the following cases:
+        nominal
+        letter premiums
+        word premiums
+        premiums already used
+        cross words
+        blanks
+        bingo
+    """
+
+    def setUp(self) -> None:
+        self.board  = ".....\n...t.\nd.s.D\n.....\n..T.."
+        self.played = "     \n     \n cat \n     \n     "
+
+    def test_nominal(self) -> None:
+        self.assertEqual(scrab.score_move(self.board, self.played, scrab.Move("ab", 2, 2, 1)), 5)
+
+    def test_letter_premium(self) -> None:
+        self.assertEqual(scrab.score_move(self.board, self.played, scrab.Move("scat", 2, 0, 0)), 8)
+
+    def test_word_premium(self) -> None:
+        self.assertEqual(scrab.score_move(self.board, self.played, scrab.Move("cats", 2, 1, 0)), 14)
+        self.assertEqual(scrab.score_move(self.board, self.played, scrab.Move("aba", 2, 2, 1)), 18)
+
+    def test_premium_used(self) -> None:
+        played = "     \n     \n cats\n     \n     "
+        self.assertEqual(scrab.score_move(self.board, played, scrab.Move("as", 1, 4, 1)), 2)
+
+    def test_cross_words(self) -> None:
+        self.assertEqual(scrab.score_move(self.board, self.played, scrab.Move("at", 1, 3, 1)), 4)
+        # "ta" across for 1 + 3, plus "ta" down for 1 + 1 and "at" down for 3 + 1
+        self.assertEqual(scrab.score_move(self.board, self.played, scrab.Move("ta", 1, 2, 0)), 10)
+
+    def test_blanks(self) -> None:
+        self.assertEqual(scrab.score_move(self.board, self.played, scrab.Move("catS", 2, 1, 0)), 12)
+        played = "     \n     \n Cat \n     \n     "
+        self.assertEqual(scrab.score_move(self.board, played, scrab.Move("Cats", 2, 1, 0)), 6)
+
+    def test_bingo(self) -> None:
+        board  = "." * 9
+        played = " " * 9
+        self.assertEqual(scrab.score_move(board, played, scrab.Move("ratines", 0, 1, 0)), 8 + scrab.BINGO)
+        self.assertEqual(scrab.score_move(board, played, scrab.Move("ratines", 0, 1, 0), bingo=50), 58)
+
+
+# %% get_board_must_play
+class Test_get_board_must_play(unittest.TestCase):
+    r"""
+    Tests the get_board_must_play function with the following cases:
+        empty board
+        not square
+    """
+
+    def test_empty(self) -> None:
+        out = scrab.get_board_must_play("...\n.s.", 2, 3, "   \n   ")
+        self.assertEqual(out, {5})
+
+    def test_not_square(self) -> None:
+        board  = "....\n....\n.s.."
+        played = "    \n    \n   a"
+        out = scrab.get_board_must_play(board, 3, 4, played)
+        self.assertEqual(out, {8, 12})
 
 
 # %% Unit test execution
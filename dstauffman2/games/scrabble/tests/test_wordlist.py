@@ -0,0 +1,172 @@
+r"""
+Test file for the `scrabble.wordlist` module of the dstauffman2 code.  It is intented to contain
+test cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import os
+import tempfile
+import unittest
+
+import dstauffman2.games.scrabble as scrab
+
+
+# %% WordList
+class Test_WordList(unittest.TestCase):
+    r"""
+    Tests the WordList class with the following cases:
+        sorted and unique
+        indexing
+        contains
+        iteration and sets
+        from a file
+        save and load
+        bad file
+    """
+
+    def setUp(self) -> None:
+        self.words = scrab.WordList.from_words(["tact", "cat", "at", "act", "cat", "cats"])
+
+    def test_sorted(self) -> None:
+        self.assertEqual(len(self.words), 5)
+        self.assertEqual(self.words.to_list(), ["act", "at", "cat", "cats", "tact"])
+
+    def test_indexing(self) -> None:
+        self.assertEqual(self.words[0], "act")
+        self.assertEqual(self.words[-1], "tact")
+        with self.assertRaises(IndexError):
+            self.words[5]
+
+    def test_contains(self) -> None:
+        for word in ["act", "at", "cat", "cats", "tact"]:
+            self.assertIn(word, self.words)
+        for word in ["", "a", "ca", "catss", "zzz"]:
+            self.assertNotIn(word, self.words)
+
+    def test_iteration(self) -> None:
+        self.assertEqual(list(self.words), self.words.to_list())
+        self.assertEqual(self.words.to_set(), {"act", "at", "cat", "cats", "tact"})
+
+    def test_from_file(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "words.txt")
+            with open(filename, "wt") as file:
+                file.write("a\nat\ncat\ncats\nstack\n")
+            words = scrab.WordList.from_file(filename, min_len=2, max_len=4)
+        self.assertEqual(words.to_list(), ["at", "cat", "cats"])
+        self.assertGreater(words.source_stat[1], 0)
+
+    def test_save_and_load(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "test.words")
+            self.words.source_stat = (123, 456)
+            self.words.save(filename)
+            words = scrab.WordList.load(filename)
+            self.assertEqual(words.to_list(), self.words.to_list())
+            self.assertEqual(words.source_stat, (123, 456))
+            self.assertIn("cats", words)
+            words.close()
+            self.assertEqual(len(words), 0)
+
+    def test_bad_file(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "bad.words")
+            with open(filename, "wb") as file:
+                file.write(b"NOPE" + bytes(40))
+            with self.assertRaises(ValueError):
+                scrab.WordList.load(filename)
+
+
+# %% get_cache_path
+class Test_get_cache_path(unittest.TestCase):
+    r"""
+    Tests the get_cache_path function with the following cases:
+        word lengths
+        different folders
+    """
+
+    def test_lengths(self) -> None:
+        path1 = scrab.get_cache_path("enable.txt", folder="cache")
+        path2 = scrab.get_cache_path("enable.txt", min_len=3, max_len=7, folder="cache")
+        self.assertNotEqual(path1, path2)
+        self.assertTrue(os.path.basename(path2).startswith("enable_3_7_"))
+
+    def test_folders(self) -> None:
+        path1 = scrab.get_cache_path(os.path.join("one", "enable.txt"), folder="cache")
+        path2 = scrab.get_cache_path(os.path.join("two", "enable.txt"), folder="cache")
+        self.assertNotEqual(path1, path2)
+
+
+# %% load_word_list
+class Test_load_word_list(unittest.TestCase):
+    r"""
+    Tests the load_word_list function with the following cases:
+        builds and caches
+        reuses the open list
+        reopens a closed list
+        rebuilds when the word list changes
+        matches get_raw_dictionary
+    """
+
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.folder.name, "words.txt")
+        with open(self.source, "wt") as file:
+            file.write("at\ncat\ncats\n")
+
+    def tearDown(self) -> None:
+        for words in list(scrab.wordlist._OPEN_LISTS.values()):
+            words.close()
+        scrab.wordlist._OPEN_LISTS.clear()
+        self.folder.cleanup()
+
+    def test_cached(self) -> None:
+        words = scrab.load_word_list(self.source, folder=self.folder.name)
+        cache = scrab.get_cache_path(self.source, folder=self.folder.name)
+        self.assertTrue(os.path.isfile(cache))
+        self.assertEqual(words.to_list(), ["at", "cat", "cats"])
+        scrab.wordlist._OPEN_LISTS.clear()
+        mtime = os.path.getmtime(cache)
+        words2 = scrab.load_word_list(self.source, folder=self.folder.name)
+        self.assertEqual(os.path.getmtime(cache), mtime)
+        self.assertEqual(words2.to_list(), words.to_list())
+        words.close()
+
+    def test_reused(self) -> None:
+        words = scrab.load_word_list(self.source, folder=self.folder.name)
+        self.assertIs(scrab.load_word_list(self.source, folder=self.folder.name), words)
+        self.assertIsNot(scrab.load_word_list(self.source, min_len=3, folder=self.folder.name), words)
+
+    def test_closed(self) -> None:
+        words = scrab.load_word_list(self.source, folder=self.folder.name)
+        words.close()
+        self.assertNotIn(words, scrab.wordlist._OPEN_LISTS.values())
+        new_words = scrab.load_word_list(self.source, folder=self.folder.name)
+        self.assertIsNot(new_words, words)
+        self.assertEqual(new_words.to_list(), ["at", "cat", "cats"])
+
+    def test_rebuild(self) -> None:
+        words = scrab.load_word_list(self.source, folder=self.folder.name)
+        stat = os.stat(self.source)
+        with open(self.source, "wt") as file:
+            file.write("at\ncat\ncats\ndog\n")
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        new_words = scrab.load_word_list(self.source, folder=self.folder.name)
+        self.assertIn("dog", new_words)
+        self.assertNotIn("dog", words)
+        words.close()
+
+    def test_raw_dictionary(self) -> None:
+        with open(scrab.get_dict_path(), "rt") as file:
+            expected = {word for word in (line.rstrip("\n") for line in file) if 2 <= len(word) <= 20}
+        self.assertEqual(scrab.get_raw_dictionary(), expected)
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
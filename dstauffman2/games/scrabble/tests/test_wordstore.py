@@ -0,0 +1,144 @@
+r"""
+Test file for the `scrabble.wordstore` module of the dstauffman2 code.  It is intented to contain
+test cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import re
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.scrabble as scrab
+
+# %% Support
+words = ["act", "acts", "at", "cat", "cats", "scat", "tact", "tacts", "ta", "aa", "queen", "qat", "xu"]
+
+
+# %% Functions - _expected
+def _expected(func):
+    r"""Filters the words one at a time, in the order of the word store, for use in testing."""
+    return sorted((word for word in words if func(word)), key=lambda item: (-len(item), item))
+
+
+# %% WordStore
+class Test_WordStore(unittest.TestCase):
+    r"""
+    Tests the WordStore class with the following cases:
+        columns
+        all words
+        prefixes
+        suffixes
+        lengths
+        contains
+        letter sets
+        simple patterns
+        wildcards past the end of short words
+        other patterns
+        combined masks
+        from a word list
+        empty
+        bad letters
+    """
+
+    def setUp(self) -> None:
+        self.store = scrab.WordStore(words)
+
+    def test_columns(self) -> None:
+        ix = self.store.get_words().index("queen")
+        self.assertEqual(bytes(self.store.letters[ix, :5]), b"queen")
+        self.assertTrue(np.all(self.store.letters[ix, 5:] == 0))
+        self.assertEqual(self.store.lengths[ix], 5)
+        self.assertEqual(self.store.counts[ix, 4], 2)
+        self.assertEqual(self.store.counts[ix].sum(), 5)
+        self.assertEqual(self.store.vowels[ix], 3)
+
+    def test_all_words(self) -> None:
+        self.assertEqual(len(self.store), len(words))
+        self.assertEqual(self.store.get_words(), sorted(words))
+
+    def test_prefix(self) -> None:
+        for prefix in ["a", "ac", "ta", "tacts", "tactss", "z", ""]:
+            self.assertEqual(self.store.get_words(self.store.prefix_mask(prefix)), _expected(lambda x: x.startswith(prefix)))
+
+    def test_suffix(self) -> None:
+        for suffix in ["t", "ts", "at", "cat", "scat", "u", "zz", ""]:
+            self.assertEqual(self.store.get_words(self.store.suffix_mask(suffix)), _expected(lambda x: x.endswith(suffix)))
+
+    def test_length(self) -> None:
+        self.assertEqual(self.store.get_words(self.store.length_mask(2, 2)), ["aa", "at", "ta", "xu"])
+        self.assertEqual(self.store.get_words(self.store.length_mask(5)), ["queen", "tacts"])
+
+    def test_contains(self) -> None:
+        self.assertEqual(self.store.get_words(self.store.contains_mask("tt")), ["tacts", "tact"])
+        self.assertEqual(self.store.get_words(self.store.contains_mask("q")), ["queen", "qat"])
+
+    def test_letter_set(self) -> None:
+        self.assertEqual(self.store.get_words(self.store.letter_set_mask("act")), _expected(lambda x: set(x) <= set("act")))
+        self.assertEqual(self.store.get_words(self.store.letter_set_mask(scrab.VOWELS)), ["aa"])
+
+    def test_simple_patterns(self) -> None:
+        for pattern in ["at", "^.a", "c.t$", "^.a.$", "^cat$", "a", "^", "$", "", "^$", "ee."]:
+            self.assertEqual(self.store.get_words(self.store.pattern_mask(pattern)), \
+                _expected(lambda x: re.search(pattern, x) is not None), pattern)
+
+    def test_padding(self) -> None:
+        these_words = ["ca", "xca", "cab", "ab", "a"]
+        store = scrab.WordStore(these_words)
+        for pattern in ["a.", "ca.", "ab.", ".a.", "..", "^a.", "b.$"]:
+            expected = sorted((word for word in these_words if re.search(pattern, word)), key=lambda item: (-len(item), item))
+            self.assertEqual(store.get_words(store.pattern_mask(pattern)), expected, pattern)
+
+    def test_other_patterns(self) -> None:
+        for pattern in ["q[^u]", "^(ac|ta)", "t+s$"]:
+            self.assertEqual(self.store.get_words(self.store.pattern_mask(pattern)), \
+                _expected(lambda x: re.search(pattern, x) is not None), pattern)
+
+    def test_combined(self) -> None:
+        mask = self.store.prefix_mask("ca") | (self.store.suffix_mask("ts") & self.store.length_mask(max_len=4))
+        self.assertEqual(self.store.get_words(mask), ["acts", "cats", "cat"])
+
+    def test_word_list(self) -> None:
+        store = scrab.WordStore(scrab.WordList.from_words(words))
+        self.assertEqual(store.get_words(), self.store.get_words())
+        np.testing.assert_array_equal(store.counts, self.store.counts)
+
+    def test_empty(self) -> None:
+        store = scrab.WordStore([])
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.get_words(store.prefix_mask("a") | store.suffix_mask("a")), [])
+        self.assertEqual(store.get_words(store.pattern_mask("a.")), [])
+
+    def test_bad_letters(self) -> None:
+        for bad in ["Ab", "a-b", "na\u00efve"]:
+            with self.assertRaises(ValueError) as context:
+                scrab.WordStore(["ab", bad])
+            self.assertIn(bad, str(context.exception))
+
+
+# %% load_word_store
+class Test_load_word_store(unittest.TestCase):
+    r"""
+    Tests the load_word_store function with the following cases:
+        reused
+        matches the word list
+    """
+
+    def test_reused(self) -> None:
+        store = scrab.load_word_store()
+        self.assertIs(scrab.load_word_store(), store)
+        self.assertIsNot(scrab.load_word_store(max_len=10), store)
+
+    def test_word_list(self) -> None:
+        store = scrab.load_word_store()
+        self.assertEqual(store.get_words(), scrab.load_word_list().to_list())
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
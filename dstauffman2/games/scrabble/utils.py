@@ -8,7 +8,7 @@
 """
 
 # %% Imports
-from collections import defaultdict
+from collections import Counter, defaultdict
 import doctest
 import itertools
 import os
@@ -16,7 +16,17 @@
 import unittest
 
 from dstauffman2 import get_data_dir as dcs_data_dir, get_root_dir as dcs_root_dir
-from dstauffman2.games.scrabble.constants import BOARD_SYMBOLS, DICT, LETTERS
+from dstauffman2.games.scrabble.constants import (
+    BINGO,
+    BOARD_SYMBOLS,
+    DICT,
+    LETTER_PREMIUMS,
+    LETTERS,
+    RACK_SIZE,
+    SCORES,
+    WORD_PREMIUMS,
+)
+from dstauffman2.games.scrabble.wordlist import load_word_list
 
 
 # %% get_root_dir
@@ -96,6 +106,8 @@ def get_raw_dictionary(filename=None, min_len=2, max_len=20):
     #.  This function returns the list of words as a set, which can sometimes be convenient,
         although the anagram solver instead uses the form where each key is a sorted version of the
         letters that form those words.
+    #.  Updated by David C. Stauffer in October 2026 to read the words from the compiled cache from
+        `load_word_list` instead of parsing the text file every time.
 
     Examples
     --------
@@ -120,13 +132,7 @@ def get_raw_dictionary(filename=None, min_len=2, max_len=20):
     """
     if filename is None:
         filename = get_dict_path()
-    words = set()
-    with open(filename, "rt") as file:
-        for line in file:
-            word = line.rstrip("\n")
-            if min_len <= len(word) <= max_len:
-                words.add(word)
-    return words
+    return load_word_list(filename, min_len=min_len, max_len=max_len).to_set()
 
 
 # %% create_dictionary_from_text
@@ -226,7 +232,7 @@ def count_num_words(words):
 
 
 # %% find_all_words
-def find_all_words(tiles, words, pattern=""):
+def find_all_words(tiles, words, pattern="", show_blanks=False):
     r"""
     Finds all the anagrams of the given tiles.
 
@@ -234,16 +240,25 @@ def find_all_words(tiles, words, pattern=""):
     ----------
     tiles : str or list of chars
         Letters to anagram
-    words : dict
-        Dictionary of words by sorted, anagrammed keys
+    words : dict or class Dawg
+        Dictionary of words by sorted, anagrammed keys, or the DAWG index from `load_dawg`
     pattern : str, optional
         Regular expression pattern to apply to matching
+    show_blanks : bool, optional
+        Whether to show the letters that the blanks stand for in uppercase
 
     Returns
     -------
     out : list of str
         List of valid words based on the given tiles, words, and pattern
 
+    Notes
+    -----
+    #.  Updated by David C. Stauffer in October 2026 to also accept a DAWG index, which only walks
+        the prefixes of real words instead of looking up every subset of the tiles.  The DAWG also
+        handles blanks as wildcards within the same walk, instead of searching again for every
+        possible letter that the blanks could be.
+
     Examples
     --------
     >>> from dstauffman2.games.scrabble import create_dict, find_all_words, get_dict_path
@@ -265,10 +280,18 @@ def find_all_words(tiles, words, pattern=""):
     >>> print(out2[10:])
     ['ward', 'wars', 'ado', 'ads', 'ars']
 
+    >>> out3 = find_all_words(tiles='qi?', words=words, pattern='^q', show_blanks=True)
+    >>> print(out3)
+    ['qiS', 'qi']
+
     """
 
     def wrapped(tiles, words):
         r"""Wrapped solver function."""
+        # search the DAWG directly when given one
+        if hasattr(words, "anagrams"):
+            return set(words.anagrams(tiles))
+
         # find all the possible keys
         keys = []
         for r in range(2, len(tiles) + 1):
@@ -283,8 +306,20 @@ def wrapped(tiles, words):
                 soln |= set(words[this_key])
         return soln
 
+    def mark_blanks(word, tiles):
+        r"""Shows the letters in the word that had to come from blanks in uppercase."""
+        left = Counter(tiles)
+        marked = []
+        for letter in word:
+            if left[letter]:
+                left[letter] -= 1
+                marked.append(letter)
+            else:
+                marked.append(letter.upper())
+        return "".join(marked)
+
     # check for any extra letters in the pattern
-    extra_letters = [letter for letter in pattern if letter in LETTERS]
+    extra_letters = [letter for letter in pattern if letter in LETTERS and letter != "?"]
 
     # create a working list of all the tiles
     full_tiles = [x for x in tiles if x != "?"] + extra_letters
@@ -296,22 +331,26 @@ def wrapped(tiles, words):
     num_blanks = tiles.count("?")
     if num_blanks == 0:
         soln = wrapped(full_tiles, words)
+    elif hasattr(words, "anagrams"):
+        soln = set(words.anagrams(full_tiles + ["?"] * num_blanks, show_blanks=show_blanks))
     else:
-        extra_combs = [list(x) for x in itertools.product(LETTERS, repeat=num_blanks)]
+        extra_combs = [list(x) for x in itertools.product(sorted(LETTERS - {"?"}), repeat=num_blanks)]
         soln = set()
         for this_comb in extra_combs:
             this_tiles = sorted(full_tiles + this_comb)
             soln |= wrapped(this_tiles, words)
+        if show_blanks:
+            soln = {mark_blanks(word, full_tiles) for word in soln}
 
     # limit based on the given pattern
     if pattern:
         r1 = re.compile(pattern)
-        out = [word for word in soln if r1.search(word)]
+        out = [word for word in soln if r1.search(word.lower())]
     else:
         out = list(soln)
 
     # sort the output words
-    out.sort(key=lambda item: (-len(item), item))
+    out.sort(key=lambda item: (-len(item), item.lower()))
     return out
 
 
@@ -333,18 +372,177 @@ def validate_board(board):
     return (num_rows, num_cols)
 
 
+# %% Functions - _move_squares
+def _move_squares(rows, move):
+    r"""Finds the (row, column) of each letter in the move, checking that they are all on the board."""
+    if move.dir not in {0, 1}:
+        raise ValueError(f"Bad Move direction: {move.dir}.")
+    (dr, dc) = (0, 1) if move.dir == 0 else (1, 0)
+    squares = [(move.row + i * dr, move.col + i * dc) for i in range(len(move.word))]
+    if any(not (0 <= r < len(rows) and 0 <= c < len(rows[0])) for (r, c) in squares):
+        raise ValueError(f'Move "{move.word}" does not fit on the board.')
+    return squares
+
+
+# %% Functions - _cross_word
+def _cross_word(rows, row, col, dir_):
+    r"""Finds the tiles already played before and after the given square, across the direction of the move."""
+    (dr, dc) = (1, 0) if dir_ == 0 else (0, 1)
+    before = []
+    (r, c) = (row - dr, col - dc)
+    while r >= 0 and c >= 0 and rows[r][c] != " ":
+        before.append(rows[r][c])
+        (r, c) = (r - dr, c - dc)
+    after = []
+    (r, c) = (row + dr, col + dc)
+    while r < len(rows) and c < len(rows[0]) and rows[r][c] != " ":
+        after.append(rows[r][c])
+        (r, c) = (r + dr, c + dc)
+    return ("".join(reversed(before)), "".join(after))
+
+
 # %% Functions - validate_move
-def validate_move(board, played, move):
-    r"""Validates whether the desired move is legal."""
-    return True  # TODO: write this
+def validate_move(board, played, move, words=None):
+    r"""
+    Validates whether the desired move is legal.
+
+    Parameters
+    ----------
+    board : str
+        Board layout
+    played : str
+        Tiles already played on the board, with spaces for empty squares
+    move : class Move
+        Move to check, where the word includes any letters already on the board
+    words : set or class Dawg, optional
+        Valid words, if not given then the words themselves are not checked
+
+    Returns
+    -------
+    bool
+        True if the move is legal, otherwise a ValueError is raised
+
+    Notes
+    -----
+    #.  Uppercase letters are blanks, both in the move and in the played tiles.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Move, validate_move
+    >>> board  = '.....\n.....\n..s..\n.....\n.....'
+    >>> played = '     \n     \n cat \n     \n     '
+    >>> print(validate_move(board, played, Move("cats", 2, 1, 0), words={"cats"}))
+    True
+
+    """
+    # check the board and the letters in the move
+    validate_board(board)
+    if not move.word or not all(letter.lower() in LETTERS - {"?"} for letter in move.word):
+        raise ValueError(f'Move "{move.word}" has invalid letters.')
+    rows = played.split("\n")
+    squares = _move_squares(rows, move)
+    # check that the word matches the tiles already on the board, and that it places new ones
+    new_squares = []
+    for (letter, (r, c)) in zip(move.word, squares):
+        if rows[r][c] == " ":
+            new_squares.append((r, c, letter))
+        elif rows[r][c] != letter:
+            raise ValueError(f'Move "{move.word}" does not match the tiles on the board.')
+    if not new_squares:
+        raise ValueError(f'Move "{move.word}" does not place any tiles.')
+    # check that the word isn't part of a longer one
+    (dr, dc) = (0, 1) if move.dir == 0 else (1, 0)
+    (r, c) = (squares[0][0] - dr, squares[0][1] - dc)
+    if r >= 0 and c >= 0 and rows[r][c] != " ":
+        raise ValueError(f'Move "{move.word}" does not include the tiles before it.')
+    (r, c) = (squares[-1][0] + dr, squares[-1][1] + dc)
+    if r < len(rows) and c < len(rows[0]) and rows[r][c] != " ":
+        raise ValueError(f'Move "{move.word}" does not include the tiles after it.')
+    # check that the word connects to the tiles already played, or covers the start for the first move
+    cross_words = []
+    for (r, c, letter) in new_squares:
+        (before, after) = _cross_word(rows, r, c, move.dir)
+        cross_words.append((before + letter + after, bool(before or after)))
+    if all(char in {" ", "\n"} for char in played):
+        layout = board.split("\n")
+        if not any(layout[r][c] == "s" for (r, c) in squares):
+            raise ValueError("The first move must cover the start square.")
+    elif len(new_squares) == len(squares) and not any(connected for (_, connected) in cross_words):
+        raise ValueError(f'Move "{move.word}" does not connect to the tiles already played.')
+    # check the words
+    if words is not None:
+        if move.word.lower() not in words:
+            raise ValueError(f'"{move.word}" is not a valid word.')
+        for (cross, connected) in cross_words:
+            if connected and cross.lower() not in words:
+                raise ValueError(f'"{cross}" is not a valid word.')
+    return True
 
 
 # %% Functions - score_move
-def score_move(board, played, move):
-    r"""Scores a given move based on a board layout and played tiles."""
+def score_move(board, played, move, scores=SCORES, bingo=BINGO):
+    r"""
+    Scores a given move based on a board layout and played tiles.
+
+    Parameters
+    ----------
+    board : str
+        Board layout
+    played : str
+        Tiles already played on the board, with spaces for empty squares
+    move : class Move
+        Move to score, where the word includes any letters already on the board
+    scores : dict, optional
+        Value of each tile
+    bingo : int, optional
+        Bonus for using all the tiles in the rack
+
+    Returns
+    -------
+    score : int
+        Score of the main word, plus all the cross words that the new tiles make
+
+    Notes
+    -----
+    #.  Premium squares only count for the tiles that are placed by this move, and blanks, which
+        are the uppercase letters, are worth zero.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble import Move, score_move
+    >>> board  = '.....\n.....\n..s..\n.....\n..D..'
+    >>> played = '     \n     \n cat \n     \n     '
+    >>> print(score_move(board, played, Move("cats", 2, 1, 0)))
+    7
+
+    >>> print(score_move(board, played, Move("bads", 1, 2, 1)))
+    16
+
+    """
+    layout = board.split("\n")
+    rows   = played.split("\n")
     # initialize output
     score = 0
-    # TODO: write this
+    main = 0
+    mult = 1
+    num_placed = 0
+    for (letter, (r, c)) in zip(move.word, _move_squares(rows, move)):
+        value = 0 if letter.isupper() else scores[letter]
+        if rows[r][c] != " ":
+            main += value
+            continue
+        num_placed += 1
+        value *= LETTER_PREMIUMS.get(layout[r][c], 1)
+        word_mult = WORD_PREMIUMS.get(layout[r][c], 1)
+        main += value
+        mult *= word_mult
+        # add the cross word made by this tile
+        (before, after) = _cross_word(rows, r, c, move.dir)
+        if before or after:
+            score += (sum(0 if tile.isupper() else scores[tile] for tile in before + after) + value) * word_mult
+    score += main * mult
+    if num_placed == RACK_SIZE:
+        score += bingo
     return score
 
 
@@ -415,18 +613,18 @@ def get_board_must_play(board, num_rows, num_cols, played):
     for row in range(num_rows):
         for col in range(num_cols):
             # alias this index
-            ix = col * stride + row
+            ix = row * stride + col
             # check if it's already occupied
             if ix in occupied:
                 continue
             # check to the left, right, above, and below for occupied squares
-            if (row > 0) and (col * stride + row - 1 in occupied):
+            if (col > 0) and (ix - 1 in occupied):
                 out.add(ix)
-            elif (row < num_rows - 1) and (col * stride + row + 1 in occupied):
+            elif (col < num_cols - 1) and (ix + 1 in occupied):
                 out.add(ix)
-            elif (col > 0) and ((col - 1) * stride + row in occupied):
+            elif (row > 0) and (ix - stride in occupied):
                 out.add(ix)
-            elif (col < num_cols - 1) and ((col + 1) * stride + row in occupied):
+            elif (row < num_rows - 1) and (ix + stride in occupied):
                 out.add(ix)
     return out
 
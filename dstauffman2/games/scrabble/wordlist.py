@@ -0,0 +1,248 @@
+r"""
+Word list module file for the "scrabble" game.  It defines the compiled word list cache.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  The text word lists are compiled once into a binary file with the sorted words packed end to
+    end, each followed by a newline, and a table of where each one starts.  The file is then
+    memory-mapped, so loading it is nearly instant, and every process that loads it shares the
+    same pages from the operating system's file cache.
+#.  The cached files are named by the word list, the minimum and maximum word lengths and a hash of
+    the full path to the word list, and they store the size and modification time of the word
+    list that they were built from, so that they are rebuilt whenever it changes.
+
+"""
+
+# %% Imports
+import bisect
+import doctest
+import mmap
+import os
+import struct
+import unittest
+import zlib
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2 import get_data_dir, get_output_dir
+from dstauffman2.games.scrabble.constants import DICT
+
+# %% Constants
+# header of the binary word list files, as the file signature, format version, number of words,
+# modification time and size of the source file, minimum and maximum word lengths and number of bytes
+_FILE_MAGIC   = b"WRDS"
+_FILE_VERSION = 1
+_FILE_HEADER  = struct.Struct("<4sIIqqIIQ")
+
+# word lists that are already open in this process, by the cached file name
+_OPEN_LISTS = {}
+
+
+# %% Classes - WordList
+class WordList(Frozen):
+    r"""
+    Sorted list of words packed into a single block of bytes.
+
+    Parameters
+    ----------
+    data : (N, ) ndarray of uint8
+        Words packed end to end, each followed by a newline
+    offsets : (num_words + 1, ) ndarray of int
+        Index to the start of each word in data, followed by the length of data
+    source_stat : (int, int), optional
+        Modification time in nanoseconds and size of the file the words came from
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.wordlist import WordList
+    >>> words = WordList.from_words(["cat", "act", "at", "cat"])
+    >>> print(len(words), words[0], "cat" in words, "ca" in words)
+    3 act True False
+
+    """
+
+    def __init__(self, data, offsets, source_stat=(0, 0)):
+        self.data        = data
+        self.offsets     = offsets
+        self.source_stat = source_stat
+        self._mmap       = None
+
+    @classmethod
+    def from_words(cls, words):
+        r"""Creates the word list from any iterable of words."""
+        blob = "".join(word + "\n" for word in sorted(set(words))).encode("utf-8")
+        data = np.frombuffer(blob, dtype=np.uint8)
+        ends = np.flatnonzero(data == ord("\n")) + 1
+        offsets = np.concatenate(([0], ends)).astype("<u4")
+        return cls(data, offsets)
+
+    @classmethod
+    def from_file(cls, filename, min_len=2, max_len=20):
+        r"""Reads the word list from a text file with one word per line, keeping the words of the given lengths."""
+        stat = os.stat(filename)
+        with open(filename, "rt") as file:
+            words = [line.rstrip("\n") for line in file]
+        out = cls.from_words(word for word in words if min_len <= len(word) <= max_len)
+        out.source_stat = (stat.st_mtime_ns, stat.st_size)
+        return out
+
+    def save(self, filename, min_len=0, max_len=0):
+        r"""Saves the word list to a binary file, replacing any existing one all at once."""
+        temp = f"{filename}.{os.getpid()}.tmp"
+        with open(temp, "wb") as file:
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, len(self), *self.source_stat, min_len, max_len, \
+                len(self.data)))
+            file.write(np.asarray(self.offsets, dtype="<u4").tobytes())
+            file.write(np.asarray(self.data, dtype=np.uint8).tobytes())
+        os.replace(temp, filename)
+
+    @classmethod
+    def load(cls, filename):
+        r"""Loads the word list from a binary file by memory-mapping it."""
+        with open(filename, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, num_words, mtime, size, _, _, num_bytes) = _FILE_HEADER.unpack_from(data)
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            data.close()
+            raise ValueError(f'File is not a supported word list file: "{filename}"')
+        offsets = np.frombuffer(data, dtype="<u4", count=num_words + 1, offset=_FILE_HEADER.size)
+        words = np.frombuffer(data, dtype=np.uint8, count=num_bytes, offset=_FILE_HEADER.size + 4 * (num_words + 1))
+        out = cls(words, offsets, source_stat=(mtime, size))
+        out._mmap = data
+        return out
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Word list index out of range.")
+        return self.data[self.offsets[index] : self.offsets[index + 1] - 1].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __contains__(self, word):
+        ix = bisect.bisect_left(self, word)
+        return ix < len(self) and self[ix] == word
+
+    def to_list(self):
+        r"""Gets all the words as a sorted list."""
+        return self.data.tobytes().decode("utf-8").split("\n")[:-1]
+
+    def to_set(self):
+        r"""Gets all the words as a set."""
+        return set(self.to_list())
+
+    def close(self):
+        r"""Releases the memory-mapped file, if there is one, and stops load_word_list from reusing this list."""
+        for key in [key for (key, words) in _OPEN_LISTS.items() if words is self]:
+            del _OPEN_LISTS[key]
+        if self._mmap is not None:
+            self.data = np.zeros(0, dtype=np.uint8)
+            self.offsets = np.zeros(1, dtype="<u4")
+            self._mmap.close()
+            self._mmap = None
+
+
+# %% get_cache_path
+def get_cache_path(filename, min_len=2, max_len=20, folder=None):
+    r"""
+    Gets the path to the cached file for the given word list and word lengths.
+
+    Parameters
+    ----------
+    filename : str
+        Full path to the word list
+    min_len : int, optional
+        Minimum length of word to include
+    max_len : int, optional
+        Maximum length of word to include
+    folder : str, optional
+        Folder for the cached files, defaults to the output folder
+
+    Returns
+    -------
+    str
+        Full path to the cached file
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.wordlist import get_cache_path
+    >>> print(os.path.basename(get_cache_path("/data/enable.txt", folder="/cache")))  # doctest: +ELLIPSIS
+    enable_2_20_....words
+
+    """
+    if folder is None:
+        folder = get_output_dir()
+    full_path = os.path.abspath(filename)
+    stem = os.path.splitext(os.path.basename(full_path))[0]
+    key = zlib.crc32(full_path.encode("utf-8"))
+    return os.path.join(folder, f"{stem}_{min_len}_{max_len}_{key:08x}.words")
+
+
+# %% load_word_list
+def load_word_list(filename=None, min_len=2, max_len=20, folder=None):
+    r"""
+    Loads the word list from its compiled cache, building the cache first if needed.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Full path to the word list, defaults to DICT in the data folder
+    min_len : int, optional
+        Minimum length of word to include
+    max_len : int, optional
+        Maximum length of word to include
+    folder : str, optional
+        Folder for the cached files, defaults to the output folder
+
+    Returns
+    -------
+    class WordList
+        Memory-mapped word list
+
+    Notes
+    -----
+    #.  Word lists that are already open in this process are reused, as long as the source file
+        hasn't changed, so they should not be closed by the caller.  If one is closed anyway, then
+        the next call opens it again, instead of returning the closed and empty list.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.wordlist import load_word_list
+    >>> words = load_word_list()
+    >>> print(len(words), "sword" in words)
+    173003 True
+
+    """
+    if filename is None:
+        filename = os.path.join(get_data_dir(), DICT)
+    cache = get_cache_path(filename, min_len=min_len, max_len=max_len, folder=folder)
+    stat = os.stat(filename)
+    source_stat = (stat.st_mtime_ns, stat.st_size)
+    words = _OPEN_LISTS.get(cache)
+    if words is not None and words.source_stat == source_stat:
+        return words
+    if os.path.isfile(cache):
+        words = WordList.load(cache)
+        if words.source_stat != source_stat:
+            words.close()
+            words = None
+    if words is None:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        WordList.from_file(filename, min_len=min_len, max_len=max_len).save(cache, min_len=min_len, max_len=max_len)
+        words = WordList.load(cache)
+    _OPEN_LISTS[cache] = words
+    return words
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.scrabble.tests.test_wordlist", exit=False)
+    doctest.testmod(verbose=False)
@@ -0,0 +1,253 @@
+r"""
+Word store module file for the "scrabble" game.  It defines the columnar word store for pattern queries.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  The words are held as columns instead of one Python string at a time: a two dimensional array
+    with one row per word padded with zeros, the length of each word, and how many of each letter
+    and how many vowels it has.  Each query is then a few whole array operations that give a
+    boolean mask over all the words, and masks can be combined with & and | before any strings are
+    made for the final answer.
+#.  The words are kept in sorted order, so all the words with a given prefix are one contiguous
+    block that is found by a binary search.  Suffixes use a second index of the reversed words,
+    which is only built the first time that a suffix query needs it.
+
+"""
+
+# %% Imports
+import doctest
+import re
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2.games.scrabble.constants import VOWELS
+from dstauffman2.games.scrabble.wordlist import load_word_list, WordList
+
+# %% Constants
+# letters in the order of the letter count columns
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# simple patterns that can be run as column comparisons, as letters and wildcards with optional anchors
+_SIMPLE_PATTERN = re.compile(r"\^?[a-z.]*\$?")
+
+# word stores that are already built in this process, by the word list and word lengths
+_OPEN_STORES = {}
+
+
+# %% Classes - WordStore
+class WordStore(Frozen):
+    r"""
+    Columnar store of words for vectorized pattern queries.
+
+    Parameters
+    ----------
+    words : iterable of str or class WordList
+        Words to store, made of the lowercase letters a-z
+
+    Raises
+    ------
+    ValueError
+        If any of the words have characters other than the lowercase letters a-z
+
+    Attributes
+    ----------
+    letters : (N, M) ndarray of uint8
+        ASCII codes of each word, padded with zeros, in sorted order
+    lengths : (N, ) ndarray of int
+        Length of each word
+    counts : (N, 26) ndarray of uint8
+        Number of each letter in each word
+    vowels : (N, ) ndarray of int
+        Number of vowels in each word
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.wordstore import WordStore
+    >>> store = WordStore(["cat", "cats", "act", "tact", "scat", "at"])
+    >>> print(store.get_words(store.prefix_mask("ca") | store.suffix_mask("act")))
+    ['cats', 'tact', 'act', 'cat']
+
+    """
+
+    def __init__(self, words):
+        if not isinstance(words, WordList):
+            words = WordList.from_words(words)
+        data    = np.asarray(words.data, dtype=np.uint8)
+        offsets = np.asarray(words.offsets, dtype=np.int64)
+        num     = len(offsets) - 1
+        # spread the packed words into rows, dropping the newline after each one
+        lengths = np.diff(offsets) - 1
+        width   = max(int(lengths.max()) if num > 0 else 0, 1)
+        row     = np.repeat(np.arange(num), lengths + 1)
+        col     = np.arange(len(data)) - offsets[:-1][row]
+        keep    = col < lengths[row]
+        letters = np.zeros((num, width), dtype=np.uint8)
+        letters[row[keep], col[keep]] = data[keep]
+        # count each letter in each word
+        codes   = data[keep].astype(np.int64) - ord("a")
+        bad     = (codes < 0) | (codes >= len(_ALPHABET))
+        if np.any(bad):
+            word = bytes(letters[row[keep][np.argmax(bad)]]).rstrip(b"\x00").decode("utf-8", errors="replace")
+            raise ValueError(f'Words can only have the lowercase letters a-z, not "{word}".')
+        counts  = np.bincount(row[keep] * len(_ALPHABET) + codes, minlength=num * len(_ALPHABET))
+        self.letters = letters
+        self.lengths = lengths
+        self.counts  = counts.reshape(num, len(_ALPHABET)).astype(np.uint8)
+        self.vowels  = self.counts[:, _letter_codes(VOWELS)].sum(axis=1)
+        self._prefix_index = None
+        self._suffix_index = None
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def _keys(self, letters):
+        r"""Views each row of letters as one fixed width byte string, for sorting and searching."""
+        return np.ascontiguousarray(letters).view(f"S{letters.shape[1]}").ravel()
+
+    def _block_mask(self, keys, order, text):
+        r"""Finds the block of sorted keys that start with text, and marks those words."""
+        first = np.searchsorted(keys, text.encode("ascii"), side="left")
+        last  = np.searchsorted(keys, text.encode("ascii") + b"\xff", side="left")
+        mask = np.zeros(len(self), dtype=bool)
+        mask[order[first:last] if order is not None else slice(first, last)] = True
+        return mask
+
+    def prefix_mask(self, prefix):
+        r"""Marks the words that start with the given prefix."""
+        if self._prefix_index is None:
+            self._prefix_index = self._keys(self.letters)
+        return self._block_mask(self._prefix_index, None, prefix)
+
+    def suffix_mask(self, suffix):
+        r"""Marks the words that end with the given suffix, building the reversed word index when first needed."""
+        if self._suffix_index is None:
+            ix = self.lengths[:, np.newaxis] - 1 - np.arange(self.letters.shape[1])
+            reverse = np.where(ix >= 0, np.take_along_axis(self.letters, np.maximum(ix, 0), axis=1), 0).astype(np.uint8)
+            keys = self._keys(reverse)
+            order = np.argsort(keys, kind="stable")
+            self._suffix_index = (keys[order], order)
+        return self._block_mask(*self._suffix_index, suffix[::-1])
+
+    def length_mask(self, min_len=0, max_len=None):
+        r"""Marks the words with lengths between min_len and max_len, inclusive."""
+        mask = self.lengths >= min_len
+        if max_len is not None:
+            mask &= self.lengths <= max_len
+        return mask
+
+    def contains_mask(self, letters):
+        r"""Marks the words that have at least the given letters, counting repeats."""
+        (codes, needed) = np.unique(_letter_codes(letters), return_counts=True)
+        return np.all(self.counts[:, codes] >= needed, axis=1)
+
+    def letter_set_mask(self, letters):
+        r"""Marks the words that are made of only the given set of letters."""
+        others = np.setdiff1d(np.arange(len(_ALPHABET)), _letter_codes(set(letters)))
+        return ~np.any(self.counts[:, others], axis=1)
+
+    def pattern_mask(self, pattern):
+        r"""
+        Marks the words that match the given regular expression anywhere, like `re.search`.
+
+        Notes
+        -----
+        #.  Patterns of only letters and "." wildcards, with optional "^" and "$" anchors, are
+            compared column by column for every word at once.  Anything else falls back to the
+            `re` module one word at a time.
+
+        """
+        if not _SIMPLE_PATTERN.fullmatch(pattern):
+            regex = re.compile(pattern)
+            return np.fromiter((regex.search(word) is not None for word in self.get_words()), dtype=bool, count=len(self))
+        start = pattern.startswith("^")
+        end   = pattern.endswith("$") and len(pattern) > int(start)
+        body  = pattern[int(start) : len(pattern) - int(end)]
+        num   = len(body)
+        width = self.letters.shape[1]
+        fits  = self.lengths >= num
+        if start and end:
+            shifts = [None]
+            fits &= self.lengths == num
+        elif start:
+            shifts = [0]
+        elif end:
+            shifts = [None]
+        else:
+            shifts = range(width - num + 1)
+        mask = np.zeros(len(self), dtype=bool)
+        for shift in shifts:
+            # shift of None lines up the end of the pattern with the end of each word
+            if shift is None:
+                cols = np.maximum(self.lengths - num, 0)[:, np.newaxis] + np.arange(num)
+                window = np.take_along_axis(self.letters, np.minimum(cols, width - 1), axis=1)
+            else:
+                window = self.letters[:, shift : shift + num]
+                if window.shape[1] < num:
+                    continue
+            this = fits.copy() if shift is None else fits & (self.lengths >= shift + num)
+            for i, letter in enumerate(body):
+                if letter != ".":
+                    this &= window[:, i] == ord(letter)
+            mask |= this
+        return mask & fits
+
+    def get_words(self, mask=None):
+        r"""Gets the marked words sorted longest first and then alphabetically, or all the words alphabetically."""
+        index = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if mask is not None:
+            index = index[np.argsort(-self.lengths[index], kind="stable")]
+        return self._keys(self.letters)[index].astype(str).tolist()
+
+
+# %% _letter_codes
+def _letter_codes(letters):
+    r"""Gets the letter count columns for the given letters."""
+    return np.array([_ALPHABET.index(letter) for letter in letters], dtype=int)
+
+
+# %% load_word_store
+def load_word_store(filename=None, min_len=2, max_len=20, folder=None):
+    r"""
+    Loads the columnar word store for the given word list, reusing it if it is already built.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Full path to the word list, defaults to DICT in the data folder
+    min_len : int, optional
+        Minimum length of word to include
+    max_len : int, optional
+        Maximum length of word to include
+    folder : str, optional
+        Folder for the cached word list files, defaults to the output folder
+
+    Returns
+    -------
+    class WordStore
+        Word store for the word list
+
+    Examples
+    --------
+    >>> from dstauffman2.games.scrabble.wordstore import load_word_store
+    >>> store = load_word_store()
+    >>> print(store.get_words(store.suffix_mask("azz")))
+    ['razzamatazz', 'razzmatazz', 'bezazz', 'pazazz', 'pizazz', 'jazz', 'razz']
+
+    """
+    words = load_word_list(filename, min_len=min_len, max_len=max_len, folder=folder)
+    key = (filename, min_len, max_len, folder)
+    (source, store) = _OPEN_STORES.get(key, (None, None))
+    if source is not words:
+        store = WordStore(words)
+        _OPEN_STORES[key] = (words, store)
+    return store
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.scrabble.tests.test_wordstore", exit=False)
+    doctest.testmod(verbose=False)
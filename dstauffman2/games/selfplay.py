@@ -0,0 +1,321 @@
+r"""
+Selfplay module file for the "dstauffman2" library.  It plays batches of headless games for the
+"pentago" and "tictactoe" games, so that the AIs can be evaluated over many games at once.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  All the games in a batch are held as rows of a single 2D board array, so that the legal moves,
+    the piece placements, the quadrant rotations and the win checks are done for every unfinished
+    game at once.  Only the "ai" policy has to loop through the boards one at a time.
+#.  Updated by David C. Stauffer in October 2026 to run the chunks with the shared runner in the
+    "batch" file, so that the results for a seed don't change when a process pool is used.
+
+"""
+
+# %% Imports
+import doctest
+import time
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2.games.batch import DRAW, NONE, PLAYER1, PLAYER2, run_chunks, split_chunks
+from dstauffman2.games.pentago.constants import PLAYER as PENTAGO_PLAYER, WIN as PENTAGO_WIN
+from dstauffman2.games.pentago.search import Searcher
+from dstauffman2.games.pentago.utils import rotate_board
+from dstauffman2.games.tictactoe.constants import PLAYER as TICTACTOE_PLAYER, WIN as TICTACTOE_WIN
+from dstauffman2.games.tictactoe.utils import find_moves as tictactoe_find_moves
+
+# %% Constants
+# number of games before switching to a process pool
+PARALLEL_THRESHOLD = 2000
+
+# valid policies for choosing moves
+POLICIES = frozenset({"random", "ai"})
+
+# the player values used within the batches are the same for both games
+assert PENTAGO_PLAYER["white"] == TICTACTOE_PLAYER["o"] == PLAYER1
+assert PENTAGO_PLAYER["black"] == TICTACTOE_PLAYER["x"] == PLAYER2
+assert PENTAGO_PLAYER["draw"] == TICTACTOE_PLAYER["draw"] == DRAW
+
+
+# %% _build_rotation_perms
+def _build_rotation_perms():
+    r"""Builds the linear index permutations for each of the eight pentago quadrant rotations."""
+    rotations = ((1, -1), (2, -1), (3, -1), (4, -1), (1, 1), (2, 1), (3, 1), (4, 1))
+    perms = np.empty((len(rotations), PENTAGO_WIN.shape[0]), dtype=np.intp)
+    for ix, (quadrant, direction) in enumerate(rotations):
+        index = np.arange(PENTAGO_WIN.shape[0]).reshape(6, 6)
+        rotate_board(index, quadrant, direction)
+        perms[ix, :] = index.ravel()
+    return (rotations, perms)
+
+
+# pentago rotations and the source index for each square after each of them
+(_ROTATIONS, _ROTATION_PERMS) = _build_rotation_perms()
+
+# game specific information, as (board size, number in a row to win, winning combinations, rotates)
+_GAMES = {
+    "pentago": (6, 5, PENTAGO_WIN.astype(np.int8), True),
+    "tictactoe": (3, 3, TICTACTOE_WIN.astype(np.int8), False),
+}
+
+
+# %% Classes - SelfPlayResults
+class SelfPlayResults(Frozen):
+    r"""
+    Results from a batch of self-play games.
+
+    Attributes
+    ----------
+    game : str
+        Name of the game
+    policies : (str, str)
+        Policy for player 1 (white or o) and player 2 (black or x)
+    first_player : (N, ) ndarray of int
+        Player that moved first in each game
+    winner : (N, ) ndarray of int
+        Winner of each game, from {1=player 1, -1=player 2, 2=draw}
+    num_moves : (N, ) ndarray of int
+        Number of moves in each game
+    elapsed : float
+        Wall clock time to play all the games, in seconds
+
+    Examples
+    --------
+    >>> from dstauffman2.games.selfplay import SelfPlayResults
+    >>> import numpy as np
+    >>> results = SelfPlayResults("tictactoe", ("random", "random"), np.array([1, -1]), np.array([1, 2]), \
+    ...     np.array([7, 9]), 0.5)
+    >>> print(results.num_games, results.num_draws, results.games_per_sec)
+    2 1 4.0
+
+    """
+
+    def __init__(self, game, policies, first_player, winner, num_moves, elapsed):
+        self.game         = game
+        self.policies     = policies
+        self.first_player = first_player
+        self.winner       = winner
+        self.num_moves    = num_moves
+        self.elapsed      = elapsed
+
+    def __str__(self):
+        text = [
+            f"{self.game}: {self.num_games} games in {self.elapsed:.3f} seconds ({self.games_per_sec:.1f} games/sec)",
+            f"    player 1 ({self.policies[0]}) wins: {self.num_player1_wins} ({100 * self.num_player1_wins / self.num_games:.1f}%)",
+            f"    player 2 ({self.policies[1]}) wins: {self.num_player2_wins} ({100 * self.num_player2_wins / self.num_games:.1f}%)",
+            f"    draws: {self.num_draws} ({100 * self.num_draws / self.num_games:.1f}%)",
+            f"    average game length: {np.mean(self.num_moves):.2f} moves",
+        ]
+        return "\n".join(text)
+
+    @property
+    def num_games(self):
+        r"""Number of games played."""
+        return self.winner.size
+
+    @property
+    def num_player1_wins(self):
+        r"""Number of games won by player 1 (white or o)."""
+        return int(np.count_nonzero(self.winner == PLAYER1))
+
+    @property
+    def num_player2_wins(self):
+        r"""Number of games won by player 2 (black or x)."""
+        return int(np.count_nonzero(self.winner == PLAYER2))
+
+    @property
+    def num_draws(self):
+        r"""Number of drawn games."""
+        return int(np.count_nonzero(self.winner == DRAW))
+
+    @property
+    def games_per_sec(self):
+        r"""Number of games played per second."""
+        return self.num_games / self.elapsed if self.elapsed > 0 else np.inf
+
+    @classmethod
+    def combine(cls, results, elapsed=None):
+        r"""Combines a list of results from the same game and policies into a single result."""
+        first_player = np.concatenate([x.first_player for x in results])
+        winner       = np.concatenate([x.winner for x in results])
+        num_moves    = np.concatenate([x.num_moves for x in results])
+        if elapsed is None:
+            elapsed = sum(x.elapsed for x in results)
+        return cls(results[0].game, results[0].policies, first_player, winner, num_moves, elapsed)
+
+
+# %% check_batch_wins
+def check_batch_wins(boards, game):
+    r"""
+    Checks a batch of boards for wins.
+
+    Parameters
+    ----------
+    boards : (N, M) ndarray of int
+        Batch of linearized boards
+    game : str
+        Name of the game, from {"pentago", "tictactoe"}
+
+    Returns
+    -------
+    winner : (N, ) ndarray of int
+        Winner for each board, from {0=none, 1=player 1, -1=player 2, 2=draw}
+
+    Examples
+    --------
+    >>> from dstauffman2.games.selfplay import check_batch_wins
+    >>> import numpy as np
+    >>> boards = np.zeros((3, 9), dtype=np.int8)
+    >>> boards[1, 0:3] = 1
+    >>> boards[2, :] = [1, -1, 1, 1, -1, -1, -1, 1, 1]
+    >>> print(check_batch_wins(boards, "tictactoe"))
+    [0 1 2]
+
+    """
+    (_, num_in_row, win, _) = _GAMES[game]
+    win1 = np.any(((boards == PLAYER1).astype(np.int8) @ win) == num_in_row, axis=1)
+    win2 = np.any(((boards == PLAYER2).astype(np.int8) @ win) == num_in_row, axis=1)
+    winner = np.full(boards.shape[0], NONE, dtype=int)
+    winner[win1] = PLAYER1
+    winner[win2] = PLAYER2
+    # simultaneous wins and full boards are draws
+    winner[(win1 & win2) | ((winner == NONE) & np.all(boards != NONE, axis=1))] = DRAW
+    return winner
+
+
+# %% _choose_random
+def _choose_random(boards, prng):
+    r"""Chooses a uniformly random legal square for each board."""
+    scores = prng.random(boards.shape)
+    scores[boards != NONE] = -1.0
+    return np.argmax(scores, axis=1)
+
+
+# %% _choose_ai
+def _choose_ai(boards, player, game, prng, searcher):
+    r"""Chooses the moves for each board using the AI for the given game."""
+    size = _GAMES[game][0]
+    squares = np.empty(boards.shape[0], dtype=np.intp)
+    rotations = np.empty(boards.shape[0], dtype=np.intp)
+    for ix in range(boards.shape[0]):
+        board = boards[ix].reshape(size, size).astype(int)
+        if game == "pentago":
+            move = searcher.search(board, player)
+            rotations[ix] = _ROTATIONS.index((move.quadrant, move.direction))
+        else:
+            (o_moves, x_moves) = tictactoe_find_moves(board)
+            moves = o_moves if player == PLAYER1 else x_moves
+            # pick randomly between equivalent moves
+            best = [x for x in moves if x.power == moves[0].power]
+            move = best[prng.integers(len(best))]
+        squares[ix] = size * move.row + move.column
+    return (squares, rotations)
+
+
+# %% _simulate_batch
+def _simulate_batch(game, num_games, policies, first_player, seed, ai_depth):
+    r"""Plays a single batch of games in the current process."""
+    (size, _, _, rotates) = _GAMES[game]
+    prng = np.random.default_rng(seed)
+    searcher = Searcher(max_depth=ai_depth, time_budget=None) if game == "pentago" else None
+    boards = np.zeros((num_games, size * size), dtype=np.int8)
+    winner = np.full(num_games, NONE, dtype=int)
+    num_moves = np.zeros(num_games, dtype=int)
+    player = first_player.copy()
+    start = time.perf_counter()
+    active = np.arange(num_games)
+    while active.size > 0:
+        squares = np.empty(active.size, dtype=np.intp)
+        rotations = prng.integers(len(_ROTATIONS), size=active.size) if rotates else None
+        for this_player, policy in zip((PLAYER1, PLAYER2), policies):
+            ix = np.flatnonzero(player[active] == this_player)
+            if ix.size == 0:
+                continue
+            if policy == "random":
+                squares[ix] = _choose_random(boards[active[ix]], prng)
+            else:
+                (squares[ix], ai_rotations) = _choose_ai(boards[active[ix]], this_player, game, prng, searcher)
+                if rotates:
+                    rotations[ix] = ai_rotations
+        # place the pieces
+        boards[active, squares] = player[active]
+        # rotate the quadrants
+        if rotates:
+            boards[active] = np.take_along_axis(boards[active], _ROTATION_PERMS[rotations], axis=1)
+        num_moves[active] += 1
+        # check for finished games
+        winner[active] = check_batch_wins(boards[active], game)
+        player[active] = -player[active]
+        active = active[winner[active] == NONE]
+    elapsed = time.perf_counter() - start
+    return SelfPlayResults(game, policies, first_player, winner, num_moves, elapsed)
+
+
+# %% simulate_games
+def simulate_games(game, num_games, *, policies=("random", "random"), seed=None, ai_depth=1, num_workers=None, \
+        chunk_size=500):
+    r"""
+    Plays a batch of headless games.
+
+    Parameters
+    ----------
+    game : str
+        Name of the game, from {"pentago", "tictactoe"}
+    num_games : int
+        Number of games to play
+    policies : (str, str), optional
+        Policy for player 1 (white or o) and player 2 (black or x), from {"random", "ai"}
+    seed : int, optional
+        Seed for the random number generator
+    ai_depth : int, optional
+        Search depth for the pentago "ai" policy
+    num_workers : int, optional
+        Number of worker processes, defaults to the number of CPUs, and 1 runs everything in this process
+    chunk_size : int, optional
+        Number of games that are played at once
+
+    Returns
+    -------
+    class SelfPlayResults
+        Winners, game lengths and timing for all the games
+
+    Notes
+    -----
+    #.  The first player alternates between games, the same way it does in the GUIs.
+    #.  A process pool is only used once there are at least PARALLEL_THRESHOLD games.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.selfplay import simulate_games
+    >>> results = simulate_games("tictactoe", 100, seed=0)
+    >>> print(results.num_games)
+    100
+
+    >>> print(results.num_player1_wins + results.num_player2_wins + results.num_draws)
+    100
+
+    """
+    if game not in _GAMES:
+        raise ValueError(f'Unexpected game: "{game}"')
+    policies = tuple(policies)
+    if len(policies) != 2 or any(policy not in POLICIES for policy in policies):
+        raise ValueError(f"Unexpected policies: {policies}")
+    first_player = np.where(np.arange(num_games) % 2 == 0, PLAYER1, PLAYER2)
+    tasks = [
+        (game, size, policies, first_player[i : i + size], this_seed, ai_depth)
+        for (i, size, this_seed) in split_chunks(num_games, chunk_size, seed)
+    ]
+    start = time.perf_counter()
+    results = run_chunks(_simulate_batch, tasks, parallel=num_games >= PARALLEL_THRESHOLD, num_workers=num_workers)
+    return SelfPlayResults.combine(results, elapsed=time.perf_counter() - start)
+
+
+# %% Unit test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.test_selfplay", exit=False)
+    doctest.testmod(verbose=False)
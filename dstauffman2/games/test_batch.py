@@ -0,0 +1,91 @@
+r"""
+Test file for the `batch` module of the "dstauffman2" library.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.batch as batch
+
+
+# %% Functions - _draw
+def _draw(size, seed):
+    r"""Draws random numbers from the stream for a chunk, for use in testing."""
+    return np.random.default_rng(seed).random(size)
+
+
+# %% split_chunks
+class Test_split_chunks(unittest.TestCase):
+    r"""
+    Tests the split_chunks function with the following cases:
+        nominal
+        exact multiple
+        empty
+        reproducible
+    """
+
+    def test_nominal(self) -> None:
+        chunks = batch.split_chunks(11, 4, seed=1)
+        self.assertEqual([(start, size) for (start, size, _) in chunks], [(0, 4), (4, 4), (8, 3)])
+
+    def test_exact(self) -> None:
+        chunks = batch.split_chunks(8, 4)
+        self.assertEqual([size for (_, size, _) in chunks], [4, 4])
+
+    def test_empty(self) -> None:
+        chunks = batch.split_chunks(0, 4)
+        self.assertEqual([(start, size) for (start, size, _) in chunks], [(0, 0)])
+
+    def test_reproducible(self) -> None:
+        chunks1 = batch.split_chunks(10, 4, seed=2)
+        chunks2 = batch.split_chunks(10, 4, seed=2)
+        for (chunk1, chunk2) in zip(chunks1, chunks2):
+            np.testing.assert_array_equal(_draw(3, chunk1[2]), _draw(3, chunk2[2]))
+        self.assertFalse(np.array_equal(_draw(3, chunks1[0][2]), _draw(3, chunks1[1][2])))
+
+
+# %% run_chunks
+class Test_run_chunks(unittest.TestCase):
+    r"""
+    Tests the run_chunks function with the following cases:
+        in order
+        stop early
+        process pool
+        process pool stops early
+    """
+
+    def setUp(self) -> None:
+        self.tasks = [(size, this_seed) for (_, size, this_seed) in batch.split_chunks(1000, 100, seed=3)]
+
+    def test_order(self) -> None:
+        results = batch.run_chunks(_draw, self.tasks, num_workers=1)
+        self.assertEqual(len(results), 10)
+        np.testing.assert_array_equal(results[3], _draw(*self.tasks[3]))
+
+    def test_stop_early(self) -> None:
+        results = batch.run_chunks(_draw, self.tasks, num_workers=1, is_done=lambda results: len(results) == 4)
+        self.assertEqual(len(results), 4)
+
+    def test_process_pool(self) -> None:
+        results1 = batch.run_chunks(_draw, self.tasks, num_workers=1)
+        results2 = batch.run_chunks(_draw, self.tasks, num_workers=2)
+        np.testing.assert_array_equal(np.concatenate(results1), np.concatenate(results2))
+
+    def test_pool_stop_early(self) -> None:
+        results1 = batch.run_chunks(_draw, self.tasks, num_workers=1, is_done=lambda results: np.sum(results) > 200)
+        results2 = batch.run_chunks(_draw, self.tasks, num_workers=2, is_done=lambda results: np.sum(results) > 200)
+        self.assertLess(len(results1), len(self.tasks))
+        np.testing.assert_array_equal(np.concatenate(results1), np.concatenate(results2))
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -5,12 +5,16 @@
 Notes
 -----
 #.  Written by David C. Stauffer in May 2016.
+#.  Updated by David C. Stauffer in October 2026 to test the array based cards and the hand evaluator.
 
 """
 
 # %% Imports
+from itertools import combinations
 import unittest
 
+import numpy as np
+
 import dstauffman2.games.cards as cards
 
 # %% Local aliases
@@ -209,11 +213,105 @@ def test_score_five_of_kind(self) -> None:
         hand2 = H([C(R.TEN, S.SPADES), C(R.TEN, S.DIAMONDS), C(R.TEN, S.CLUBS), C(R.TEN, S.HEARTS), C(R.TEN, S.SPADES)])
         score1 = hand1.score_hand()
         score2 = hand2.score_hand()
-        # self.assertGreater(score1, 9)
-        # self.assertGreater(score2, 9)
-        # self.assertLess(score1, 10)
-        # self.assertLess(score2, 10)
-        # self.assertGreater(score1, score2)
+        self.assertEqual(cards.get_hand_category(score1), 9)
+        self.assertEqual(cards.get_hand_category(score2), 9)
+        self.assertGreater(score1, score2)
+
+    def test_score_categories(self) -> None:
+        hands = [
+            [C(R.ACE, S.SPADES), C(R.KING, S.SPADES), C(R.QUEEN, S.SPADES), C(R.JACK, S.SPADES), C(R.TEN, S.SPADES)],
+            [C(R.NINE, S.CLUBS), C(R.NINE, S.HEARTS), C(R.NINE, S.SPADES), C(R.NINE, S.DIAMONDS), C(R.TWO, S.CLUBS)],
+            [C(R.NINE, S.CLUBS), C(R.NINE, S.HEARTS), C(R.NINE, S.SPADES), C(R.TWO, S.DIAMONDS), C(R.TWO, S.CLUBS)],
+            [C(R.NINE, S.CLUBS), C(R.SEVEN, S.CLUBS), C(R.FIVE, S.CLUBS), C(R.FOUR, S.CLUBS), C(R.TWO, S.CLUBS)],
+            [C(R.ACE, S.CLUBS), C(R.TWO, S.HEARTS), C(R.THREE, S.CLUBS), C(R.FOUR, S.CLUBS), C(R.FIVE, S.CLUBS)],
+            [C(R.NINE, S.CLUBS), C(R.NINE, S.HEARTS), C(R.NINE, S.SPADES), C(R.FOUR, S.CLUBS), C(R.TWO, S.CLUBS)],
+            [C(R.NINE, S.CLUBS), C(R.NINE, S.HEARTS), C(R.FOUR, S.SPADES), C(R.FOUR, S.CLUBS), C(R.TWO, S.CLUBS)],
+            [C(R.NINE, S.CLUBS), C(R.NINE, S.HEARTS), C(R.FIVE, S.SPADES), C(R.FOUR, S.CLUBS), C(R.TWO, S.CLUBS)],
+            [C(R.NINE, S.CLUBS), C(R.EIGHT, S.HEARTS), C(R.FIVE, S.SPADES), C(R.FOUR, S.CLUBS), C(R.TWO, S.CLUBS)],
+        ]
+        scores = [H(hand).score_hand() for hand in hands]
+        self.assertEqual([cards.get_hand_category(score) for score in scores], [8, 7, 6, 5, 4, 3, 2, 1, 0])
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_score_kickers(self) -> None:
+        hand1 = H([C(R.ACE, S.SPADES), C(R.ACE, S.CLUBS), C(R.KING, S.SPADES), C(R.SIX, S.HEARTS), C(R.TWO, S.CLUBS)])
+        hand2 = H([C(R.ACE, S.HEARTS), C(R.ACE, S.DIAMONDS), C(R.QUEEN, S.SPADES), C(R.JACK, S.HEARTS), C(R.TEN, S.CLUBS)])
+        self.assertGreater(hand1.score_hand(), hand2.score_hand())
+
+    def test_to_array(self) -> None:
+        self.hand.add_card(self.card1)
+        self.hand.add_card(self.card2)
+        codes = self.hand.to_array()
+        self.assertEqual(codes.dtype, np.uint8)
+        np.testing.assert_array_equal(codes, [51, 10])
+
+
+# %% encode_cards, decode_cards and new_deck
+class Test_encode_cards(unittest.TestCase):
+    r"""
+    Tests the encode_cards, decode_cards and new_deck functions with the following cases:
+        nominal
+        round trip with the Card class
+        full deck
+    """
+
+    def test_nominal(self) -> None:
+        codes = cards.encode_cards([R.TWO, R.TWO, R.ACE], [S.CLUBS, S.SPADES, S.SPADES])
+        self.assertEqual(codes.dtype, np.uint8)
+        np.testing.assert_array_equal(codes, [0, 3, 51])
+        (ranks, suits) = cards.decode_cards(codes)
+        np.testing.assert_array_equal(ranks, [0, 0, 12])
+        np.testing.assert_array_equal(suits, [0, 3, 3])
+
+    def test_cards(self) -> None:
+        for code in range(cards.DECK_SIZE):
+            card = C.from_code(code)
+            self.assertEqual(card.code, code)
+
+    def test_deck(self) -> None:
+        deck = cards.new_deck()
+        self.assertEqual(deck.dtype, np.uint8)
+        np.testing.assert_array_equal(np.sort(cards.Deck().to_array()), deck)
+
+
+# %% evaluate_hands
+class Test_evaluate_hands(unittest.TestCase):
+    r"""
+    Tests the evaluate_hands function with the following cases:
+        all five card hands
+        matches the best five cards of seven
+        matches the Hand class
+        single hand
+        bad size
+    """
+
+    def setUp(self) -> None:
+        prng = np.random.default_rng(42)
+        self.hands = prng.random((200, cards.DECK_SIZE)).argsort(axis=1)[:, :7].astype(np.uint8)
+
+    def test_all_five_card_hands(self) -> None:
+        hands = np.array(list(combinations(range(cards.DECK_SIZE), 5)), dtype=np.uint8)
+        counts = np.bincount(cards.get_hand_category(cards.evaluate_hands(hands)), minlength=9)
+        np.testing.assert_array_equal(counts, [1302540, 1098240, 123552, 54912, 10200, 5108, 3744, 624, 40])
+
+    def test_best_of_seven(self) -> None:
+        values = cards.evaluate_hands(self.hands)
+        for hand, value in zip(self.hands, values):
+            subsets = np.array(list(combinations(hand, 5)), dtype=np.uint8)
+            self.assertEqual(value, np.max(cards.evaluate_hands(subsets)))
+
+    def test_hand_class(self) -> None:
+        values = cards.evaluate_hands(self.hands[:, :6])
+        for hand, value in zip(self.hands[:, :6], values):
+            self.assertEqual(value, H([C.from_code(code) for code in hand]).score_hand())
+
+    def test_single(self) -> None:
+        value = cards.evaluate_hands(self.hands[0])
+        self.assertEqual(value, cards.evaluate_hands(self.hands[:1])[0])
+
+    def test_bad_size(self) -> None:
+        with self.assertRaises(ValueError):
+            cards.evaluate_hands(self.hands[:, :4])
 
 
 # %% Unit test execution
@@ -0,0 +1,142 @@
+r"""
+Test file for the `poker` module of the "dstauffman2" library.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.cards as cards
+import dstauffman2.games.poker as poker
+
+# %% Local aliases
+R = cards.Rank
+S = cards.Suit
+C = cards.Card
+
+
+# %% PokerEquity
+class Test_PokerEquity(unittest.TestCase):
+    r"""
+    Tests the PokerEquity class with the following cases:
+        probabilities
+        confidence interval
+        string
+        combine
+        no trials
+    """
+
+    def setUp(self) -> None:
+        self.results = poker.PokerEquity(4, 2, 1, 2.5, 2.25, elapsed=2.0)
+
+    def test_probabilities(self) -> None:
+        self.assertEqual(self.results.num_losses, 1)
+        self.assertAlmostEqual(self.results.equity, 0.625)
+        self.assertAlmostEqual(self.results.win_prob, 0.5)
+        self.assertAlmostEqual(self.results.tie_prob, 0.25)
+        self.assertAlmostEqual(self.results.loss_prob, 0.25)
+        self.assertAlmostEqual(self.results.trials_per_sec, 2.0)
+
+    def test_confidence_interval(self) -> None:
+        shares = np.array([1.0, 1.0, 0.5, 0.0])
+        std_err = np.std(shares, ddof=1) / 2
+        self.assertAlmostEqual(self.results.std_err, std_err)
+        self.assertAlmostEqual(self.results.half_width, 1.959963984540054 * std_err)
+        (lower, upper) = self.results.confidence_interval
+        self.assertAlmostEqual(lower, 0.625 - self.results.half_width)
+        self.assertEqual(upper, 1.0)
+
+    def test_str(self) -> None:
+        text = str(self.results)
+        self.assertIn("Equity: 62.50%", text)
+        self.assertIn("4 trials", text)
+
+    def test_combine(self) -> None:
+        results = poker.PokerEquity.combine([self.results, poker.PokerEquity(2, 0, 0, 0.0, 0.0, elapsed=1.0)])
+        self.assertEqual(results.num_trials, 6)
+        self.assertEqual(results.num_wins, 2)
+        self.assertAlmostEqual(results.equity, 2.5 / 6)
+        self.assertEqual(results.elapsed, 3.0)
+
+    def test_no_trials(self) -> None:
+        results = poker.PokerEquity(0, 0, 0, 0.0, 0.0)
+        self.assertEqual(results.equity, 0.0)
+        self.assertEqual(results.std_err, np.inf)
+
+
+# %% calc_equity
+class Test_calc_equity(unittest.TestCase):
+    r"""
+    Tests the calc_equity function with the following cases:
+        pocket aces
+        sure win
+        split pot
+        hand class
+        reproducible
+        error target
+        bad inputs
+    """
+
+    def setUp(self) -> None:
+        self.aces = [C(R.ACE, S.SPADES), C(R.ACE, S.HEARTS)]
+
+    def test_pocket_aces(self) -> None:
+        results = poker.calc_equity(self.aces, num_trials=50000, seed=1, num_workers=1)
+        self.assertEqual(results.num_trials, 50000)
+        # pocket aces win about 85.2% against a single random hand
+        self.assertLess(abs(results.equity - 0.852), 4 * results.std_err)
+        self.assertAlmostEqual(results.win_prob + results.tie_prob + results.loss_prob, 1.0)
+
+    def test_sure_win(self) -> None:
+        board = [C(R.QUEEN, S.SPADES), C(R.JACK, S.SPADES), C(R.TEN, S.SPADES)]
+        results = poker.calc_equity([C(R.ACE, S.SPADES), C(R.KING, S.SPADES)], board, num_opponents=4, num_trials=500)
+        self.assertEqual(results.equity, 1.0)
+        self.assertEqual(results.num_wins, 500)
+
+    def test_split_pot(self) -> None:
+        # everyone plays the royal flush on the board
+        board = cards.encode_cards([R.ACE, R.KING, R.QUEEN, R.JACK, R.TEN], [S.SPADES] * 5)
+        results = poker.calc_equity([C(R.TWO, S.CLUBS), C(R.THREE, S.HEARTS)], board, num_opponents=2, num_trials=500)
+        self.assertEqual(results.num_ties, 500)
+        self.assertAlmostEqual(results.equity, 1 / 3)
+
+    def test_hand_class(self) -> None:
+        results1 = poker.calc_equity(cards.Hand(self.aces), num_trials=1000, seed=2)
+        results2 = poker.calc_equity([51, 50], num_trials=1000, seed=2)
+        self.assertEqual(results1.total, results2.total)
+
+    def test_reproducible(self) -> None:
+        results1 = poker.calc_equity(self.aces, num_opponents=3, num_trials=5000, seed=3, batch_size=1000)
+        results2 = poker.calc_equity(self.aces, num_opponents=3, num_trials=5000, seed=3, batch_size=1000)
+        self.assertEqual(results1.num_wins, results2.num_wins)
+        self.assertEqual(results1.total, results2.total)
+
+    def test_error_target(self) -> None:
+        results = poker.calc_equity(self.aces, num_trials=100000, seed=4, error_target=0.01, batch_size=1000, num_workers=1)
+        self.assertLess(results.num_trials, 100000)
+        self.assertLessEqual(results.half_width, 0.01)
+
+
+    def test_bad_inputs(self) -> None:
+        with self.assertRaises(ValueError):
+            poker.calc_equity(self.aces[:1])
+        with self.assertRaises(ValueError):
+            poker.calc_equity(self.aces, list(range(6)))
+        with self.assertRaises(ValueError):
+            poker.calc_equity(self.aces, [self.aces[0]])
+        with self.assertRaises(ValueError):
+            poker.calc_equity(self.aces, num_opponents=0)
+        with self.assertRaises(ValueError):
+            poker.calc_equity(self.aces, num_opponents=23)
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,353 @@
+r"""
+Test file for the `rubik` module of the "dstauffman2" library.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  Updated by David C. Stauffer in October 2026 to test the cube engine and solver.
+
+"""
+
+# %% Imports
+from math import factorial
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.rubik as rubik
+
+# %% Constants
+# number of permutations for the bigger cubes, as they were saved before the closed form
+PERMS = {
+        4: 7401196841564901869874093974498574336000000000,
+        5: 282870942277741856536180333107150328293127731985672134721536000000000000000,
+        6: 157152858401024063281013959519483771508510790313968742344694684829502629887168573442107637760000000000000000000000000,
+        7: 19500551183731307835329126754019748794904992692043434567152132912323232706135469180065278712755853360682328551719137311299993600000000000000000000000000000000000,
+        8: 35173780923109452777509592367006557398539936328978098352427605879843998663990903628634874024098344287402504043608416113016679717941937308041012307368528117622006727311360000000000000000000000000000000000000000000000000,
+        9: 14170392390542612915246393916889970752732946384514830589276833655387444667609821068034079045039617216635075219765012566330942990302517903971787699783519265329288048603083134861573075573092224082416866010882486829056000000000000000000000000000000000000000000000000000000000000000,
+        10: 82983598512782362708769381780036344745129162094677382883567691311764021348095163778336143207042993152056079271030423741110902768732457008486832096777758106509177169197894747758859723340177608764906985646389382047319811227549112086753524742719830990076805422479380054016000000000000000000000000000000000000000000000000000000000000000000000000000000000,
+        11: 108540871852024137837529457366425345163408989164877909166491842616641991981135011689476695849803941790591401795168969498249897355324768178088518513156026831828793854471326717801604260274446021846541136205357444802749291495386649979610567642710417177711042509688835903368099465519253326878312637499376794203125671816898434564096000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000,
+}
+
+
+# %% rubiks_cube_permutations
+class Test_rubiks_cube_permutations(unittest.TestCase):
+    r"""
+    Tests the rubiks_cube_permutations function with the following cases:
+        small cubes
+        saved values
+        growth
+        big cubes
+        bad sizes
+    """
+
+    def test_small(self) -> None:
+        self.assertEqual(rubik.rubiks_cube_permutations(1), 1)
+        self.assertEqual(rubik.rubiks_cube_permutations(2), 3674160)
+        self.assertEqual(rubik.rubiks_cube_permutations(3), 43252003274489856000)
+        self.assertEqual(rubik.rubiks_cube_permutations(), 43252003274489856000)
+
+    def test_saved_values(self) -> None:
+        for size, perms in PERMS.items():
+            with self.subTest(size=size):
+                self.assertEqual(rubik.rubiks_cube_permutations(size), perms)
+
+    def test_growth(self) -> None:
+        # adding two layers adds one orbit of wings and size - 1 orbits of centers
+        centers = factorial(24) // factorial(4) ** 6
+        for size in range(2, 30):
+            perms = rubik.rubiks_cube_permutations(size)
+            self.assertEqual(rubik.rubiks_cube_permutations(size + 2), perms * factorial(24) * centers ** (size - 1))
+
+    def test_big(self) -> None:
+        perms = [rubik.rubiks_cube_permutations(size) for size in range(1, 101)]
+        self.assertEqual(perms, sorted(perms))
+        hits = rubik.rubiks_cube_permutations.cache_info().hits
+        self.assertEqual(rubik.rubiks_cube_permutations(100), perms[-1])
+        self.assertEqual(rubik.rubiks_cube_permutations.cache_info().hits, hits + 1)
+
+    def test_bad_sizes(self) -> None:
+        for size in (0, -3, 2.5, "3"):
+            with self.subTest(size=size):
+                with self.assertRaises(ValueError):
+                    rubik.rubiks_cube_permutations(size)
+
+
+# %% parse_moves and format_moves
+class Test_parse_moves(unittest.TestCase):
+    r"""
+    Tests the parse_moves and format_moves functions with the following cases:
+        string
+        names and indices
+        round trip
+        bad moves
+    """
+
+    def test_string(self) -> None:
+        self.assertEqual(rubik.parse_moves("U D2  B'"), [0, 16, 14])
+        self.assertEqual(rubik.parse_moves(""), [])
+
+    def test_names_and_indices(self) -> None:
+        self.assertEqual(rubik.parse_moves(["L", 17, np.int64(3)]), [3, 17, 3])
+
+    def test_round_trip(self) -> None:
+        self.assertEqual(rubik.format_moves(rubik.parse_moves(rubik.MOVES)), " ".join(rubik.MOVES))
+
+    def test_bad_moves(self) -> None:
+        with self.assertRaises(ValueError):
+            rubik.parse_moves("R U3")
+        with self.assertRaises(ValueError):
+            rubik.parse_moves([18])
+
+
+# %% apply_moves
+class Test_apply_moves(unittest.TestCase):
+    r"""
+    Tests the apply_moves function with the following cases:
+        quarter turns
+        half and inverse turns
+        centers
+        known pattern
+        sequence
+        batch with the same moves
+        batch with different moves
+        bad batch
+    """
+
+    def test_quarter_turns(self) -> None:
+        for move in rubik.MOVES:
+            state = rubik.apply_moves(rubik.SOLVED, [move])
+            self.assertFalse(rubik.is_solved(state))
+            self.assertTrue(rubik.is_solved(rubik.apply_moves(rubik.SOLVED, [move] * 4)))
+
+    def test_half_and_inverse(self) -> None:
+        for face in rubik.FACES:
+            half = rubik.apply_moves(rubik.SOLVED, face + "2")
+            np.testing.assert_array_equal(half, rubik.apply_moves(rubik.SOLVED, [face] * 2))
+            self.assertTrue(rubik.is_solved(rubik.apply_moves(rubik.SOLVED, f"{face} {face}'")))
+
+    def test_centers(self) -> None:
+        (state, _) = rubik.scramble_cube(30, seed=1)
+        np.testing.assert_array_equal(state[4::9], np.arange(6))
+        np.testing.assert_array_equal(np.bincount(state), np.full(6, 9))
+
+    def test_known_pattern(self) -> None:
+        # R moves the front facelets of the right column up
+        text = rubik.cube_to_string(rubik.apply_moves(rubik.SOLVED, "R"))
+        self.assertEqual(text, "UUFUUFUUF" + "L" * 9 + "FFDFFDFFD" + "R" * 9 + "UBBUBBUBB" + "DDBDDBDDB")
+
+    def test_sequence(self) -> None:
+        # the commutator of two adjacent faces repeats after six times
+        for count in range(1, 6):
+            self.assertFalse(rubik.is_solved(rubik.apply_moves(rubik.SOLVED, "R U R' U' " * count)))
+        self.assertTrue(rubik.is_solved(rubik.apply_moves(rubik.SOLVED, "R U R' U' " * 6)))
+
+    def test_batch_same(self) -> None:
+        states = np.tile(rubik.SOLVED, (3, 1))
+        out = rubik.apply_moves(states, "F R2 D'")
+        self.assertEqual(out.shape, (3, 54))
+        np.testing.assert_array_equal(out[2], rubik.apply_moves(rubik.SOLVED, "F R2 D'"))
+
+    def test_batch_different(self) -> None:
+        moves = rubik.parse_moves("F R2 D' B")
+        states = np.tile(rubik.SOLVED, (3, 1))
+        out = rubik.apply_moves(states, [moves, moves[:2] + [-1, -1], [-1] * 4])
+        np.testing.assert_array_equal(out[0], rubik.apply_moves(rubik.SOLVED, moves))
+        np.testing.assert_array_equal(out[1], rubik.apply_moves(rubik.SOLVED, moves[:2]))
+        np.testing.assert_array_equal(out[2], rubik.SOLVED)
+
+    def test_bad_batch(self) -> None:
+        with self.assertRaises(ValueError):
+            rubik.apply_moves(np.tile(rubik.SOLVED, (3, 1)), [[0], [1]])
+
+
+# %% is_solved, cube_to_string and cube_from_string
+class Test_cube_strings(unittest.TestCase):
+    r"""
+    Tests the is_solved, cube_to_string and cube_from_string functions with the following cases:
+        solved
+        round trip
+        batch
+        bad strings
+    """
+
+    def test_solved(self) -> None:
+        self.assertEqual(rubik.cube_to_string(rubik.SOLVED), "".join(face * 9 for face in rubik.FACES))
+
+    def test_round_trip(self) -> None:
+        (state, _) = rubik.scramble_cube(seed=2)
+        np.testing.assert_array_equal(rubik.cube_from_string(rubik.cube_to_string(state)), state)
+
+    def test_batch(self) -> None:
+        states = np.vstack((rubik.SOLVED, rubik.apply_moves(rubik.SOLVED, "B")))
+        np.testing.assert_array_equal(rubik.is_solved(states), [True, False])
+
+    def test_bad_strings(self) -> None:
+        with self.assertRaises(ValueError):
+            rubik.cube_from_string("U" * 53)
+        with self.assertRaises(ValueError):
+            rubik.cube_from_string("X" * 54)
+
+
+# %% scramble_cube
+class Test_scramble_cube(unittest.TestCase):
+    r"""
+    Tests the scramble_cube function with the following cases:
+        nominal
+        reproducible
+        no repeated faces
+    """
+
+    def test_nominal(self) -> None:
+        (state, moves) = rubik.scramble_cube(20, seed=3)
+        np.testing.assert_array_equal(rubik.apply_moves(rubik.SOLVED, moves), state)
+        self.assertEqual(len(moves.split()), 20)
+
+    def test_reproducible(self) -> None:
+        self.assertEqual(rubik.scramble_cube(seed=4)[1], rubik.scramble_cube(seed=4)[1])
+
+    def test_no_repeats(self) -> None:
+        moves = rubik.parse_moves(rubik.scramble_cube(200, seed=5)[1])
+        self.assertTrue(all(a // 3 != b // 3 for (a, b) in zip(moves[:-1], moves[1:])))
+
+
+# %% _get_cubies
+class Test__get_cubies(unittest.TestCase):
+    r"""
+    Tests the _get_cubies function with the following cases:
+        solved
+        matches the facelet moves
+        twisted corner
+        flipped edge
+        swapped edges
+        wrong colors
+    """
+
+    def test_solved(self) -> None:
+        (cp, co, ep, eo) = rubik._get_cubies(rubik.SOLVED)
+        np.testing.assert_array_equal(cp, np.arange(8))
+        np.testing.assert_array_equal(co, 0)
+        np.testing.assert_array_equal(ep, np.arange(12))
+        np.testing.assert_array_equal(eo, 0)
+
+    def test_moves(self) -> None:
+        (state, _) = rubik.scramble_cube(seed=6)
+        (cp, co, ep, eo) = rubik._get_cubies(state)
+        for move in rubik.parse_moves("R U2 F' L D B2"):
+            state = rubik.apply_moves(state, [move])
+            (mcp, mco, mep, meo) = (rubik._MOVE_CP[move], rubik._MOVE_CO[move], rubik._MOVE_EP[move], rubik._MOVE_EO[move])
+            (cp, co, ep, eo) = (cp[mcp], (co[mcp] + mco) % 3, ep[mep], (eo[mep] + meo) % 2)
+            for exp, act in zip((cp, co, ep, eo), rubik._get_cubies(state)):
+                np.testing.assert_array_equal(act, exp)
+
+    def test_twisted_corner(self) -> None:
+        state = rubik.SOLVED.copy()
+        state[rubik._CORNER_FACELETS[0]] = state[np.roll(rubik._CORNER_FACELETS[0], 1)]
+        with self.assertRaises(ValueError):
+            rubik._get_cubies(state)
+
+    def test_flipped_edge(self) -> None:
+        state = rubik.SOLVED.copy()
+        state[rubik._EDGE_FACELETS[0]] = state[rubik._EDGE_FACELETS[0][::-1]]
+        with self.assertRaises(ValueError):
+            rubik._get_cubies(state)
+
+    def test_swapped_edges(self) -> None:
+        state = rubik.SOLVED.copy()
+        (state[rubik._EDGE_FACELETS[0]], state[rubik._EDGE_FACELETS[1]]) = \
+            (state[rubik._EDGE_FACELETS[1]], state[rubik._EDGE_FACELETS[0]])
+        with self.assertRaises(ValueError):
+            rubik._get_cubies(state)
+
+    def test_wrong_colors(self) -> None:
+        state = rubik.SOLVED.copy()
+        state[0] = 1
+        with self.assertRaises(ValueError):
+            rubik._get_cubies(state)
+
+
+# %% load_solver_tables
+class Test_load_solver_tables(unittest.TestCase):
+    r"""
+    Tests the load_solver_tables function with the following cases:
+        cached to disk
+        pruning depths
+    """
+
+    def test_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            tables1 = rubik.load_solver_tables(folder)
+            self.assertTrue(os.path.isfile(os.path.join(folder, f"rubik_tables_v{rubik._TABLES_VERSION}.npz")))
+            self.assertIs(rubik.load_solver_tables(folder), tables1)
+            # reading the saved file gives the same tables
+            rubik._TABLES.clear()
+            tables2 = rubik.load_solver_tables(folder)
+            self.assertIsNot(tables2, tables1)
+            for key, value in tables1.items():
+                np.testing.assert_array_equal(tables2[key], value)
+            rubik._TABLES.clear()
+
+    def test_depths(self) -> None:
+        tables = rubik.load_solver_tables()
+        # every coordinate pair can be reached, and the first phase needs at most twelve moves
+        for key in ("twist_prune", "flip_prune", "cperm_prune", "eperm_prune"):
+            self.assertGreaterEqual(tables[key].min(), 0)
+        self.assertLessEqual(max(tables["twist_prune"].max(), tables["flip_prune"].max()), rubik._MAX_DEPTH1)
+        self.assertEqual(np.count_nonzero(tables["twist_prune"] == 0), 1)
+        self.assertEqual(np.count_nonzero(tables["cperm_prune"] == 0), 1)
+
+
+# %% solve_cube
+class Test_solve_cube(unittest.TestCase):
+    r"""
+    Tests the solve_cube function with the following cases:
+        solved cube
+        short scramble
+        random scrambles
+        maximum length
+        time budget
+        unsolvable cube
+    """
+
+    def test_solved(self) -> None:
+        self.assertEqual(rubik.solve_cube(rubik.SOLVED), "")
+
+    def test_short(self) -> None:
+        state = rubik.apply_moves(rubik.SOLVED, "R U")
+        self.assertEqual(rubik.solve_cube(state), "U' R'")
+
+    def test_random(self) -> None:
+        for seed in range(3):
+            (state, _) = rubik.scramble_cube(30, seed=seed)
+            solution = rubik.solve_cube(state)
+            self.assertTrue(rubik.is_solved(rubik.apply_moves(state, solution)))
+            self.assertLessEqual(len(solution.split()), rubik._MAX_DEPTH1 + rubik._MAX_DEPTH2)
+
+    def test_max_length(self) -> None:
+        (state, _) = rubik.scramble_cube(30, seed=2)
+        solution1 = rubik.solve_cube(state, max_tries=1)
+        solution2 = rubik.solve_cube(state, max_tries=10)
+        self.assertLessEqual(len(solution2.split()), len(solution1.split()))
+        solution3 = rubik.solve_cube(state, max_length=len(solution2.split()), max_tries=100)
+        self.assertLessEqual(len(solution3.split()), len(solution2.split()))
+        self.assertTrue(rubik.is_solved(rubik.apply_moves(state, solution3)))
+
+    def test_max_time(self) -> None:
+        (state, _) = rubik.scramble_cube(30, seed=2)
+        solution = rubik.solve_cube(state, max_tries=100, max_time=0.0)
+        self.assertEqual(solution, rubik.solve_cube(state, max_tries=1))
+        self.assertTrue(rubik.is_solved(rubik.apply_moves(state, solution)))
+
+    def test_unsolvable(self) -> None:
+        state = rubik.SOLVED.copy()
+        state[rubik._EDGE_FACELETS[0]] = state[rubik._EDGE_FACELETS[0][::-1]]
+        with self.assertRaises(ValueError):
+            rubik.solve_cube(state)
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
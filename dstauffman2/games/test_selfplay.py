@@ -0,0 +1,148 @@
+r"""
+Test file for the `selfplay` module of the "dstauffman2" library.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.pentago as pentago
+import dstauffman2.games.selfplay as selfplay
+import dstauffman2.games.tictactoe as tictactoe
+
+
+# %% SelfPlayResults
+class Test_SelfPlayResults(unittest.TestCase):
+    r"""
+    Tests the SelfPlayResults class with the following cases:
+        counts
+        string
+        combine
+    """
+
+    def setUp(self) -> None:
+        self.results = selfplay.SelfPlayResults(
+            "pentago", ("ai", "random"), np.array([1, -1, 1, -1]), np.array([1, 1, -1, 2]), np.array([9, 10, 12, 36]), 2.0
+        )
+
+    def test_counts(self) -> None:
+        self.assertEqual(self.results.num_games, 4)
+        self.assertEqual(self.results.num_player1_wins, 2)
+        self.assertEqual(self.results.num_player2_wins, 1)
+        self.assertEqual(self.results.num_draws, 1)
+        self.assertEqual(self.results.games_per_sec, 2.0)
+
+    def test_str(self) -> None:
+        text = str(self.results)
+        self.assertIn("pentago: 4 games", text)
+        self.assertIn("player 1 (ai) wins: 2 (50.0%)", text)
+        self.assertIn("average game length: 16.75 moves", text)
+
+    def test_combine(self) -> None:
+        results = selfplay.SelfPlayResults.combine([self.results, self.results])
+        self.assertEqual(results.num_games, 8)
+        self.assertEqual(results.num_draws, 2)
+        self.assertEqual(results.elapsed, 4.0)
+        results = selfplay.SelfPlayResults.combine([self.results, self.results], elapsed=1.0)
+        self.assertEqual(results.games_per_sec, 8.0)
+
+
+# %% check_batch_wins
+class Test_check_batch_wins(unittest.TestCase):
+    r"""
+    Tests the check_batch_wins function with the following cases:
+        tictactoe matches check_for_win
+        pentago matches check_for_win
+        pentago simultaneous win
+    """
+
+    def test_tictactoe(self) -> None:
+        prng = np.random.default_rng(0)
+        boards = prng.choice([-1, 0, 1], size=(200, 9)).astype(np.int8)
+        winner = selfplay.check_batch_wins(boards, "tictactoe")
+        for board, this_winner in zip(boards, winner):
+            self.assertEqual(this_winner, tictactoe.check_for_win(board.reshape(3, 3).astype(int))[0])
+
+    def test_pentago(self) -> None:
+        prng = np.random.default_rng(1)
+        boards = prng.choice([-1, 0, 1], size=(200, 36), p=[0.3, 0.4, 0.3]).astype(np.int8)
+        winner = selfplay.check_batch_wins(boards, "pentago")
+        for board, this_winner in zip(boards, winner):
+            self.assertEqual(this_winner, pentago.check_for_win(board.reshape(6, 6).astype(int))[0])
+
+    def test_simultaneous(self) -> None:
+        boards = np.zeros((1, 36), dtype=np.int8)
+        boards[0, 0:5] = 1
+        boards[0, 6:11] = -1
+        np.testing.assert_array_equal(selfplay.check_batch_wins(boards, "pentago"), [2])
+
+
+# %% simulate_games
+class Test_simulate_games(unittest.TestCase):
+    r"""
+    Tests the simulate_games function with the following cases:
+        tictactoe random
+        pentago random
+        reproducible
+        ai beats random
+        bad game
+        bad policy
+        process pool
+    """
+
+    def test_tictactoe(self) -> None:
+        results = selfplay.simulate_games("tictactoe", 500, seed=2, num_workers=1)
+        self.assertEqual(results.num_games, 500)
+        self.assertEqual(results.num_player1_wins + results.num_player2_wins + results.num_draws, 500)
+        self.assertTrue(np.all((results.num_moves >= 5) & (results.num_moves <= 9)))
+        np.testing.assert_array_equal(results.first_player[0:4], [1, -1, 1, -1])
+        # games that go to the last move and end without a win are draws
+        self.assertTrue(np.all(results.num_moves[results.winner == selfplay.DRAW] == 9))
+
+    def test_pentago(self) -> None:
+        results = selfplay.simulate_games("pentago", 200, seed=3, num_workers=1)
+        self.assertEqual(results.num_games, 200)
+        self.assertTrue(np.all((results.num_moves >= 5) & (results.num_moves <= 36)))
+        self.assertNotIn(selfplay.NONE, results.winner)
+
+    def test_reproducible(self) -> None:
+        results1 = selfplay.simulate_games("pentago", 50, seed=4, num_workers=1)
+        results2 = selfplay.simulate_games("pentago", 50, seed=4, num_workers=1)
+        np.testing.assert_array_equal(results1.winner, results2.winner)
+        np.testing.assert_array_equal(results1.num_moves, results2.num_moves)
+
+    def test_ai(self) -> None:
+        results = selfplay.simulate_games("tictactoe", 100, policies=("random", "ai"), seed=5, num_workers=1)
+        self.assertGreater(results.num_player2_wins, 50)
+        results = selfplay.simulate_games("pentago", 10, policies=("ai", "random"), seed=6, num_workers=1)
+        self.assertGreaterEqual(results.num_player1_wins, 8)
+
+    def test_bad_game(self) -> None:
+        with self.assertRaises(ValueError):
+            selfplay.simulate_games("chess", 10)
+
+    def test_bad_policy(self) -> None:
+        with self.assertRaises(ValueError):
+            selfplay.simulate_games("tictactoe", 10, policies=("random", "perfect"))
+
+    def test_pool(self) -> None:
+        results = selfplay.simulate_games("tictactoe", selfplay.PARALLEL_THRESHOLD, seed=7, num_workers=2, chunk_size=700)
+        self.assertEqual(results.num_games, selfplay.PARALLEL_THRESHOLD)
+        np.testing.assert_array_equal(results.first_player[698:702], [1, -1, 1, -1])
+        self.assertNotIn(selfplay.NONE, results.winner)
+        # the same seed gives the same games without the process pool
+        results2 = selfplay.simulate_games("tictactoe", selfplay.PARALLEL_THRESHOLD, seed=7, num_workers=1, chunk_size=700)
+        np.testing.assert_array_equal(results.winner, results2.winner)
+        np.testing.assert_array_equal(results.num_moves, results2.num_moves)
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,142 @@
+r"""
+Test file for the `war` module of the "dstauffman2" library.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.war as war
+
+
+# %% WarResults
+class Test_WarResults(unittest.TestCase):
+    r"""
+    Tests the WarResults class with the following cases:
+        counts
+        lengths
+        string
+        combine
+    """
+
+    def setUp(self) -> None:
+        self.results = war.WarResults(np.array([1, 1, -1, 2, 3, 0]), np.array([100, 200, 300, 7, 50, 10000]), 2.0)
+
+    def test_counts(self) -> None:
+        self.assertEqual(self.results.num_games, 6)
+        self.assertEqual(self.results.num_player1_wins, 2)
+        self.assertEqual(self.results.num_player2_wins, 1)
+        self.assertEqual(self.results.num_draws, 1)
+        self.assertEqual(self.results.num_loops, 1)
+        self.assertEqual(self.results.num_unfinished, 1)
+        self.assertEqual(self.results.games_per_sec, 3.0)
+        self.assertAlmostEqual(self.results.first_player_advantage, 1 / 6)
+        self.assertAlmostEqual(self.results.advantage_std_err, np.std([1, 1, -1, 0, 0, 0], ddof=1) / np.sqrt(6))
+
+    def test_lengths(self) -> None:
+        np.testing.assert_array_equal(self.results.length_percentiles((0, 100)), [7, 10000])
+        (counts, edges) = self.results.length_histogram(bins=2)
+        np.testing.assert_array_equal(counts, [5, 1])
+        self.assertEqual(edges[0], 7)
+
+    def test_str(self) -> None:
+        text = str(self.results)
+        self.assertIn("6 games", text)
+        self.assertIn("loops: 1", text)
+
+    def test_combine(self) -> None:
+        results = war.WarResults.combine([self.results, self.results])
+        self.assertEqual(results.num_games, 12)
+        self.assertEqual(results.num_player1_wins, 4)
+        self.assertEqual(results.elapsed, 4.0)
+
+
+# %% _play_games
+class Test__play_games(unittest.TestCase):
+    r"""
+    Tests the _play_games function with the following cases:
+        player 1 always wins
+        player 2 always wins
+        only wars is a draw
+    """
+
+    def setUp(self) -> None:
+        self.prng = np.random.default_rng(0)
+        # the deck is dealt alternately, so the even cards go to player 1 and the odd cards to player 2
+        self.high = np.repeat(np.arange(12, -1, -1), 4)[:26]
+        self.low = np.repeat(np.arange(12, -1, -1), 4)[26:]
+
+    def test_player1(self) -> None:
+        ranks = np.empty((1, 52), dtype=np.uint8)
+        (ranks[0, 0::2], ranks[0, 1::2]) = (self.high, self.low)
+        (winner, num_moves) = war._play_games(ranks, self.prng, 3, True, 10000)
+        self.assertEqual(winner[0], war.PLAYER1)
+        self.assertEqual(num_moves[0], 26)
+
+    def test_player2(self) -> None:
+        ranks = np.empty((1, 52), dtype=np.uint8)
+        (ranks[0, 0::2], ranks[0, 1::2]) = (self.low, self.high)
+        (winner, num_moves) = war._play_games(ranks, self.prng, 3, False, 10000)
+        self.assertEqual(winner[0], war.PLAYER2)
+        self.assertEqual(num_moves[0], 26)
+
+    def test_draw(self) -> None:
+        ranks = np.repeat(np.arange(12, -1, -1), 4)[np.newaxis, :].astype(np.uint8)
+        (winner, num_moves) = war._play_games(ranks, self.prng, 3, True, 10000)
+        self.assertEqual(winner[0], war.DRAW)
+        self.assertEqual(num_moves[0], 7)
+
+
+# %% simulate_war
+class Test_simulate_war(unittest.TestCase):
+    r"""
+    Tests the simulate_war function with the following cases:
+        nominal
+        reproducible
+        loops
+        move limit
+        bad war downs
+    """
+
+    def test_nominal(self) -> None:
+        results = war.simulate_war(1000, seed=1, num_workers=1)
+        self.assertEqual(results.num_games, 1000)
+        self.assertEqual(results.num_player1_wins + results.num_player2_wins + results.num_draws, 1000)
+        self.assertTrue(np.all(results.num_moves > 0))
+        # the game is fair, since both players are dealt from a shuffled deck
+        self.assertLess(abs(results.first_player_advantage), 4 * results.advantage_std_err)
+
+    def test_reproducible(self) -> None:
+        results1 = war.simulate_war(200, seed=2, chunk_size=50)
+        results2 = war.simulate_war(200, seed=2, chunk_size=50)
+        np.testing.assert_array_equal(results1.winner, results2.winner)
+        np.testing.assert_array_equal(results1.num_moves, results2.num_moves)
+
+    def test_loops(self) -> None:
+        results = war.simulate_war(500, seed=3, shuffle=False, num_workers=1)
+        self.assertGreater(results.num_loops, 0)
+        self.assertEqual(results.num_unfinished, 0)
+        self.assertFalse(results.shuffle)
+
+    def test_max_moves(self) -> None:
+        results = war.simulate_war(200, seed=4, max_moves=50, num_workers=1)
+        self.assertTrue(np.all(results.num_moves <= 50))
+        np.testing.assert_array_equal(results.num_moves[results.winner == war.NONE], 50)
+        self.assertGreater(results.num_unfinished, 0)
+
+
+    def test_bad_war_downs(self) -> None:
+        with self.assertRaises(ValueError):
+            war.simulate_war(10, war_downs=-1)
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -17,10 +17,12 @@
 # %% Imports
 # fmt: off
 from .classes   import GameStats, Move, Options, State
-from .constants import COLOR, PLAYER, SCORING, SIZES, WIN
+from .constants import COLOR, PLAYER, SCORING, SIZES, SNAPSHOT_INTERVAL, WIN
 from .gui       import TicTacToeGui
+from .mnk       import MnkBoard, play_mnk_game
 from .plotting  import plot_board, plot_cur_move, plot_piece, plot_possible_win, plot_powers, \
                        plot_win
+from .solver    import board_to_index, get_solver_table, solve_moves
 from .utils     import get_root_dir, calc_cur_move, check_for_win, create_board_from_moves, \
                        find_moves, make_move, play_ai_game
 # fmt: on
@@ -10,13 +10,28 @@
 # %% Imports
 import doctest
 import pickle
+import struct
 import unittest
 
 import numpy as np
 
 from dstauffman import Frozen
 
-from dstauffman2.games.tictactoe.constants import PLAYER
+from dstauffman2.games.tictactoe.constants import PLAYER, SIZES, SNAPSHOT_INTERVAL
+
+# %% Constants
+# header of the binary game history files, as the file signature, format version and number of games
+_FILE_MAGIC   = b"TTTG"
+_FILE_VERSION = 2
+_FILE_HEADER  = struct.Struct("<4sBI")
+
+# record for each game in the binary game history files, with the board shape, and each move
+_GAME_DTYPE = np.dtype([("number", "<u4"), ("first_move", "i1"), ("winner", "i1"), ("rows", "u1"), ("columns", "u1"), \
+    ("num_moves", "<u2")])
+_MOVE_DTYPE = np.dtype([("row", "u1"), ("column", "u1")])
+
+# version 1 files only had 3x3 boards, with each move as the square number
+_GAME_DTYPE_V1 = np.dtype([("number", "<u4"), ("first_move", "i1"), ("winner", "i1"), ("num_moves", "u1")])
 
 
 # %% Options
@@ -29,6 +44,7 @@ class Options(Frozen):
     plot_move_power    = False
     o_is_computer      = False
     x_is_computer      = False
+    ai_method          = "solver"  # from ["solver","heuristic"]
 
     def __init__(self, **kwargs):
         r"""Creates options instance with ability to override defaults."""
@@ -105,16 +121,19 @@ def __repr__(self):
 
 # %% GameStats
 class GameStats(Frozen):
-    r"""Class that keeps track of all the moves in a game."""
+    r"""Class that keeps track of all the moves in a game, on a board of the given (rows, columns) shape."""
 
-    def __init__(self, number, first_move, winner=PLAYER["none"], move_list=None):
+    def __init__(self, number, first_move, winner=PLAYER["none"], move_list=None, shape=None):
         self.number     = number
         self.first_move = first_move
         self.winner     = winner
+        self.shape      = (SIZES["board"], SIZES["board"]) if shape is None else tuple(shape)
         if move_list is None:
             self.move_list = []
         else:
             self.move_list = move_list
+        # (o, x) bitboards after every SNAPSHOT_INTERVAL moves, built as needed
+        self._snapshots = [(0, 0)]
 
     def add_move(self, move):
         r"""Adds the given move to the game move history."""
@@ -125,8 +144,67 @@ def remove_moves(self, cur_move=None):
         r"""Removes the moves from the current move number to the end of the list."""
         if cur_move is None:
             self.move_list.pop()
+            cur_move = len(self.move_list)
         else:
             del self.move_list[cur_move:]
+        # drop the snapshots that could depend on the removed moves, including one taken right at the
+        # cut, since callers may have replaced the move before it
+        del self._snapshots[max((cur_move - 1) // SNAPSHOT_INTERVAL + 1, 1):]
+
+    def _replay(self, bits, start, num_moves):
+        r"""Replays the given number of moves from the start move onto a pair of bitboards."""
+        (o_bits, x_bits) = bits
+        for ix in range(start, start + num_moves):
+            move = self.move_list[ix]
+            bit = 1 << (self.shape[1] * move.row + move.column)
+            assert not (o_bits | x_bits) & bit, "Invalid move encountered."
+            if (ix % 2 == 0) == (self.first_move == PLAYER["o"]):
+                o_bits |= bit
+            else:
+                x_bits |= bit
+        return (o_bits, x_bits)
+
+    def board_at(self, move_number=None):
+        r"""
+        Gets the board after the given number of moves.
+
+        Parameters
+        ----------
+        move_number : int, optional
+            Number of moves to play, defaults to all of them
+
+        Returns
+        -------
+        board : 2D ndarray of int
+            Board position
+
+        Notes
+        -----
+        #.  Snapshots of the board are kept as bitboards every SNAPSHOT_INTERVAL moves, so any move
+            can be reached by replaying at most SNAPSHOT_INTERVAL - 1 moves onto the nearest one.
+
+        Examples
+        --------
+        >>> from dstauffman2.games.tictactoe import GameStats, Move, PLAYER
+        >>> game = GameStats(number=0, first_move=PLAYER["x"])
+        >>> game.add_move(Move(1, 1))
+        >>> game.add_move(Move(0, 2))
+        >>> print(game.board_at(1)[1, 1] == PLAYER["x"], game.board_at()[0, 2] == PLAYER["o"])
+        True True
+
+        """
+        if move_number is None:
+            move_number = self.num_moves
+        assert 0 <= move_number <= self.num_moves, "Move number must be within the game."
+        (index, extra) = divmod(int(move_number), SNAPSHOT_INTERVAL)
+        while len(self._snapshots) <= index:
+            last = len(self._snapshots) - 1
+            self._snapshots.append(self._replay(self._snapshots[last], last * SNAPSHOT_INTERVAL, SNAPSHOT_INTERVAL))
+        (o_bits, x_bits) = self._replay(self._snapshots[index], index * SNAPSHOT_INTERVAL, extra)
+        # bigger boards don't fit in an int64, so check the squares as python ints
+        squares = [1 << i for i in range(self.shape[0] * self.shape[1])]
+        board = [PLAYER["o"] if o_bits & bit else PLAYER["x"] if x_bits & bit else PLAYER["none"] for bit in squares]
+        return np.array(board, dtype=int).reshape(self.shape)
 
     @property
     def num_moves(self):
@@ -140,15 +218,55 @@ def get_results(game_hist):
 
     @staticmethod
     def save(filename, game_hist):
-        r"""Saves a list of GameStats objects to disk."""
+        r"""
+        Saves a list of GameStats objects to disk.
+
+        Notes
+        -----
+        #.  The file is a small header, followed by a record for each game with its board shape,
+            followed by all the moves packed into one byte each for the row and column.
+
+        """
+        if any(max(game.shape) > np.iinfo(np.uint8).max for game in game_hist):
+            raise ValueError("Boards can have at most 255 rows and columns to be saved.")
+        games = np.array([(game.number, game.first_move, game.winner, *game.shape, game.num_moves) for game in game_hist], \
+            dtype=_GAME_DTYPE)
+        moves = np.array([(m.row, m.column) for game in game_hist for m in game.move_list], dtype=_MOVE_DTYPE)
         with open(filename, "wb") as file:
-            pickle.dump(game_hist, file)
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, len(game_hist)))
+            file.write(games.tobytes())
+            file.write(moves.tobytes())
 
     @staticmethod
     def load(filename):
-        r"""Loads a list of GameStats objects to disk."""
+        r"""Loads a list of GameStats objects from disk, including older pickled files."""
         with open(filename, "rb") as file:
-            game_hist = pickle.load(file)
+            data = file.read()
+        if not data.startswith(_FILE_MAGIC):
+            # older histories were pickled lists of GameStats, so rebuild them to get the snapshots
+            old_hist = pickle.loads(data)
+            return [GameStats(x.number, x.first_move, winner=x.winner, move_list=x.move_list) for x in old_hist]
+        (_, version, num_games) = _FILE_HEADER.unpack_from(data)
+        if version not in {1, _FILE_VERSION}:
+            raise ValueError(f"Unexpected game history file version: {version}")
+        games = np.frombuffer(data, dtype=_GAME_DTYPE if version > 1 else _GAME_DTYPE_V1, count=num_games, \
+            offset=_FILE_HEADER.size)
+        offset = _FILE_HEADER.size + games.nbytes
+        if version > 1:
+            moves = np.frombuffer(data, dtype=_MOVE_DTYPE, offset=offset)
+            (rows, columns) = (moves["row"].tolist(), moves["column"].tolist())
+        else:
+            codes = np.frombuffer(data, dtype="u1", offset=offset)
+            (rows, columns) = ((codes // SIZES["board"]).tolist(), (codes % SIZES["board"]).tolist())
+        game_hist = []
+        start = 0
+        for game in games:
+            stop = start + int(game["num_moves"])
+            move_list = [Move(row, column) for (row, column) in zip(rows[start:stop], columns[start:stop])]
+            shape = (int(game["rows"]), int(game["columns"])) if version > 1 else None
+            game_hist.append(GameStats(int(game["number"]), int(game["first_move"]), winner=int(game["winner"]), \
+                move_list=move_list, shape=shape))
+            start = stop
         return game_hist
 
 
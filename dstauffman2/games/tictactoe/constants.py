@@ -47,6 +47,9 @@
 SIZES["square"] = 1.0
 SIZES["board"]  = 3
 
+# number of moves between the board snapshots kept in each game history
+SNAPSHOT_INTERVAL = 8
+
 # all possible winning combinations
 WIN = np.array([\
 [1,0,0,1,0,0,1,0],\
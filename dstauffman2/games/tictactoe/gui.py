@@ -40,7 +40,6 @@
 from dstauffman2.games.tictactoe.utils import (
     calc_cur_move,
     check_for_win,
-    create_board_from_moves,
     find_moves,
     make_move,
     play_ai_game,
@@ -98,8 +97,7 @@ def initialize_state(self, filename, board, cur_move, cur_game, game_hist):  # T
                 self.state.game_hist   = GameStats.load(filename)
                 self.state.cur_game    = np.array(len(self.state.game_hist)-1, dtype=int)
                 self.state.cur_move    = np.array(len(self.state.game_hist[-1].move_list), dtype=int)
-                self.state.board       = create_board_from_moves(self.state.game_hist[-1].move_list, \
-                    self.state.game_hist[-1].first_move)
+                self.state.board       = self.state.game_hist[-1].board_at()
             else:
                 raise ValueError(f'Could not find file: "{filename}"')  # pragma: no cover
 
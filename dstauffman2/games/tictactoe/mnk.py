@@ -0,0 +1,319 @@
+r"""
+MNK module file for the "tictactoe" game.  It extends the game to any m,n,k-game, such as gomoku.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  An m,n,k-game is played on an m by n board, and the first player to get k in a row wins.
+    Tic Tac Toe is the 3,3,3-game, and gomoku is normally the 15,15,5-game.
+#.  Instead of correlating the whole board against every possible winning line, the win check only
+    walks the four lines through the last move, and the move generation only looks at the squares
+    that create or answer threats.
+
+"""
+
+# %% Imports
+import doctest
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2.games.tictactoe.classes import GameStats, Move
+from dstauffman2.games.tictactoe.constants import PLAYER, SCORING
+
+# %% Constants
+# directions of the lines through a square, as (row, column) steps
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# distance from the existing pieces within which to consider quiet moves
+NEIGHBORHOOD = 2
+
+
+# %% Classes - MnkBoard
+class MnkBoard(Frozen):
+    r"""
+    Array backed board for an m,n,k-game with incremental win detection.
+
+    Parameters
+    ----------
+    rows : int, optional
+        Number of rows on the board, m
+    columns : int, optional
+        Number of columns on the board, n
+    k : int, optional
+        Number in a row needed to win
+    first_move : int, optional
+        Player that moves first
+
+    Examples
+    --------
+    >>> from dstauffman2.games.tictactoe import MnkBoard, PLAYER
+    >>> board = MnkBoard(15, 15, 5)
+    >>> for column in range(4):
+    ...     _ = board.place(7, column)
+    ...     _ = board.place(8, column)
+    >>> winner = board.place(7, 4)
+    >>> print(winner == PLAYER["o"], board.num_pieces)
+    True 9
+
+    """
+
+    def __init__(self, rows=15, columns=15, k=5, first_move=PLAYER["o"]):
+        if k > max(rows, columns):
+            raise ValueError("The number in a row can't be more than the size of the board.")
+        self.k          = k
+        self.board      = np.full((rows, columns), PLAYER["none"], dtype=np.int8)
+        self.num_pieces = 0
+        self.winner     = PLAYER["none"]
+        self.win_line   = None
+        self.game_stats = GameStats(number=0, first_move=first_move, shape=(rows, columns))
+
+    @property
+    def shape(self):
+        r"""Size of the board as (rows, columns)."""
+        return self.board.shape
+
+    @property
+    def player(self):
+        r"""Player to move next."""
+        first = self.game_stats.first_move
+        return first if self.num_pieces % 2 == 0 else -first
+
+    @property
+    def win_mask(self):
+        r"""Mask of the winning squares, for use with plot_win."""
+        mask = np.zeros(self.shape, dtype=bool)
+        if self.win_line is not None:
+            for row, column in self.win_line:
+                mask[row, column] = True
+        return mask
+
+    def place(self, row, column):
+        r"""
+        Places a piece for the player to move and checks the lines through it for a win.
+
+        Parameters
+        ----------
+        row : int
+            Board row
+        column : int
+            Board column
+
+        Returns
+        -------
+        winner : int
+            Winner of the game, from {0=none, 1=o, -1=x, 2=draw}
+
+        """
+        if self.winner != PLAYER["none"]:
+            raise ValueError("The game is already over.")
+        if self.board[row, column] != PLAYER["none"]:
+            raise ValueError(f"Square ({row}, {column}) is already taken.")
+        player = self.player
+        self.board[row, column] = player
+        self.num_pieces += 1
+        self.game_stats.add_move(Move(row, column))
+        line = self.find_line(row, column)
+        if line is not None:
+            self.winner = player
+            self.win_line = line
+        elif self.num_pieces == self.board.size:
+            self.winner = PLAYER["draw"]
+        self.game_stats.winner = self.winner
+        return self.winner
+
+    def undo(self):
+        r"""Takes back the last move."""
+        if self.game_stats.num_moves == 0:
+            raise ValueError("There are no moves to undo.")
+        move = self.game_stats.move_list[-1]
+        self.game_stats.remove_moves()
+        self.board[move.row, move.column] = PLAYER["none"]
+        self.num_pieces -= 1
+        self.winner = PLAYER["none"]
+        self.win_line = None
+        self.game_stats.winner = self.winner
+
+    def _count(self, row, column, dr, dc, player):
+        r"""Counts the consecutive pieces for player from the given square (exclusive) in one direction."""
+        (m, n) = self.shape
+        count = 0
+        row += dr
+        column += dc
+        while 0 <= row < m and 0 <= column < n and self.board[row, column] == player:
+            count += 1
+            row += dr
+            column += dc
+        return count
+
+    def _is_open(self, row, column):
+        r"""Determines whether the given square is on the board and empty."""
+        (m, n) = self.shape
+        return 0 <= row < m and 0 <= column < n and self.board[row, column] == PLAYER["none"]
+
+    def find_line(self, row, column):
+        r"""
+        Finds a winning line through the given square, using the piece that is on it.
+
+        Returns
+        -------
+        list of (row, column) or None
+            Squares in the winning line, or None if there isn't one
+
+        """
+        player = self.board[row, column]
+        if player == PLAYER["none"]:
+            return None
+        for dr, dc in DIRECTIONS:
+            forward = self._count(row, column, dr, dc, player)
+            backward = self._count(row, column, -dr, -dc, player)
+            if forward + backward + 1 >= self.k:
+                return [(row + i * dr, column + i * dc) for i in range(-backward, forward + 1)]
+        return None
+
+    def threats(self, row, column, player):
+        r"""
+        Classifies what placing a piece for player on the given empty square would do.
+
+        Returns
+        -------
+        win : bool
+            Whether the move gets k in a row
+        forcing : int
+            Number of lines where the move makes k-1 with an open end, or k-2 with both ends open
+        potential : int
+            Total number of pieces in the lines through the square, counting the new piece
+
+        """
+        win = False
+        forcing = 0
+        potential = 0
+        for dr, dc in DIRECTIONS:
+            forward = self._count(row, column, dr, dc, player)
+            backward = self._count(row, column, -dr, -dc, player)
+            total = forward + backward + 1
+            ends = self._is_open(row + (forward + 1) * dr, column + (forward + 1) * dc) + \
+                self._is_open(row - (backward + 1) * dr, column - (backward + 1) * dc)
+            if total >= self.k:
+                win = True
+            elif (total == self.k - 1 and ends >= 1) or (total == self.k - 2 and ends == 2 and self.k > 3):
+                forcing += 1
+            if ends > 0:
+                potential += total
+        return (win, forcing, potential)
+
+    def candidates(self):
+        r"""Finds the empty squares within the neighborhood of the existing pieces, or the center on an empty board."""
+        (m, n) = self.shape
+        if self.num_pieces == 0:
+            return [(m // 2, n // 2)]
+        taken = self.board != PLAYER["none"]
+        near = np.zeros((m + 2 * NEIGHBORHOOD, n + 2 * NEIGHBORHOOD), dtype=bool)
+        for dr in range(-NEIGHBORHOOD, NEIGHBORHOOD + 1):
+            for dc in range(-NEIGHBORHOOD, NEIGHBORHOOD + 1):
+                near[NEIGHBORHOOD + dr : NEIGHBORHOOD + dr + m, NEIGHBORHOOD + dc : NEIGHBORHOOD + dc + n] |= taken
+        near = near[NEIGHBORHOOD : NEIGHBORHOOD + m, NEIGHBORHOOD : NEIGHBORHOOD + n] & ~taken
+        return [(int(row), int(column)) for row, column in np.argwhere(near)]
+
+    def find_moves(self, player=None):
+        r"""
+        Finds the moves worth considering for the player, using threat-space move generation.
+
+        Parameters
+        ----------
+        player : int, optional
+            Player to move, defaults to the player to move next
+
+        Returns
+        -------
+        moves : list of class Move
+            Moves sorted from best to worst, with the power set using the SCORING constants
+
+        Notes
+        -----
+        #.  If the player can win, only the winning moves are returned.  Otherwise if the opponent
+            can win, only the blocks are returned.  Otherwise if any moves create or answer a
+            forcing threat, only those are returned, and if there aren't any, all the moves near
+            the existing pieces are scored by their potential lines.
+
+        Examples
+        --------
+        >>> from dstauffman2.games.tictactoe import MnkBoard, PLAYER
+        >>> board = MnkBoard(9, 9, 5)
+        >>> for (row, column) in [(4, 2), (0, 0), (4, 3), (0, 8), (4, 4), (8, 0), (4, 5)]:
+        ...     _ = board.place(row, column)
+        >>> moves = board.find_moves()
+        >>> print(moves)
+        [<row: 4, col: 6, pwr: 10>, <row: 4, col: 1, pwr: 10>]
+
+        """
+        if self.winner != PLAYER["none"]:
+            raise ValueError("The game is already over.")
+        if player is None:
+            player = self.player
+        wins = []
+        blocks = []
+        forcing = []
+        quiet = []
+        for row, column in self.candidates():
+            (own_win, own_forcing, own_potential) = self.threats(row, column, player)
+            (opp_win, opp_forcing, opp_potential) = self.threats(row, column, -player)
+            if own_win:
+                wins.append(Move(row, column, SCORING["win"]))
+            elif opp_win:
+                blocks.append(Move(row, column, SCORING["block_win"]))
+            elif own_forcing > 0 or opp_forcing > 0:
+                power = SCORING["win_in_two"] * own_forcing + SCORING["block_in_two"] * opp_forcing
+                forcing.append(Move(row, column, power))
+            else:
+                power = SCORING["normal_line"] * own_potential + SCORING["block_line"] * opp_potential
+                quiet.append(Move(row, column, round(power, 1)))
+        moves = wins or blocks or forcing or quiet
+        moves.sort(reverse=True)
+        return moves
+
+
+# %% play_mnk_game
+def play_mnk_game(board, prng=None, max_moves=None):
+    r"""
+    Plays out the rest of a game between two computer players.
+
+    Parameters
+    ----------
+    board : class MnkBoard
+        Board to play on, which is modified in-place
+    prng : np.random.Generator, optional
+        Pseudo-random number generator used to choose between equally good moves
+    max_moves : int, optional
+        Maximum number of moves to play
+
+    Returns
+    -------
+    winner : int
+        Winner of the game, from {0=none, 1=o, -1=x, 2=draw}
+
+    Examples
+    --------
+    >>> from dstauffman2.games.tictactoe import MnkBoard, play_mnk_game, PLAYER
+    >>> board = MnkBoard(3, 3, 3)
+    >>> winner = play_mnk_game(board)
+    >>> print(winner == PLAYER["draw"])
+    True
+
+    """
+    num_moves = 0
+    while board.winner == PLAYER["none"] and (max_moves is None or num_moves < max_moves):
+        moves = board.find_moves()
+        best = [move for move in moves if move.power == moves[0].power]
+        move = best[0] if prng is None else best[prng.integers(len(best))]
+        board.place(move.row, move.column)
+        num_moves += 1
+    return board.winner
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.tictactoe.tests.test_mnk", exit=False)
+    doctest.testmod(verbose=False)
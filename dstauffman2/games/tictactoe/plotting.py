@@ -173,14 +173,14 @@ def plot_board(ax, board):
     ymax = n - 1 + s
 
     # fill background
-    ax.add_patch(Rectangle((-xmin - 1, -ymin - 1), xmax - xmin, ymax - ymin, facecolor=COLOR["board"], edgecolor=None))
+    ax.add_patch(Rectangle((ymin, xmin), ymax - ymin, xmax - xmin, facecolor=COLOR["board"], edgecolor=None))
 
-    # draw minor horizontal lines
-    ax.plot([1 - s, 1 - s], [ymin, ymax], color=COLOR["edge"], linewidth=2)
-    ax.plot([2 - s, 2 - s], [ymin, ymax], color=COLOR["edge"], linewidth=2)
     # draw minor vertical lines
-    ax.plot([xmin, xmax], [1 - s, 1 - s], color=COLOR["edge"], linewidth=2)
-    ax.plot([xmin, xmax], [2 - s, 2 - s], color=COLOR["edge"], linewidth=2)
+    for j in range(1, n):
+        ax.plot([j - s, j - s], [xmin, xmax], color=COLOR["edge"], linewidth=2)
+    # draw minor horizontal lines
+    for i in range(1, m):
+        ax.plot([ymin, ymax], [i - s, i - s], color=COLOR["edge"], linewidth=2)
 
     # loop through and place pieces
     for i in range(m):
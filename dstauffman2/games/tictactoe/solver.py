@@ -0,0 +1,198 @@
+r"""
+Solver module file for the "tictactoe" game.  It defines the perfect play lookup table.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  Every board is keyed by its base-3 index, so the table for each player to move is a dense
+    array of 3^9 = 19683 values.  It is solved by a vectorized backwards induction from the
+    fullest boards to the emptiest ones the first time it is needed, which takes a fraction of a
+    second, and is then cached for the rest of the session.
+#.  The table has a row for each player to move, 2 * 3^9 = 39366 values, instead of one value
+    per board, since the side to move doesn't follow from the board alone.  The games alternate
+    which player moves first, so a board with the same number of each piece can have either
+    player to move, and `solve_moves` also scores the moves for the player that isn't next, so
+    that the possible wins can be shown for both of them.  At one byte each, it is still only
+    about 38 KB.
+
+"""
+
+# %% Imports
+import doctest
+from functools import lru_cache
+import unittest
+
+import numpy as np
+
+from dstauffman2.games.tictactoe.classes import Move
+from dstauffman2.games.tictactoe.constants import PLAYER, SIZES, WIN
+
+# %% Constants
+# number of squares on the board
+NUM_SQUARES = SIZES["board"] * SIZES["board"]
+
+# number of possible boards
+NUM_BOARDS = 3**NUM_SQUARES
+
+# place value of each square in the base-3 index
+POWERS = 3 ** np.arange(NUM_SQUARES)
+
+# base-3 digit for each player
+DIGITS = {PLAYER["none"]: 0, PLAYER["o"]: 1, PLAYER["x"]: 2}
+
+# value used for squares that are already taken
+INVALID = np.iinfo(np.int8).min
+
+
+# %% board_to_index
+def board_to_index(board):
+    r"""
+    Converts a board to its base-3 index.
+
+    Parameters
+    ----------
+    board : 2D int ndarray
+        Board position
+
+    Returns
+    -------
+    int
+        Index of the board, from 0 to 3^9 - 1
+
+    Examples
+    --------
+    >>> from dstauffman2.games.tictactoe import board_to_index, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((3, 3), PLAYER['none'], dtype=int)
+    >>> board[0, 1] = PLAYER['o']
+    >>> board[2, 2] = PLAYER['x']
+    >>> print(board_to_index(board))
+    13125
+
+    """
+    flat = board.ravel()
+    digits = np.where(flat == PLAYER["o"], DIGITS[PLAYER["o"]], np.where(flat == PLAYER["x"], DIGITS[PLAYER["x"]], 0))
+    return int(np.dot(digits, POWERS))
+
+
+# %% _move_values
+def _move_values(table, index, player, info):
+    r"""Calculates the value of every square for the given player to move on each of the given boards."""
+    (digits, counts, wins) = info
+    p_ix = 0 if player == PLAYER["o"] else 1
+    empty = digits[index] == 0
+    child = np.where(empty, index[:, np.newaxis] + DIGITS[player] * POWERS, 0)
+    values = np.where(
+        wins[p_ix][child], 10 - counts[child], np.where(counts[child] == NUM_SQUARES, 0, -table[1 - p_ix][child].astype(int))
+    )
+    values[~empty] = INVALID
+    return values
+
+
+# %% _board_info
+@lru_cache(maxsize=None)
+def _board_info():
+    r"""Finds the digits, number of pieces and wins for every possible board."""
+    index = np.arange(NUM_BOARDS)
+    digits = (index[:, np.newaxis] // POWERS) % 3
+    counts = np.count_nonzero(digits, axis=1)
+    win = WIN.astype(int)
+    o_win = np.any(((digits == DIGITS[PLAYER["o"]]).astype(int) @ win) == SIZES["board"], axis=1)
+    x_win = np.any(((digits == DIGITS[PLAYER["x"]]).astype(int) @ win) == SIZES["board"], axis=1)
+    return (digits, counts, (o_win, x_win))
+
+
+# %% get_solver_table
+@lru_cache(maxsize=None)
+def get_solver_table():
+    r"""
+    Gets the perfect play values of every board for each player to move.
+
+    Returns
+    -------
+    table : (2, 3^9) ndarray of int8
+        Value of each board with o to move (first row) and x to move (second row)
+
+    Notes
+    -----
+    #.  A win is worth 10 minus the number of pieces on the final board, so that quicker wins are
+        worth more and slower losses are worth less, and a draw is worth zero.  The value is from
+        the point of view of the player to move.
+    #.  Boards that are already won or full are not playable and are left at zero.
+    #.  There is a row for each player to move, since either player can move first, and so the
+        side to move can't be found from the number of pieces on the board.
+    #.  The table is built on the first call and then cached.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.tictactoe import get_solver_table
+    >>> table = get_solver_table()
+    >>> print(table.shape, table[0, 0], table[1, 0])
+    (2, 19683) 0 0
+
+    """
+    info = _board_info()
+    (_, counts, (o_win, x_win)) = info
+    terminal = o_win | x_win | (counts == NUM_SQUARES)
+    table = np.zeros((2, NUM_BOARDS), dtype=np.int8)
+    # work backwards from the fullest boards, so that all the children are already solved
+    for count in range(NUM_SQUARES - 1, -1, -1):
+        index = np.flatnonzero((counts == count) & ~terminal)
+        for p_ix, player in enumerate((PLAYER["o"], PLAYER["x"])):
+            table[p_ix, index] = np.max(_move_values(table, index, player, info), axis=1)
+    table.setflags(write=False)
+    return table
+
+
+# %% solve_moves
+def solve_moves(board):
+    r"""
+    Finds the perfect play value of every move for both players.
+
+    Parameters
+    ----------
+    board : 2D int ndarray
+        Board position
+
+    Returns
+    -------
+    o_moves : list of class Move
+        Moves for o, sorted from best to worst, with the power set to the game theoretic value
+    x_moves : list of class Move
+        Moves for x, sorted from best to worst, with the power set to the game theoretic value
+
+    Examples
+    --------
+    >>> from dstauffman2.games.tictactoe import solve_moves, PLAYER
+    >>> import numpy as np
+    >>> board = np.full((3, 3), PLAYER['none'], dtype=int)
+    >>> board[0, 0] = PLAYER['x']
+    >>> board[1, 1] = PLAYER['o']
+    >>> board[2, 2] = PLAYER['x']
+    >>> (o_moves, x_moves) = solve_moves(board)
+    >>> print(o_moves[0].power, x_moves[0].power)
+    0 4
+
+    """
+    index = np.array([board_to_index(board)])
+    info = _board_info()
+    (_, counts, (o_win, x_win)) = info
+    if o_win[index[0]] or x_win[index[0]]:
+        raise ValueError("Board should not already be in a winning position.")
+    assert counts[index[0]] < NUM_SQUARES, "At least one move must be available."
+    table = get_solver_table()
+    out = []
+    for player in (PLAYER["o"], PLAYER["x"]):
+        values = _move_values(table, index, player, info)[0]
+        moves = [
+            Move(ix // SIZES["board"], ix % SIZES["board"], int(value)) for (ix, value) in enumerate(values) if value != INVALID
+        ]
+        moves.sort(reverse=True)
+        out.append(moves)
+    return (out[0], out[1])
+
+
+# %% Unit Test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.tictactoe.tests.test_solver", exit=False)
+    doctest.testmod(verbose=False)
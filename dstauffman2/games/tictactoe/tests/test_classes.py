@@ -10,6 +10,8 @@
 
 # %% Imports
 import os
+import pickle
+import struct
 import unittest
 
 import numpy as np
@@ -187,6 +189,71 @@ def test_save_and_load(self) -> None:
             for j in range(self.game_hist[i].num_moves):
                 self.assertEqual(self.game_hist[i].move_list[j], game_hist[i].move_list[j])
 
+    def test_save_format(self) -> None:
+        filename = os.path.join(ttt.get_root_dir(), "tests", "temp_save.pkl")
+        game = ttt.GameStats(7, x, o, [ttt.Move(1, 1), ttt.Move(0, 2), ttt.Move(2, 0)])
+        ttt.GameStats.save(filename, [game])
+        self.assertEqual(os.path.getsize(filename), 9 + 10 + 2 * 3)
+        game_hist = ttt.GameStats.load(filename)
+        self.assertEqual(game_hist[0].number, 7)
+        self.assertEqual(game_hist[0].first_move, x)
+        self.assertEqual(game_hist[0].winner, o)
+        self.assertEqual(game_hist[0].move_list, game.move_list)
+
+    def test_load_version1(self) -> None:
+        filename = os.path.join(ttt.get_root_dir(), "tests", "temp_save.pkl")
+        with open(filename, "wb") as file:
+            file.write(struct.pack("<4sBI", b"TTTG", 1, 1))
+            file.write(struct.pack("<IbbB", 7, x, o, 3))
+            file.write(bytes([4, 2, 6]))
+        game_hist = ttt.GameStats.load(filename)
+        self.assertEqual(game_hist[0].number, 7)
+        self.assertEqual(game_hist[0].shape, (3, 3))
+        self.assertEqual(game_hist[0].move_list, [ttt.Move(1, 1), ttt.Move(0, 2), ttt.Move(2, 0)])
+
+    def test_save_mnk(self) -> None:
+        filename = os.path.join(ttt.get_root_dir(), "tests", "temp_save.pkl")
+        board = ttt.MnkBoard(15, 20, 5)
+        for (row, column) in [(7, 7), (14, 14), (0, 19), (14, 0)]:
+            board.place(row, column)
+        ttt.GameStats.save(filename, [board.game_stats])
+        game_hist = ttt.GameStats.load(filename)
+        self.assertEqual(game_hist[0].shape, (15, 20))
+        self.assertEqual(game_hist[0].move_list, board.game_stats.move_list)
+        np.testing.assert_array_equal(game_hist[0].board_at(), board.board)
+
+    def test_save_too_big(self) -> None:
+        filename = os.path.join(ttt.get_root_dir(), "tests", "temp_save.pkl")
+        with self.assertRaises(ValueError):
+            ttt.GameStats.save(filename, [ttt.GameStats(0, o, shape=(300, 300))])
+
+    def test_load_pickle(self) -> None:
+        filename = os.path.join(ttt.get_root_dir(), "tests", "temp_save.pkl")
+        with open(filename, "wb") as file:
+            pickle.dump(self.game_hist, file)
+        game_hist = ttt.GameStats.load(filename)
+        self.assertEqual(game_hist[1].move_list, self.gamestats2.move_list)
+        np.testing.assert_array_equal(game_hist[0].board_at(), np.zeros((3, 3), dtype=int))
+
+    def test_board_at(self) -> None:
+        moves = [ttt.Move(1, 1), ttt.Move(0, 0), ttt.Move(2, 2), ttt.Move(0, 2), ttt.Move(0, 1), ttt.Move(2, 1), \
+            ttt.Move(1, 0), ttt.Move(1, 2), ttt.Move(2, 0)]
+        game = ttt.GameStats(0, x, n, moves)
+        for i in range(len(moves) + 1):
+            np.testing.assert_array_equal(game.board_at(i), ttt.create_board_from_moves(moves[:i], x))
+        with self.assertRaises(AssertionError):
+            game.board_at(10)
+
+    def test_board_at_replaced(self) -> None:
+        moves = [ttt.Move(i // 3, i % 3) for i in range(9)]
+        game = ttt.GameStats(0, o, n, moves)
+        game.board_at()
+        # replace a move the same way as make_move, and the later snapshots should be rebuilt
+        game.move_list[7] = ttt.Move(2, 2)
+        game.remove_moves(8)
+        game.add_move(ttt.Move(2, 1))
+        np.testing.assert_array_equal(game.board_at(), ttt.create_board_from_moves(game.move_list, o))
+
     def tearDown(self) -> None:
         filename = os.path.join(ttt.get_root_dir(), "tests", "temp_save.pkl")
         if os.path.isfile(filename):
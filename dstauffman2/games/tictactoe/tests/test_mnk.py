@@ -0,0 +1,229 @@
+r"""
+Test file for the `tictactoe.mnk` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import dstauffman2.games.tictactoe as ttt
+
+# %% Aliases
+o = ttt.PLAYER["o"]
+x = ttt.PLAYER["x"]
+n = ttt.PLAYER["none"]
+
+
+# %% Functions - _has_k_in_row
+def _has_k_in_row(board, player, k):
+    r"""Brute force check of the whole board for k in a row, for use in testing."""
+    (m, n) = board.shape
+    for row in range(m):
+        for column in range(n):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                if all(0 <= row + i * dr < m and 0 <= column + i * dc < n and board[row + i * dr, column + i * dc] == player \
+                        for i in range(k)):
+                    return True
+    return False
+
+
+# %% Functions - _play
+def _play(board, moves):
+    r"""Plays the (row, column) moves in order, alternating players, for use in testing."""
+    winner = n
+    for row, column in moves:
+        winner = board.place(row, column)
+    return winner
+
+
+# %% MnkBoard
+class Test_MnkBoard(unittest.TestCase):
+    r"""
+    Tests the MnkBoard class with the following cases:
+        defaults
+        bad size
+        alternating players
+        horizontal, vertical and diagonal wins
+        win mask
+        draw
+        square taken
+        game over
+        undo
+        matches brute force
+    """
+
+    def setUp(self) -> None:
+        self.board = ttt.MnkBoard(9, 9, 5)
+
+    def test_defaults(self) -> None:
+        board = ttt.MnkBoard()
+        self.assertEqual(board.shape, (15, 15))
+        self.assertEqual(board.k, 5)
+        self.assertEqual(board.board.dtype, np.int8)
+        self.assertEqual(board.player, o)
+
+    def test_bad_size(self) -> None:
+        with self.assertRaises(ValueError):
+            ttt.MnkBoard(4, 4, 5)
+
+    def test_players(self) -> None:
+        board = ttt.MnkBoard(9, 9, 5, first_move=x)
+        self.assertEqual(board.player, x)
+        board.place(0, 0)
+        self.assertEqual(board.player, o)
+        self.assertEqual(board.board[0, 0], x)
+        self.assertEqual(board.game_stats.move_list, [ttt.Move(0, 0)])
+
+    def test_wins(self) -> None:
+        for dr, dc in ttt.mnk.DIRECTIONS:
+            board = ttt.MnkBoard(9, 9, 5)
+            start = (2, 6) if dc == -1 else (2, 2)
+            line = [(start[0] + i * dr, start[1] + i * dc) for i in range(5)]
+            winner = _play(board, [line[0], (8, 0), line[1], (8, 2), line[2], (8, 4), line[3], (8, 6), line[4]])
+            self.assertEqual(winner, o)
+            self.assertEqual(len(board.win_line), 5)
+
+    def test_win_in_middle(self) -> None:
+        board = ttt.MnkBoard(9, 9, 5, first_move=x)
+        for column in (0, 1, 3, 4):
+            self.assertEqual(_play(board, [(4, column), (8, 2 * column)]), n)
+        self.assertEqual(board.place(4, 2), x)
+        expected = np.zeros((9, 9), dtype=bool)
+        expected[4, 0:5] = True
+        np.testing.assert_array_equal(board.win_mask, expected)
+        self.assertEqual(board.game_stats.winner, x)
+
+    def test_draw(self) -> None:
+        board = ttt.MnkBoard(3, 3, 3)
+        for row, column in [(0, 0), (1, 1), (2, 2), (0, 1), (2, 1), (2, 0), (0, 2), (1, 2), (1, 0)]:
+            winner = board.place(row, column)
+        self.assertEqual(winner, ttt.PLAYER["draw"])
+        self.assertFalse(np.any(board.win_mask))
+
+    def test_taken(self) -> None:
+        self.board.place(1, 1)
+        with self.assertRaises(ValueError):
+            self.board.place(1, 1)
+
+    def test_game_over(self) -> None:
+        _play(self.board, [(0, 0), (8, 0), (0, 1), (8, 2), (0, 2), (8, 4), (0, 3), (8, 6), (0, 4)])
+        with self.assertRaises(ValueError):
+            self.board.place(1, 1)
+        with self.assertRaises(ValueError):
+            self.board.find_moves()
+
+    def test_undo(self) -> None:
+        _play(self.board, [(0, 0), (8, 0), (0, 1), (8, 2), (0, 2), (8, 4), (0, 3), (8, 6), (0, 4)])
+        self.assertEqual(self.board.winner, o)
+        self.board.undo()
+        self.assertEqual(self.board.winner, n)
+        self.assertIsNone(self.board.win_line)
+        self.assertEqual(self.board.num_pieces, 8)
+        self.assertEqual(self.board.board[0, 4], n)
+        self.assertEqual(self.board.game_stats.num_moves, 8)
+        self.assertEqual(self.board.player, o)
+        board = ttt.MnkBoard(3, 3, 3)
+        with self.assertRaises(ValueError):
+            board.undo()
+
+    def test_brute_force(self) -> None:
+        prng = np.random.default_rng(0)
+        for _ in range(10):
+            board = ttt.MnkBoard(7, 8, 4)
+            order = prng.permutation(56)
+            for ix in order:
+                player = board.player
+                winner = board.place(ix // 8, ix % 8)
+                if winner == player:
+                    self.assertTrue(_has_k_in_row(board.board, player, 4))
+                    break
+                self.assertFalse(_has_k_in_row(board.board, player, 4))
+
+
+# %% MnkBoard.find_moves
+class Test_MnkBoard_find_moves(unittest.TestCase):
+    r"""
+    Tests the MnkBoard.find_moves method with the following cases:
+        empty board
+        take the win
+        block the win
+        open three
+        quiet moves stay near the pieces
+    """
+
+    def setUp(self) -> None:
+        self.board = ttt.MnkBoard(15, 15, 5)
+
+    def test_empty(self) -> None:
+        self.assertEqual(self.board.find_moves(), [ttt.Move(7, 7)])
+
+    def test_win(self) -> None:
+        _play(self.board, [(5, 3), (4, 2), (5, 4), (4, 3), (5, 5), (0, 0), (5, 6)])
+        moves = self.board.find_moves(o)
+        self.assertEqual(set(moves), {ttt.Move(5, 2), ttt.Move(5, 7)})
+        self.assertTrue(all(move.power == ttt.SCORING["win"] for move in moves))
+
+    def test_block(self) -> None:
+        _play(self.board, [(5, 3), (5, 7), (5, 4), (0, 0), (5, 5), (0, 14), (5, 6)])
+        moves = self.board.find_moves(x)
+        self.assertEqual(moves, [ttt.Move(5, 2)])
+        self.assertEqual(moves[0].power, ttt.SCORING["block_win"])
+
+    def test_open_three(self) -> None:
+        _play(self.board, [(6, 7), (0, 0), (7, 7), (0, 14), (8, 7)])
+        moves = self.board.find_moves(x)
+        self.assertEqual(set(moves[0:2]), {ttt.Move(5, 7), ttt.Move(9, 7)})
+        self.assertTrue(all(move.power >= ttt.SCORING["block_in_two"] for move in moves))
+
+    def test_quiet(self) -> None:
+        self.board.place(7, 7)
+        moves = self.board.find_moves(x)
+        self.assertEqual(len(moves), 24)
+        self.assertTrue(all(abs(move.row - 7) <= 2 and abs(move.column - 7) <= 2 for move in moves))
+
+
+# %% play_mnk_game
+class Test_play_mnk_game(unittest.TestCase):
+    r"""
+    Tests the play_mnk_game function with the following cases:
+        gomoku game finishes
+        maximum number of moves
+        plotting with the existing functions
+    """
+
+    def test_gomoku(self) -> None:
+        board = ttt.MnkBoard(15, 15, 5)
+        winner = ttt.play_mnk_game(board, prng=np.random.default_rng(1))
+        self.assertNotEqual(winner, n)
+        self.assertEqual(board.game_stats.num_moves, board.num_pieces)
+        if winner != ttt.PLAYER["draw"]:
+            self.assertTrue(_has_k_in_row(board.board, winner, 5))
+
+    def test_max_moves(self) -> None:
+        board = ttt.MnkBoard(19, 19, 5)
+        winner = ttt.play_mnk_game(board, max_moves=6)
+        self.assertEqual(winner, n)
+        self.assertEqual(board.num_pieces, 6)
+
+    def test_plotting(self) -> None:
+        board = ttt.MnkBoard(7, 9, 4)
+        ttt.play_mnk_game(board, prng=np.random.default_rng(2))
+        plt.ioff()
+        fig = plt.figure()
+        ax = fig.add_subplot(111)
+        ttt.plot_board(ax, board.board)
+        ttt.plot_win(ax, board.win_mask, board.board)
+        plt.close(fig)
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
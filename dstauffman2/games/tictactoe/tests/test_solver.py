@@ -0,0 +1,152 @@
+r"""
+Test file for the `tictactoe.solver` module of the dstauffman2 code.  It is intented to contain test
+cases to demonstrate functionaliy and correct outcomes for all the functions within the module.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import unittest
+
+import numpy as np
+
+import dstauffman2.games.tictactoe as ttt
+
+# %% Aliases
+o = ttt.PLAYER["o"]
+x = ttt.PLAYER["x"]
+n = ttt.PLAYER["none"]
+
+
+# %% Functions - _minimax
+def _minimax(board, player):
+    r"""Brute force minimax value of the board for the player to move, for use in testing."""
+    best = None
+    for ix in np.flatnonzero(board.ravel() == n):
+        board.ravel()[ix] = player
+        winner = ttt.check_for_win(board)[0]
+        if winner == player:
+            value = 10 - np.count_nonzero(board)
+        elif winner == ttt.PLAYER["draw"]:
+            value = 0
+        else:
+            value = -_minimax(board, -player)
+        board.ravel()[ix] = n
+        if best is None or value > best:
+            best = value
+    return best
+
+
+# %% board_to_index
+class Test_board_to_index(unittest.TestCase):
+    r"""
+    Tests the board_to_index function with the following cases:
+        empty board
+        full range
+        unique
+    """
+
+    def test_empty(self) -> None:
+        self.assertEqual(ttt.board_to_index(np.zeros((3, 3), dtype=int)), 0)
+
+    def test_range(self) -> None:
+        self.assertEqual(ttt.board_to_index(np.full((3, 3), x, dtype=int)), 3**9 - 1)
+        board = np.zeros((3, 3), dtype=int)
+        board[2, 2] = o
+        self.assertEqual(ttt.board_to_index(board), 3**8)
+
+    def test_unique(self) -> None:
+        prng = np.random.default_rng(0)
+        boards = prng.choice([o, n, x], size=(500, 3, 3))
+        index = {ttt.board_to_index(board) for board in boards}
+        self.assertEqual(len(index), len({board.tobytes() for board in boards}))
+
+
+# %% get_solver_table
+class Test_get_solver_table(unittest.TestCase):
+    r"""
+    Tests the get_solver_table function with the following cases:
+        shape and type
+        cached
+        empty board is a draw
+        matches brute force minimax
+    """
+
+    def setUp(self) -> None:
+        self.table = ttt.get_solver_table()
+
+    def test_shape(self) -> None:
+        self.assertEqual(self.table.shape, (2, 3**9))
+        self.assertEqual(self.table.dtype, np.int8)
+        self.assertFalse(self.table.flags.writeable)
+
+    def test_cached(self) -> None:
+        self.assertIs(ttt.get_solver_table(), self.table)
+
+    def test_empty(self) -> None:
+        self.assertEqual(self.table[0, 0], 0)
+        self.assertEqual(self.table[1, 0], 0)
+
+    def test_minimax(self) -> None:
+        prng = np.random.default_rng(1)
+        count = 0
+        while count < 20:
+            board = np.zeros((3, 3), dtype=int)
+            num = prng.integers(2, 6)
+            board.ravel()[prng.choice(9, size=num, replace=False)] = np.resize([o, x], num)
+            if ttt.check_for_win(board)[0] != n:
+                continue
+            index = ttt.board_to_index(board)
+            self.assertEqual(self.table[0, index], _minimax(board, o))
+            self.assertEqual(self.table[1, index], _minimax(board, x))
+            count += 1
+
+
+# %% solve_moves
+class Test_solve_moves(unittest.TestCase):
+    r"""
+    Tests the solve_moves function with the following cases:
+        empty board
+        win now or block
+        already won
+        no valid moves
+    """
+
+    def setUp(self) -> None:
+        self.board = np.zeros((3, 3), dtype=int)
+
+    def test_empty(self) -> None:
+        (o_moves, x_moves) = ttt.solve_moves(self.board)
+        self.assertEqual(len(o_moves), 9)
+        self.assertEqual(len(x_moves), 9)
+        self.assertTrue(all(move.power == 0 for move in o_moves + x_moves))
+
+    def test_win(self) -> None:
+        self.board[1, 0:2] = x
+        self.board[0, 0] = o
+        self.board[2, 2] = o
+        (o_moves, x_moves) = ttt.solve_moves(self.board)
+        self.assertEqual(x_moves[0], ttt.Move(1, 2))
+        self.assertEqual(x_moves[0].power, 5)
+        # o has to block, which then leads to a draw
+        self.assertEqual(o_moves[0], ttt.Move(1, 2))
+        self.assertEqual(o_moves[0].power, 0)
+        self.assertTrue(all(move.power < 0 for move in o_moves[1:]))
+
+    def test_already_won(self) -> None:
+        self.board[0, :] = o
+        with self.assertRaises(ValueError):
+            ttt.solve_moves(self.board)
+
+    def test_no_valid_moves(self) -> None:
+        self.board[:] = np.array([[x, o, x], [x, o, o], [o, x, o]])
+        with self.assertRaises(AssertionError):
+            ttt.solve_moves(self.board)
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)
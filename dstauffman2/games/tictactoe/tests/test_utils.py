@@ -172,13 +172,15 @@ class Test_find_moves(unittest.TestCase):
     r"""
     Tests the find_moves function with the following cases:
         TBD
+        solver method
+        bad method
     """
 
     def setUp(self) -> None:
         self.board = np.zeros((3, 3), dtype=int)
 
     def test_no_wins(self) -> None:
-        (white_moves, black_moves) = ttt.find_moves(self.board)
+        (white_moves, black_moves) = ttt.find_moves(self.board, method="heuristic")
         self.assertEqual(white_moves[0], ttt.Move(1, 1))
         self.assertEqual(black_moves[0], ttt.Move(1, 1))
 
@@ -187,12 +189,12 @@ def test_already_won(self) -> None:
         self.board[1, 1] = x
         self.board[1, 2] = x
         with self.assertRaises(ValueError):
-            ttt.find_moves(self.board)
+            ttt.find_moves(self.board, method="heuristic")
 
     def test_o_place_to_win(self) -> None:
         self.board[2, 0] = o
         self.board[2, 1] = o
-        (white_moves, black_moves) = ttt.find_moves(self.board)
+        (white_moves, black_moves) = ttt.find_moves(self.board, method="heuristic")
         self.assertEqual(white_moves[0], ttt.Move(2, 2))
         self.assertEqual(black_moves[0], ttt.Move(2, 2))
         self.assertEqual(white_moves[0].power, 100)
@@ -202,7 +204,7 @@ def test_wins_blocked(self) -> None:
         self.board[2, 0] = o
         self.board[2, 1] = o
         self.board[2, 2] = x
-        (white_moves, black_moves) = ttt.find_moves(self.board)
+        (white_moves, black_moves) = ttt.find_moves(self.board, method="heuristic")
         self.assertEqual(white_moves[0], ttt.Move(1, 1))
         self.assertEqual(black_moves[0], ttt.Move(1, 1))
 
@@ -217,12 +219,12 @@ def test_no_valid_moves(self) -> None:
         self.board[2, 1] = x
         self.board[2, 2] = o
         with self.assertRaises(AssertionError):
-            ttt.find_moves(self.board)
+            ttt.find_moves(self.board, method="heuristic")
 
     def test_x_place_to_win(self) -> None:
         self.board[0, 0] = x
         self.board[2, 2] = x
-        (white_moves, black_moves) = ttt.find_moves(self.board)
+        (white_moves, black_moves) = ttt.find_moves(self.board, method="heuristic")
         self.assertEqual(white_moves[0], ttt.Move(1, 1))
         self.assertEqual(black_moves[0], ttt.Move(1, 1))
         self.assertEqual(white_moves[0].power, 10)
@@ -233,7 +235,7 @@ def test_same_win_square(self) -> None:
         self.board[2, 2] = x
         self.board[1, 0] = o
         self.board[1, 2] = o
-        (white_moves, black_moves) = ttt.find_moves(self.board)
+        (white_moves, black_moves) = ttt.find_moves(self.board, method="heuristic")
         self.assertEqual(white_moves[0], ttt.Move(1, 1))
         self.assertEqual(black_moves[0], ttt.Move(1, 1))
         self.assertEqual(white_moves[0].power, 100)
@@ -243,7 +245,7 @@ def test_one_from_win_move(self) -> None:
         self.board[0, 1] = o
         self.board[1, 2] = o
         self.board[1, 1] = x
-        (white_moves, black_moves) = ttt.find_moves(self.board)
+        (white_moves, black_moves) = ttt.find_moves(self.board, method="heuristic")
         self.assertEqual(white_moves[0], ttt.Move(0, 2))
         self.assertEqual(black_moves[0], ttt.Move(0, 2))
         self.assertEqual(white_moves[0].power, 6)
@@ -253,7 +255,7 @@ def test_another_off_one_win(self) -> None:
         self.board[0, 0] = o
         self.board[0, 1] = x
         self.board[1, 2] = x
-        (white_moves, black_moves) = ttt.find_moves(self.board)
+        (white_moves, black_moves) = ttt.find_moves(self.board, method="heuristic")
         self.assertEqual(white_moves[0], ttt.Move(1, 1))
         self.assertEqual(black_moves[0], ttt.Move(1, 1))
         self.assertEqual(white_moves[0].power, 5)
@@ -264,7 +266,7 @@ def test_double_win_in_two(self) -> None:
         self.board[1, 2] = o
         self.board[1, 0] = x
         self.board[2, 1] = x
-        (white_moves, black_moves) = ttt.find_moves(self.board)
+        (white_moves, black_moves) = ttt.find_moves(self.board, method="heuristic")
         self.assertEqual(white_moves[0], ttt.Move(0, 2))
         self.assertEqual(black_moves[0], ttt.Move(2, 0))
         self.assertEqual(white_moves[0].power, 6)
@@ -274,6 +276,27 @@ def test_double_win_in_two(self) -> None:
         self.assertEqual(white_moves[1].power, 5)
         self.assertEqual(black_moves[1].power, 5)
 
+    def test_solver(self) -> None:
+        self.board[0, 0] = x
+        self.board[1, 1] = o
+        self.board[2, 2] = x
+        (o_moves, x_moves) = ttt.find_moves(self.board, method="solver")
+        self.assertEqual(o_moves[0].power, 0)
+        self.assertEqual({move for move in o_moves if move.power == 0}, {ttt.Move(0, 1), ttt.Move(1, 0), ttt.Move(1, 2), ttt.Move(2, 1)})
+        self.assertEqual(x_moves[0].power, 4)
+        self.assertEqual({move for move in x_moves if move.power == 4}, {ttt.Move(0, 2), ttt.Move(2, 0)})
+
+    def test_default_method(self) -> None:
+        self.board[0, 0] = o
+        self.board[0, 1] = o
+        (o_moves, _) = ttt.find_moves(self.board)
+        (o_solved, _) = ttt.solve_moves(self.board)
+        self.assertEqual([move.power for move in o_moves], [move.power for move in o_solved])
+
+    def test_bad_method(self) -> None:
+        with self.assertRaises(ValueError):
+            ttt.find_moves(self.board, method="bad")
+
 
 # %% make_move
 class Test_make_move(unittest.TestCase):
@@ -335,6 +358,7 @@ class Test_play_ai_game(unittest.TestCase):
     r"""
     Tests the play_ai_game function with the following cases:
         Nominal (O to play first move)
+        Perfect play
     """
 
     def setUp(self) -> None:
@@ -370,6 +394,17 @@ def test_two_moves(self) -> None:
         self.assertEqual(self.cur_move, 2)
         self.assertEqual(self.cur_game, 0)
 
+    def test_perfect_play(self) -> None:
+        # set AI options
+        ttt.Options.x_is_computer = True
+        ttt.Options.o_is_computer = True
+        # play a whole game, which should always be a draw
+        board = self.board.copy()
+        for _ in range(9):
+            ttt.play_ai_game(self.ax, board, self.cur_move, self.cur_game, self.game_hist, self.prng)
+        self.assertEqual(self.cur_move, 9)
+        self.assertEqual(ttt.check_for_win(board)[0], ttt.PLAYER["draw"])
+
     def test_no_ai(self) -> None:
         # set AI options
         ttt.Options.x_is_computer = False
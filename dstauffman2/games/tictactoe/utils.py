@@ -19,6 +19,7 @@
 from dstauffman2.games.tictactoe.classes import Move, Options
 from dstauffman2.games.tictactoe.constants import COLOR, PLAYER, SCORING, SIZES, WIN
 from dstauffman2.games.tictactoe.plotting import plot_piece
+from dstauffman2.games.tictactoe.solver import solve_moves
 
 # %% Option instance
 OPTS = Options()
@@ -134,7 +135,7 @@ def check_for_win(board):
 
 
 # %% find_moves
-def find_moves(board):
+def find_moves(board, method=None):
     r"""
     Finds the best current move.
 
@@ -142,6 +143,21 @@ def find_moves(board):
     ----------
     board : 2D int ndarray
         Board position
+    method : str, optional
+        Method to score the moves, from {"solver", "heuristic"}, defaults to the ai_method option
+
+    Returns
+    -------
+    o_moves : list of class Move
+        Moves for o, sorted from best to worst
+    x_moves : list of class Move
+        Moves for x, sorted from best to worst
+
+    Notes
+    -----
+    #.  The "solver" method gives the perfect play values from the `solver` module, where positive
+        values are wins, zero is a draw and negative values are losses.  The "heuristic" method
+        scores the moves based on the SCORING constants.
 
     Examples
     --------
@@ -152,8 +168,16 @@ def find_moves(board):
     >>> board[0, 1] = PLAYER['o']
     >>> board[1, 1] = PLAYER['o']
     >>> (o_moves, x_moves) = find_moves(board)
+    >>> print(o_moves[0], o_moves[0].power)
+    row: 2, col: 2 6
 
     """
+    if method is None:
+        method = OPTS.ai_method
+    if method == "solver":
+        return solve_moves(board)
+    if method != "heuristic":
+        raise ValueError(f'Unexpected value for method: "{method}"')
 
     def calculate_move_score(wins, block_wins, win_in_2, block_in_2, lines, block_lines):
         r"""Calculates the numeric value for the current move."""
@@ -349,24 +373,27 @@ def play_ai_game(ax, board, cur_move, cur_game, game_hist, prng):
     >>> _ = ax.set_ylim(-0.5, 2.5)
     >>> ax.invert_yaxis()
     >>> board = np.full((3, 3), PLAYER['none'], dtype=int)
+    >>> board[0, 0:2] = PLAYER['x']
+    >>> board[1, 1] = PLAYER['o']
+    >>> board[2, 0] = PLAYER['o']
     >>> cur_move = np.array(0, dtype=int)
     >>> cur_game = np.array(0, dtype=int)
     >>> game_hist = [GameStats(1, PLAYER['o'])]
     >>> prng = np.random.default_rng()
     >>> Options.o_is_computer = True
     >>> Options.x_is_computer = True
-    >>> play_ai_game(ax, board, cur_move, cur_game, game_hist, prng)  # doesn't play move as it's not the computers turn
+    >>> play_ai_game(ax, board, cur_move, cur_game, game_hist, prng)
 
     >>> print(board)
-    [[0 0 0]
-     [0 1 0]
-     [0 0 0]]
+    [[-1 -1  1]
+     [ 0  1  0]
+     [ 1  0  0]]
 
     >>> print(cur_move)
     1
 
     >>> print(game_hist[0].move_list)
-    [<row: 1, col: 1, pwr: None>]
+    [<row: 0, col: 2, pwr: None>]
 
     >>> plt.close(fig)
 
@@ -378,6 +405,11 @@ def play_ai_game(ax, board, cur_move, cur_game, game_hist, prng):
         (_, moves) = find_moves(board)
     else:
         return
+    # for perfect play, use the heuristic to choose between the moves with the same value
+    if OPTS.ai_method == "solver":
+        best = {move for move in moves if move.power == moves[0].power}
+        (o_moves, x_moves) = find_moves(board, method="heuristic")
+        moves = [move for move in (o_moves if current_player == PLAYER["o"] else x_moves) if move in best]
     this_move = moves[0]
     # potentially pick another equivalent move
     for next_move in moves[1:]:
@@ -0,0 +1,327 @@
+r"""
+War module file for the "dstauffman2" library.  It plays batches of headless games of War, so that
+the statistics of the game can be found over millions of games.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+#.  All the games in a batch are played at once, one card from each player per step.  Each player's
+    cards are one row of a circular buffer, with the hand at the front and the cards that they have
+    won behind it, so that winning a pot only writes to the end of the row, and picking up the won
+    cards when the hand runs out only moves the counts, after shuffling them in place.
+#.  The rules are the same as `WarGame` in the "cards" file: ties go to a war with three down
+    cards, the pot goes into the winner's pile of won cards, and that pile is shuffled when their
+    hand runs out.  A player who can't play a card loses, and if both can't, the game is a draw.
+#.  Without shuffling, the game is deterministic and can go on forever.  These loops are found
+    with Brent's cycle detection on a hash of both players' cards after each battle.
+
+"""
+
+# %% Imports
+import doctest
+import time
+import unittest
+
+import numpy as np
+
+from dstauffman import Frozen
+
+from dstauffman2.games.batch import DRAW, NONE, PLAYER1, PLAYER2, run_chunks, split_chunks
+from dstauffman2.games.cards import DECK_SIZE, decode_cards, new_deck, WarGame
+
+# %% Constants
+# number of games before switching to a process pool
+PARALLEL_THRESHOLD = 20000
+
+# game result for a loop, in addition to the player, draw and unfinished results from the "batch" file
+LOOP = 3
+
+# multipliers for hashing each position of each player's cards
+_HASH_MULTS = np.random.default_rng(20261019).integers(1, 2**63, size=(2, DECK_SIZE), dtype=np.uint64) | np.uint64(1)
+
+
+# %% Classes - WarResults
+class WarResults(Frozen):
+    r"""
+    Results of a batch of War games.
+
+    Parameters
+    ----------
+    winner : (N, ) ndarray of int
+        Result of each game, from {PLAYER1, PLAYER2, DRAW, LOOP, NONE}, where NONE means it hit the move limit
+    num_moves : (N, ) ndarray of int
+        Number of battles in each game, including the ones within wars
+    elapsed : float
+        Time taken, in seconds
+    war_downs : int, optional
+        Number of down cards in each war
+    shuffle : bool, optional
+        Whether the won cards were shuffled
+
+    Examples
+    --------
+    >>> from dstauffman2.games.war import WarResults
+    >>> import numpy as np
+    >>> results = WarResults(np.array([1, -1, 1, 3]), np.array([210, 455, 90, 37]), 0.5)
+    >>> print(results.num_games, results.num_player1_wins, results.num_loops, results.first_player_advantage)
+    4 2 1 0.25
+
+    """
+
+    def __init__(self, winner, num_moves, elapsed, war_downs=WarGame.war_downs, shuffle=True):
+        self.winner    = winner
+        self.num_moves = num_moves
+        self.elapsed   = elapsed
+        self.war_downs = war_downs
+        self.shuffle   = shuffle
+
+    def __str__(self):
+        percent = lambda num: 100 * num / self.num_games if self.num_games > 0 else 0.0  # noqa: E731
+        (p05, p50, p95) = self.length_percentiles((5, 50, 95))
+        text = [
+            f"War: {self.num_games} games in {self.elapsed:.3f} seconds ({self.games_per_sec:.1f} games/sec)",
+            f"    player 1 wins: {self.num_player1_wins} ({percent(self.num_player1_wins):.1f}%)",
+            f"    player 2 wins: {self.num_player2_wins} ({percent(self.num_player2_wins):.1f}%)",
+            f"    draws: {self.num_draws}, loops: {self.num_loops}, unfinished: {self.num_unfinished}",
+            f"    first player advantage: {self.first_player_advantage:.4f} +/- {self.advantage_std_err:.4f}",
+            f"    game length: {np.mean(self.num_moves):.1f} mean, {p50:g} median, {p05:g} to {p95:g} (5% to 95%)",
+        ]
+        return "\n".join(text)
+
+    @property
+    def num_games(self):
+        r"""Number of games played."""
+        return self.winner.size
+
+    @property
+    def num_player1_wins(self):
+        r"""Number of games won by player 1, who is dealt the first card."""
+        return int(np.count_nonzero(self.winner == PLAYER1))
+
+    @property
+    def num_player2_wins(self):
+        r"""Number of games won by player 2."""
+        return int(np.count_nonzero(self.winner == PLAYER2))
+
+    @property
+    def num_draws(self):
+        r"""Number of games where both players ran out of cards at once."""
+        return int(np.count_nonzero(self.winner == DRAW))
+
+    @property
+    def num_loops(self):
+        r"""Number of games that repeated an earlier position, and so would never end."""
+        return int(np.count_nonzero(self.winner == LOOP))
+
+    @property
+    def num_unfinished(self):
+        r"""Number of games stopped at the move limit."""
+        return int(np.count_nonzero(self.winner == NONE))
+
+    @property
+    def games_per_sec(self):
+        r"""Number of games played per second."""
+        return self.num_games / self.elapsed if self.elapsed > 0 else np.inf
+
+    @property
+    def first_player_advantage(self):
+        r"""Fraction of games won by player 1 minus the fraction won by player 2."""
+        return (self.num_player1_wins - self.num_player2_wins) / self.num_games if self.num_games > 0 else 0.0
+
+    @property
+    def advantage_std_err(self):
+        r"""Standard error of the first player advantage."""
+        if self.num_games < 2:
+            return np.inf
+        return float(np.std(np.where(np.abs(self.winner) == 1, self.winner, 0), ddof=1) / np.sqrt(self.num_games))
+
+    def length_percentiles(self, q=(5, 25, 50, 75, 95)):
+        r"""Gets the given percentiles of the game lengths."""
+        return np.percentile(self.num_moves, q) if self.num_games > 0 else np.full(len(q), np.nan)
+
+    def length_histogram(self, bins=50):
+        r"""Gets the histogram of the game lengths, as the counts and the bin edges."""
+        return np.histogram(self.num_moves, bins=bins)
+
+    @classmethod
+    def combine(cls, results, elapsed=None):
+        r"""Combines a list of results from the same rules into a single result."""
+        winner    = np.concatenate([x.winner for x in results])
+        num_moves = np.concatenate([x.num_moves for x in results])
+        if elapsed is None:
+            elapsed = sum(x.elapsed for x in results)
+        return cls(winner, num_moves, elapsed, war_downs=results[0].war_downs, shuffle=results[0].shuffle)
+
+
+# %% _hash_states
+def _hash_states(queue, head, count):
+    r"""Hashes the cards of both players in the order that they will be played."""
+    cols = (head[:, :, np.newaxis] + np.arange(DECK_SIZE)) % DECK_SIZE
+    cards = np.take_along_axis(queue, cols, axis=2).astype(np.uint64) + np.uint64(1)
+    cards[np.arange(DECK_SIZE) >= count[:, :, np.newaxis]] = 0
+    return (cards * _HASH_MULTS).sum(axis=(1, 2), dtype=np.uint64)
+
+
+# %% _pick_up
+def _pick_up(queue, head, num_hand, num_hold, games, shuffle, prng):
+    r"""Moves the won cards into the hand of each player that has run out, shuffling them first."""
+    for player in range(2):
+        ix = games[(num_hand[games, player] == 0) & (num_hold[games, player] > 0)]
+        if ix.size == 0:
+            continue
+        if shuffle:
+            # random keys with the empty positions last give a random order of just the won cards
+            valid = np.arange(DECK_SIZE) < num_hold[ix, player][:, np.newaxis]
+            order = np.argsort(np.where(valid, prng.random((ix.size, DECK_SIZE)), 2.0), axis=1)
+            start = head[ix, player][:, np.newaxis]
+            cards = queue[ix[:, np.newaxis], player, (start + order) % DECK_SIZE]
+            (rows, cols) = np.nonzero(valid)
+            queue[ix[rows], player, (start[rows, 0] + cols) % DECK_SIZE] = cards[rows, cols]
+        num_hand[ix, player] = num_hold[ix, player]
+        num_hold[ix, player] = 0
+
+
+# %% _play_games
+def _play_games(ranks, prng, war_downs, shuffle, max_moves):
+    r"""Plays all the games from the ranks of their dealt decks, and returns the winners and number of moves."""
+    num_games = ranks.shape[0]
+    # deal alternating cards to each player
+    queue = np.zeros((num_games, 2, DECK_SIZE), dtype=np.uint8)
+    queue[:, 0, : DECK_SIZE // 2] = ranks[:, 0::2]
+    queue[:, 1, : DECK_SIZE // 2] = ranks[:, 1::2]
+    head      = np.zeros((num_games, 2), dtype=np.int64)
+    num_hand  = np.full((num_games, 2), DECK_SIZE // 2, dtype=np.int64)
+    num_hold  = np.zeros((num_games, 2), dtype=np.int64)
+    pot       = np.zeros((num_games, DECK_SIZE), dtype=np.uint8)
+    num_pot   = np.zeros(num_games, dtype=np.int64)
+    downs     = np.zeros(num_games, dtype=np.int64)
+    num_moves = np.zeros(num_games, dtype=np.int64)
+    winner    = np.full(num_games, NONE, dtype=np.int8)
+    # state for Brent's cycle detection, which is only needed when the game is deterministic
+    if not shuffle:
+        saved = _hash_states(queue, head, num_hand + num_hold)
+        power = np.ones(num_games, dtype=np.int64)
+        lam   = np.zeros(num_games, dtype=np.int64)
+    games = np.arange(num_games)
+    while games.size > 0:
+        # pick up the won cards, and end the games where someone can't play
+        _pick_up(queue, head, num_hand, num_hold, games, shuffle, prng)
+        out = num_hand[games] == 0
+        over = out[:, 0] | out[:, 1]
+        if np.any(over):
+            ix = games[over]
+            winner[ix] = np.where(out[over, 0], np.where(out[over, 1], DRAW, PLAYER2), PLAYER1)
+            games = games[~over]
+        # stop the games that hit the move limit without a winner
+        games = games[num_moves[games] < max_moves]
+        if games.size == 0:
+            break
+        # each player plays their next card into the pot
+        cols = head[games] % DECK_SIZE
+        card1 = queue[games, 0, cols[:, 0]]
+        card2 = queue[games, 1, cols[:, 1]]
+        head[games] += 1
+        num_hand[games] -= 1
+        pot[games, num_pot[games]] = card1
+        pot[games, num_pot[games] + 1] = card2
+        num_pot[games] += 2
+        # down cards only go into the pot, and up cards are a battle
+        is_down = downs[games] > 0
+        downs[games[is_down]] -= 1
+        battle = games[~is_down]
+        (card1, card2) = (card1[~is_down], card2[~is_down])
+        num_moves[battle] += 1
+        downs[battle[card1 == card2]] = war_downs
+        # the winner takes the pot, in the reverse order that it was played
+        for player, won in enumerate((card1 > card2, card1 < card2)):
+            ix = battle[won]
+            if ix.size == 0:
+                continue
+            tail = head[ix, player] + num_hand[ix, player] + num_hold[ix, player]
+            for j in range(int(num_pot[ix].max())):
+                keep = j < num_pot[ix]
+                queue[ix[keep], player, (tail[keep] + j) % DECK_SIZE] = pot[ix[keep], num_pot[ix[keep]] - 1 - j]
+            num_hold[ix, player] += num_pot[ix]
+            num_pot[ix] = 0
+        # check for repeated positions after each finished battle
+        if not shuffle:
+            ix = battle[card1 != card2]
+            hashes = _hash_states(queue[ix], head[ix], num_hand[ix] + num_hold[ix])
+            looped = hashes == saved[ix]
+            winner[ix[looped]] = LOOP
+            lam[ix] += 1
+            is_reset = lam[ix] == power[ix]
+            reset = ix[is_reset]
+            saved[reset] = hashes[is_reset]
+            power[reset] *= 2
+            lam[reset] = 0
+        # drop the games that looped
+        games = games[winner[games] == NONE]
+    return (winner, num_moves)
+
+
+# %% _simulate_batch
+def _simulate_batch(num_games, seed, war_downs, shuffle, max_moves):
+    r"""Plays a single batch of games with its own random stream."""
+    start = time.perf_counter()
+    prng = np.random.default_rng(seed)
+    (ranks, _) = decode_cards(prng.permuted(np.tile(new_deck(), (num_games, 1)), axis=1))
+    (winner, num_moves) = _play_games(ranks, prng, war_downs, shuffle, max_moves)
+    return WarResults(winner, num_moves, time.perf_counter() - start, war_downs=war_downs, shuffle=shuffle)
+
+
+# %% simulate_war
+def simulate_war(num_games, *, seed=None, war_downs=WarGame.war_downs, shuffle=True, max_moves=10000, num_workers=None, \
+        chunk_size=5000):
+    r"""
+    Plays a batch of headless games of War.
+
+    Parameters
+    ----------
+    num_games : int
+        Number of games to play
+    seed : int, optional
+        Seed for the random number generator
+    war_downs : int, optional
+        Number of down cards in each war
+    shuffle : bool, optional
+        Whether to shuffle the won cards before picking them up, otherwise the game is deterministic after the deal
+    max_moves : int, optional
+        Number of battles after which a game is stopped without a winner
+    num_workers : int, optional
+        Number of worker processes, defaults to the number of CPUs, and 1 runs everything in this process
+    chunk_size : int, optional
+        Number of games that are played at once
+
+    Returns
+    -------
+    class WarResults
+        Winners, game lengths and timing for all the games
+
+    Notes
+    -----
+    #.  The chunks are run with the shared runner in the "batch" file, so for the same seed the
+        results are the same with or without a process pool.
+    #.  A process pool is only used once there are at least PARALLEL_THRESHOLD games.
+
+    Examples
+    --------
+    >>> from dstauffman2.games.war import simulate_war
+    >>> results = simulate_war(100, seed=0)
+    >>> print(results.num_games, results.num_player1_wins + results.num_player2_wins + results.num_draws)
+    100 100
+
+    """
+    if war_downs < 0:
+        raise ValueError(f"Unexpected number of war down cards: {war_downs}")
+    chunks = split_chunks(num_games, chunk_size, seed)
+    tasks = [(size, this_seed, war_downs, shuffle, max_moves) for (_, size, this_seed) in chunks]
+    start = time.perf_counter()
+    results = run_chunks(_simulate_batch, tasks, parallel=num_games >= PARALLEL_THRESHOLD, num_workers=num_workers)
+    return WarResults.combine(results, elapsed=time.perf_counter() - start)
+
+
+# %% Unit test
+if __name__ == "__main__":
+    unittest.main(module="dstauffman2.games.test_war", exit=False)
+    doctest.testmod(verbose=False)
@@ -2,8 +2,15 @@
 
 # %% Imports
 import doctest
+from itertools import permutations
 import unittest
 
+import numpy as np
+
+# %% Constants
+# most strings to search, since the time and memory both grow as 2**N
+MAX_STRS = 20
+
 
 # %% Functions - is_str_one_off
 def is_str_one_off(str1, str2):
@@ -82,6 +89,45 @@ def find_one_offs(key, input_array):
     return out
 
 
+# %% Functions - find_one_off_matrix
+def find_one_off_matrix(input_array):
+    r"""
+    Finds which pairs of strings are one character different from one another, all at once.
+
+    Parameters
+    ----------
+    input_array : list
+        List of fixed length character strings
+
+    Returns
+    -------
+    out : (N, N) ndarray of bool
+        Whether the strings at each row and column are one off from each other
+
+    Notes
+    -----
+    #.  The strings are packed into one uint8 array, with a row per string, so that the number of
+        differences for every pair is a single broadcast comparison instead of a loop per pair.
+
+    Examples
+    --------
+    >>> from dstauffman2.puzzles.codefights_2017_01_17 import *
+    >>> print(find_one_off_matrix(['abc', 'aac', 'aby']).astype(int))
+    [[0 1 1]
+     [1 0 0]
+     [1 0 0]]
+
+    """
+    # check that the lengths are the same
+    num_chars = len(input_array[0])
+    assert all(len(this_str) == num_chars for this_str in input_array)
+    # pack the strings into rows of character codes
+    chars = np.frombuffer("".join(input_array).encode("ascii"), dtype=np.uint8).reshape(len(input_array), num_chars)
+    # count the differences between every pair of rows
+    diffs = np.count_nonzero(chars[:, np.newaxis, :] != chars[np.newaxis, :, :], axis=2)
+    return diffs == 1
+
+
 # %% Functions - stringsRearrangement
 def stringsRearrangement(input_array):
     r"""
@@ -97,6 +143,20 @@ def stringsRearrangement(input_array):
     has_path : bool
         Flag for whether the list has a one character path
 
+    Raises
+    ------
+    ValueError
+        If there are more than MAX_STRS strings
+
+    Notes
+    -----
+    #.  Updated by David C. Stauffer in October 2026 to search for a Hamiltonian path through the
+        one off graph with the Held-Karp bitmask dynamic program, instead of trying every ordering.
+        For each subset of strings, it keeps a bitmask of the strings that a path through exactly
+        that subset can end on.  The subsets are done in order of size, and each size is vectorized
+        over all the subsets at once, so that twenty strings only take a fraction of a second.
+    #.  An empty list has no path, the same as the original search through every ordering.
+
     Examples
     --------
     >>> from dstauffman2.puzzles.codefights_2017_01_17 import *
@@ -107,44 +167,31 @@ def stringsRearrangement(input_array):
     False
 
     """
-
-    def recursive_solver(key, items, last=0):
-        r"""
-        Recursive path solver.
-            Using a current key and list, deterimen if there is a next move
-            If there is, take it and shorten list
-            If list is empty, we found a path
-            If list is not empty, recursively continue
-            If there is not a path, reverse the last step
-        """
-        # find valid next steps
-        possible_steps = find_one_offs(key, items)
-        for this_step in possible_steps:
-            # if any steps, take the first one and continue recursively
-            new_key = items.pop(this_step)
-            done = recursive_solver(new_key, items, last=this_step)
-            if done:
-                # solution was found
-                return done
-        # if no valid steps, determine if we are done or need to backtrack
-        if items:
-            # backtrack
-            items.insert(last, key)
-            return False
-        # success
-        return True
-        # no steps and no backtracking
+    num_strs = len(input_array)
+    if num_strs == 0:
         return False
-
-    # solve wrapper
-    for i, this_key in enumerate(input_array):
-        # build a working list of everything except the current starting point
-        working_list = [value for (j, value) in enumerate(input_array) if j != i]
-        # recursively solve puzzle
-        has_path = recursive_solver(this_key, working_list)
-        if has_path:
-            return True
-    return False
+    if num_strs > MAX_STRS:
+        raise ValueError(f"Can only search up to {MAX_STRS} strings, not {num_strs}.")
+    bits = 1 << np.arange(num_strs, dtype=np.int32)
+    # build the adjacency of the one off graph, as a bitmask of the neighbors of each string
+    neighbors = find_one_off_matrix(input_array) @ bits
+    # every string is a path by itself
+    ends = np.zeros(1 << num_strs, dtype=np.int32)
+    ends[bits] = bits
+    # sort the subsets by their number of strings, so that each size is a contiguous block
+    sizes = np.bitwise_count(np.arange(1 << num_strs, dtype=np.int32))
+    subsets = np.argsort(sizes, kind="stable").astype(np.int32)
+    bounds = np.cumsum(np.bincount(sizes))
+    for size in range(2, num_strs + 1):
+        layer = subsets[bounds[size - 1] : bounds[size], np.newaxis]
+        # a path through the subset can end on a string if a path through the rest ends on one of its neighbors,
+        # and strings that are not in the subset are never valid, as bigger subsets don't have any paths yet
+        valid = (ends[layer ^ bits] & neighbors) != 0
+        ends[layer[:, 0]] = valid @ bits
+        # if no path covers any subset of this size, then none can cover everything
+        if not np.any(valid):
+            return False
+    return bool(ends[-1] != 0)
 
 
 # %% Tests - is_str_one_off
@@ -189,6 +236,25 @@ def test_nominal(self):
         self.assertListEqual(ix, [0, 1, 2, 5, 6, 7])
 
 
+# %% Tests - find_one_off_matrix
+class Test_find_one_off_matrix(unittest.TestCase):
+    r"""
+    Tests the find_one_off_matrix function with the following cases:
+        matches find_one_offs
+        wrong length
+    """
+
+    def test_nominal(self):
+        strs = ["ccd", "cdc", "dcc", "ddd", "bbb", "bcc", "cbc", "ccb", "ccc"]
+        out = find_one_off_matrix(strs)
+        for (i, key) in enumerate(strs):
+            self.assertListEqual(np.flatnonzero(out[i]).tolist(), find_one_offs(key, strs))
+
+    def test_wrong_len(self):
+        with self.assertRaises(AssertionError):
+            find_one_off_matrix(["aaa", "aa"])
+
+
 # %% Tests - stringsRearrangement
 class Test_stringsRearrangement(unittest.TestCase):
     r"""
@@ -232,6 +298,31 @@ def test_8(self):
     def test_repeats(self):
         self.assertTrue(stringsRearrangement(["abc", "xbc", "xxc", "xbc", "aby", "ayy", "aby"]))
 
+    def test_single(self):
+        self.assertTrue(stringsRearrangement(["abc"]))
+
+    def test_empty(self):
+        self.assertFalse(stringsRearrangement([]))
+
+    def test_too_many(self):
+        with self.assertRaises(ValueError):
+            stringsRearrangement(["a"] * (MAX_STRS + 1))
+
+    def test_random(self):
+        # compare against trying every ordering
+        prng = np.random.default_rng(0)
+        for _ in range(200):
+            strs = ["".join(x) for x in prng.choice(["a", "b"], size=(prng.integers(2, 7), 3))]
+            exp = any(all(is_str_one_off(x, y) for (x, y) in zip(order, order[1:])) for order in permutations(strs))
+            self.assertEqual(stringsRearrangement(strs), exp, strs)
+
+    def test_large(self):
+        # a Gray code visits all the binary strings one bit change at a time
+        strs = ["{:05b}".format(i ^ (i >> 1)) for i in range(20)]
+        prng = np.random.default_rng(1)
+        self.assertTrue(stringsRearrangement(list(prng.permutation(strs))))
+        self.assertFalse(stringsRearrangement(strs[:19] + ["22222"]))
+
 
 # %% Script
 if __name__ == "__main__":
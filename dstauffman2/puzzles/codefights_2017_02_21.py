@@ -2,8 +2,13 @@
 
 # %% Imports
 import doctest
+from functools import lru_cache
+from math import comb
+import timeit
 import unittest
 
+import numpy as np
+
 
 # %% Functions - digit_sum
 def digit_sum(num):
@@ -15,40 +20,54 @@ def digit_sum(num):
 
 
 # %% Functions - brute_force
-def brute_force(sum_, num_len):
+def brute_force(sum_, num_len, verbose=True):
     out = 0
     for i in range(10**num_len):
         this_sum = digit_sum(i)
         if this_sum == sum_:
             out += 1
-            print(i)
+            if verbose:
+                print(i)
     return out
 
 
+# %% Functions - _digit_sum_counts
+@lru_cache(maxsize=None)
+def _digit_sum_counts(num_len):
+    r"""
+    Counts the numbers with up to `num_len` digits that have each possible digit sum.
+
+    Notes
+    -----
+    #.  The counts are the coefficients of the polynomial (1 + x + ... + x^9)^num_len, so each
+        length is the counts for one less digit convolved with the ten ways to pick the new digit.
+    #.  The largest count for 15 digits is less than 10^15, so it fits exactly in an int64.
+
+    """
+    if num_len == 0:
+        return np.ones(1, dtype=np.int64)
+    return np.convolve(_digit_sum_counts(num_len - 1), np.ones(10, dtype=np.int64))
+
+
 # %% Functions - digitSumInverse
 def digitSumInverse(sum_, num_len):
     r"""
     Given integers `sum_` and `num_len`, find the number of non-negative integers less than 10^num_len
     such that the sum of digits for each of them is equal to `sum_`.
+
+    Examples
+    --------
+    >>> print(digitSumInverse(67, 15))
+    35460394945125
+
     """
     # checks
     assert 0 <= sum_ <= 1000
     assert 1 <= num_len <= 15
 
-    # find simple solutions
-    if num_len <= 1:
-        return 1 if sum_ < 10 else 0
-
-    # checks for no possible solutions
-    if sum_ > 9 * num_len:
-        return 0
-
-    # otherwise, solve recursively
-    out = 0
-    for digit in range(10):
-        if digit <= sum_:
-            out += digitSumInverse(sum_ - digit, num_len - 1)
-    return out
+    # look up the count from the digit sum polynomial, which is only built once for each length
+    counts = _digit_sum_counts(num_len)
+    return int(counts[sum_]) if sum_ < counts.size else 0
 
 
 # %% Tests - stringsRearrangement
@@ -83,6 +102,25 @@ def test_6(self):
     def test_7(self):
         self.assertEqual(digitSumInverse(18, 5), 4840)
 
+    def test_8(self):
+        # inclusion-exclusion over the digits that would be ten or more
+        for sum_ in range(0, 136, 7):
+            exp = sum((-1) ** k * comb(15, k) * comb(sum_ - 10 * k + 14, 14) for k in range(sum_ // 10 + 1))
+            self.assertEqual(digitSumInverse(sum_, 15), exp)
+
+
+# %% Tests - brute_force
+class Test_brute_force(unittest.TestCase):
+    r"""
+    Tests the brute_force function with the following cases:
+        matches digitSumInverse for short numbers
+    """
+
+    def test_matches(self):
+        for num_len in range(1, 4):
+            for sum_ in range(9 * num_len + 2):
+                self.assertEqual(brute_force(sum_, num_len, verbose=False), digitSumInverse(sum_, num_len))
+
 
 # %% Script
 if __name__ == "__main__":
@@ -90,3 +128,8 @@ def test_7(self):
     unittest.main(exit=False)
     # execute doctests
     doctest.testmod(verbose=False)
+    # benchmark against the brute force solution for small cases
+    for (sum_, num_len) in [(5, 2), (13, 4), (23, 5)]:
+        time1 = timeit.timeit(lambda: brute_force(sum_, num_len, verbose=False), number=1)
+        time2 = timeit.timeit(lambda: digitSumInverse(sum_, num_len), number=1000) / 1000
+        print(f"digitSumInverse({sum_}, {num_len}): brute force {time1 * 1e6:.1f} us, DP {time2 * 1e6:.2f} us")
@@ -0,0 +1,144 @@
+r"""
+Test file for the `words` module of the "dstauffman2.commands" library.
+
+Notes
+-----
+#.  Written by David C. Stauffer in October 2026.
+
+"""
+
+# %% Imports
+import argparse
+import io
+import os
+import socketserver
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from slog import ReturnCodes
+
+import dstauffman2.commands as commands
+
+
+# %% commands.parse_find_words
+class Test_commands_parse_find_words(unittest.TestCase):
+    r"""
+    Tests the commands.parse_find_words function with the following cases:
+        Nominal
+        Pattern
+        Socket
+        Dictionary
+        Show blanks
+        No tiles
+    """
+
+    def setUp(self) -> None:
+        # fmt: off
+        self.expected             = argparse.Namespace()
+        self.expected.tiles       = "words"
+        self.expected.pattern     = ""
+        self.expected.socket      = None
+        self.expected.dict_name   = None
+        self.expected.show_blanks = False
+        # fmt: on
+
+    def test_nominal(self) -> None:
+        args = commands.parse_find_words(["words"])
+        self.assertEqual(args, self.expected)
+
+    def test_pattern(self) -> None:
+        self.expected.pattern = "a..$"
+        args = commands.parse_find_words(["words", "-p", "a..$"])
+        self.assertEqual(args, self.expected)
+
+    def test_socket(self) -> None:
+        self.expected.tiles = None
+        self.expected.socket = "/tmp/words.sock"
+        args = commands.parse_find_words(["-s", "/tmp/words.sock"])
+        self.assertEqual(args, self.expected)
+
+    def test_dict(self) -> None:
+        self.expected.dict_name = "sowpods.txt"
+        args = commands.parse_find_words(["words", "-d", "sowpods.txt"])
+        self.assertEqual(args, self.expected)
+
+    def test_show_blanks(self) -> None:
+        self.expected.show_blanks = True
+        args = commands.parse_find_words(["words", "-b"])
+        self.assertEqual(args, self.expected)
+
+    def test_no_tiles(self) -> None:
+        self.expected.tiles = None
+        args = commands.parse_find_words([])
+        self.assertEqual(args, self.expected)
+
+
+# %% commands.execute_find_words
+class Test_commands_execute_find_words(unittest.TestCase):
+    r"""
+    Tests the commands.execute_find_words function with the following cases:
+        Single query
+        Single query with a pattern
+        Single query with a bad pattern
+        Queries from stdin
+        Socket is removed at the end
+    """
+
+    def setUp(self) -> None:
+        self.args = argparse.Namespace(tiles="words", pattern="", socket=None, dict_name=None, show_blanks=False)
+
+    def test_single(self) -> None:
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            rc = commands.execute_find_words(self.args)
+        self.assertEqual(rc, ReturnCodes.clean)
+        self.assertTrue(stdout.getvalue().startswith("sword words dors"))
+
+    def test_single_pattern(self) -> None:
+        self.args.pattern = "a..$"
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            rc = commands.execute_find_words(self.args)
+        self.assertEqual(rc, ReturnCodes.clean)
+        self.assertTrue(stdout.getvalue().startswith("draws roads sward"))
+        self.args.pattern = "a $"
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            rc = commands.execute_find_words(self.args)
+        self.assertEqual(rc, ReturnCodes.clean)
+        self.assertEqual(stdout.getvalue(), "\n")
+
+    def test_bad_pattern(self) -> None:
+        for pattern in ["a(", "[a"]:
+            self.args.pattern = pattern
+            with patch("sys.stdout", new_callable=io.StringIO) as stdout, \
+                    patch("sys.stderr", new_callable=io.StringIO) as stderr:
+                rc = commands.execute_find_words(self.args)
+            self.assertEqual(rc, ReturnCodes.bad_command)
+            self.assertEqual(stdout.getvalue(), "")
+            self.assertIn("Error: ", stderr.getvalue())
+
+    def test_stdin(self) -> None:
+        self.args.tiles = None
+        with patch("sys.stdin", io.StringIO("qi\nwords a..$\n")), patch("sys.stdout", new_callable=io.StringIO) as stdout, \
+                patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            rc = commands.execute_find_words(self.args)
+        self.assertEqual(rc, ReturnCodes.clean)
+        self.assertEqual(stdout.getvalue().split("\n")[0], "qi")
+        self.assertTrue(stdout.getvalue().split("\n")[1].startswith("draws roads sward"))
+        self.assertIn("Answered 2 queries", stderr.getvalue())
+
+    @unittest.skipIf(not hasattr(socketserver, "UnixStreamServer"), "Unix sockets are not supported.")
+    def test_socket(self) -> None:
+        self.args.tiles = None
+        with tempfile.TemporaryDirectory() as folder:
+            self.args.socket = os.path.join(folder, "words.sock")
+            with patch.object(socketserver.BaseServer, "serve_forever", side_effect=KeyboardInterrupt), \
+                    patch("sys.stderr", new_callable=io.StringIO) as stderr:
+                rc = commands.execute_find_words(self.args)
+            self.assertEqual(rc, ReturnCodes.clean)
+            self.assertIn("Answered 0 queries", stderr.getvalue())
+            self.assertFalse(os.path.exists(self.args.socket))
+
+
+# %% Unit test execution
+if __name__ == "__main__":
+    unittest.main(exit=False)